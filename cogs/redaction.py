@@ -1,6 +1,7 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import json
 import re
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 import aiofiles
@@ -26,6 +27,64 @@ SENSITIVE_KEYS: set[str] = {
 }
 
 
+# Announce passkeys (/<passkey>/announce), proxy secrets (/proxy/<secret>/api), secret query params
+# and long hex tokens, in one pass. This gives the same result as substituting them one after the
+# other in this order: alternatives starting at the same position are tried in that order, and a
+# proxy secret isn't matched when its "/api" is the start of an announce passkey redacted first.
+_SECRET_VALUE_RE = re.compile(
+    r"(?<=/)[a-zA-Z0-9]{10,}(?=/announce)"
+    r"|(?<=/proxy/)[^/]+(?=/api)(?!/[a-zA-Z0-9]{10,}/announce)"
+    r"|(?i:([?&](?:passkey|key|token|auth|info_hash|torrent_pass)=))[^&]+"
+    r"|\b[a-fA-F0-9]{32,}\b"
+)
+
+# Characters the JSON block scanner reacts to; everything in between is skipped in C
+_JSON_SCAN_RE = re.compile(r"[\\\"'{}\[\]]")
+
+# First characters (after JSON whitespace) json.loads can accept: objects, arrays, strings, numbers,
+# true/false/null and NaN/Infinity. Strings starting with anything else can't be JSON.
+_JSON_START_RE = re.compile(r"[ \t\n\r]*[{\[\"\-0-9tfnNI]")
+
+_KEY_CACHE_LIMIT = 10000
+
+
+def _redact_secret(match: "re.Match[str]") -> str:
+    prefix = match.group(1)
+    return f"{prefix}[REDACTED]" if prefix is not None else "[REDACTED]"
+
+
+class _KeyClassifier:
+    """Answers "is this dict key sensitive?" for one set of sensitive key fragments, with a per-key cache."""
+
+    __slots__ = ("cache", "pattern")
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        # any(s.lower() in key.lower() for s in keys) as one regex search
+        self.pattern = re.compile("|".join(re.escape(key.lower()) for key in sorted(keys, key=len, reverse=True)))
+        self.cache: dict[str, bool] = {}
+
+    def is_sensitive(self, key: str) -> bool:
+        sensitive = self.cache.get(key)
+        if sensitive is None:
+            sensitive = self.pattern.search(key.lower()) is not None
+            if len(self.cache) >= _KEY_CACHE_LIMIT:
+                self.cache.clear()
+            self.cache[key] = sensitive
+        return sensitive
+
+
+_classifiers: dict[frozenset[str], _KeyClassifier] = {}
+
+
+def _classifier_for(sensitive_keys: Optional[set[str]]) -> _KeyClassifier:
+    keys = frozenset(sensitive_keys or SENSITIVE_KEYS)
+    classifier = _classifiers.get(keys)
+    if classifier is None:
+        classifier = _KeyClassifier(keys)
+        _classifiers[keys] = classifier
+    return classifier
+
+
 class Redaction:
     @staticmethod
     def extract_json_blocks(text: str) -> list[tuple[int, int]]:
@@ -41,20 +100,25 @@ class Redaction:
         - Blocks are only redacted if `json.loads` successfully parses them.
         """
         blocks: list[tuple[int, int]] = []
+        if "{" not in text and "[" not in text:
+            return blocks
+
         stack: list[str] = []
         start: Optional[int] = None
         in_string = False
         string_char: Optional[str] = None
-        escape = False
+        # Index of the character a backslash inside a string escapes
+        escaped = -1
 
-        for i, ch in enumerate(text):
-            if escape:
-                escape = False
+        for match in _JSON_SCAN_RE.finditer(text):
+            i = match.start()
+            if i == escaped:
                 continue
+            ch = match.group()
 
             if in_string:
                 if ch == "\\":
-                    escape = True
+                    escaped = i + 1
                 elif ch == string_char:
                     in_string = False
                     string_char = None
@@ -84,7 +148,10 @@ class Redaction:
     @staticmethod
     def redact_value(val: Any, sensitive_keys: Optional[set[str]] = None) -> Any:
         """Redact sensitive values, including passkeys in URLs and JSON substrings."""
-        keys = sensitive_keys or SENSITIVE_KEYS
+        return Redaction._redact_value(val, _classifier_for(sensitive_keys))
+
+    @staticmethod
+    def _redact_value(val: Any, classifier: _KeyClassifier) -> Any:
         if isinstance(val, str):
             # First, try to find and redact embedded JSON substrings within the string.
             # This uses bracket counting (not regex) so it can handle nested JSON.
@@ -97,44 +164,75 @@ class Redaction:
                     continue
 
                 try:
-                    redacted = Redaction.redact_private_info(parsed, keys)
+                    redacted = Redaction._redact(parsed, classifier)
                     redacted_str = json.dumps(redacted)
                 except (TypeError, ValueError):
                     continue
 
                 val = val[:start] + redacted_str + val[end:]
 
-            # Redact passkeys in announce URLs (e.g. /<passkey>/announce)
-            val = re.sub(r"(?<=/)[a-zA-Z0-9]{10,}(?=/announce)", "[REDACTED]", val)
-            # Redact content between /proxy/ and /api (e.g. /proxy/<secret>/api)
-            val = re.sub(r"(?<=/proxy/)[^/]+(?=/api)", "[REDACTED]", val)
-            # Redact query params like ?passkey=... or &token=...
-            val = re.sub(r"([?&](passkey|key|token|auth|info_hash|torrent_pass)=)[^&]+", r"\1[REDACTED]", val, flags=re.I)
-            # Redact long hex or base64-like strings (common for tokens)
-            val = re.sub(r"\b[a-fA-F0-9]{32,}\b", "[REDACTED]", val)
+            # Every pattern needs a "/" or "=", or is a 32+ character token
+            if len(val) >= 32 or "/" in val or "=" in val:
+                val = _SECRET_VALUE_RE.sub(_redact_secret, val)
         return val
 
     @staticmethod
     def redact_private_info(data: Any, sensitive_keys: Optional[set[str]] = None) -> Any:
         """Recursively redact sensitive info in dicts/lists/strings containing JSON."""
-        keys = sensitive_keys or SENSITIVE_KEYS
+        return Redaction._redact(data, _classifier_for(sensitive_keys))
+
+    @staticmethod
+    def _redact(data: Any, classifier: _KeyClassifier) -> Any:
         if isinstance(data, dict):
             typed_data = cast(dict[str, Any], data)
-            return {k: ("[REDACTED]" if any(s.lower() in k.lower() for s in keys) else Redaction.redact_private_info(v, keys)) for k, v in typed_data.items()}
+            return {k: ("[REDACTED]" if classifier.is_sensitive(k) else Redaction._redact(v, classifier)) for k, v in typed_data.items()}
         if isinstance(data, list):
             typed_list = cast(list[Any], data)
-            return [Redaction.redact_private_info(item, keys) for item in typed_list]
+            return [Redaction._redact(item, classifier) for item in typed_list]
         if isinstance(data, str):
-            # Try to parse as JSON first
-            try:
-                parsed_json = json.loads(data)
-                redacted_json = Redaction.redact_private_info(parsed_json, keys)
-                return json.dumps(redacted_json)
-            except (json.JSONDecodeError, TypeError):
-                # Not valid JSON, treat as regular string
-                return Redaction.redact_value(data, keys)
+            # Try to parse as JSON first, unless it can't be JSON at all
+            if _JSON_START_RE.match(data):
+                try:
+                    parsed_json = json.loads(data)
+                    redacted_json = Redaction._redact(parsed_json, classifier)
+                    return json.dumps(redacted_json)
+                except (json.JSONDecodeError, TypeError):
+                    pass
+            # Not valid JSON, treat as regular string
+            return Redaction._redact_value(data, classifier)
         return data
 
+    @staticmethod
+    def iter_redacted_json(data: Any, sensitive_keys: Optional[set[str]] = None, indent: int = 4) -> Iterator[str]:
+        """Yield ``json.dumps(redact_private_info(data), indent=indent)`` in pieces.
+
+        Only one top-level entry of ``data`` is redacted and serialized at a time, so large
+        payloads (a whole meta, long dupe lists) can be written out without building a full
+        redacted copy and one big string first.
+        """
+        classifier = _classifier_for(sensitive_keys)
+        if isinstance(data, dict):
+            items = [(json.dumps(k) + ": ", "[REDACTED]" if classifier.is_sensitive(k) else None, v) for k, v in cast(dict[str, Any], data).items()]
+            brackets = ("{", "}")
+        elif isinstance(data, list):
+            items = [("", None, item) for item in cast(list[Any], data)]
+            brackets = ("[", "]")
+        else:
+            yield json.dumps(Redaction._redact(data, classifier), indent=indent)
+            return
+
+        if not items:
+            yield brackets[0] + brackets[1]
+            return
+        newline = "\n" + " " * indent
+        yield brackets[0]
+        for position, (prefix, replacement, value) in enumerate(items):
+            redacted = replacement if replacement is not None else Redaction._redact(value, classifier)
+            # JSON strings never contain raw newlines, so nested lines can be re-indented by replacement
+            text = json.dumps(redacted, indent=indent).replace("\n", newline)
+            yield f"{newline}{prefix}{text}{',' if position < len(items) - 1 else ''}"
+        yield "\n" + brackets[1]
+
     @staticmethod
     async def clean_meta_for_export(meta: "Meta") -> "Meta":
         """
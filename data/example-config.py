@@ -8,6 +8,8 @@ config = {
         "update_notification": True,
         # will print the changelog if an update is available
         "verbose_notification": False,
+        # hours between update checks, the last result is remembered in data/update_check.json
+        "update_check_interval": 6,
 
         # tmdb api key **REQUIRED**
         # visit "https://www.themoviedb.org/settings/api" copy api key and insert below
@@ -21,6 +23,12 @@ config = {
         # If less than the number of trackers pass the checking, exit immediately.
         "tracker_pass_checks": 1,
 
+        # How many trackers to upload to at the same time, 0 = all of them
+        # Season packs and multi-disc uploads always go one tracker at a time
+        "tracker_upload_concurrency": 0,
+        # Trackers to start uploading to first, e.g. "PTP, BLU". Others follow in the order they were given
+        "tracker_upload_priority": "",
+
         # Set true to suppress config warnings on startup
         "suppress_warnings": False,
 
@@ -38,6 +46,10 @@ config = {
         # Will prevent meta.json file from being deleted before running
         "keep_meta": False,
 
+        # Reuse the MediaInfo export, uploaded images and BASE.torrent of an earlier run for the same (unchanged) source,
+        # and skip trackers that run already uploaded to. Progress is kept in tmp/<uuid>/checkpoints.json, --delete-tmp resets it
+        "resume_uploads": True,
+
         # IMAGE HOSTING SETTINGS
 
         # Order of image hosts. primary host as first with others as backup
@@ -68,6 +80,12 @@ config = {
         # utp.pm API key
         "utppm_api": "",
 
+        # Remember which screenshots were already uploaded to which image host (keyed by file contents)
+        # so re-hosting for another tracker, --edit re-runs and cross-seeds reuse the existing links
+        "image_host_cache": True,
+        # Set true to check that cached links still resolve before reusing them
+        "image_host_cache_revalidate": False,
+
         # GETTING METADATA
 
         # btn api key used to get details from btn
@@ -141,6 +159,14 @@ config = {
         # The final value will be the minimum, between this value and number of screens being processed
         "process_limit": "4",
 
+        # Probe a few low-resolution keyframes per screenshot first, and capture the most detailed one
+        # Avoids black or flat frames up front, instead of retaking them after the full-quality capture
+        "screenshot_prescan": True,
+
+        # Losslessly optimize each screenshot PNG as soon as it is captured, in worker processes (at most one per CPU)
+        # Uses oxipng when installed, else Pillow. Helps 4K screenshots fit image host size limits (10 MB for imgbox/pixhost)
+        "optimize_screenshots": False,
+
         # Set true to limit the amount of CPU when running ffmpeg.
         # This places an additional limitation on ffmpeg to reduce CPU usage
         "ffmpeg_limit": False,
@@ -160,6 +186,10 @@ config = {
         # Some systems are slow to compile libplacebo shaders, which will cause the first screenshot to fail
         "ffmpeg_warmup": False,
 
+        # Remember which tonemap filter chain (libplacebo, zscale or none) works with your ffmpeg build
+        # for each HDR format, so later uploads skip the compatibility check. Set false to check every time
+        "tonemap_cache": True,
+
         # Set ffmpeg compression level for screenshots (0-9)
         # 6 is a good balance between compression and speed
         "ffmpeg_compression": "6",
@@ -294,6 +324,13 @@ config = {
         "radarr_url_1": "http://my-second-instance:7878",
         "radarr_api_key_1": "",
 
+        # Load the whole Sonarr/Radarr library of every instance once and answer lookups from memory,
+        # instead of querying each instance per upload. Useful for large queues.
+        "arr_library_mirror": True,
+        # Minutes before the library copy is brought up to date. Only items changed since the last update are fetched;
+        # the whole library is reloaded once a day
+        "arr_library_mirror_ttl": 60,
+
         # Add a directory for Emby linking. This is the folder where the emby files will be linked to.
         # If not set, Emby linking will not be performed. Symlinking only, linux not tested
         # path in quotes (double quotes for windows), e.g. "C:\\Emby\\Movies"
@@ -350,6 +387,13 @@ config = {
         # Set true to cross-seed check every valid tracker defined in your config
         # regardless of whether the tracker was selected for upload or not (needs cross-seeding above to be True)
         "cross_seed_check_everything": False,
+        # Number of cross-seed searches run at the same time (one per tracker site at a time)
+        "cross_seed_search_concurrency": 8,
+        # Number of cross-seed torrents downloaded and added to the client at the same time
+        "cross_seed_concurrency": 8,
+        # Minutes before a tracker whose cross-seed search found nothing is searched again for the same content
+        # Set to 0 to search every time
+        "cross_seed_miss_ttl": 60,
 
     },
 
@@ -0,0 +1,110 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Description cleaner and converter throughput.
+
+Runs the site cleaners (PTP, UNIT3D, HDB, BHD) and the converter runs the trackers make over
+the descriptions in tests/data/bbcode, and prints descriptions per second for each::
+
+    python scripts/bench_bbcode.py [--seconds 1.0] [--scale 1]
+
+``--scale N`` joins N copies of each fixture into one description, to see how the cost grows
+with the size of the description. Run it on two checkouts to compare.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = REPO_DIR / "tests" / "data" / "bbcode"
+
+# Converter runs as the trackers call them, back to back
+CHAINS: dict[str, tuple[tuple[Any, ...], ...]] = {
+    "OE": (("convert_pre_to_code",), ("convert_hide_to_spoiler",), ("convert_comparison_to_collapse", 1000)),
+    "HDT": (("convert_spoiler_to_hide",), ("remove_img_resize",), ("convert_comparison_to_centered", 1000), ("remove_spoiler",), ("remove_list",)),
+    "BJS": (("convert_named_spoiler_to_named_hide",), ("convert_spoiler_to_hide",), ("remove_img_resize",), ("convert_to_align",), ("remove_list",)),
+}
+
+
+def rate(run: Callable[[], Any], seconds: float) -> float:
+    """Calls per second of ``run``, over at least ``seconds``."""
+    calls = 0
+    started = time.perf_counter()
+    while True:
+        run()
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= seconds:
+            return calls / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="time spent on each case")
+    parser.add_argument("--scale", type=int, default=1, help="copies of each fixture joined into one description")
+    options = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_DIR))
+    import src.bbcode as bbcode_module
+
+    bbcode = bbcode_module.BBCODE()
+
+    def fixture(name: str) -> str:
+        return "\n".join([(DATA_DIR / name).read_text(encoding="utf-8")] * options.scale)
+
+    ptp = fixture("ptp_encode.txt")
+    ptp_bdmv = fixture("ptp_bdmv.txt")
+    unit3d = fixture("unit3d_aither.txt")
+    hdb = fixture("hdb_encode.txt")
+    bhd = fixture("bhd_framestor.txt")
+    ua = fixture("ua_description.txt")
+
+    def chain(desc: str, steps: tuple[tuple[Any, ...], ...]) -> Callable[[], Any]:
+        def run() -> str:
+            converted = desc
+            for method, *args in steps:
+                converted = getattr(bbcode, method)(converted, *args)
+            return converted
+
+        return run
+
+    cases: dict[str, Callable[[], Any]] = {
+        "clean_ptp_description (encode)": lambda: bbcode.clean_ptp_description(ptp, ""),
+        "clean_ptp_description (BDMV)": lambda: bbcode.clean_ptp_description(ptp_bdmv, "BDMV"),
+        "clean_unit3d_description": lambda: bbcode.clean_unit3d_description(unit3d, "https://aither.cc/torrents/download/1"),
+        "clean_hdb_description": lambda: bbcode.clean_hdb_description(hdb),
+        "clean_bhd_description": lambda: bbcode.clean_bhd_description(bhd, {"flux": True}),
+    }
+    for tracker, steps in CHAINS.items():
+        cases[f"{tracker} converter run"] = chain(ua, steps)
+    # The same runs as the trackers now make them, in one BBCODE.convert (older checkouts don't have it)
+    if hasattr(bbcode, "convert"):
+        one_convert = {
+            "OE": (bbcode_module.PRE_TO_CODE, bbcode_module.HIDE_TO_SPOILER, bbcode_module.comparison_to_collapse(1000)),
+            "HDT": (
+                bbcode_module.SPOILER_TO_HIDE,
+                bbcode_module.REMOVE_IMG_RESIZE,
+                bbcode_module.comparison_to_centered(1000),
+                bbcode_module.REMOVE_SPOILER,
+                bbcode_module.REMOVE_LIST,
+            ),
+            "BJS": (
+                bbcode_module.NAMED_SPOILER_TO_NAMED_HIDE,
+                bbcode_module.SPOILER_TO_HIDE,
+                bbcode_module.REMOVE_IMG_RESIZE,
+                bbcode_module.TO_ALIGN,
+                bbcode_module.REMOVE_LIST,
+            ),
+        }
+        for tracker, conversions in one_convert.items():
+            cases[f"{tracker} one convert"] = lambda conversions=conversions: bbcode.convert(ua, *conversions)
+
+    print(f"scale {options.scale}: {len(ua) / 1024:.1f} KiB converter input")
+    for name, run in cases.items():
+        print(f"{name:<34} {rate(run, options.seconds):>9.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
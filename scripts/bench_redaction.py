@@ -0,0 +1,153 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Redacted meta dump: time and peak memory.
+
+Writes a redacted JSON dump of a meta.json to a temporary file, once by redacting the whole
+meta and serializing it in one string and once with ``Redaction.iter_redacted_json`` (when the
+checkout has it), and prints the best time and the traced peak memory of each::
+
+    python scripts/bench_redaction.py --meta tmp/<uuid>/meta.json [--rounds 5]
+
+Point ``--meta`` at the meta.json an upload left in its tmp folder. Without it a BDMV meta
+with the same layout (BDInfo report, MediaInfo, screenshots, tracker status) is generated.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+_PASSKEY = "0123456789abcdef0123456789abcdef"
+
+
+def sample_meta() -> dict[str, Any]:
+    """A BDMV upload's meta, shaped like the one prep writes to tmp/<uuid>/meta.json."""
+    tracks = [f"{index:05d}.m2ts" for index in range(40)]
+    bdinfo_lines = ["DISC INFO:", "", "Disc Title:     Movie 2020", "Disc Size:      46,123,456,789 bytes", "Protection:     AACS2", ""]
+    bdinfo_lines += ["PLAYLIST REPORT:", "", "Name:                   00800.MPLS", "Length:                 2:01:33.123 (h:m:s.ms)", ""]
+    for index, name in enumerate(tracks):
+        bdinfo_lines.append(
+            f"{name:<24}{index * 13:>6}:{index % 60:02d}:{index % 60:02d}.000   0:02:{index % 60:02d}.{index:03d}   {index * 123456789:>16,} {index * 4567:>10,}"
+        )
+    for language in ("English", "French", "German", "Spanish", "Italian", "Japanese") * 4:
+        bdinfo_lines.append(f"Presentation Graphics           {language:<16}{31.123:>8.3f} kbps")
+    bdinfo_summary = "\n".join(bdinfo_lines * 6)
+
+    def track(kind: str, index: int, **extra: Any) -> dict[str, Any]:
+        data: dict[str, Any] = {"@type": kind, "@typeorder": str(index), "StreamOrder": str(index), "ID": str(4113 + index), "Format": "AVC", "Duration": "7293.123"}
+        data.update({f"Field{field}": f"value {field} of {kind} {index}" for field in range(40)})
+        data.update(extra)
+        return data
+
+    video_settings = " / ".join(f"option{index}={index}" for index in range(120))
+    mediainfo_tracks = [track("General", 0, CompleteName=f"/data/Movie.2020.1080p.BluRay/BDMV/STREAM/{tracks[0]}")]
+    mediainfo_tracks.append(track("Video", 1, Encoded_Library_Settings=video_settings, Width="1920", Height="1080"))
+    mediainfo_tracks += [track("Audio", index, Language="en", Title=f"Commentary {index}") for index in range(2, 10)]
+    mediainfo_tracks += [track("Text", index, Language="en") for index in range(10, 34)]
+    mediainfo_tracks.append(track("Menu", 34, extra={f"_00_{minute:02d}_00_000": f"Chapter {minute}" for minute in range(60)}))
+
+    image_list = [
+        {"img_url": f"https://ptpimg.me/{index:06d}.png", "raw_url": f"https://ptpimg.me/{index:06d}.png", "web_url": f"https://ptpimg.me/{index:06d}.png"}
+        for index in range(12)
+    ]
+    trackers = ["BLU", "AITHER", "LST", "OE", "PTP", "HDB", "BHD", "MTV", "ANT", "TL"]
+    return {
+        "uuid": "Movie.2020.1080p.BluRay.COMPLETE.BLURAY-GRP",
+        "path": "/data/Movie.2020.1080p.BluRay.COMPLETE.BLURAY-GRP",
+        "base_dir": "/app",
+        "is_disc": "BDMV",
+        "name": "Movie 2020 1080p Blu-ray AVC DTS-HD MA 5.1-GRP",
+        "overview": "A long overview of the movie. " * 40,
+        "discs": [
+            {
+                "path": "/data/Movie/BDMV",
+                "name": "Movie",
+                "type": "BDMV",
+                "summary": bdinfo_summary,
+                "bdinfo": {"files": [{"file": name, "length": "0:02:00"} for name in tracks]},
+            }
+        ],
+        "bdinfo": {
+            "title": "Movie 2020",
+            "files": [{"file": name, "size": str(index * 123456789)} for index, name in enumerate(tracks)],
+            "video": [{"codec": "MPEG-4 AVC Video"}],
+        },
+        "mediainfo": {"creatingLibrary": {"name": "MediaInfoLib", "version": "24.06"}, "media": {"@ref": "/data/Movie/BDMV/STREAM/00000.m2ts", "track": mediainfo_tracks}},
+        "image_list": image_list,
+        "description": "[center][b]Movie 2020[/b][/center]\n" + "\n".join(f"[url={image['web_url']}][img]{image['img_url']}[/img][/url]" for image in image_list) * 4,
+        "tracker_status": {
+            tracker: {
+                "banned": False,
+                "skipped": False,
+                "dupe": False,
+                "upload": True,
+                "status_message": {"success": True, "data": f"https://{tracker.lower()}.cc/torrent/download/12345.{_PASSKEY}", "message": "Torrent uploaded"},
+            }
+            for tracker in trackers
+        },
+        "tmdb_keywords": ", ".join(f"keyword {index}" for index in range(60)),
+        "tmdb_cast": [{"name": f"Actor {index}", "character": f"Character {index}"} for index in range(80)],
+        "filelist": [],
+        "trackers": trackers,
+    }
+
+
+def measure(write: Callable[[Any], None], rounds: int) -> tuple[float, float]:
+    """Best time over ``rounds`` and the traced peak of one extra run, in ms and MiB."""
+    best = float("inf")
+    with tempfile.TemporaryFile("w", encoding="utf-8") as output:
+        for _ in range(rounds):
+            output.seek(0)
+            output.truncate()
+            started = time.perf_counter()
+            write(output)
+            best = min(best, time.perf_counter() - started)
+        output.seek(0)
+        output.truncate()
+        tracemalloc.start()
+        write(output)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return best * 1000, peak / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meta", type=Path, help="meta.json to dump (default: a generated BDMV meta)")
+    parser.add_argument("--rounds", type=int, default=5)
+    options = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_DIR))
+    from cogs.redaction import Redaction
+
+    meta = json.loads(options.meta.read_text(encoding="utf-8")) if options.meta else sample_meta()
+    size = len(json.dumps(meta, indent=4))
+    print(f"meta: {size / 1024:.0f} KiB as indented JSON, {len(meta)} top-level keys")
+
+    def whole(output: Any) -> None:
+        output.write(json.dumps(Redaction.redact_private_info(meta), indent=4))
+
+    elapsed, peak = measure(whole, options.rounds)
+    print(f"redact + json.dumps: {elapsed:.1f} ms, peak {peak:.1f} MiB")
+
+    iter_redacted_json = getattr(Redaction, "iter_redacted_json", None)
+    if iter_redacted_json is None:
+        print("streaming: not available in this checkout")
+        return
+
+    def streamed(output: Any) -> None:
+        for chunk in iter_redacted_json(meta):
+            output.write(chunk)
+
+    elapsed, peak = measure(streamed, options.rounds)
+    print(f"iter_redacted_json:  {elapsed:.1f} ms, peak {peak:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Authenticated web UI requests per second.
+
+Sends bearer-token ``GET /api/jobs`` requests through the Flask test client with the rate
+limiter off, against a throwaway config dir, and prints the rate of each round::
+
+    python scripts/bench_webui_auth.py [--requests 2000] [--rounds 3]
+
+Run it on two checkouts to compare the cost of the per-request auth checks.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as config_home:
+        # webui_auth.json and the session secret go to the throwaway dir, set before web_ui is imported
+        os.environ["XDG_CONFIG_HOME"] = config_home
+        os.environ["SESSION_SECRET"] = "bench-" + "s" * 58
+        sys.path.insert(0, str(REPO_DIR))
+        from web_ui import auth as auth_mod
+        from web_ui import server
+        from web_ui.jobs import JobManager
+
+        auth_mod.create_user("bench", "Correct-Horse-Battery-Staple-42")
+        with server.app.test_request_context():
+            token = server._create_api_token("bench", "benchmark")
+        # A job manager that is never started: the request only lists its (empty) queue
+        manager = JobManager(Path(config_home), REPO_DIR)
+        server._get_job_manager = lambda: manager
+        server.limiter.enabled = False
+        client = server.app.test_client()
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = client.get("/api/jobs", headers=headers)
+        if response.status_code != 200:
+            raise SystemExit(f"GET /api/jobs returned {response.status_code}: {response.get_data(as_text=True)}")
+        for round_number in range(1, options.rounds + 1):
+            started = time.perf_counter()
+            for _ in range(options.requests):
+                client.get("/api/jobs", headers=headers)
+            elapsed = time.perf_counter() - started
+            print(f"round {round_number}: {options.requests / elapsed:.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
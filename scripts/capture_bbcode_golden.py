@@ -0,0 +1,53 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Capture tests/data/bbcode/golden.json from a given revision of src/bbcode.py.
+
+Runs every golden case of tests/test_bbcode_golden.py through the ``BBCODE`` class as it is at
+``--rev`` (read with ``git show``, so the working tree is untouched) and writes the results::
+
+    python scripts/capture_bbcode_golden.py --rev <commit>
+
+Only regenerate the golden file when a change in cleaner output is intended.
+"""
+
+import argparse
+import importlib.util
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rev", default="HEAD", help="git revision to take src/bbcode.py from")
+    options = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_DIR))
+    source = subprocess.run(["git", "show", f"{options.rev}:src/bbcode.py"], cwd=REPO_DIR, check=True, capture_output=True, text=True).stdout
+    with tempfile.TemporaryDirectory() as temp_dir:
+        module_path = Path(temp_dir) / "bbcode_at_rev.py"
+        module_path.write_text(source, encoding="utf-8")
+        spec = importlib.util.spec_from_file_location("bbcode_at_rev", module_path)
+        tests_spec = importlib.util.spec_from_file_location("test_bbcode_golden", REPO_DIR / "tests" / "test_bbcode_golden.py")
+        if spec is None or spec.loader is None or tests_spec is None or tests_spec.loader is None:
+            raise SystemExit("could not load the modules")
+        bbcode_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(bbcode_module)
+
+        # The test module reads golden.json at import time; start from an empty one if it's missing
+        golden_path = REPO_DIR / "tests" / "data" / "bbcode" / "golden.json"
+        if not golden_path.exists():
+            golden_path.write_text("{}\n", encoding="utf-8")
+        tests_module = importlib.util.module_from_spec(tests_spec)
+        tests_spec.loader.exec_module(tests_module)
+        outputs = tests_module.golden_outputs(bbcode_module.BBCODE())
+
+    golden_path.write_text(json.dumps(outputs, indent=2, ensure_ascii=False, sort_keys=True) + "\n", encoding="utf-8")
+    print(f"wrote {len(outputs)} cases to {golden_path.relative_to(REPO_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
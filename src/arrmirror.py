@@ -0,0 +1,346 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import os
+import time
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, cast
+from urllib.parse import quote
+
+import httpx
+
+from src.console import console
+
+LibraryItem = dict[str, Any]
+_Index = dict[Any, dict[str, LibraryItem]]
+
+# Same limit as the per-request lookups: instances are configured as <service>_url, <service>_url_1 ... _3
+MAX_INSTANCES = 4
+
+# An instance whose library failed to load is not asked again for this long; lookups go to its API meanwhile
+_RETRY_FAILED_AFTER = 300.0
+
+# A refresh only fetches items with history events since the last sync; the whole library is still reloaded this often,
+# since adding or deleting a series/movie without any file activity leaves no history
+_FULL_RELOAD_AFTER = 24 * 3600.0
+# Seconds of history asked for before a full load started, for events during the load and clock drift
+_HISTORY_OVERLAP = 600.0
+# Above this many changed items one library request is cheaper than fetching them one by one
+_MAX_PATCHED_ITEMS = 200
+
+# Returned for an item the instance no longer has
+_MISSING = object()
+
+# Endpoints, the history field naming the item and the ids worth indexing for each service
+_LIBRARY_ENDPOINTS: dict[str, str] = {
+    "sonarr": "/api/v3/series?includeSeasonImages=false",
+    "radarr": "/api/v3/movie?excludeLocalCovers=true",
+}
+_ITEM_ENDPOINTS: dict[str, str] = {
+    "sonarr": "/api/v3/series/{id}",
+    "radarr": "/api/v3/movie/{id}",
+}
+_HISTORY_ID_FIELDS: dict[str, str] = {
+    "sonarr": "seriesId",
+    "radarr": "movieId",
+}
+_ID_FIELDS: dict[str, tuple[str, ...]] = {
+    "sonarr": ("tvdbId", "tmdbId", "imdbId", "tvMazeId"),
+    "radarr": ("tmdbId", "imdbId"),
+}
+
+
+def configured_instances(default_config: Mapping[str, Any], service: str) -> list[tuple[str, str, str]]:
+    """Return ``(label, base_url, api_key)`` for every configured instance of ``service``, in priority order."""
+    instances: list[tuple[str, str, str]] = []
+    for instance_index in range(MAX_INSTANCES):
+        suffix = "" if instance_index == 0 else f"_{instance_index}"
+        api_key_value = default_config.get(f"{service}_api_key{suffix}")
+        base_url_value = default_config.get(f"{service}_url{suffix}")
+        # Unconfigured slots are skipped, so configs starting at _1 work too
+        if not isinstance(api_key_value, str) or not api_key_value.strip():
+            continue
+        if not isinstance(base_url_value, str) or not base_url_value.strip():
+            continue
+        label = str(instance_index) if instance_index > 0 else "default"
+        instances.append((label, base_url_value.strip().rstrip("/"), api_key_value.strip()))
+    return instances
+
+
+def _normalise_path(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _normalise_id(field: str, value: Any) -> Optional[str]:
+    if not value:
+        return None
+    if field == "imdbId":
+        value = str(value).lower().replace("tt", "")
+        try:
+            return str(int(value))
+        except ValueError:
+            return None
+    return str(value)
+
+
+class ArrLibraryMirror:
+    """In-memory copy of the Sonarr series / Radarr movie libraries of every configured instance.
+
+    The whole library of each instance is fetched once (all instances concurrently) and indexed by
+    ids, folder path, file path and original release name, so per-item lookups in a queue run don't
+    go to the network. The mirror is shared by every upload in the process. Once a copy is older
+    than ``arr_library_mirror_ttl`` minutes, only the items with history events since the last sync
+    are fetched again and patched into the indexes; the whole library is reloaded once a day (or
+    when the history can't be read), which also picks up items that were added or removed without
+    any file activity. Instances that failed to load are retried on the next lookup without
+    refetching the others.
+    """
+
+    _instances: dict[tuple[Any, ...], "ArrLibraryMirror"] = {}
+
+    def __init__(self, service: str, instances: list[tuple[str, str, str]], ttl: float) -> None:
+        self.service = service
+        self.instances = instances
+        self.ttl = ttl
+        self._labels = [label for label, _, _ in instances]
+        self._items: dict[str, dict[Any, LibraryItem]] = {}
+        self._loaded_at: dict[str, float] = {}
+        self._full_loaded_at: dict[str, float] = {}
+        self._synced_since: dict[str, str] = {}
+        self._failed_at: dict[str, float] = {}
+        # Index key -> {instance label: item}; lookups pick the first instance in priority order
+        self._id_index: dict[tuple[str, str], dict[str, LibraryItem]] = {}
+        self._path_index: dict[str, dict[str, LibraryItem]] = {}
+        self._release_index: dict[str, dict[str, LibraryItem]] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def for_config(cls, default_config: Mapping[str, Any], service: str) -> Optional["ArrLibraryMirror"]:
+        """Return the shared mirror for ``service``, or None if it is disabled or no instance is configured."""
+        if not default_config.get("arr_library_mirror", True):
+            return None
+        instances = configured_instances(default_config, service)
+        if not instances:
+            return None
+        try:
+            ttl = float(default_config.get("arr_library_mirror_ttl", 60)) * 60
+        except (TypeError, ValueError):
+            ttl = 3600.0
+        key = (service, tuple(instances))
+        mirror = cls._instances.get(key)
+        if mirror is None:
+            mirror = cls(service, instances, ttl)
+            cls._instances[key] = mirror
+        mirror.ttl = ttl
+        return mirror
+
+    def _get_lock(self) -> asyncio.Lock:
+        # The mirror outlives a single event loop (e.g. web UI jobs), so the lock is recreated per loop
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def is_fresh(self, label: str) -> bool:
+        """True when the library copy of instance ``label`` was loaded within the TTL."""
+        loaded_at = self._loaded_at.get(label)
+        return loaded_at is not None and time.monotonic() - loaded_at < self.ttl
+
+    def is_complete(self) -> bool:
+        """True when every instance has a fresh copy, so a miss means the item isn't in any library."""
+        return all(self.is_fresh(label) for label, _, _ in self.instances)
+
+    async def _get_json(self, client: httpx.AsyncClient, label: str, url: str, api_key: str, what: str, timeout: float = 10.0, allow_missing: bool = False) -> Any:
+        """GET ``url`` and return the decoded JSON, ``_MISSING`` for a 404 if ``allow_missing``, or None when the request fails."""
+        name = self.service.capitalize()
+        try:
+            response = await client.get(url, headers={"X-Api-Key": api_key, "Content-Type": "application/json"}, timeout=timeout)
+            if allow_missing and response.status_code == 404:
+                return _MISSING
+            if response.status_code != 200:
+                console.print(f"[yellow]Failed to fetch {name} {what} from instance {label}: {response.status_code} - {response.text}[/yellow]")
+                return None
+            return response.json()
+        except httpx.TimeoutException:
+            console.print(f"[red]Timeout when fetching {name} {what} from instance {label}[/red]")
+        except httpx.RequestError as e:
+            console.print(f"[red]Error fetching {name} {what} from instance {label}: {e}[/red]")
+        except Exception as e:
+            console.print(f"[red]Unexpected error fetching {name} {what} from instance {label}: {e}[/red]")
+        return None
+
+    async def _fetch_library(self, client: httpx.AsyncClient, label: str, base_url: str, api_key: str, debug: bool) -> Optional[list[LibraryItem]]:
+        data = await self._get_json(client, label, f"{base_url}{_LIBRARY_ENDPOINTS[self.service]}", api_key, "library", timeout=60.0)
+        if not isinstance(data, list):
+            return None
+        items = [cast(LibraryItem, item) for item in cast(list[Any], data) if isinstance(item, dict)]
+        if debug:
+            console.print(f"[blue]Loaded {len(items)} items from {self.service.capitalize()} instance {label}[/blue]")
+        return items
+
+    async def _fetch_changed_ids(self, client: httpx.AsyncClient, label: str, base_url: str, api_key: str, since: str) -> Optional[tuple[set[int], str]]:
+        """Ids of the series/movies with history events since ``since``, and the timestamp to ask from next time."""
+        data = await self._get_json(client, label, f"{base_url}/api/v3/history/since?date={quote(since)}", api_key, "history")
+        if not isinstance(data, list):
+            return None
+        id_field = _HISTORY_ID_FIELDS[self.service]
+        changed: set[int] = set()
+        latest = since
+        for record in cast(list[Any], data):
+            if not isinstance(record, dict):
+                continue
+            record_dict = cast(Mapping[str, Any], record)
+            item_id = record_dict.get(id_field)
+            if isinstance(item_id, int) and item_id > 0:
+                changed.add(item_id)
+            date = record_dict.get("date")
+            # ISO 8601 UTC timestamps from the same server compare correctly as strings
+            if isinstance(date, str) and date > latest:
+                latest = date
+        return changed, latest
+
+    async def _fetch_item(self, client: httpx.AsyncClient, label: str, base_url: str, api_key: str, item_id: int) -> Any:
+        """One series/movie by its *arr id: the item, ``_MISSING`` if it was deleted, or None when the request fails."""
+        data = await self._get_json(client, label, f"{base_url}{_ITEM_ENDPOINTS[self.service].format(id=item_id)}", api_key, f"item {item_id}", allow_missing=True)
+        if data is _MISSING or isinstance(data, dict):
+            return data
+        return None
+
+    async def _sync_instance(self, client: httpx.AsyncClient, label: str, base_url: str, api_key: str, debug: bool) -> bool:
+        """Bring the copy of one instance up to date: patch the items changed since the last sync, or load the whole library."""
+        since = self._synced_since.get(label)
+        if since is not None and label in self._items and time.monotonic() - self._full_loaded_at.get(label, 0.0) < _FULL_RELOAD_AFTER:
+            changes = await self._fetch_changed_ids(client, label, base_url, api_key, since)
+            if changes is not None and len(changes[0]) <= _MAX_PATCHED_ITEMS:
+                changed_ids = sorted(changes[0])
+                fetched = await asyncio.gather(*[self._fetch_item(client, label, base_url, api_key, item_id) for item_id in changed_ids])
+                if all(item is not None for item in fetched):
+                    for item_id, item in zip(changed_ids, fetched):
+                        self._patch_item(label, item_id, None if item is _MISSING else cast(LibraryItem, item))
+                    self._synced_since[label] = changes[1]
+                    if debug:
+                        console.print(f"[blue]Updated {len(changed_ids)} items from {self.service.capitalize()} instance {label}[/blue]")
+                    return True
+            # No usable history (or too much changed): fall back to a full load
+
+        started = (datetime.now(timezone.utc) - timedelta(seconds=_HISTORY_OVERLAP)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        items = await self._fetch_library(client, label, base_url, api_key, debug)
+        if items is None:
+            return False
+        self._replace_library(label, items)
+        self._full_loaded_at[label] = time.monotonic()
+        self._synced_since[label] = started
+        return True
+
+    async def refresh(self, debug: bool = False) -> None:
+        """Bring every instance whose copy is older than the TTL up to date, concurrently."""
+        async with self._get_lock():
+            now = time.monotonic()
+            stale = [
+                instance
+                for instance in self.instances
+                if not self.is_fresh(instance[0]) and now - self._failed_at.get(instance[0], -_RETRY_FAILED_AFTER) >= _RETRY_FAILED_AFTER
+            ]
+            if not stale:
+                return
+            async with httpx.AsyncClient() as client:
+                results = await asyncio.gather(*[self._sync_instance(client, label, base_url, api_key, debug) for label, base_url, api_key in stale])
+            now = time.monotonic()
+            for (label, _, _), synced in zip(stale, results):
+                if not synced:
+                    self._failed_at[label] = now
+                    continue
+                self._loaded_at[label] = now
+                self._failed_at.pop(label, None)
+
+    def _index_keys(self, item: LibraryItem) -> list[tuple[_Index, Any]]:
+        keys: list[tuple[_Index, Any]] = []
+        for field in _ID_FIELDS[self.service]:
+            value = _normalise_id(field, item.get(field))
+            if value is not None:
+                keys.append((self._id_index, (field, value)))
+        folder = item.get("path")
+        if isinstance(folder, str) and folder:
+            keys.append((self._path_index, _normalise_path(folder)))
+        movie_file = item.get("movieFile")
+        if isinstance(movie_file, dict):
+            movie_file_dict = cast(Mapping[str, Any], movie_file)
+            file_path = movie_file_dict.get("path")
+            if isinstance(file_path, str) and file_path:
+                keys.append((self._path_index, _normalise_path(file_path)))
+            original = movie_file_dict.get("originalFilePath")
+            if isinstance(original, str) and original:
+                keys.append((self._release_index, original))
+        return keys
+
+    def _add_to_indexes(self, label: str, item: LibraryItem) -> None:
+        for index, key in self._index_keys(item):
+            # Within one instance the first item keeps the key, like the sequential per-request lookups
+            index.setdefault(key, {}).setdefault(label, item)
+
+    def _remove_from_indexes(self, label: str, item: LibraryItem) -> None:
+        for index, key in self._index_keys(item):
+            entries = index.get(key)
+            if entries is not None and entries.get(label) is item:
+                del entries[label]
+                if not entries:
+                    del index[key]
+
+    def _replace_library(self, label: str, items: list[LibraryItem]) -> None:
+        for old_item in self._items.get(label, {}).values():
+            self._remove_from_indexes(label, old_item)
+        library: dict[Any, LibraryItem] = {}
+        for position, item in enumerate(items):
+            item_id = item.get("id")
+            library[item_id if isinstance(item_id, int) else ("position", position)] = item
+            self._add_to_indexes(label, item)
+        self._items[label] = library
+
+    def _patch_item(self, label: str, item_id: int, item: Optional[LibraryItem]) -> None:
+        """Replace (or with ``item=None`` drop) one item of an instance's copy, updating only its index keys."""
+        library = self._items.setdefault(label, {})
+        old_item = library.pop(item_id, None)
+        if old_item is not None:
+            self._remove_from_indexes(label, old_item)
+        if item is not None:
+            library[item_id] = item
+            self._add_to_indexes(label, item)
+
+    def _first(self, entries: Optional[dict[str, LibraryItem]]) -> Optional[tuple[str, LibraryItem]]:
+        # Instance priority decides between libraries that share a key
+        if not entries:
+            return None
+        for label in self._labels:
+            item = entries.get(label)
+            if item is not None:
+                return label, item
+        return None
+
+    def find_by_id(self, field: str, value: Any) -> Optional[tuple[str, LibraryItem]]:
+        """Look up an item by ``tvdbId``/``tmdbId``/``imdbId``/``tvMazeId``; returns ``(instance label, item)``."""
+        normalised = _normalise_id(field, value)
+        if normalised is None:
+            return None
+        return self._first(self._id_index.get((field, normalised)))
+
+    def find_by_path(self, path: str) -> Optional[tuple[str, LibraryItem]]:
+        """Find the item whose file or folder is ``path`` or one of its parents."""
+        if not path:
+            return None
+        current = _normalise_path(path)
+        while True:
+            entry = self._first(self._path_index.get(current))
+            if entry is not None:
+                return entry
+            parent = os.path.dirname(current)
+            if parent == current:
+                return None
+            current = parent
+
+    def find_by_release(self, original_file_path: str) -> Optional[tuple[str, LibraryItem]]:
+        """Find a movie by the release name its file was imported from (``movieFile.originalFilePath``)."""
+        if not original_file_path:
+            return None
+        return self._first(self._release_index.get(original_file_path))
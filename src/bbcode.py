@@ -3,8 +3,9 @@ import html
 import os
 import re
 import urllib.parse
-from typing import Any
+from typing import Any, Callable, NamedTuple, Optional, Union, cast
 
+from src.bbcodetree import BBNode, Node, Visitor, parse, render, transform
 from src.console import console
 
 # Bold - KEEP
@@ -35,6 +36,327 @@ from src.console import console
 # IMG - REMOVE?
 # INDENT - Probably not an issue, but maybe just remove tags
 
+# Descriptions are cleaned per tracker and per imported description, so every pattern is compiled once here.
+_HDBITS_RE = re.compile(r"hdbits\.org", re.IGNORECASE)
+_HDB_COMPARISON_LINE_RE = re.compile(r"(.*comparison.*)\n", re.IGNORECASE)
+_HDB_HEADING_RE = re.compile(r"comparison|vs", re.IGNORECASE)
+_HDB_BARE_LINK_RE = re.compile(r"https?:\/\/hdbits\.org", re.IGNORECASE)
+_HDB_STANDALONE_URL_RE = re.compile(r"https?:\/\/(img\.|t\.)?hdbits\.org\/[^\s\[\]]+", re.IGNORECASE)
+_THREE_OR_MORE_NEWLINES_RE = re.compile(r"\n{3,}")
+_WEB_URL_RE = re.compile(r"https?:\/\/", re.IGNORECASE)
+
+_SIZE_OPEN_RE = re.compile(r"\[size=.*?\]")
+_IMG_BLOCK_RE = re.compile(r"\[img\][\s\S]*?\[\/img\]", re.IGNORECASE)
+_IMG_SIZED_OPEN_RE = re.compile(r"\[img=[\s\S]*?\]", re.IGNORECASE)
+_LOOSE_IMAGE_RE = re.compile(r"(https?:\/\/[^\s\[\]]+\.(?:png|jpg))", re.IGNORECASE)
+_BLANK_LINES_RE = re.compile("\n\n+")
+
+_PTP_HDB_LINK_RE = re.compile(r"https?:\/\/(?:passthepopcorn\.m|hdbits\.o)", re.IGNORECASE)
+_PTP_HDB_URL_OPEN_RE = re.compile(r"\[url[\=\]][^\]]*https?:\/\/(?:passthepopcorn\.m|hdbits\.o)[^\]]*\]", re.IGNORECASE)
+_PTP_SOURCE_ENCODE_COMPARISON_RE = re.compile(r"\[comparison=Source, Encode\][\s\S]*", re.IGNORECASE)
+_PTP_SOURCE_VS_ENCODE_RE = re.compile(r"Source Vs Encode:[\s\S]*", re.IGNORECASE)
+_COMPARISON_PLACEHOLDER_RE = re.compile(r"COMPARISON_PLACEHOLDER-(\d+) ")
+_LINK_RE = re.compile(r"https?://\S+")
+_LINK_PLACEHOLDER_RE = re.compile(r"__LINK_PLACEHOLDER_(\d+)__")
+# BDInfo report sections pasted as plain text, removed in this order
+_PTP_BDINFO_SECTION_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"DISC INFO:[\s\S]*?(\n\n|$)",
+        r"Disc Title:[\s\S]*?(\n\n|$)",
+        r"Disc Size:[\s\S]*?(\n\n|$)",
+        r"Protection:[\s\S]*?(\n\n|$)",
+        r"BD-Java:[\s\S]*?(\n\n|$)",
+        r"BDInfo:[\s\S]*?(\n\n|$)",
+        r"PLAYLIST REPORT:[\s\S]*?(?=\n\n|$)",
+        r"Name:[\s\S]*?(\n\n|$)",
+        r"Length:[\s\S]*?(\n\n|$)",
+        r"Size:[\s\S]*?(\n\n|$)",
+        r"Total Bitrate:[\s\S]*?(\n\n|$)",
+        r"VIDEO:[\s\S]*?(?=\n\n|$)",
+        r"AUDIO:[\s\S]*?(?=\n\n|$)",
+        r"SUBTITLES:[\s\S]*?(?=\n\n|$)",
+        r"Codec\s+Bitrate\s+Description[\s\S]*?(?=\n\n|$)",
+        r"Codec\s+Language\s+Bitrate\s+Description[\s\S]*?(?=\n\n|$)",
+    )
+)
+# Plain-text MediaInfo sections, removed in this order (the menu pattern runs on the text plus a blank line)
+_PTP_MEDIAINFO_SECTION_RES = tuple(
+    re.compile(pattern, re.MULTILINE | re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r"(^general\nunique)(.*?)^$",
+        r"(^general\ncomplete)(.*?)^$",
+        r"(^(Format[\s]{2,}:))(.*?)^$",
+        r"(^(video|audio|text)( #\d+)?\nid)(.*?)^$",
+    )
+)
+_PTP_MEDIAINFO_MENU_RE = re.compile(r"(^(menu)( #\d+)?\n)(.*?)^$", re.MULTILINE | re.IGNORECASE | re.DOTALL)
+_PTP_BOLD_SPEC_RE = re.compile(
+    r"\[b\](.*?)(Matroska|DTS|AVC|x264|Progressive|23\.976 fps|16:9|[0-9]+x[0-9]+|[0-9]+ MiB|[0-9]+ Kbps|[0-9]+ bits|cabac=.*?/ aq=.*?|\d+\.\d+ Mbps)\[/b\]",
+    re.IGNORECASE | re.DOTALL,
+)
+_PTP_SPEC_RE = re.compile(
+    r"(Matroska|DTS|AVC|x264|Progressive|23\.976 fps|16:9|[0-9]+x[0-9]+|[0-9]+ MiB|[0-9]+ Kbps|[0-9]+ bits|cabac=.*?/ aq=.*?|\d+\.\d+ Mbps|[0-9]+\s+channels|[0-9]+\.[0-9]+\s+KHz|[0-9]+ KHz|[0-9]+\s+bits)",
+    re.IGNORECASE | re.DOTALL,
+)
+_PTP_SPEC_LABEL_RE = re.compile(r"\[u\](Format|Bitrate|Channels|Sampling Rate|Resolution):\[/u\]\s*\d*.*?", re.IGNORECASE)
+_PTP_SPEC_LINE_RE = re.compile(r"^\s*\d+\s*(channels|KHz|bits)\s*$", re.MULTILINE | re.IGNORECASE)
+_WHITESPACE_LINE_RE = re.compile(r"^\s+$", re.MULTILINE)
+_TWO_OR_MORE_NEWLINES_RE = re.compile(r"\n{2,}")
+_QUOTE_OPEN_RE = re.compile(r"\[quote.*?\]")
+_ALIGN_OPEN_RE = re.compile(r"\[align=.*?\]")
+_IMG_TAG_RE = re.compile(r"\[\/?img[\s\S]*?\]", re.IGNORECASE)
+
+_UNIT3D_BOT_IMAGE_URLS = frozenset(
+    [
+        "https://blutopia.xyz/favicon.ico",  # Example bot image URL
+        "https://i.ibb.co/2NVWb0c/uploadrr.webp",
+        "https://blutopia/favicon.ico",
+        "https://ptpimg.me/606tk4.png",
+        # Add any other known bot image URLs here
+    ]
+)
+_THUMBS_RE = re.compile(r"thumbs", re.IGNORECASE)
+_UNIT3D_BOT_SIGNATURE_RE = re.compile(
+    r"""
+    \[center\]\s*\[img=\d+\]https:\/\/blutopia\.xyz\/favicon\.ico\[\/img\]\s*\[b\]
+    Uploaded\sUsing\s\[url=https:\/\/github\.com\/HDInnovations\/UNIT3D\]UNIT3D\[\/url\]\s
+    Auto\sUploader\[\/b\]\s*\[img=\d+\]https:\/\/blutopia\.xyz\/favicon\.ico\[\/img\]\s*\[\/center\]|
+    \[center\]\s*\[b\]Uploaded\sUsing\s\[url=https:\/\/github\.com\/HDInnovations\/UNIT3D\]UNIT3D\[\/url\]
+    \sAuto\sUploader\[\/b\]\s*\[\/center\]|
+    \[center\]\[url=https:\/\/github\.com\/z-ink\/uploadrr\]\[img=\d+\]https:\/\/i\.ibb\.co\/2NVWb0c\/uploadrr\.webp\[\/img\]\[\/url\]\[\/center\]|
+    \n\[center\]\[url=https:\/\/github\.com\/edge20200\/Only-Uploader\]Powered\sby\s
+    Only-Uploader\[\/url\]\[\/center\]|
+    \[center\]\[url=\/torrents\?perPage=\d+&name=[^\]]*\]\[\/url\]\[\/center\]
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+_AITHER_INTERNAL_SIGNATURE_RE = re.compile(
+    r"\[center\]\[b\]\[size=\d+\]🖌️\[/size\]\[/b\][\s\S]*?This is an internal release which was first released exclusively on Aither\.[\s\S]*?🍻 Cheers to all the Aither.*?\[/center\]",
+    re.IGNORECASE,
+)
+_UA_CENTER_SIGNATURE_RE = re.compile(r"\[center\].*Created by.*Upload Assistant.*\[\/center\]", re.IGNORECASE)
+_UA_RIGHT_SIGNATURE_RE = re.compile(r"\[right\].*Created by.*Upload Assistant.*\[\/right\]", re.IGNORECASE)
+_UNIT3D_WEB_URL_RE = re.compile(r"https?://[^\]]+", re.IGNORECASE)
+# [center] blocks up to the first [/center], as the UNIT3D cleaner matched them before the tree
+_UNIT3D_CENTER_BLOCK_RE = re.compile(r"\[center[\s\S]*?\[\/center\]")
+_UNIT3D_EMPTY_CENTER_RE = re.compile(r"\[center\]\s*\[\/center\]")
+_UNIT3D_CENTER_OPEN_SPACE_RE = re.compile(r"\[center\]\s+")
+_UNIT3D_CENTER_CLOSE_SPACE_RE = re.compile(r"\s*\[\/center\]")
+
+_ANY_TAG_RE = re.compile(r"\[/?[a-zA-Z0-9]+(?:=[^\]]*)?\]")
+_NAMED_SPOILER_OPEN_RE = re.compile(r"\[spoiler=([^\[\]]+)]", re.IGNORECASE)
+_SPOILER_TAG_RE = re.compile(r"\[\/?spoiler[^\[\]]*\]", re.IGNORECASE)
+_NAMED_SPOILER_RE = re.compile(r"(\[spoiler=[^\[\]]+])", re.IGNORECASE)
+_IMG_OPEN_RE = re.compile(r"\[img[^\[\]]*\]", re.IGNORECASE)
+_ALIGN_NAME_OPEN_RE = re.compile(r"\[(right|center|left)\]")
+_ALIGN_NAME_CLOSE_RE = re.compile(r"\[/(right|center|left)\]")
+_COMPARISON_RE = re.compile(r"\[comparison=[\s\S]*?\[\/comparison\]")
+_COMPARISON_IMAGE_RE = re.compile(r"(https?:\/\/.*\.(?:png|jpg))", re.IGNORECASE)
+_COMMA_SPACED_RE = re.compile(r"\s*,\s*")
+_IMG_ANY_BLOCK_RE = re.compile(r"\[img[\s\S]*?\[\/img\]", re.IGNORECASE)
+_IMG_OPEN_GREEDY_RE = re.compile(r"\[img[\s\S]*\]", re.IGNORECASE)
+_SPOILER_OPEN_LAZY_RE = re.compile(r"\[spoiler[\s\S]*?\]")
+_HIDE_OPEN_LAZY_RE = re.compile(r"\[hide[\s\S]*?\]")
+_COMPARISON_WORD_RE = re.compile("comparison", re.IGNORECASE)
+
+# A conversion either respells tags, or rebuilds whole blocks. A rewrite only ever matches from a
+# "[" to the next "]" with no bracket in between, so it can't reach across a tag and runs on the
+# string at str.replace speed: the same as rewriting each tag of the tree, without building one
+Rewrite = Callable[[str], str]
+
+
+class BlockConversion(NamedTuple):
+    """Rebuild each block ``matches`` accepts from its markup; ``build`` returns None to keep the block.
+
+    ``marker`` is text every such block starts with: without it in the description there is nothing to parse.
+    """
+
+    marker: str
+    matches: Callable[[BBNode], bool]
+    build: Callable[[str], Optional[str]]
+
+
+Conversion = Union[Rewrite, BlockConversion]
+
+
+def _replace(*pairs: tuple[str, str]) -> Rewrite:
+    def rewrite(text: str) -> str:
+        for old, new in pairs:
+            text = text.replace(old, new)
+        return text
+
+    return rewrite
+
+
+def _sub(pattern: re.Pattern[str], replacement: str) -> Rewrite:
+    return lambda text: pattern.sub(replacement, text)
+
+
+def _chain(*rewrites: Rewrite) -> Rewrite:
+    def rewrite(text: str) -> str:
+        for each in rewrites:
+            text = each(text)
+        return text
+
+    return rewrite
+
+
+def remove_tags(*names: str) -> Rewrite:
+    """Drop the ``[name]`` and ``[/name]`` tags of each of ``names``, keeping what they wrap."""
+    return _replace(*((tag, "") for name in names for tag in (f"[{name}]", f"[/{name}]")))
+
+
+PRE_TO_CODE = _replace(("[pre]", "[code]"), ("[/pre]", "[/code]"))
+CODE_TO_PRE = _replace(("[code]", "[pre]"), ("[/code]", "[/pre]"))
+HIDE_TO_SPOILER = _replace(("[hide", "[spoiler"), ("[/hide]", "[/spoiler]"))
+SPOILER_TO_HIDE = _replace(("[spoiler", "[hide"), ("[/spoiler]", "[/hide]"))
+SPOILER_TO_CODE = _replace(("[spoiler", "[code"), ("[/spoiler]", "[/code]"))
+CODE_TO_QUOTE = _replace(("[code", "[quote"), ("[/code]", "[/quote]"))
+REMOVE_HIDE = remove_tags("hide")
+REMOVE_SUP = remove_tags("sup")
+REMOVE_SUB = remove_tags("sub")
+REMOVE_LIST = remove_tags("list")
+
+
+NAMED_SPOILER_TO_NAMED_HIDE = _chain(_sub(_NAMED_SPOILER_OPEN_RE, r"[hide=\1]"), _replace(("[/spoiler]", "[/hide]")))
+REMOVE_SPOILER = _sub(_SPOILER_TAG_RE, "")
+NAMED_SPOILER_TO_NORMAL_SPOILER = _sub(_NAMED_SPOILER_RE, "[spoiler]")
+REMOVE_IMG_RESIZE = _sub(_IMG_OPEN_RE, "[img]")
+TO_ALIGN = _chain(_sub(_ALIGN_NAME_OPEN_RE, r"[align=\1]"), _sub(_ALIGN_NAME_CLOSE_RE, "[/align]"))
+
+
+def _comparison_rows(comp: str, comp_sources: list[str], max_width: int) -> str:
+    """Lay the images of a [comparison] block out as linked thumbnails, one row per set of sources."""
+    line: list[str] = []
+    output: list[str] = []
+    comp_images_text = comp.split("]", 1)[1].replace("[/comparison]", "").replace(",", "\n").replace(" ", "\n")
+    comp_images: list[str] = _COMPARISON_IMAGE_RE.findall(comp_images_text)
+    screens_per_line = len(comp_sources)
+    img_size = int(max_width / screens_per_line)
+    if img_size > 350:
+        img_size = 350
+    for img in comp_images:
+        img = img.strip()
+        if img != "":
+            bb = f"[url={img}][img={img_size}]{img}[/img][/url]"
+            line.append(bb)
+            if len(line) == screens_per_line:
+                output.append("".join(line))
+                line = []
+    return "\n".join(output)
+
+
+def _is_comparison(node: BBNode) -> bool:
+    return node.open_raw.startswith("[comparison=") and node.close_raw == "[/comparison]"
+
+
+def comparison_to_collapse(max_width: int) -> BlockConversion:
+    """[comparison=A, B] blocks as a spoiler named "A vs B" holding rows of thumbnails."""
+
+    def to_collapse(comp: str) -> str:
+        comp_sources = comp.split("]", 1)[0].replace("[comparison=", "").replace(" ", "").split(",")
+        output_str = _comparison_rows(comp, comp_sources, max_width)
+        return f"[spoiler={' vs '.join(comp_sources)}][center]{' | '.join(comp_sources)}[/center]\n{output_str}[/spoiler]"
+
+    return BlockConversion("[comparison=", _is_comparison, to_collapse)
+
+
+def comparison_to_centered(max_width: int) -> BlockConversion:
+    """[comparison=A, B] blocks as a centered "A | B" heading over rows of thumbnails."""
+
+    def to_centered(comp: str) -> str:
+        comp_sources = _COMMA_SPACED_RE.split(comp.split("]", 1)[0].replace("[comparison=", "").strip())
+        output_str = _comparison_rows(comp, comp_sources, max_width)
+        return f"[center]{' | '.join(comp_sources)}\n{output_str}[/center]"
+
+    return BlockConversion("[comparison=", _is_comparison, to_centered)
+
+
+def collapse_to_comparison(spoiler_hide: str) -> BlockConversion:
+    """Named [spoiler]/[hide] blocks (``spoiler_hide``) holding six images or more as [comparison=...] blocks."""
+
+    def matches(node: BBNode) -> bool:
+        return node.open_raw.startswith(f"[{spoiler_hide}") and node.close_raw == f"[/{spoiler_hide}]"
+
+    def to_comparison(tag: str) -> Optional[str]:
+        images = _IMG_ANY_BLOCK_RE.findall(tag)
+        if len(images) < 6:
+            return None
+        comp_images = [_IMG_OPEN_GREEDY_RE.sub("", image.replace("[/img]", "")) for image in images]
+        sources = ""
+        if spoiler_hide == "spoiler":
+            spoiler_match = _SPOILER_OPEN_LAZY_RE.match(tag)
+            if spoiler_match:
+                sources = spoiler_match[0].replace("[spoiler=", "")[:-1]
+        elif spoiler_hide == "hide":
+            hide_match = _HIDE_OPEN_LAZY_RE.match(tag)
+            if hide_match:
+                sources = hide_match[0].replace("[hide=", "")[:-1]
+        if not sources:
+            return None
+        sources = _COMPARISON_WORD_RE.sub("", sources)
+        for each in ["vs", ",", "|"]:
+            sources_list = sources.split(each)
+            sources = "$".join(sources_list)
+        final_sources = [source.strip() for source in sources.split("$")]
+        comp_images_str = "\n".join(comp_images)
+        final_sources_str = ", ".join(final_sources)
+        return f"[comparison={final_sources_str}]{comp_images_str}[/comparison]"
+
+    return BlockConversion(f"[{spoiler_hide}", matches, to_comparison)
+
+
+# PTP hides full of screenshots are comparisons
+_HIDE_TO_COMPARISON = collapse_to_comparison("hide")
+
+
+def _rewrite_tags(rewrite: Rewrite) -> Visitor:
+    """Respell each tag pair with ``rewrite``; a pair rewritten away leaves what it wrapped."""
+
+    def visit(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+        _ = ancestors
+        open_raw, close_raw = rewrite(node.open_raw), rewrite(node.close_raw)
+        if open_raw == node.open_raw and close_raw == node.close_raw:
+            return None
+        if not open_raw and not close_raw:
+            return node.children
+        node.retag(open_raw, close_raw)
+        return None
+
+    return visit
+
+
+def _rebuild_blocks(block: BlockConversion) -> Visitor:
+    # The built markup goes back as text: nothing after the block conversion looks inside it
+    def visit(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+        _ = ancestors
+        if not block.matches(node):
+            return None
+        built = block.build(render([node]))
+        return None if built is None else [built]
+
+    return visit
+
+
+def _drop_hdb_comparison_lines(desc: str) -> str:
+    """Drop each line mentioning a comparison, with the two lines after it, when those three lines link to HDBits.
+
+    Headings inside a [center] are left to the tree, which drops the whole section.
+    """
+    kept: list[str] = []
+    position = 0
+    for line in _HDB_COMPARISON_LINE_RE.finditer(desc):
+        start = line.start()
+        if start < position or "[center" in line.group(1).lower():
+            continue
+        window = "\n".join(desc[start : start + 500].split("\n", 3)[:3])
+        if _HDBITS_RE.search(window):
+            kept.append(desc[position:start])
+            position = start + len(window)
+    kept.append(desc[position:])
+    return "".join(kept)
+
 
 class BBCODE:
     def __init__(self) -> None:
@@ -46,82 +368,71 @@ class BBCODE:
         desc = desc.replace("\r\n", "\n")
         imagelist: list[dict[str, Any]] = []
 
-        # First pass: Remove entire comparison sections
-        # Start by finding section headers for comparisons
-        comparison_sections = re.finditer(r"\[center\]\s*\[b\].*?(Comparison|vs).*?\[\/b\][\s\S]*?\[\/center\]", desc, flags=re.IGNORECASE)
-        for section in comparison_sections:
-            section_text = section.group(0)
-            # If section contains hdbits.org, remove the entire section
-            if re.search(r"hdbits\.org", section_text, flags=re.IGNORECASE):
-                desc = desc.replace(section_text, "")
-
-        # Handle individual comparison lines
-        comparison_lines = re.finditer(r"(.*comparison.*)\n", desc, flags=re.IGNORECASE)
-        for comp_match in comparison_lines:
-            comp_pos = comp_match.start()
-
-            # Get the next lines after the comparison line
-            next_lines = desc[comp_pos : comp_pos + 500].split("\n", 3)[:3]  # Get comparison line + 2 more lines
-            next_lines_text = "\n".join(next_lines)
-
-            # Check if any of these lines contain HDBits URLs
-            if re.search(r"hdbits\.org", next_lines_text, flags=re.IGNORECASE):
-                # Replace the entire section (comparison line + next 2 lines)
-                line_end_pos = comp_pos + len(next_lines_text)
-                to_remove = desc[comp_pos:line_end_pos]
-                desc = desc.replace(to_remove, "")
-
-        # Remove all empty URL tags containing hdbits.org
-        desc = re.sub(r"\[url=https?:\/\/(img\.|t\.)?hdbits\.org[^\]]*\]\[\/url\]", "", desc, flags=re.IGNORECASE)
-
-        # Remove URL tags with visible content
-        hdbits_urls = re.findall(r"(\[url[\=\]]https?:\/\/(img\.|t\.)?hdbits\.org[^\]]+\])(.*?)(\[\/url\])?", desc, flags=re.IGNORECASE)
-        for url_parts in hdbits_urls:
-            full_url = "".join(url_parts)
-            desc = desc.replace(full_url, "")
-
-        # Remove HDBits image tags
-        hdbits_imgs = re.findall(r"\[img\][\s\S]*?(img\.|t\.)?hdbits\.org[\s\S]*?\[\/img\]", desc, flags=re.IGNORECASE)
-        for img_tag in hdbits_imgs:
-            desc = desc.replace(img_tag, "")
-
-        # Remove any standalone HDBits URLs
-        standalone_urls = re.findall(r"https?:\/\/(img\.|t\.)?hdbits\.org\/[^\s\[\]]+", desc, flags=re.IGNORECASE)
-        for url in standalone_urls:
-            desc = desc.replace(url, "")
-
-        # Catch any remaining URL tags with hdbits.org in them
-        desc = re.sub(r"\[url[^\]]*hdbits\.org[^\]]*\](.*?)\[\/url\]", "", desc, flags=re.IGNORECASE)
-
-        # Double-check for any self-closing URL tags that might have been missed
-        desc = re.sub(r"\[url=https?:\/\/[^\]]*hdbits\.org[^\]]*\]\[\/url\]", "", desc, flags=re.IGNORECASE)
-
-        # Remove empty comparison section headers and center tags
-        desc = re.sub(r"\[center\]\s*\[b\].*?(Comparison|vs).*?\[\/b\][\s\S]*?\[\/center\]", "", desc, flags=re.IGNORECASE)
-
-        # Remove any empty center tags that might be left
-        desc = re.sub(r"\[center\]\s*\[\/center\]", "", desc, flags=re.IGNORECASE)
-
-        # Clean up multiple consecutive newlines
-        desc = re.sub(r"\n{3,}", "\n\n", desc)
+        # Comparison lines are about lines rather than tags, so they go before the tree is built
+        desc = _drop_hdb_comparison_lines(desc)
+
+        def is_center(node: BBNode) -> bool:
+            return node.open_raw.lower() == "[center]" and node.close_raw.lower() == "[/center]"
+
+        def is_comparison_section(node: BBNode) -> bool:
+            # [center][b]Source vs Encode[/b] ...[/center]
+            children = node.children
+            if children and isinstance(children[0], str) and not children[0].strip():
+                children = children[1:]
+            if not children or not isinstance(children[0], BBNode) or children[0].open_raw.lower() != "[b]":
+                return False
+            heading = children[0].text()
+            return "\n" not in heading and bool(_HDB_HEADING_RE.search(heading))
+
+        def remove_hdbits(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+            _ = ancestors
+            if node.name == "img":
+                # HDBits images, and images left empty by the removal of HDBits links
+                content = node.text()
+                return [] if _HDBITS_RE.search(content) or not content.strip() else None
+            if node.name != "url":
+                return None
+            if _HDBITS_RE.search(node.open_raw):
+                # Links to the bare domain keep their text; image host links go with what they wrap
+                return node.children if _HDB_BARE_LINK_RE.match(node.arg or "") else []
+            return [] if node.arg is None and not node.text().strip() else None
 
         # Extract images wrapped in URL tags (e.g., [url=https://imgbox.com/xxx][img]https://thumbs.imgbox.com/xxx[/img][/url])
-        url_img_pattern = r"\[url=(https?:\/\/[^\]]+)\]\[img\](https?:\/\/[^\]]+)\[\/img\]\[\/url\]"
-        url_img_matches: list[tuple[str, str]] = re.findall(url_img_pattern, desc, flags=re.IGNORECASE)
-        for web_url, img_url in url_img_matches:
-            # Skip HDBits images
-            if "hdbits.org" in web_url.lower() or "hdbits.org" in img_url.lower():
-                desc = desc.replace(f"[url={web_url}][img]{img_url}[/img][/url]", "")
-                continue
-
+        def extract_url_image(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+            _ = ancestors
+            if node.name != "url" or node.open_raw[4:5] != "=" or not _WEB_URL_RE.match(node.arg or "") or len(node.children) != 1:
+                return None
+            img = node.children[0]
+            if not isinstance(img, BBNode) or img.open_raw.lower() != "[img]" or len(img.children) != 1:
+                return None
+            img_url = img.children[0]
+            if not isinstance(img_url, str) or not _WEB_URL_RE.match(img_url):
+                return None
+            web_url = node.arg or ""
             raw_url = img_url
             if "thumbs2.imgbox.com" in img_url:
                 raw_url = img_url.replace("thumbs2.imgbox.com", "images2.imgbox.com")
                 raw_url = raw_url.replace("_t.png", "_o.png")
+            imagelist.append({"img_url": img_url, "raw_url": raw_url, "web_url": web_url})
+            # Only the lower-case spelling is removed
+            lower_case = node.open_raw == f"[url={web_url}]" and node.close_raw == "[/url]" and img.open_raw == "[img]" and img.close_raw == "[/img]"
+            return [] if lower_case else None
+
+        def remove_centers(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+            _ = ancestors
+            # Comparison sections (their HDBits images are gone by now) and centers left empty
+            if not is_center(node):
+                return None
+            if is_comparison_section(node) or all(isinstance(child, str) and not child.strip() for child in node.children):
+                return []
+            return None
+
+        # Standalone HDBits URLs are text; the tags are handled in the same traversal
+        nodes = transform(parse(desc), remove_hdbits, extract_url_image, remove_centers, text=lambda text: _HDB_STANDALONE_URL_RE.sub("", text))
+        desc = render(nodes)
 
-            image_dict = {"img_url": img_url, "raw_url": raw_url, "web_url": web_url}
-            imagelist.append(image_dict)
-            desc = desc.replace(f"[url={web_url}][img]{img_url}[/img][/url]", "")
+        # Clean up multiple consecutive newlines
+        desc = _THREE_OR_MORE_NEWLINES_RE.sub("\n\n", desc)
 
         description = desc.strip()
         if self.is_only_bbcode(description):
@@ -148,33 +459,35 @@ class BBCODE:
             meta["nfo"] = True
             meta["bhd_nfo"] = True
 
-        # Remove size tags
-        desc = re.sub(r"\[size=.*?\]", "", desc)
-        desc = desc.replace("[/size]", "")
         desc = desc.replace("<", "/")
         desc = desc.replace("<", "\\")
 
-        # Remove Images in IMG tags
-        desc = re.sub(r"\[img\][\s\S]*?\[\/img\]", "", desc, flags=re.IGNORECASE)
-        desc = re.sub(r"\[img=[\s\S]*?\]", "", desc, flags=re.IGNORECASE)
+        # Remove size tags and Images in IMG tags; a sized [img=...] keeps its link, which is taken as a loose image below
+        remove_sizes = _chain(_sub(_SIZE_OPEN_RE, ""), _replace(("[/size]", "")))
 
-        # Extract loose images and add to imagelist as dictionaries
-        loose_images = re.findall(r"(https?:\/\/[^\s\[\]]+\.(?:png|jpg))", desc, flags=re.IGNORECASE)
-        for img_url in loose_images:
-            image_dict = {"img_url": img_url, "raw_url": img_url, "web_url": img_url}
-            imagelist.append(image_dict)
-            desc = desc.replace(img_url, "")
+        def remove_images(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+            _ = ancestors
+            if node.open_raw.lower() == "[img]":
+                return []
+            return node.children if node.name == "img" and node.open_raw[4:5] == "=" else None
 
-        # Now, remove matching URLs from [URL] tags
-        for img in imagelist:
-            img_url = re.escape(img["img_url"])
-            desc = re.sub(rf"\[URL={img_url}\]\[/URL\]", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(rf"\[URL={img_url}\]\[img[^\]]*\]{img_url}\[/img\]\[/URL\]", "", desc, flags=re.IGNORECASE)
+        nodes = transform(parse(desc), _rewrite_tags(remove_sizes), remove_images, text=_chain(remove_sizes, _sub(_IMG_BLOCK_RE, ""), _sub(_IMG_SIZED_OPEN_RE, "")))
 
-        # Remove leftover [img] or [URL] tags in the description
-        desc = re.sub(r"\[img\][\s\S]*?\[\/img\]", "", desc, flags=re.IGNORECASE)
-        desc = re.sub(r"\[img=[\s\S]*?\]", "", desc, flags=re.IGNORECASE)
-        desc = re.sub(r"\[URL=[\s\S]*?\]\[\/URL\]", "", desc, flags=re.IGNORECASE)
+        # Extract loose images and add to imagelist as dictionaries; taking them out of the tag
+        # arguments too empties any [URL=image][/URL] wrapper, which is dropped with them
+        def extract_loose_images(text: str) -> str:
+            imagelist.extend({"img_url": img_url, "raw_url": img_url, "web_url": img_url} for img_url in _LOOSE_IMAGE_RE.findall(text))
+            return _LOOSE_IMAGE_RE.sub("", text)
+
+        def remove_linked_images(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+            _ = ancestors
+            open_raw = extract_loose_images(node.open_raw)
+            if open_raw != node.open_raw:
+                node.retag(open_raw, node.close_raw)
+            empty_link = node.open_raw[:5].lower() == "[url=" and node.close_raw.lower() == "[/url]" and not node.children
+            return [] if empty_link else None
+
+        desc = render(transform(nodes, remove_linked_images, text=extract_loose_images))
 
         if meta.get("flux", False):
             # Strip trailing whitespace and newlines:
@@ -182,7 +495,7 @@ class BBCODE:
 
             # Strip blank lines:
             desc = desc.strip("\n")
-            desc = re.sub("\n\n+", "\n\n", desc)
+            desc = _BLANK_LINES_RE.sub("\n\n", desc)
             while desc.startswith("\n"):
                 desc = desc.replace("\n", "", 1)
             desc = desc.strip("\n")
@@ -210,185 +523,130 @@ class BBCODE:
         desc = html.unescape(desc)
         desc = desc.replace("\r\n", "\n")
 
-        # Remove url tags with PTP/HDB links
-        url_tags: list[str] = re.findall(
-            r"(?:\[url(?:=|\])[^\]]*https?:\/\/passthepopcorn\.m[^\]]*\]|\bhttps?:\/\/passthepopcorn\.m[^\s]+)",
-            desc,
-            flags=re.IGNORECASE,
-        )
-        url_tags += [
-            "".join(tag)
-            for tag in re.findall(
-                r"(\[url[\=\]]https?:\/\/hdbits\.o[^\]]+)([^\[]+)(\[\/url\])?",
-                desc,
-                flags=re.IGNORECASE,
-            )
-        ]
-        if url_tags:
-            for url_tag in url_tags:
-                url_tag_removed = re.sub(r"(\[url[\=\]]https?:\/\/passthepopcorn\.m[^\]]+])", "", url_tag, flags=re.IGNORECASE)
-                url_tag_removed = re.sub(r"(\[url[\=\]]https?:\/\/hdbits\.o[^\]]+])", "", url_tag_removed, flags=re.IGNORECASE)
-                url_tag_removed = url_tag_removed.replace("[/url]", "")
-                desc = desc.replace(url_tag, url_tag_removed)
-
-        # Remove links to PTP/HDB
-        desc = desc.replace("http://passthepopcorn.me", "PTP").replace("https://passthepopcorn.me", "PTP")
-        desc = desc.replace("http://hdbits.org", "HDB").replace("https://hdbits.org", "HDB")
-
         # Catch Stray Images and Prepare Image List
         imagelist: list[dict[str, Any]] = []
-        excluded_urls: set[str] = set()
-
-        source_encode_comps = re.findall(r"\[comparison=Source, Encode\][\s\S]*", desc, flags=re.IGNORECASE)
-        source_vs_encode_sections = re.findall(r"Source Vs Encode:[\s\S]*", desc, flags=re.IGNORECASE)
-        specific_cases = source_encode_comps + source_vs_encode_sections
 
-        # Extract URLs and update excluded_urls
-        for block in specific_cases:
-            urls = re.findall(r"(https?:\/\/[^\s\[\]]+\.(?:png|jpg))", block, flags=re.IGNORECASE)
-            excluded_urls.update(urls)
-            desc = desc.replace(block, "")
+        # Source vs encode comparisons run to the end of the description: cut them off and keep their images out of the list
+        cut = len(desc)
+        for specific_case_re in (_PTP_SOURCE_ENCODE_COMPARISON_RE, _PTP_SOURCE_VS_ENCODE_RE):
+            specific_case = specific_case_re.search(desc)
+            if specific_case:
+                cut = min(cut, specific_case.start())
+        excluded_urls: set[str] = set(_LOOSE_IMAGE_RE.findall(desc[cut:]))
+        desc = desc[:cut]
 
-        # General [comparison=...] handling
-        comps = re.findall(r"\[comparison=[\s\S]*?\[\/comparison\]", desc, flags=re.IGNORECASE)
-        hides = re.findall(r"\[hide[\s\S]*?\[\/hide\]", desc, flags=re.IGNORECASE)
-        comps.extend(hides)
-        nocomp = desc
+        # Convert Quote tags, remove Alignments, size tags and Movie/Person/User/hr/Indent; unclosed and stray ones are text
+        remove_list = ["[movie]", "[/movie]", "[artist]", "[/artist]", "[user]", "[/user]", "[indent]", "[/indent]", "[size]", "[/size]", "[hr]"]
+        tag_rewrite = _chain(
+            _sub(_QUOTE_OPEN_RE, "[code]"),
+            _replace(("[/quote]", "[/code]")),
+            _sub(_ALIGN_OPEN_RE, ""),
+            _replace(("[/align]", "")),
+            _sub(_SIZE_OPEN_RE, ""),
+            _replace(("[/size]", ""), *((each, "") for each in remove_list)),
+            _sub(_IMG_BLOCK_RE, ""),
+            _sub(_IMG_SIZED_OPEN_RE, ""),
+        )
+        convert_tags = _rewrite_tags(tag_rewrite)
 
-        # Exclude URLs from excluded array fom `nocomp`
-        for url in excluded_urls:
-            nocomp = nocomp.replace(url, "")
+        def is_comparison_or_hide(node: BBNode) -> bool:
+            comparison = node.open_raw[:12].lower() == "[comparison=" and node.close_raw.lower() == "[/comparison]"
+            return comparison or (node.open_raw[:5].lower() == "[hide" and node.close_raw.lower() == "[/hide]")
 
+        # Replace comparison/hide tags with placeholder because sometimes uploaders use comp images as loose images
         comp_placeholders: list[str] = []
 
-        # Replace comparison/hide tags with placeholder because sometimes uploaders use comp images as loose images
-        for i, comp in enumerate(comps):
-            nocomp = nocomp.replace(comp, "")
-            desc = desc.replace(comp, f"COMPARISON_PLACEHOLDER-{i} ")
-            comp_placeholders.append(comp)
+        def set_aside(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+            if not is_comparison_or_hide(node) or any(is_comparison_or_hide(ancestor) for ancestor in ancestors):
+                return None
+            comp = render([node])
+            # Convert hides with multiple images to comparison
+            converted = _HIDE_TO_COMPARISON.build(comp) if _HIDE_TO_COMPARISON.matches(node) else None
+            comp_placeholders.append(converted if converted is not None else _IMG_TAG_RE.sub("", comp))
+            return [f"COMPARISON_PLACEHOLDER-{len(comp_placeholders) - 1} "]
+
+        def remove_blocks(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+            if any(is_comparison_or_hide(ancestor) for ancestor in ancestors):
+                return None
+            # Remove MediaInfo, Videos and Staff tags
+            if (node.open_raw, node.close_raw) in (("[mediainfo]", "[/mediainfo]"), ("[video]", "[/video]")):
+                return []
+            if node.open_raw.startswith("[staff") and node.close_raw == "[/staff]":
+                return []
+            # Remove Images in IMG tags; their links are taken as loose images below
+            if node.open_raw.lower() == "[img]" or node.open_raw[:5].lower() == "[img=":
+                return ["".join(_LOOSE_IMAGE_RE.findall(node.text()))]
+            return convert_tags(node, ancestors)
+
+        def unlink(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+            _ = ancestors
+            # Remove url tags with PTP/HDB links, keeping their text
+            return node.children if node.name == "url" and _PTP_HDB_LINK_RE.search(node.open_raw) else None
+
+        # Remove links to PTP/HDB (the opening tags of unclosed links are text)
+        link_names = _replace(("http://passthepopcorn.me", "PTP"), ("https://passthepopcorn.me", "PTP"), ("http://hdbits.org", "HDB"), ("https://hdbits.org", "HDB"))
+
+        desc = render(transform(parse(desc), set_aside, remove_blocks, unlink, text=_chain(_sub(_PTP_HDB_URL_OPEN_RE, ""), link_names, tag_rewrite)))
+
+        # Extract loose images and add to imagelist as dictionaries
+        loose_images: list[str] = _LOOSE_IMAGE_RE.findall(desc)
+        for img_url in loose_images:
+            if img_url not in excluded_urls:  # Only include URLs not part of excluded sections
+                image_dict = {"img_url": img_url, "raw_url": img_url, "web_url": img_url}
+                imagelist.append(image_dict)
 
         # as the name implies, protect image links while doing regex things
         def protect_links(desc: str) -> tuple[str, list[str]]:
-            links: list[str] = re.findall(r"https?://\S+", desc)
-            for i, link in enumerate(links):
-                desc = desc.replace(link, f"__LINK_PLACEHOLDER_{i}__")
-            return desc, links
+            links: list[str] = []
+
+            def protect(link: re.Match[str]) -> str:
+                links.append(link.group(0))
+                return f"__LINK_PLACEHOLDER_{len(links) - 1}__"
+
+            return _LINK_RE.sub(protect, desc), links
 
         def restore_links(desc: str, links: list[str]) -> str:
-            for i, link in enumerate(links):
-                desc = desc.replace(f"__LINK_PLACEHOLDER_{i}__", link)
-            return desc
+            if not links:
+                return desc
+            return _LINK_PLACEHOLDER_RE.sub(lambda placeholder: links[int(placeholder.group(1))] if int(placeholder.group(1)) < len(links) else placeholder.group(0), desc)
 
         links: list[str] = []
 
-        if is_disc == "DVD":
-            desc = re.sub(r"\[mediainfo\][\s\S]*?\[\/mediainfo\]", "", desc)
-
-        elif is_disc == "BDMV":
-            desc = re.sub(r"\[mediainfo\][\s\S]*?\[\/mediainfo\]", "", desc)
-            desc = re.sub(r"DISC INFO:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Disc Title:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Disc Size:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Protection:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"BD-Java:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"BDInfo:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"PLAYLIST REPORT:[\s\S]*?(?=\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Name:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Length:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Size:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Total Bitrate:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"VIDEO:[\s\S]*?(?=\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"AUDIO:[\s\S]*?(?=\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"SUBTITLES:[\s\S]*?(?=\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Codec\s+Bitrate\s+Description[\s\S]*?(?=\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Codec\s+Language\s+Bitrate\s+Description[\s\S]*?(?=\n\n|$)", "", desc, flags=re.IGNORECASE)
+        # MediaInfo and BDInfo reports pasted as text
+        if is_disc == "BDMV":
+            for section_re in _PTP_BDINFO_SECTION_RES:
+                desc = section_re.sub("", desc)
 
-        else:
-            desc = re.sub(r"\[mediainfo\][\s\S]*?\[\/mediainfo\]", "", desc)
-            desc = re.sub(r"(^general\nunique)(.*?)^$", "", desc, flags=re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            desc = re.sub(r"(^general\ncomplete)(.*?)^$", "", desc, flags=re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            desc = re.sub(r"(^(Format[\s]{2,}:))(.*?)^$", "", desc, flags=re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            desc = re.sub(r"(^(video|audio|text)( #\d+)?\nid)(.*?)^$", "", desc, flags=re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            desc = re.sub(r"(^(menu)( #\d+)?\n)(.*?)^$", "", f"{desc}\n\n", flags=re.MULTILINE | re.IGNORECASE | re.DOTALL)
+        elif is_disc != "DVD":
+            for section_re in _PTP_MEDIAINFO_SECTION_RES:
+                desc = section_re.sub("", desc)
+            desc = _PTP_MEDIAINFO_MENU_RE.sub("", f"{desc}\n\n")
 
             desc, links = protect_links(desc)
 
-            desc = re.sub(
-                r"\[b\](.*?)(Matroska|DTS|AVC|x264|Progressive|23\.976 fps|16:9|[0-9]+x[0-9]+|[0-9]+ MiB|[0-9]+ Kbps|[0-9]+ bits|cabac=.*?/ aq=.*?|\d+\.\d+ Mbps)\[/b\]",
-                "",
-                desc,
-                flags=re.IGNORECASE | re.DOTALL,
-            )
-            desc = re.sub(
-                r"(Matroska|DTS|AVC|x264|Progressive|23\.976 fps|16:9|[0-9]+x[0-9]+|[0-9]+ MiB|[0-9]+ Kbps|[0-9]+ bits|cabac=.*?/ aq=.*?|\d+\.\d+ Mbps|[0-9]+\s+channels|[0-9]+\.[0-9]+\s+KHz|[0-9]+ KHz|[0-9]+\s+bits)",
-                "",
-                desc,
-                flags=re.IGNORECASE | re.DOTALL,
-            )
-            desc = re.sub(
-                r"\[u\](Format|Bitrate|Channels|Sampling Rate|Resolution):\[/u\]\s*\d*.*?",
-                "",
-                desc,
-                flags=re.IGNORECASE,
-            )
-            desc = re.sub(
-                r"^\s*\d+\s*(channels|KHz|bits)\s*$",
-                "",
-                desc,
-                flags=re.MULTILINE | re.IGNORECASE,
-            )
-
-            desc = re.sub(r"^\s+$", "", desc, flags=re.MULTILINE)
-            desc = re.sub(r"\n{2,}", "\n", desc)
+            desc = _PTP_BOLD_SPEC_RE.sub("", desc)
+            desc = _PTP_SPEC_RE.sub("", desc)
+            desc = _PTP_SPEC_LABEL_RE.sub("", desc)
+            desc = _PTP_SPEC_LINE_RE.sub("", desc)
 
-        desc = restore_links(desc, links)
-
-        # Convert Quote tags:
-        desc = re.sub(r"\[quote.*?\]", "[code]", desc)
-        desc = desc.replace("[/quote]", "[/code]")
-
-        # Remove Alignments:
-        desc = re.sub(r"\[align=.*?\]", "", desc)
-        desc = desc.replace("[/align]", "")
-
-        # Remove size tags
-        desc = re.sub(r"\[size=.*?\]", "", desc)
-        desc = desc.replace("[/size]", "")
-
-        # Remove Videos
-        desc = re.sub(r"\[video\][\s\S]*?\[\/video\]", "", desc)
-
-        # Remove Staff tags
-        desc = re.sub(r"\[staff[\s\S]*?\[\/staff\]", "", desc)
+            desc = _WHITESPACE_LINE_RE.sub("", desc)
+            desc = _TWO_OR_MORE_NEWLINES_RE.sub("\n", desc)
 
-        # Remove Movie/Person/User/hr/Indent
-        remove_list = ["[movie]", "[/movie]", "[artist]", "[/artist]", "[user]", "[/user]", "[indent]", "[/indent]", "[size]", "[/size]", "[hr]"]
-        for each in remove_list:
-            desc = desc.replace(each, "")
+        desc = restore_links(desc, links)
 
-        # Remove Images in IMG tags
-        desc = re.sub(r"\[img\][\s\S]*?\[\/img\]", "", desc, flags=re.IGNORECASE)
-        desc = re.sub(r"\[img=[\s\S]*?\]", "", desc, flags=re.IGNORECASE)
-
-        # Extract loose images and add to imagelist as dictionaries
-        loose_images = re.findall(r"(https?:\/\/[^\s\[\]]+\.(?:png|jpg))", nocomp, flags=re.IGNORECASE)
-        for img_url in loose_images:
-            if img_url not in excluded_urls:  # Only include URLs not part of excluded sections
-                image_dict = {"img_url": img_url, "raw_url": img_url, "web_url": img_url}
-                imagelist.append(image_dict)
-                desc = desc.replace(img_url, "")
+        if imagelist:
+            # Drop every occurrence of the extracted links in one pass (earlier links win where they overlap)
+            loose_image_re = re.compile("|".join(re.escape(url) for url in dict.fromkeys(img["img_url"] for img in imagelist)))
+            desc = loose_image_re.sub("", desc)
 
         # Re-place comparisons
-        for i, comp in enumerate(comp_placeholders):
-            comp = re.sub(r"\[\/?img[\s\S]*?\]", "", comp, flags=re.IGNORECASE)
-            desc = desc.replace(f"COMPARISON_PLACEHOLDER-{i} ", comp)
-
-        # Convert hides with multiple images to comparison
-        desc = self.convert_collapse_to_comparison(desc, "hide", hides)
+        desc = _COMPARISON_PLACEHOLDER_RE.sub(
+            lambda placeholder: comp_placeholders[int(placeholder.group(1))] if int(placeholder.group(1)) < len(comp_placeholders) else placeholder.group(0), desc
+        )
 
         # Strip blank lines:
         desc = desc.strip("\n")
-        desc = re.sub("\n\n+", "\n\n", desc)
+        desc = _BLANK_LINES_RE.sub("\n\n", desc)
         while desc.startswith("\n"):
             desc = desc.replace("\n", "", 1)
         desc = desc.strip("\n")
@@ -410,109 +668,101 @@ class BBCODE:
         site_netloc = urllib.parse.urlparse(site).netloc
         site_domain = site_netloc.split(".")[0]
         site_regex = rf"(\[url[\=\]]https?:\/\/{site_domain}\.[^\/\]]+/[^\]]+])([^\[]+)(\[\/url\])?"
-        site_url_tags = re.findall(site_regex, desc)
-        if site_url_tags:
-            for site_url_tag in site_url_tags:
-                site_url_tag = "".join(site_url_tag)
-                url_tag_regex = rf"(\[url[\=\]]https?:\/\/{site_domain}\.[^\/\]]+[^\]]+])"
-                url_tag_removed = re.sub(url_tag_regex, "", site_url_tag)
-                url_tag_removed = url_tag_removed.replace("[/url]", "")
-                desc = desc.replace(site_url_tag, url_tag_removed)
+        # Keep only the link text
+        desc = re.sub(site_regex, lambda site_url_tag: site_url_tag.group(2), desc)
 
         desc = desc.replace(site_netloc, site_domain)
 
-        # Temporarily hide spoiler tags
-        spoilers = re.findall(r"\[spoiler[\s\S]*?\[\/spoiler\]", desc)
-        nospoil = desc
-        spoiler_placeholders: list[str] = []
-        for i in range(len(spoilers)):
-            nospoil = nospoil.replace(spoilers[i], "")
-            desc = desc.replace(spoilers[i], f"SPOILER_PLACEHOLDER-{i} ")
-            spoiler_placeholders.append(spoilers[i])
-
-        # Get Images from [img] tags, checking if they're wrapped in [url] tags
-        imagelist: list[dict[str, Any]] = []
-
-        # First, find images wrapped in URL tags: [url=web_url][img]img_url[/img][/url]
-        url_img_pattern = r"\[url=(https?://[^\]]+)\]\[img[^\]]*\](.*?)\[/img\]\[/url\]"
-        url_img_matches = re.findall(url_img_pattern, desc, flags=re.IGNORECASE)
-        for web_url, img_url in url_img_matches:
-            image_dict = {
-                "img_url": img_url.strip(),
-                "raw_url": img_url.strip(),
-                "web_url": web_url.strip(),
-            }
-            imagelist.append(image_dict)
-            # Remove the entire [url=...][img]...[/img][/url] structure
-            desc = re.sub(rf"\[url={re.escape(web_url)}\]\[img[^\]]*\]{re.escape(img_url)}\[/img\]\[/url\]", "", desc, flags=re.IGNORECASE)
-
-        # Then find standalone [img] tags (not wrapped in URL)
-        img_tags = re.findall(r"\[img[^\]]*\](.*?)\[/img\]", desc, re.IGNORECASE)
-        if img_tags:
-            for img_url in img_tags:
-                img_url = img_url.strip()
-                # Check if this image was already added (wrapped in URL)
-                if not any(img["img_url"] == img_url for img in imagelist):
-                    image_dict = {
-                        "img_url": img_url,
-                        "raw_url": img_url,
-                        "web_url": img_url,
-                    }
-                    imagelist.append(image_dict)
-                # Remove the [img] tag
-                desc = re.sub(rf"\[img[^\]]*\]{re.escape(img_url)}\[/img\]", "", desc, flags=re.IGNORECASE)
+        # One pass over the tag tree: pull images out (spoilers keep theirs) and tidy [center] blocks
+        wrapped_images: list[dict[str, Any]] = []
+        standalone_urls: list[str] = []
+
+        def plain_content(node: BBNode) -> Optional[str]:
+            # Image links are single-line text, as the [img]...[/img] patterns always expected
+            if not node.children:
+                return ""
+            if len(node.children) == 1 and isinstance(node.children[0], str) and "\n" not in node.children[0]:
+                return node.children[0]
+            return None
+
+        def is_url_wrapped_image(node: BBNode) -> bool:
+            # [url=web_url][img]img_url[/img][/url]
+            if node.name != "url" or node.open_raw[4:5] != "=" or not _UNIT3D_WEB_URL_RE.match(node.arg or ""):
+                return False
+            if len(node.children) != 1 or not isinstance(node.children[0], BBNode):
+                return False
+            img = node.children[0]
+            return img.name == "img" and plain_content(img) is not None
+
+        def is_center(node: BBNode) -> bool:
+            return node.open_raw.startswith("[center") and node.close_raw == "[/center]"
+
+        def in_spoiler(ancestors: tuple[BBNode, ...]) -> bool:
+            return any(node.open_raw.startswith("[spoiler") and node.close_raw == "[/spoiler]" for node in ancestors)
+
+        def extract_images(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+            # Spoilers keep their images; an [img] inside [url=...] is taken with its link
+            if in_spoiler(ancestors) or (ancestors and is_url_wrapped_image(ancestors[-1])):
+                return None
+            if is_url_wrapped_image(node):
+                img_url = plain_content(cast(BBNode, node.children[0])) or ""
+                wrapped_images.append({"img_url": img_url.strip(), "raw_url": img_url.strip(), "web_url": (node.arg or "").strip()})
+                return []
+            content = plain_content(node) if node.name == "img" else None
+            if content is None:
+                return None
+            standalone_urls.append(content.strip())
+            # A link padded with whitespace stays in the description, as before
+            return [] if content == content.strip() else None
+
+        def clean_nested_centers(text: str) -> str:
+            # Nested [center] blocks keep the first-[/center] matching of the old string cleanup
+            for center in _UNIT3D_CENTER_BLOCK_RE.findall(text):
+                cleaned = _UNIT3D_EMPTY_CENTER_RE.sub("", center)
+                cleaned = _UNIT3D_CENTER_OPEN_SPACE_RE.sub("[center]", cleaned)
+                cleaned = _UNIT3D_CENTER_CLOSE_SPACE_RE.sub("[/center]", cleaned)
+                text = text.replace(center, "") if cleaned == "[center][/center]" else text.replace(center, cleaned.strip())
+            return text
+
+        def clean_center(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+            # If [center] contains only whitespace or empty tags, remove the entire tag
+            if not is_center(node) or any(is_center(ancestor) for ancestor in ancestors):
+                return None
+            if "[center" in node.text():
+                return [clean_nested_centers(render([node]))]
+            children = node.children
+            if node.open_raw == "[center]" and children and isinstance(children[0], str):
+                children[0] = children[0].lstrip()
+            if children and isinstance(children[-1], str):
+                children[-1] = children[-1].rstrip()
+            node.children = [child for child in children if child != ""]
+            if node.open_raw == "[center]" and not node.children:
+                return []
+            return None
+
+        desc = render(transform(parse(desc), extract_images, clean_center))
+
+        # Get Images from [img] tags, URL-wrapped ones first; skip standalone duplicates
+        imagelist: list[dict[str, Any]] = list(wrapped_images)
+        seen_urls = {img["img_url"] for img in imagelist}
+        for img_url in standalone_urls:
+            if img_url not in seen_urls:
+                imagelist.append({"img_url": img_url, "raw_url": img_url, "web_url": img_url})
+                seen_urls.add(img_url)
 
         # Filter out bot images from imagelist
-        bot_image_urls = [
-            "https://blutopia.xyz/favicon.ico",  # Example bot image URL
-            "https://i.ibb.co/2NVWb0c/uploadrr.webp",
-            "https://blutopia/favicon.ico",
-            "https://ptpimg.me/606tk4.png",
-            # Add any other known bot image URLs here
-        ]
-        imagelist = [img for img in imagelist if img["img_url"] not in bot_image_urls and not re.search(r"thumbs", img["img_url"], re.IGNORECASE)]
-
-        # Restore spoiler tags
-        if spoiler_placeholders:
-            for i, spoiler in enumerate(spoiler_placeholders):
-                desc = desc.replace(f"SPOILER_PLACEHOLDER-{i} ", spoiler)
-
-        # Check for and clean up empty [center] tags
-        centers = re.findall(r"\[center[\s\S]*?\[\/center\]", desc)
-        if centers:
-            for center in centers:
-                # If [center] contains only whitespace or empty tags, remove the entire tag
-                cleaned_center = re.sub(r"\[center\]\s*\[\/center\]", "", center)
-                cleaned_center = re.sub(r"\[center\]\s+", "[center]", cleaned_center)
-                cleaned_center = re.sub(r"\s*\[\/center\]", "[/center]", cleaned_center)
-                desc = desc.replace(center, "") if cleaned_center == "[center][/center]" else desc.replace(center, cleaned_center.strip())
+        imagelist = [img for img in imagelist if img["img_url"] not in _UNIT3D_BOT_IMAGE_URLS and not _THUMBS_RE.search(img["img_url"])]
 
         # Remove bot signatures
-        bot_signature_regex = r"""
-            \[center\]\s*\[img=\d+\]https:\/\/blutopia\.xyz\/favicon\.ico\[\/img\]\s*\[b\]
-            Uploaded\sUsing\s\[url=https:\/\/github\.com\/HDInnovations\/UNIT3D\]UNIT3D\[\/url\]\s
-            Auto\sUploader\[\/b\]\s*\[img=\d+\]https:\/\/blutopia\.xyz\/favicon\.ico\[\/img\]\s*\[\/center\]|
-            \[center\]\s*\[b\]Uploaded\sUsing\s\[url=https:\/\/github\.com\/HDInnovations\/UNIT3D\]UNIT3D\[\/url\]
-            \sAuto\sUploader\[\/b\]\s*\[\/center\]|
-            \[center\]\[url=https:\/\/github\.com\/z-ink\/uploadrr\]\[img=\d+\]https:\/\/i\.ibb\.co\/2NVWb0c\/uploadrr\.webp\[\/img\]\[\/url\]\[\/center\]|
-            \n\[center\]\[url=https:\/\/github\.com\/edge20200\/Only-Uploader\]Powered\sby\s
-            Only-Uploader\[\/url\]\[\/center\]|
-            \[center\]\[url=\/torrents\?perPage=\d+&name=[^\]]*\]\[\/url\]\[\/center\]
-        """
-        desc = re.sub(bot_signature_regex, "", desc, flags=re.IGNORECASE | re.VERBOSE)
+        desc = _UNIT3D_BOT_SIGNATURE_RE.sub("", desc)
         # Remove Aither internal signature
-        desc = re.sub(
-            r"\[center\]\[b\]\[size=\d+\]🖌️\[/size\]\[/b\][\s\S]*?This is an internal release which was first released exclusively on Aither\.[\s\S]*?🍻 Cheers to all the Aither.*?\[/center\]",
-            "",
-            desc,
-            flags=re.IGNORECASE,
-        )
-        desc = re.sub(r"\[center\].*Created by.*Upload Assistant.*\[\/center\]", "", desc, flags=re.IGNORECASE)
-        desc = re.sub(r"\[right\].*Created by.*Upload Assistant.*\[\/right\]", "", desc, flags=re.IGNORECASE)
+        desc = _AITHER_INTERNAL_SIGNATURE_RE.sub("", desc)
+        desc = _UA_CENTER_SIGNATURE_RE.sub("", desc)
+        desc = _UA_RIGHT_SIGNATURE_RE.sub("", desc)
 
         # Remove leftover [img] or [URL] tags in the description
-        desc = re.sub(r"\[img\][\s\S]*?\[\/img\]", "", desc, flags=re.IGNORECASE)
-        desc = re.sub(r"\[img=[\s\S]*?\]", "", desc, flags=re.IGNORECASE)
+        desc = _IMG_BLOCK_RE.sub("", desc)
+        desc = _IMG_SIZED_OPEN_RE.sub("", desc)
         # desc = re.sub(r"\[URL=[\s\S]*?\]\[\/URL\]", "", desc, flags=re.IGNORECASE)
 
         # Strip trailing whitespace and newlines:
@@ -526,191 +776,97 @@ class BBCODE:
 
     def is_only_bbcode(self, desc: str) -> bool:
         # Remove all BBCode tags
-        text = re.sub(r"\[/?[a-zA-Z0-9]+(?:=[^\]]*)?\]", "", desc)
+        text = _ANY_TAG_RE.sub("", desc)
         # Remove whitespace and newlines
         text = text.strip()
         # If nothing left, it's only BBCode
         return not text
 
-    def convert_pre_to_code(self, desc: str) -> str:
-        desc = desc.replace("[pre]", "[code]")
-        desc = desc.replace("[/pre]", "[/code]")
+    def convert(self, desc: str, *conversions: Conversion) -> str:
+        """Apply ``conversions`` in order: rewrites go over the string, each block conversion over one parse of it."""
+        for conversion in conversions:
+            if not isinstance(conversion, BlockConversion):
+                desc = conversion(desc)
+            elif conversion.marker in desc:
+                desc = render(transform(parse(desc), _rebuild_blocks(conversion)))
         return desc
 
+    def convert_pre_to_code(self, desc: str) -> str:
+        return self.convert(desc, PRE_TO_CODE)
+
     def convert_code_to_pre(self, desc: str) -> str:
-        desc = desc.replace("[code]", "[pre]")
-        desc = desc.replace("[/code]", "[/pre]")
-        return desc
+        return self.convert(desc, CODE_TO_PRE)
 
     def convert_hide_to_spoiler(self, desc: str) -> str:
-        desc = desc.replace("[hide", "[spoiler")
-        desc = desc.replace("[/hide]", "[/spoiler]")
-        return desc
+        return self.convert(desc, HIDE_TO_SPOILER)
 
     def convert_spoiler_to_hide(self, desc: str) -> str:
-        desc = desc.replace("[spoiler", "[hide")
-        desc = desc.replace("[/spoiler]", "[/hide]")
-        return desc
+        return self.convert(desc, SPOILER_TO_HIDE)
 
     def remove_hide(self, desc: str) -> str:
-        desc = desc.replace("[hide]", "").replace("[/hide]", "")
-        return desc
+        return self.convert(desc, REMOVE_HIDE)
 
     def convert_named_spoiler_to_named_hide(self, desc: str) -> str:
         """
         Converts [spoiler=Name] to [hide=Name]
         """
-        desc = re.sub(r"\[spoiler=([^]]+)]", r"[hide=\1]", desc, flags=re.IGNORECASE)
-        desc = desc.replace("[/spoiler]", "[/hide]")
-        return desc
+        return self.convert(desc, NAMED_SPOILER_TO_NAMED_HIDE)
 
     def remove_spoiler(self, desc: str) -> str:
-        desc = re.sub(r"\[\/?spoiler[\s\S]*?\]", "", desc, flags=re.IGNORECASE)
-        return desc
+        return self.convert(desc, REMOVE_SPOILER)
 
     def convert_named_spoiler_to_normal_spoiler(self, desc: str) -> str:
-        desc = re.sub(r"(\[spoiler=[^]]+])", "[spoiler]", desc, flags=re.IGNORECASE)
-        return desc
+        return self.convert(desc, NAMED_SPOILER_TO_NORMAL_SPOILER)
 
     def convert_spoiler_to_code(self, desc: str) -> str:
-        desc = desc.replace("[spoiler", "[code")
-        desc = desc.replace("[/spoiler]", "[/code]")
-        return desc
+        return self.convert(desc, SPOILER_TO_CODE)
 
     def convert_code_to_quote(self, desc: str) -> str:
-        desc = desc.replace("[code", "[quote")
-        desc = desc.replace("[/code]", "[/quote]")
-        return desc
+        return self.convert(desc, CODE_TO_QUOTE)
 
     def remove_img_resize(self, desc: str) -> str:
         """
         Converts [img=number] or any other parameters to just [img]
         """
-        desc = re.sub(r"\[img(?:[^\]]*)\]", "[img]", desc, flags=re.IGNORECASE)
-        return desc
+        return self.convert(desc, REMOVE_IMG_RESIZE)
 
     def remove_extra_lines(self, desc: str) -> str:
         """
         Removes more than 2 consecutive newlines
         """
-        desc = re.sub(r"\n{3,}", "\n\n", desc)
+        desc = _THREE_OR_MORE_NEWLINES_RE.sub("\n\n", desc)
         return desc
 
     def convert_to_align(self, desc: str) -> str:
         """
         Converts [right], [left], [center] to [align=right], [align=left], [align=center]
         """
-        desc = re.sub(r"\[(right|center|left)\]", lambda m: f"[align={m.group(1)}]", desc)
-        desc = re.sub(r"\[/(right|center|left)\]", "[/align]", desc)
-        return desc
+        return self.convert(desc, TO_ALIGN)
 
     def remove_sup(self, desc: str) -> str:
         """
         Removes [sup] tags
         """
-        desc = desc.replace("[sup]", "").replace("[/sup]", "")
-        return desc
+        return self.convert(desc, REMOVE_SUP)
 
     def remove_sub(self, desc: str) -> str:
         """
         Removes [sub] tags
         """
-        desc = desc.replace("[sub]", "").replace("[/sub]", "")
-        return desc
+        return self.convert(desc, REMOVE_SUB)
 
     def remove_list(self, desc: str) -> str:
         """
         Removes [list] tags
         """
-        desc = desc.replace("[list]", "").replace("[/list]", "")
-        return desc
+        return self.convert(desc, REMOVE_LIST)
 
     def convert_comparison_to_collapse(self, desc: str, max_width: int) -> str:
-        comparisons = re.findall(r"\[comparison=[\s\S]*?\[\/comparison\]", desc)
-        for comp in comparisons:
-            line: list[str] = []
-            output: list[str] = []
-            comp_sources = comp.split("]", 1)[0].replace("[comparison=", "").replace(" ", "").split(",")
-            comp_images = comp.split("]", 1)[1].replace("[/comparison]", "").replace(",", "\n").replace(" ", "\n")
-            comp_images = re.findall(r"(https?:\/\/.*\.(?:png|jpg))", comp_images, flags=re.IGNORECASE)
-            screens_per_line = len(comp_sources)
-            img_size = int(max_width / screens_per_line)
-            if img_size > 350:
-                img_size = 350
-            for img in comp_images:
-                img = img.strip()
-                if img != "":
-                    bb = f"[url={img}][img={img_size}]{img}[/img][/url]"
-                    line.append(bb)
-                    if len(line) == screens_per_line:
-                        output.append("".join(line))
-                        line = []
-            output_str = "\n".join(output)
-            new_bbcode = f"[spoiler={' vs '.join(comp_sources)}][center]{' | '.join(comp_sources)}[/center]\n{output_str}[/spoiler]"
-            desc = desc.replace(comp, new_bbcode)
-        return desc
+        return self.convert(desc, comparison_to_collapse(max_width))
 
     def convert_comparison_to_centered(self, desc: str, max_width: int) -> str:
-        comparisons = re.findall(r"\[comparison=[\s\S]*?\[\/comparison\]", desc)
-        for comp in comparisons:
-            line: list[str] = []
-            output: list[str] = []
-            comp_sources = comp.split("]", 1)[0].replace("[comparison=", "").strip()
-            comp_sources = re.split(r"\s*,\s*", comp_sources)
-            comp_images = comp.split("]", 1)[1].replace("[/comparison]", "").replace(",", "\n").replace(" ", "\n")
-            comp_images = re.findall(r"(https?:\/\/.*\.(?:png|jpg))", comp_images, flags=re.IGNORECASE)
-            screens_per_line = len(comp_sources)
-            img_size = int(max_width / screens_per_line)
-            if img_size > 350:
-                img_size = 350
-            for img in comp_images:
-                img = img.strip()
-                if img != "":
-                    bb = f"[url={img}][img={img_size}]{img}[/img][/url]"
-                    line.append(bb)
-                    if len(line) == screens_per_line:
-                        output.append("".join(line))
-                        line = []
-            output_str = "\n".join(output)
-            new_bbcode = f"[center]{' | '.join(comp_sources)}\n{output_str}[/center]"
-            desc = desc.replace(comp, new_bbcode)
-        return desc
+        return self.convert(desc, comparison_to_centered(max_width))
 
-    def convert_collapse_to_comparison(self, desc: str, spoiler_hide: str, collapses: list[str]) -> str:
+    def convert_collapse_to_comparison(self, desc: str, spoiler_hide: str) -> str:
         # Convert Comparison spoilers to [comparison=]
-        if collapses != []:
-            for i in range(len(collapses)):
-                tag = collapses[i]
-                images = re.findall(r"\[img[\s\S]*?\[\/img\]", tag, flags=re.IGNORECASE)
-                if len(images) >= 6:
-                    comp_images: list[str] = []
-                    final_sources: list[str] = []
-                    for image in images:
-                        image_url = re.sub(r"\[img[\s\S]*\]", "", image.replace("[/img]", ""), flags=re.IGNORECASE)
-                        comp_images.append(image_url)
-                    sources = ""
-                    if spoiler_hide == "spoiler":
-                        spoiler_match = re.match(r"\[spoiler[\s\S]*?\]", tag)
-                        if spoiler_match:
-                            sources = spoiler_match[0].replace("[spoiler=", "")[:-1]
-                        else:
-                            continue
-                    elif spoiler_hide == "hide":
-                        hide_match = re.match(r"\[hide[\s\S]*?\]", tag)
-                        if hide_match:
-                            sources = hide_match[0].replace("[hide=", "")[:-1]
-                        else:
-                            continue
-                    if not sources:
-                        continue
-                    sources = re.sub("comparison", "", sources, flags=re.IGNORECASE)
-                    for each in ["vs", ",", "|"]:
-                        sources_list = sources.split(each)
-                        sources = "$".join(sources_list)
-                    sources_list = sources.split("$")
-                    final_sources = [source.strip() for source in sources_list]
-                    comp_images_str = "\n".join(comp_images)
-                    final_sources_str = ", ".join(final_sources)
-                    spoil2comp = f"[comparison={final_sources_str}]{comp_images_str}[/comparison]"
-                    desc = desc.replace(tag, spoil2comp)
-        return desc
+        return self.convert(desc, collapse_to_comparison(spoiler_hide))
@@ -0,0 +1,175 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Single-pass BBCode tokenizer, tree and serializer.
+
+``parse`` turns a description into a list of nodes (``str`` for text, ``BBNode`` for a tag
+pair), ``transform`` runs visitor passes over that tree in one traversal and ``render``
+writes it back. Opening tags that never close and closing tags without an opener are kept
+as text, so ``render(parse(text)) == text`` for any input.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import Callable, Optional, Union
+
+# [name], [name=arg], [name arg=...] and [/name]
+_TAG_RE = re.compile(r"\[(/?)([a-zA-Z][a-zA-Z0-9]*)((?:=|\s)[^\[\]]*)?\]")
+
+
+class BBNode:
+    """A matched ``[tag]...[/tag]`` pair; ``open_raw``/``close_raw`` keep the original spelling."""
+
+    __slots__ = ("arg", "children", "close_raw", "name", "open_raw")
+
+    def __init__(self, name: str, arg: Optional[str], open_raw: str, close_raw: str = "", children: Optional[list["Node"]] = None) -> None:
+        self.name = name
+        self.arg = arg
+        self.open_raw = open_raw
+        self.close_raw = close_raw
+        self.children: list[Node] = children if children is not None else []
+
+    def text(self) -> str:
+        """The rendered content between the opening and closing tag."""
+        return render(self.children)
+
+    def retag(self, open_raw: str, close_raw: str) -> None:
+        """Respell the tag pair; ``name`` and ``arg`` follow the new opening tag when it is one."""
+        self.open_raw = open_raw
+        self.close_raw = close_raw
+        match = _TAG_RE.fullmatch(open_raw)
+        if match and not match.group(1):
+            arg = match.group(3)
+            self.name = match.group(2).lower()
+            self.arg = arg[1:] if arg and arg.startswith("=") else arg
+
+    def __repr__(self) -> str:
+        return f"BBNode({self.open_raw!r}, {len(self.children)} children)"
+
+
+Node = Union[str, BBNode]
+
+# A visitor gets (node, ancestors) and returns None to keep the node, or the nodes to put in its place
+Visitor = Callable[[BBNode, tuple[BBNode, ...]], Optional[list[Node]]]
+
+
+def _append_text(nodes: list[Node], text: str) -> None:
+    if not text:
+        return
+    if nodes and isinstance(nodes[-1], str):
+        nodes[-1] += text
+    else:
+        nodes.append(text)
+
+
+def _extend(nodes: list[Node], extra: Iterable[Node]) -> None:
+    for node in extra:
+        if isinstance(node, str):
+            _append_text(nodes, node)
+        else:
+            nodes.append(node)
+
+
+def parse(text: str) -> list[Node]:
+    """Tokenize ``text`` and build the tag tree in a single left-to-right pass."""
+    root: list[Node] = []
+    # Open tags still waiting for their closing tag; ``current`` is the list new nodes go into
+    stack: list[BBNode] = []
+    current = root
+    position = 0
+
+    def unwind(depth: int) -> None:
+        # Tags opened above ``depth`` never closed: turn them back into text in their parent
+        while len(stack) > depth:
+            node = stack.pop()
+            parent = stack[-1].children if stack else root
+            _append_text(parent, node.open_raw)
+            _extend(parent, node.children)
+
+    for match in _TAG_RE.finditer(text):
+        start = match.start()
+        if start > position:
+            _append_text(current, text[position:start])
+        position = match.end()
+        raw = match.group(0)
+        closing, name, arg = match.groups()
+        name = name.lower()
+        if not closing:
+            node = BBNode(name, arg[1:] if arg and arg[0] == "=" else arg, raw)
+            stack.append(node)
+            current = node.children
+            continue
+        for depth in range(len(stack) - 1, -1, -1):
+            if stack[depth].name == name:
+                unwind(depth + 1)
+                node = stack.pop()
+                node.close_raw = raw
+                current = stack[-1].children if stack else root
+                current.append(node)
+                break
+        else:
+            _append_text(current, raw)
+
+    _append_text(current, text[position:])
+    unwind(0)
+    return root
+
+
+def render(nodes: Iterable[Node]) -> str:
+    """Serialize a tree back to BBCode."""
+    out: list[str] = []
+    # Explicit stack so deeply nested input can't hit the recursion limit
+    pending: list[Union[Node, tuple[str]]] = list(nodes)[::-1]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, str):
+            out.append(item)
+        elif isinstance(item, tuple):
+            out.append(item[0])
+        else:
+            out.append(item.open_raw)
+            pending.append((item.close_raw,))
+            pending.extend(reversed(item.children))
+    return "".join(out)
+
+
+def transform(nodes: list[Node], *visitors: Visitor, text: Optional[Callable[[str], str]] = None) -> list[Node]:
+    """Apply ``visitors`` to every tag in one depth-first traversal, children before their parent.
+
+    Each visitor sees the node as already rewritten by the visitors before it. Returning None
+    keeps the node, returning a list replaces it (an empty list removes it); later visitors see
+    the replacement nodes but not their children. ``text`` rewrites every text node of the input,
+    which is where unclosed and stray tags are.
+    """
+
+    def apply(node: BBNode, ancestors: tuple[BBNode, ...]) -> list[Node]:
+        replacement: list[Node] = [node]
+        for visitor in visitors:
+            new_nodes: list[Node] = []
+            for item in replacement:
+                if isinstance(item, str):
+                    new_nodes.append(item)
+                    continue
+                replaced = visitor(item, ancestors)
+                new_nodes.extend([item] if replaced is None else replaced)
+            replacement = new_nodes
+        return replacement
+
+    root: list[Node] = []
+    # Explicit stack like ``render``: (tag whose children are being rewritten, its remaining input
+    # children, the rewritten children so far, ancestors of those children)
+    stack: list[tuple[Optional[BBNode], Iterator[Node], list[Node], tuple[BBNode, ...]]] = [(None, iter(nodes), root, ())]
+    while stack:
+        owner, pending, result, ancestors = stack[-1]
+        for item in pending:
+            if isinstance(item, str):
+                _append_text(result, text(item) if text is not None else item)
+                continue
+            stack.append((item, iter(item.children), [], (*ancestors, item)))
+            break
+        else:
+            stack.pop()
+            if owner is not None:
+                owner.children = result
+                _, _, parent_result, owner_ancestors = stack[-1]
+                _extend(parent_result, apply(owner, owner_ancestors))
+    return root
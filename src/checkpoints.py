@@ -0,0 +1,163 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable, Mapping
+from typing import Any, Optional, cast
+
+from src.console import console
+
+MANIFEST_NAME = "checkpoints.json"
+_MANIFEST_VERSION = 1
+
+# Stage names
+MEDIAINFO = "mediainfo"
+SCREENSHOTS = "screenshots"
+IMAGES = "images"
+BASE_TORRENT = "base_torrent"
+
+
+def _signature(path: str) -> Optional[list[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def source_fingerprint(path: str) -> str:
+    """Digest of the name, size and modification time of ``path`` and every file below it."""
+    digest = hashlib.sha1(usedforsecurity=False)
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                digest.update(f"{os.path.relpath(file_path, path)}\0{_signature(file_path)}\n".encode("utf-8", "surrogateescape"))
+    else:
+        digest.update(f"{os.path.basename(path)}\0{_signature(path)}\n".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def _normalise(value: Any) -> Any:
+    # Inputs are compared with what was read back from JSON, so tuples become lists and so on
+    return json.loads(json.dumps(value, sort_keys=True, default=str))
+
+
+class UploadCheckpoints:
+    """Completed stages of one upload, kept in ``tmp/<uuid>/checkpoints.json``.
+
+    Every stage records the inputs it ran with, its outputs and the files it wrote (with their
+    size and modification time). A later run for the same source can take the outputs of a
+    stage whose inputs match and whose files are untouched instead of running it again, and
+    only retry the trackers that didn't get the upload. The whole manifest belongs to one
+    version of the source: when the files under ``meta['path']`` change, every stage is dropped.
+    """
+
+    _instances: dict[str, "UploadCheckpoints"] = {}
+
+    def __init__(self, tmp_dir: str, fingerprint: str, resume: bool = True) -> None:
+        self.tmp_dir = tmp_dir
+        self.manifest_path = os.path.join(tmp_dir, MANIFEST_NAME)
+        self.fingerprint = fingerprint
+        # Stages are still recorded when resuming is disabled; they just aren't handed out
+        self.resume = resume
+        self.source_changed = False
+        self._stages: dict[str, dict[str, Any]] = {}
+        self._trackers: dict[str, dict[str, Any]] = {}
+        # Stages recorded for an earlier version of the source
+        self._stale_stages: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    @classmethod
+    def for_meta(cls, meta: Mapping[str, Any], config: Optional[Mapping[str, Any]] = None) -> "UploadCheckpoints":
+        """Return the checkpoints of the upload described by ``meta``, reading the manifest once per process."""
+        tmp_dir = os.path.abspath(os.path.join(str(meta["base_dir"]), "tmp", str(meta["uuid"])))
+        checkpoints = cls._instances.get(tmp_dir)
+        if checkpoints is None:
+            resume = True
+            if config is not None:
+                resume = bool(config.get("DEFAULT", {}).get("resume_uploads", True))
+            checkpoints = cls(tmp_dir, source_fingerprint(str(meta.get("path") or "")), resume=resume)
+            cls._instances[tmp_dir] = checkpoints
+        return checkpoints
+
+    @classmethod
+    def discard(cls, meta: Mapping[str, Any]) -> None:
+        """Forget the in-memory manifest, e.g. after the tmp folder was deleted."""
+        cls._instances.pop(os.path.abspath(os.path.join(str(meta.get("base_dir", "")), "tmp", str(meta.get("uuid", "")))), None)
+
+    def _load(self) -> None:
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                loaded = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            console.print(f"[yellow]Ignoring unreadable upload checkpoints: {e}[/yellow]")
+            return
+        if not isinstance(loaded, dict):
+            return
+        manifest = cast(dict[str, Any], loaded)
+        if manifest.get("version") != _MANIFEST_VERSION:
+            return
+        if manifest.get("fingerprint") != self.fingerprint:
+            self.source_changed = True
+            self._stale_stages = cast(dict[str, dict[str, Any]], manifest.get("stages") or {})
+            return
+        self._stages = cast(dict[str, dict[str, Any]], manifest.get("stages") or {})
+        self._trackers = cast(dict[str, dict[str, Any]], manifest.get("trackers") or {})
+
+    def _save(self) -> None:
+        manifest = {"version": _MANIFEST_VERSION, "fingerprint": self.fingerprint, "stages": self._stages, "trackers": self._trackers}
+        tmp_path = f"{self.manifest_path}.tmp"
+        try:
+            os.makedirs(self.tmp_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=4)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            console.print(f"[yellow]Could not save upload checkpoints: {e}[/yellow]")
+
+    def get(self, stage: str, inputs: Any) -> Optional[dict[str, Any]]:
+        """Outputs of ``stage`` if it completed with the same ``inputs`` and its files are untouched."""
+        if not self.resume:
+            return None
+        entry = self._stages.get(stage)
+        if entry is None or entry.get("inputs") != _normalise(inputs):
+            return None
+        files = cast(dict[str, Any], entry.get("files") or {})
+        if any(_signature(path) != signature for path, signature in files.items()):
+            return None
+        return cast(dict[str, Any], entry.get("outputs") or {})
+
+    def put(self, stage: str, inputs: Any, outputs: Optional[Mapping[str, Any]] = None, files: Iterable[str] = ()) -> None:
+        """Record that ``stage`` completed with ``inputs``, producing ``outputs`` and ``files``."""
+        signatures = {os.path.abspath(path): _signature(path) for path in files}
+        self._stages[stage] = {
+            "inputs": _normalise(inputs),
+            "outputs": _normalise(dict(outputs or {})),
+            "files": {path: signature for path, signature in signatures.items() if signature is not None},
+            "completed_at": time.time(),
+        }
+        self._save()
+
+    def stale_files(self, stage: str) -> list[str]:
+        """Files ``stage`` wrote for an earlier version of the source, limited to the upload's tmp folder."""
+        files = cast(dict[str, Any], self._stale_stages.get(stage, {}).get("files") or {})
+        return [path for path in files if os.path.dirname(os.path.abspath(path)) == self.tmp_dir]
+
+    def record_tracker(self, tracker: str, uploaded: bool, status: Optional[Mapping[str, Any]] = None) -> None:
+        """Remember whether ``tracker`` took the upload, with its torrent id when it reported one."""
+        entry: dict[str, Any] = {"uploaded": uploaded, "completed_at": time.time()}
+        if status is not None and status.get("torrent_id") is not None:
+            entry["torrent_id"] = status["torrent_id"]
+        self._trackers[tracker] = _normalise(entry)
+        self._save()
+
+    def uploaded_trackers(self) -> set[str]:
+        """Trackers an earlier run already uploaded this source to."""
+        if not self.resume:
+            return set()
+        return {tracker for tracker, entry in self._trackers.items() if entry.get("uploaded")}
@@ -21,6 +21,7 @@ REQUIRED_DEFAULT_KEYS: dict[str, type] = {
 DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "update_notification": (bool,),
     "verbose_notification": (bool,),
+    "update_check_interval": (int, float),
     "tmdb_api": (str,),
     "btn_api": (str,),
     "img_host_1": (str,),
@@ -42,7 +43,10 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "use_libplacebo": (bool,),
     "ffmpeg_is_good": (bool,),
     "ffmpeg_warmup": (bool,),
+    "tonemap_cache": (bool,),
     "ffmpeg_compression": (str, int),
+    "screenshot_prescan": (bool,),
+    "optimize_screenshots": (bool,),
     "process_limit": (str, int),
     "threads": (str, int),
     "ffmpeg_limit": (bool,),
@@ -55,11 +59,17 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "skip_auto_torrent": (bool,),
     "sfx_on_prompt": (bool,),
     "tracker_pass_checks": (str, int),
+    "tracker_upload_concurrency": (int, str),
+    "tracker_upload_priority": (str, list),
     "use_largest_playlist": (bool,),
     "keep_images": (bool,),
+    "image_host_cache": (bool,),
+    "image_host_cache_revalidate": (bool,),
     "only_id": (bool,),
     "use_sonarr": (bool,),
     "use_radarr": (bool,),
+    "arr_library_mirror": (bool,),
+    "arr_library_mirror_ttl": (str, int, float),
     "mkbrr": (bool,),
     "mkbrr_threads": (str, int),
     "user_overrides": (bool,),
@@ -71,6 +81,7 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "bluray_score": (float, int),
     "bluray_single_score": (float, int),
     "keep_meta": (bool,),
+    "resume_uploads": (bool,),
     "show_upload_duration": (bool,),
     "print_tracker_messages": (bool,),
     "print_tracker_links": (bool,),
@@ -81,6 +92,9 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "prefer_max_16_torrent": (bool,),
     "cross_seeding": (bool,),
     "cross_seed_check_everything": (bool,),
+    "cross_seed_search_concurrency": (int, str),
+    "cross_seed_concurrency": (int, str),
+    "cross_seed_miss_ttl": (int, str),
     "auto_mode": (bool, str),
 }
 
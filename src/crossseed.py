@@ -0,0 +1,237 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Awaitable, Iterable, Mapping
+from pathlib import Path
+from typing import Any, Callable, Optional, cast
+
+from src.console import console
+from src.torrenttemplate import TorrentTemplate
+from src.uploadscheduler import SiteLimits
+
+# Searches of one site at a time across the process, like a site's default upload_concurrency
+_search_limits = SiteLimits()
+
+
+def _as_int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def content_fingerprint(meta: Mapping[str, Any]) -> Optional[str]:
+    """Key of the content being uploaded: the names and sizes of its files, wherever they live."""
+    files = cast(list[Any], meta.get("filelist") or []) or [meta.get("path")]
+    parts: list[str] = []
+    for file in files:
+        if not isinstance(file, str) or not file:
+            continue
+        try:
+            size = "dir" if os.path.isdir(file) else str(os.path.getsize(file))
+        except OSError:
+            continue
+        parts.append(f"{os.path.basename(os.path.normpath(file))}:{size}")
+    if not parts:
+        return None
+    return hashlib.sha256("\n".join(sorted(parts)).encode("utf-8")).hexdigest()[:32]
+
+
+class CrossSeedMisses:
+    """Persistent record of cross-seed searches that found nothing, per content and tracker.
+
+    Lets queue runs skip a tracker that had no match for the same content a short while ago.
+    Stored at ``data/cross_seed/misses.json`` as ``{fingerprint: {tracker: searched_at}}``.
+    """
+
+    _instances: dict[str, "CrossSeedMisses"] = {}
+
+    def __init__(self, base_dir: str) -> None:
+        self.cache_path = Path(base_dir) / "data" / "cross_seed" / "misses.json"
+        self._entries: Optional[dict[str, dict[str, float]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_base_dir(cls, base_dir: str) -> "CrossSeedMisses":
+        """Return the shared record for ``base_dir``."""
+        key = os.path.abspath(base_dir)
+        if key not in cls._instances:
+            cls._instances[key] = cls(key)
+        return cls._instances[key]
+
+    def _load_entries(self) -> dict[str, dict[str, float]]:
+        if self._entries is not None:
+            return self._entries
+        entries: dict[str, dict[str, float]] = {}
+        try:
+            if self.cache_path.exists():
+                loaded = json.loads(self.cache_path.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict):
+                    entries = cast(dict[str, dict[str, float]], loaded)
+        except Exception as e:
+            console.print(f"[yellow]Failed to read cross-seed search cache, starting fresh: {e}[/yellow]")
+        self._entries = entries
+        return entries
+
+    def is_fresh(self, fingerprint: str, tracker: str, ttl: float) -> bool:
+        """Whether ``tracker`` found nothing for this content within the last ``ttl`` seconds."""
+        with self._lock:
+            searched_at = self._load_entries().get(fingerprint, {}).get(tracker)
+        return searched_at is not None and time.time() - float(searched_at) < ttl
+
+    def add(self, fingerprint: str, tracker: str) -> None:
+        with self._lock:
+            self._load_entries().setdefault(fingerprint, {})[tracker] = time.time()
+            self._dirty = True
+
+    def prune(self, ttl: float) -> None:
+        """Forget searches older than ``ttl`` seconds, so the file does not grow forever."""
+        cutoff = time.time() - ttl
+        with self._lock:
+            entries = self._load_entries()
+            for fingerprint in list(entries):
+                trackers = {tracker: searched_at for tracker, searched_at in entries[fingerprint].items() if float(searched_at) >= cutoff}
+                if len(trackers) != len(entries[fingerprint]):
+                    self._dirty = True
+                    if trackers:
+                        entries[fingerprint] = trackers
+                    else:
+                        del entries[fingerprint]
+
+    def save(self) -> None:
+        """Write pending changes via a temp file, like the image host cache."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            data = json.dumps(self._entries, indent=2)
+            self._dirty = False
+        tmp_path = self.cache_path.with_suffix(".json.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            self._dirty = True
+            console.print(f"[yellow]Failed to write cross-seed search cache: {e}[/yellow]")
+
+
+class CrossSeedEngine:
+    """Searches trackers for cross-seeds and injects each match as soon as it is found.
+
+    Searches run at most ``cross_seed_search_concurrency`` at a time, and one per site across the
+    process. Matches, and trackers that already have a cross-seed from the dupe check, go to
+    ``cross_seed_concurrency`` workers that download the torrent and add it to the client,
+    skipping a torrent whose infohash was already added in this run. A tracker whose search
+    found nothing is not searched again for ``cross_seed_miss_ttl`` minutes (0 = always search).
+    """
+
+    def __init__(self, config: Mapping[str, Any], misses: Optional[CrossSeedMisses] = None, fingerprint: Optional[str] = None, debug: bool = False) -> None:
+        default_config = config.get("DEFAULT", {})
+        self.search_concurrency = max(1, _as_int(default_config.get("cross_seed_search_concurrency", 8), 8))
+        self.inject_concurrency = max(1, _as_int(default_config.get("cross_seed_concurrency", 8), 8))
+        self.miss_ttl = max(0, _as_int(default_config.get("cross_seed_miss_ttl", 60), 60)) * 60
+        self.misses = misses if self.miss_ttl and fingerprint else None
+        self.fingerprint = fingerprint or ""
+        self.debug = debug
+        self.outcomes: dict[str, str] = {}
+
+    def needs_search(self, trackers: Iterable[str]) -> list[str]:
+        """``trackers`` without a recent search that found nothing for this content."""
+        if self.misses is None:
+            return list(trackers)
+        pending: list[str] = []
+        for tracker in trackers:
+            if self.misses.is_fresh(self.fingerprint, tracker, self.miss_ttl):
+                self.outcomes[tracker] = "recent miss"
+            else:
+                pending.append(tracker)
+        return pending
+
+    async def run(
+        self,
+        search_trackers: Iterable[str],
+        found_trackers: Iterable[str],
+        search: Callable[[str], Awaitable[Optional[bool]]],
+        download: Callable[[str], Awaitable[Optional[str]]],
+        add: Callable[[str], Awaitable[None]],
+    ) -> dict[str, str]:
+        """Search ``search_trackers``, then download and ``add`` every match plus ``found_trackers``.
+
+        ``search(tracker)`` returns whether it found a cross-seed, or None when the search did not
+        complete (the site failed, timed out, ...) so no miss is recorded. ``download(tracker)``
+        returns the path of the downloaded torrent (None when there is none). Returns the outcome
+        per tracker.
+        """
+        queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        for tracker in found_trackers:
+            queue.put_nowait(tracker)
+        search_slots = asyncio.Semaphore(self.search_concurrency)
+        injected: set[str] = set()
+
+        async def search_one(tracker: str) -> None:
+            async with search_slots, _search_limits.get(tracker.upper(), 1):
+                try:
+                    found = await search(tracker)
+                except Exception as e:
+                    self.outcomes[tracker] = "failed"
+                    if self.debug:
+                        console.print(f"[yellow]Error checking {tracker} for cross-seeds: {e}[/yellow]")
+                    return
+            if found:
+                queue.put_nowait(tracker)
+            elif found is None:
+                self.outcomes[tracker] = "failed"
+                if self.debug:
+                    console.print(f"[yellow]Cross-seed search on {tracker} did not complete, not recording a miss[/yellow]")
+            else:
+                self.outcomes[tracker] = "no match"
+                if self.misses is not None:
+                    self.misses.add(self.fingerprint, tracker)
+
+        async def inject(tracker: str) -> None:
+            torrent_path = await download(tracker)
+            if not torrent_path or not os.path.exists(torrent_path):
+                self.outcomes[tracker] = "no torrent"
+                return
+            info_hash = await asyncio.to_thread(lambda: TorrentTemplate.for_path(torrent_path).info_hash())
+            if info_hash in injected:
+                self.outcomes[tracker] = "duplicate"
+                if self.debug:
+                    console.print(f"[yellow]Cross-seed from {tracker} has an infohash that was already added, skipping[/yellow]")
+                return
+            injected.add(info_hash)
+            await add(tracker)
+            self.outcomes[tracker] = "added"
+
+        async def inject_worker() -> None:
+            while True:
+                tracker = await queue.get()
+                if tracker is None:
+                    return
+                try:
+                    await inject(tracker)
+                except Exception as e:
+                    self.outcomes[tracker] = "failed"
+                    console.print(f"[red]Cross-seed handling failed for {tracker}: {e}[/red]")
+
+        workers = [asyncio.create_task(inject_worker()) for _ in range(self.inject_concurrency)]
+        try:
+            await asyncio.gather(*(search_one(tracker) for tracker in search_trackers))
+            for _ in workers:
+                queue.put_nowait(None)
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        finally:
+            if self.misses is not None:
+                self.misses.prune(self.miss_ttl)
+                await asyncio.to_thread(self.misses.save)
+        return self.outcomes
@@ -0,0 +1,123 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import os
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Hashable, Mapping
+from typing import Any, Callable, Optional, TypeVar, cast
+
+import aiofiles
+
+T = TypeVar("T")
+
+# Fragments of this many uploads are kept; older uploads are dropped first
+_MAX_UPLOADS = 8
+
+
+def _file_signature(path: str) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class DescriptionFragments:
+    """Tracker-independent description pieces of one upload, built once and shared by every tracker.
+
+    Each tracker renders its own description, but most of what goes into it (the MediaInfo and
+    BDInfo dumps, parsed MediaInfo, covers, per-file MediaInfo of packs) is the same for all of
+    them. Fragments are keyed by the inputs they depend on, and file contents by the file's size
+    and modification time, so a rewritten file is read again instead of served stale.
+    """
+
+    _instances: "OrderedDict[tuple[str, str], DescriptionFragments]" = OrderedDict()
+
+    def __init__(self, tmp_dir: str) -> None:
+        self.tmp_dir = tmp_dir
+        self._values: dict[Hashable, Any] = {}
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    @classmethod
+    def for_meta(cls, meta: Mapping[str, Any]) -> "DescriptionFragments":
+        """Return the fragments of the upload described by ``meta``."""
+        base_dir = str(meta.get("base_dir", ""))
+        uuid = str(meta.get("uuid", ""))
+        key = (base_dir, uuid)
+        fragments = cls._instances.get(key)
+        if fragments is None:
+            fragments = cls(os.path.join(base_dir, "tmp", uuid))
+            cls._instances[key] = fragments
+            while len(cls._instances) > _MAX_UPLOADS:
+                cls._instances.popitem(last=False)
+        else:
+            cls._instances.move_to_end(key)
+        return fragments
+
+    @classmethod
+    def discard(cls, meta: Mapping[str, Any]) -> None:
+        """Drop the fragments of a finished upload."""
+        cls._instances.pop((str(meta.get("base_dir", "")), str(meta.get("uuid", ""))), None)
+
+    def _get_lock(self, key: Hashable) -> asyncio.Lock:
+        # Trackers build their descriptions concurrently; one lock per fragment makes the first
+        # caller build it while the others wait for the result. Locks are recreated per event loop.
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._locks = {}
+            self._lock_loop = loop
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+        return lock
+
+    async def get(self, name: str, inputs: Hashable, build: Callable[[], Awaitable[T]]) -> T:
+        """Return fragment ``name`` for ``inputs``, awaiting ``build()`` only if it isn't cached yet."""
+        key = (name, inputs)
+        async with self._get_lock(key):
+            if key in self._values:
+                self.hits[name] += 1
+                return cast(T, self._values[key])
+            self.misses[name] += 1
+            value = await build()
+            self._values[key] = value
+            return value
+
+    async def read_text(self, path: str, errors: Optional[str] = None) -> str:
+        """Read a UTF-8 text file once per version of the file.
+
+        Raises the same ``OSError`` as ``open`` when the file doesn't exist.
+        """
+        signature = _file_signature(path)
+
+        async def read() -> str:
+            async with aiofiles.open(path, encoding="utf-8", errors=errors) as f:
+                return str(await f.read())
+
+        return await self.get(os.path.basename(path), (os.path.abspath(path), signature, errors), read)
+
+    async def parse_file(self, name: str, path: str, parse: Callable[[str], T]) -> T:
+        """Read and ``parse`` a text file once per version of the file.
+
+        The parsed value is shared by every caller, which must not modify it.
+        """
+        signature = _file_signature(path)
+
+        async def build() -> T:
+            return parse(await self.read_text(path))
+
+        return await self.get(name, (os.path.abspath(path), signature), build)
+
+    async def read_tmp_file(self, filename: str) -> str:
+        """Read ``filename`` from the upload's tmp folder, e.g. ``MEDIAINFO.txt`` or ``BD_SUMMARY_00.txt``."""
+        return await self.read_text(os.path.join(self.tmp_dir, filename))
+
+    def stats(self) -> dict[str, tuple[int, int]]:
+        """``{fragment name: (hits, misses)}``"""
+        return {name: (self.hits[name], self.misses[name]) for name in sorted(set(self.hits) | set(self.misses))}
+
+    def summary(self) -> str:
+        hits = sum(self.hits.values())
+        misses = sum(self.misses.values())
+        details = ", ".join(f"{name} {hit}/{hit + miss}" for name, (hit, miss) in self.stats().items())
+        return f"Description fragments: {hits} hits, {misses} misses ({details})" if details else "Description fragments: unused"
@@ -1,10 +1,13 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import copy
+import fnmatch
 import json
 import os
 import platform
 import re
 import shutil
+import time
 import traceback
 from collections import OrderedDict, defaultdict
 from glob import glob
@@ -23,6 +26,9 @@ from src.exportmi import setup_mediainfo_library
 PlaylistItem = dict[str, Any]
 PlaylistInfo = dict[str, Any]
 
+# Per-disc DVD MediaInfo results keyed by IFO fingerprint, reused for repeat scans in the same process
+_dvd_info_cache: dict[tuple[Any, ...], dict[str, Any]] = {}
+
 
 class DiscParse:
     def __init__(self, config: dict[str, Any]) -> None:
@@ -87,6 +93,208 @@ class DiscParse:
     Get and parse bdinfo
     """
 
+    @staticmethod
+    def _load_disc_playlists(path: str, debug: bool = False) -> list[PlaylistInfo]:
+        """Parse every MPLS in a disc's PLAYLIST folder in a single pass.
+
+        Runs inside one worker thread per disc instead of one thread hop per playlist.
+        """
+        playlists_path = os.path.join(path, "PLAYLIST")
+        stream_directory = os.path.join(path, "STREAM")
+        valid_playlists: list[PlaylistInfo] = []
+
+        for file_name in os.listdir(playlists_path):
+            if not file_name.endswith(".mpls"):
+                continue
+
+            mpls_path = os.path.join(playlists_path, file_name)
+            if debug:
+                console.print(f"[cyan]Processing playlist: {file_name}")
+
+            try:
+                with open(mpls_path, "rb") as mpls_file:
+                    parser = MplsParser(mpls_file)
+                    header = parser.load_movie_playlist()
+                    mpls_file.seek(header.playlist_start_address, os.SEEK_SET)
+                    playlist_data = parser.load_playlist()
+
+                duration: float = 0.0
+                file_counts: defaultdict[str, int] = defaultdict(int)
+                file_sizes: dict[str, int] = {}
+
+                play_items = getattr(playlist_data, "play_items", None)
+                if not play_items:
+                    if debug:
+                        console.print(f"[yellow]  No play_items found in {file_name}")
+                    continue
+
+                if debug:
+                    console.print(f"[cyan]  Found {len(play_items)} play items in {file_name}")
+
+                for item in play_items:
+                    intime = getattr(item, "intime", None)
+                    outtime = getattr(item, "outtime", None)
+                    if intime is None or outtime is None:
+                        continue
+                    duration += (outtime - intime) / 45000.0
+                    try:
+                        clip_name = getattr(item, "clip_information_filename", None)
+                        if not isinstance(clip_name, str):
+                            continue
+                        clip_name = clip_name.strip()
+                        if not clip_name:
+                            continue
+                        m2ts_file = os.path.join(stream_directory, clip_name + ".m2ts")
+                        if m2ts_file in file_sizes:
+                            file_counts[m2ts_file] += 1
+                        elif os.path.exists(m2ts_file):
+                            file_counts[m2ts_file] += 1
+                            file_sizes[m2ts_file] = os.path.getsize(m2ts_file)
+                        elif debug:
+                            console.print(f"[yellow]    Missing m2ts file: {clip_name}.m2ts")
+                    except AttributeError as e:
+                        console.print(f"[bold red]Error accessing clip information for item in {file_name}: {e}")
+
+                if not file_sizes:
+                    if debug:
+                        console.print(f"[yellow]  No m2ts files found for {file_name}")
+                    continue
+
+                items = [{"file": file, "size": file_sizes[file]} for file in file_counts]
+                total_size = sum(file_sizes.values())
+                valid_playlists.append({"file": file_name, "duration": duration, "path": mpls_path, "items": items})
+
+                if debug:
+                    duplicates = [f for f, c in file_counts.items() if c > 1]
+                    if duplicates:
+                        console.print(
+                            f"[green]  ✓ Added {file_name}: {duration:.1f}s, {len(file_sizes)} unique files ({len(duplicates)} files repeated), {total_size // (1024 * 1024)} MB total"
+                        )
+                    else:
+                        console.print(f"[green]  ✓ Added {file_name}: {duration:.1f}s, {len(items)} unique files, {total_size // (1024 * 1024)} MB total")
+            except Exception as e:
+                console.print(f"[bold red]Error parsing playlist {mpls_path}: {e}")
+
+        return valid_playlists
+
+    @staticmethod
+    def _get_bdinfo_command(base_dir: str, path: str, playlist_file: str, output_dir: str) -> Optional[list[str]]:
+        # Prefer the bundled bdinfo binary for the detected OS/arch
+        system = platform.system().lower()
+        machine = platform.machine().lower()
+        if system == "linux":
+            if machine in ("x86_64", "amd64"):
+                folder = "linux/amd64"
+            elif machine in ("arm64", "aarch64"):
+                folder = "linux/arm64"
+            else:
+                folder = "linux/arm"
+            bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, path, "-m", playlist_file, output_dir]
+        elif system == "darwin":
+            folder = "macos/arm64" if machine in ("arm64",) else "macos/x86_64"
+            bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, path, "-m", playlist_file, output_dir]
+        elif system == "windows":
+            # Windows builds are provided as x64
+            bdinfo_path = f"{base_dir}/bin/bdinfo/windows/x86_64/bdinfo.exe"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, "-m", playlist_file, path, output_dir]
+
+        # Fallback to system-installed commands if bundled binary not present
+        if shutil.which("bdinfo"):
+            return ["bdinfo", path, "-m", playlist_file, output_dir]
+        if shutil.which("BDInfo"):
+            return ["BDInfo", path, "-m", playlist_file, output_dir]
+        return None
+
+    @staticmethod
+    def _disc_device_key(path: str) -> Any:
+        """Key scans by the device backing the disc, so one spindle only serves one BDInfo scan at a time."""
+        try:
+            return os.stat(path).st_dev
+        except OSError:
+            return path
+
+    def _process_limit(self) -> int:
+        """``process_limit`` from the config: how many disc scans or MediaInfo runs may run at once."""
+        try:
+            return max(1, int(self.config.get("DEFAULT", {}).get("process_limit", 4) or 4))
+        except (TypeError, ValueError):
+            return 4
+
+    async def _scan_bdinfo_playlists(self, scans: list[dict[str, Any]], base_dir: str, save_dir: str) -> None:
+        """Run the BDInfo scans for all selected playlists of all discs.
+
+        Scans of discs on different devices run concurrently (bounded by process_limit),
+        while scans sharing a device are serialised. Each scan writes into its own scratch
+        folder, so concurrently produced BDINFO reports can't be picked up by the wrong disc.
+        """
+        pending = [scan for scan in scans if not os.path.exists(scan["report_path"])]
+        for scan in scans:
+            if scan not in pending:
+                scan["report"] = scan["report_path"]
+        if not pending:
+            return
+
+        global_semaphore = asyncio.Semaphore(self._process_limit())
+        device_locks: dict[Any, asyncio.Lock] = {}
+        for scan in pending:
+            device_locks.setdefault(self._disc_device_key(scan["path"]), asyncio.Lock())
+
+        total = len(pending)
+        concurrent = len(device_locks) > 1 and total > 1
+        finished = 0
+        started = time.perf_counter()
+
+        async def _run_scan(scan: dict[str, Any]) -> None:
+            nonlocal finished
+            playlist = scan["playlist"]
+            scratch_dir = os.path.join(save_dir, f"bdinfo_scan_{scan['disc_index']}_{scan['playlist_number']}")
+            async with device_locks[self._disc_device_key(scan["path"])], global_semaphore:
+                console.print(
+                    f"[bold green]Scanning playlist {playlist['file']} with duration {int(playlist['duration'] // 3600)} hours {int((playlist['duration'] % 3600) // 60)} minutes {int(playlist['duration'] % 60)} seconds"
+                )
+                try:
+                    os.makedirs(scratch_dir, exist_ok=True)
+                    bdinfo_executable = self._get_bdinfo_command(base_dir, scan["path"], playlist["file"], scratch_dir)
+                    if bdinfo_executable is None:
+                        console.print(
+                            f"[bold red]BDInfo not found. Please download bdinfo and place it under {base_dir}/bin/bdinfo/ or install a system bdinfo/BDInfo binary[/bold red]"
+                        )
+                        return
+
+                    # BDInfo progress output from several discs would interleave, report aggregate progress instead
+                    stdout = asyncio.subprocess.DEVNULL if concurrent else None
+                    proc = await asyncio.create_subprocess_exec(*bdinfo_executable, stdout=stdout)
+                    await proc.wait()
+
+                    if proc.returncode != 0:
+                        console.print(f"[bold red]BDInfo failed with return code {proc.returncode}[/bold red]")
+                        return
+
+                    # Rename the output to playlist_report_path
+                    for file in os.listdir(scratch_dir):
+                        if file.startswith("BDINFO") and file.endswith(".txt"):
+                            shutil.move(os.path.join(scratch_dir, file), scan["report_path"])
+                            scan["report"] = scan["report_path"]
+                            break
+                except Exception as e:
+                    console.print(f"[bold red]Error scanning playlist {playlist['file']}: {e}")
+                finally:
+                    shutil.rmtree(scratch_dir, ignore_errors=True)
+                    finished += 1
+                    if concurrent:
+                        console.print(
+                            f"[cyan]BDInfo progress: {finished}/{total} scans finished ({scan['disc_name']} {playlist['file']}) - {time.perf_counter() - started:.0f}s elapsed[/cyan]"
+                        )
+
+        if concurrent:
+            console.print(f"[cyan]Running {total} BDInfo scans across {len(device_locks)} devices[/cyan]")
+        await asyncio.gather(*(_run_scan(scan) for scan in pending))
+
     async def get_bdinfo(
         self,
         meta: dict[str, Any],
@@ -103,6 +311,8 @@ class DiscParse:
         if meta.get("emby", False):
             return discs, meta_discs
 
+        # Work out which discs still need scanning, then parse all of their playlists concurrently
+        to_scan: list[tuple[int, str]] = []
         for i in range(len(discs)):
             bdinfo_text = None
             path = os.path.abspath(discs[i]["path"])
@@ -114,7 +324,6 @@ class DiscParse:
                 if file == f"BD_SUMMARY_{str(i).zfill(2)}.txt":
                     bdinfo_text = save_dir + "/" + file
             if bdinfo_text is None or meta_discs == []:
-                bdinfo_text = ""
                 playlists_path = os.path.join(path, "PLAYLIST")
 
                 if not os.path.exists(playlists_path):
@@ -123,285 +332,171 @@ class DiscParse:
 
                 if meta.get("debug"):
                     console.print(f"[cyan]Parsing playlists from: {playlists_path}")
+                to_scan.append((i, path))
+            else:
+                discs = meta_discs
 
-                def _load_mpls(mpls_path: str) -> tuple[Any, Any]:
-                    with open(mpls_path, "rb") as mpls_file:
-                        parser = MplsParser(mpls_file)
-                        header = parser.load_movie_playlist()
-                        mpls_file.seek(header.playlist_start_address, os.SEEK_SET)
-                        playlist_data = parser.load_playlist()
-                    return header, playlist_data
-
-                # Parse playlists
-                valid_playlists: list[PlaylistInfo] = []
-                for file_name in os.listdir(playlists_path):
-                    if not file_name.endswith(".mpls"):
-                        continue
-
-                    mpls_path = os.path.join(playlists_path, file_name)
-                    if meta.get("debug"):
-                        console.print(f"[cyan]Processing playlist: {file_name}")
+        parsed_playlists = await asyncio.gather(*(asyncio.to_thread(self._load_disc_playlists, path, bool(meta.get("debug"))) for _i, path in to_scan))
 
-                    try:
-                        _, playlist_data = await asyncio.to_thread(_load_mpls, mpls_path)
-                        duration: float = 0.0
-                        stream_directory = os.path.join(path, "STREAM")
-                        file_counts: defaultdict[str, int] = defaultdict(int)
-                        file_sizes: dict[str, int] = {}
-
-                        play_items = getattr(playlist_data, "play_items", None)
-                        if not play_items:
-                            if meta.get("debug"):
-                                console.print(f"[yellow]  No play_items found in {file_name}")
-                            continue
+        # Playlist selection may prompt, so it stays sequential
+        scans: list[dict[str, Any]] = []
+        disc_selections: list[tuple[int, str, list[PlaylistInfo], list[PlaylistInfo]]] = []
+        for (i, path), valid_playlists in zip(to_scan, parsed_playlists):
+            if not valid_playlists:
+                console.print(f"[bold red]No playlists found for disc {path}")
+                continue
 
-                        if meta.get("debug"):
-                            console.print(f"[cyan]  Found {len(play_items)} play items in {file_name}")
+            scored_playlists = [(p, self._calculate_playlist_score(p)) for p in valid_playlists]
+            scored_playlists.sort(key=lambda x: x[1], reverse=True)
+            top_playlists = [p for p, _score in scored_playlists[:5]]
 
-                        for item in play_items:
-                            intime = getattr(item, "intime", None)
-                            outtime = getattr(item, "outtime", None)
-                            if intime is None or outtime is None:
-                                continue
-                            duration += (outtime - intime) / 45000.0
+            if use_largest or (meta["unattended"] and not meta.get("unattended_confirm", False)):
+                best_playlist, best_score = scored_playlists[0]
+                console.print(f"[yellow]Auto-selecting best playlist using weighted scoring: {best_playlist['file']} ({best_score:.2f})")
+                selected_playlists = [best_playlist]
+            else:
+                if len(top_playlists) == 1:
+                    console.print("[yellow]Only one playlist found. Automatically selecting.")
+                    selected_playlists = top_playlists
+                else:
+                    while True:
+                        console.print("[bold green]Available top playlists (by score):")
+                        for idx, playlist in enumerate(top_playlists):
+                            duration_str = f"{int(playlist['duration'] // 3600)}h {int((playlist['duration'] % 3600) // 60)}m {int(playlist['duration'] % 60)}s"
+                            items_str = ", ".join(f"{os.path.basename(item['file'])} ({item['size'] // (1024 * 1024)} MB)" for item in playlist["items"])
+                            score = self._calculate_playlist_score(playlist)
+                            console.print(f"[{idx}] {playlist['file']} - {duration_str} - score {score:.2f} - {items_str}")
+
+                        console.print("[bold yellow]Enter playlist numbers separated by commas, 'ALL' to select all, or press Enter to select the top-scoring playlist:")
+                        user_input_raw = cli_ui.ask_string("Select playlists: ")
+                        user_input = (user_input_raw or "").strip().lower()
+
+                        if user_input == "all":
+                            selected_playlists = top_playlists
+                            break
+                        elif user_input == "":
+                            selected_playlists = [top_playlists[0]]
+                            break
+                        else:
                             try:
-                                clip_name = getattr(item, "clip_information_filename", None)
-                                if not isinstance(clip_name, str):
-                                    continue
-                                clip_name = clip_name.strip()
-                                if not clip_name:
-                                    continue
-                                m2ts_file = os.path.join(stream_directory, clip_name + ".m2ts")
-                                if os.path.exists(m2ts_file):
-                                    size = os.path.getsize(m2ts_file)
-                                    file_counts[m2ts_file] += 1
-                                    file_sizes[m2ts_file] = size
-                                elif meta.get("debug"):
-                                    console.print(f"[yellow]    Missing m2ts file: {clip_name}.m2ts")
-                            except AttributeError as e:
-                                console.print(f"[bold red]Error accessing clip information for item in {file_name}: {e}")
-
-                        if not file_sizes:
-                            if meta.get("debug"):
-                                console.print(f"[yellow]  No m2ts files found for {file_name}")
-                            continue
-
-                        items = [{"file": file, "size": file_sizes[file]} for file in file_counts]
-                        total_size = sum(file_sizes.values())
-                        valid_playlists.append({"file": file_name, "duration": duration, "path": mpls_path, "items": items})
+                                selected_indices = [int(x) for x in user_input.split(",")]
+                                selected_playlists = [top_playlists[idx] for idx in selected_indices if 0 <= idx < len(top_playlists)]
+                                if selected_playlists:
+                                    break
+                                console.print("[bold red]No valid selections. Please try again.")
+                            except ValueError:
+                                console.print("[bold red]Invalid input. Please try again.")
+
+            disc_selections.append((i, path, valid_playlists, selected_playlists))
+            for idx, playlist in enumerate(selected_playlists):
+                playlist_number = playlist["file"].replace(".mpls", "")
+                scans.append(
+                    {
+                        "disc_index": i,
+                        "disc_name": f"Disc{i + 1}",
+                        "idx": idx,
+                        "path": path,
+                        "playlist": playlist,
+                        "playlist_number": playlist_number,
+                        "report_path": os.path.join(save_dir, f"Disc{i + 1}_{playlist_number}_FULL.txt"),
+                        "report": None,
+                    }
+                )
 
-                        if meta.get("debug"):
-                            duplicates = [f for f, c in file_counts.items() if c > 1]
-                            if duplicates:
-                                console.print(
-                                    f"[green]  ✓ Added {file_name}: {duration:.1f}s, {len(file_sizes)} unique files ({len(duplicates)} files repeated), {total_size // (1024 * 1024)} MB total"
-                                )
-                            else:
-                                console.print(f"[green]  ✓ Added {file_name}: {duration:.1f}s, {len(items)} unique files, {total_size // (1024 * 1024)} MB total")
-                    except Exception as e:
-                        console.print(f"[bold red]Error parsing playlist {mpls_path}: {e}")
+        await self._scan_bdinfo_playlists(scans, base_dir, save_dir)
 
-                if not valid_playlists:
-                    console.print(f"[bold red]No playlists found for disc {path}")
+        reports = {(scan["disc_index"], scan["idx"]): scan["report"] for scan in scans}
+        for i, path, valid_playlists, selected_playlists in disc_selections:
+            for idx, playlist in enumerate(selected_playlists):
+                bdinfo_text = reports.get((i, idx))
+                playlist_number = playlist["file"].replace(".mpls", "")
+                if bdinfo_text is None:
                     continue
 
-                scored_playlists = [(p, self._calculate_playlist_score(p)) for p in valid_playlists]
-                scored_playlists.sort(key=lambda x: x[1], reverse=True)
-                top_playlists = [p for p, _score in scored_playlists[:5]]
-
-                if use_largest or (meta["unattended"] and not meta.get("unattended_confirm", False)):
-                    best_playlist, best_score = scored_playlists[0]
-                    console.print(f"[yellow]Auto-selecting best playlist using weighted scoring: {best_playlist['file']} ({best_score:.2f})")
-                    selected_playlists = [best_playlist]
-                else:
-                    if len(top_playlists) == 1:
-                        console.print("[yellow]Only one playlist found. Automatically selecting.")
-                        selected_playlists = top_playlists
-                    else:
-                        while True:
-                            console.print("[bold green]Available top playlists (by score):")
-                            for idx, playlist in enumerate(top_playlists):
-                                duration_str = f"{int(playlist['duration'] // 3600)}h {int((playlist['duration'] % 3600) // 60)}m {int(playlist['duration'] % 60)}s"
-                                items_str = ", ".join(f"{os.path.basename(item['file'])} ({item['size'] // (1024 * 1024)} MB)" for item in playlist["items"])
-                                score = self._calculate_playlist_score(playlist)
-                                console.print(f"[{idx}] {playlist['file']} - {duration_str} - score {score:.2f} - {items_str}")
-
-                            console.print("[bold yellow]Enter playlist numbers separated by commas, 'ALL' to select all, or press Enter to select the top-scoring playlist:")
-                            user_input_raw = cli_ui.ask_string("Select playlists: ")
-                            user_input = (user_input_raw or "").strip().lower()
-
-                            if user_input == "all":
-                                selected_playlists = top_playlists
-                                break
-                            elif user_input == "":
-                                selected_playlists = [top_playlists[0]]
-                                break
-                            else:
-                                try:
-                                    selected_indices = [int(x) for x in user_input.split(",")]
-                                    selected_playlists = [top_playlists[idx] for idx in selected_indices if 0 <= idx < len(top_playlists)]
-                                    if selected_playlists:
-                                        break
-                                    console.print("[bold red]No valid selections. Please try again.")
-                                except ValueError:
-                                    console.print("[bold red]Invalid input. Please try again.")
-
-                for idx, playlist in enumerate(selected_playlists):
-                    console.print(
-                        f"[bold green]Scanning playlist {playlist['file']} with duration {int(playlist['duration'] // 3600)} hours {int((playlist['duration'] % 3600) // 60)} minutes {int(playlist['duration'] % 60)} seconds"
-                    )
-                    playlist_number = playlist["file"].replace(".mpls", "")
-                    playlist_report_path = os.path.join(save_dir, f"Disc{i + 1}_{playlist_number}_FULL.txt")
-
-                    if os.path.exists(playlist_report_path):
-                        bdinfo_text = playlist_report_path
-                    else:
-                        try:
-                            bdinfo_executable = None
-                            # Prefer the bundled bdinfo binary for the detected OS/arch
-                            system = platform.system().lower()
-                            machine = platform.machine().lower()
-                            if system == "linux":
-                                if machine in ("x86_64", "amd64"):
-                                    folder = "linux/amd64"
-                                elif machine in ("arm64", "aarch64"):
-                                    folder = "linux/arm64"
-                                else:
-                                    folder = "linux/arm"
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, path, "-m", playlist["file"], save_dir]
-                            elif system == "darwin":
-                                folder = "macos/arm64" if machine in ("arm64",) else "macos/x86_64"
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, path, "-m", playlist["file"], save_dir]
-                            elif system == "windows":
-                                # Windows builds are provided as x64
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/windows/x86_64/bdinfo.exe"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, "-m", playlist["file"], path, save_dir]
-
-                            # Fallback to system-installed commands if bundled binary not present
-                            if bdinfo_executable is None:
-                                if shutil.which("bdinfo"):
-                                    bdinfo_executable = ["bdinfo", path, "-m", playlist["file"], save_dir]
-                                elif shutil.which("BDInfo"):
-                                    bdinfo_executable = ["BDInfo", path, "-m", playlist["file"], save_dir]
-                                else:
-                                    console.print(
-                                        f"[bold red]BDInfo not found. Please download bdinfo and place it under {base_dir}/bin/bdinfo/ or install a system bdinfo/BDInfo binary[/bold red]"
-                                    )
-                                    continue
-
-                            if bdinfo_executable:
-                                proc = await asyncio.create_subprocess_exec(*bdinfo_executable)
-                                await proc.wait()
-
-                                if proc.returncode != 0:
-                                    console.print(f"[bold red]BDInfo failed with return code {proc.returncode}[/bold red]")
-                                    continue
-
-                                # Rename the output to playlist_report_path
-                                for file in os.listdir(save_dir):
-                                    if file.startswith("BDINFO") and file.endswith(".txt"):
-                                        bdinfo_text = os.path.join(save_dir, file)
-                                        shutil.move(bdinfo_text, playlist_report_path)
-                                        bdinfo_text = playlist_report_path  # Update bdinfo_text to the renamed file
-                                        break
-                        except Exception as e:
-                            console.print(f"[bold red]Error scanning playlist {playlist['file']}: {e}")
-                            continue
-
-                    # Process the BDInfo report in the while True loop
-                    while True:
-                        try:
-                            if not os.path.exists(bdinfo_text):
-                                console.print(f"[bold red]No valid BDInfo file found for playlist {playlist_number}.")
-                                break
-
-                            text = await asyncio.to_thread(Path(bdinfo_text).read_text, encoding="utf-8", errors="replace")
-                            result = text.split("QUICK SUMMARY:", 2)
-                            files = result[0].split("FILES:", 2)[1].split("CHAPTERS:", 2)[0].split("-------------")
-                            result2 = result[1].rstrip(" \n")
-                            result = result2.split("********************", 1)
-                            bd_summary = result[0].rstrip(" \n")
-
-                            result = text.split("[code]", 3)
-                            result2 = result[2].rstrip(" \n")
-                            result = result2.split("FILES:", 1)
-                            ext_bd_summary = result[0].rstrip(" \n")
-
-                            # Save summaries and bdinfo for each playlist
-                            if idx == 0:
-                                summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}.txt"
-                                extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}.txt"
-                            else:
-                                summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}_{idx}.txt"
-                                extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}_{idx}.txt"
-
-                            # Strip multiple spaces to single spaces before saving
-                            bd_summary_cleaned = re.sub(r" +", " ", bd_summary.strip())
-                            ext_bd_summary_cleaned = re.sub(r" +", " ", ext_bd_summary.strip())
-
-                            await asyncio.to_thread(Path(summary_file).write_text, bd_summary_cleaned, encoding="utf-8", errors="replace")
-                            await asyncio.to_thread(Path(extended_summary_file).write_text, ext_bd_summary_cleaned, encoding="utf-8", errors="replace")
-
-                            bdinfo = self.parse_bdinfo(bd_summary_cleaned, files[1], path)
-
-                            # Prompt user for custom edition if conditions are met
-                            if len(selected_playlists) > 1:
-                                current_label = bdinfo.get("label", f"Playlist {idx}")
-                                console.print(f"[bold yellow]Current label for playlist {playlist['file']}: {current_label}")
-
-                                if not meta["unattended"] or (meta["unattended"] and meta.get("unattended_confirm", False)):
-                                    console.print("[bold green]You can create a custom Edition for this playlist.")
-                                    user_input_raw = cli_ui.ask_string(
-                                        f"Enter a new Edition title for playlist {playlist['file']} (or press Enter to keep the current label): "
-                                    )
-                                    user_input = (user_input_raw or "").strip()
-                                    if user_input:
-                                        bdinfo["edition"] = user_input
-                                        selected_playlists[idx]["edition"] = user_input
-                                        console.print(f"[bold green]Edition updated to: {bdinfo['edition']}")
-                                else:
-                                    console.print("[bold yellow]Unattended mode: Custom edition not added.")
-
-                            # Save to discs array
-                            if idx == 0:
-                                discs[i]["summary"] = bd_summary_cleaned
-                                discs[i]["bdinfo"] = bdinfo
-                                discs[i]["playlists"] = selected_playlists
-                                if valid_playlists and meta["unattended"] and not meta.get("unattended_confirm", False):
-                                    simplified_playlists: list[dict[str, Any]] = [{"file": p["file"], "duration": p["duration"]} for p in valid_playlists]
-                                    duration_map: dict[int, dict[str, Any]] = {}
-
-                                    # Store simplified version with only file and duration, keeping only one per unique duration
-                                    for playlist in valid_playlists:
-                                        rounded_duration = round(float(playlist["duration"]))
-                                        if rounded_duration in duration_map:
-                                            continue
-
-                                        duration_map[rounded_duration] = {"file": playlist["file"], "duration": playlist["duration"]}
-
-                                    simplified_playlists = list(duration_map.values())
-                                    simplified_playlists.sort(key=lambda x: float(x["duration"]), reverse=True)
-                                    discs[i]["all_valid_playlists"] = simplified_playlists
-
-                                    if meta["debug"]:
-                                        console.print(f"[cyan]Stored {len(simplified_playlists)} unique playlists by duration (from {len(valid_playlists)} total)")
+                # Process the BDInfo report in the while True loop
+                while True:
+                    try:
+                        if not os.path.exists(bdinfo_text):
+                            console.print(f"[bold red]No valid BDInfo file found for playlist {playlist_number}.")
+                            break
+
+                        text = await asyncio.to_thread(Path(bdinfo_text).read_text, encoding="utf-8", errors="replace")
+                        result = text.split("QUICK SUMMARY:", 2)
+                        files = result[0].split("FILES:", 2)[1].split("CHAPTERS:", 2)[0].split("-------------")
+                        result2 = result[1].rstrip(" \n")
+                        result = result2.split("********************", 1)
+                        bd_summary = result[0].rstrip(" \n")
+
+                        result = text.split("[code]", 3)
+                        result2 = result[2].rstrip(" \n")
+                        result = result2.split("FILES:", 1)
+                        ext_bd_summary = result[0].rstrip(" \n")
+
+                        # Save summaries and bdinfo for each playlist
+                        if idx == 0:
+                            summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}.txt"
+                            extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}.txt"
+                        else:
+                            summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}_{idx}.txt"
+                            extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}_{idx}.txt"
+
+                        # Strip multiple spaces to single spaces before saving
+                        bd_summary_cleaned = re.sub(r" +", " ", bd_summary.strip())
+                        ext_bd_summary_cleaned = re.sub(r" +", " ", ext_bd_summary.strip())
+
+                        await asyncio.to_thread(Path(summary_file).write_text, bd_summary_cleaned, encoding="utf-8", errors="replace")
+                        await asyncio.to_thread(Path(extended_summary_file).write_text, ext_bd_summary_cleaned, encoding="utf-8", errors="replace")
+
+                        bdinfo = self.parse_bdinfo(bd_summary_cleaned, files[1], path)
+
+                        # Prompt user for custom edition if conditions are met
+                        if len(selected_playlists) > 1:
+                            current_label = bdinfo.get("label", f"Playlist {idx}")
+                            console.print(f"[bold yellow]Current label for playlist {playlist['file']}: {current_label}")
+
+                            if not meta["unattended"] or (meta["unattended"] and meta.get("unattended_confirm", False)):
+                                console.print("[bold green]You can create a custom Edition for this playlist.")
+                                user_input_raw = cli_ui.ask_string(f"Enter a new Edition title for playlist {playlist['file']} (or press Enter to keep the current label): ")
+                                user_input = (user_input_raw or "").strip()
+                                if user_input:
+                                    bdinfo["edition"] = user_input
+                                    selected_playlists[idx]["edition"] = user_input
+                                    console.print(f"[bold green]Edition updated to: {bdinfo['edition']}")
                             else:
-                                discs[i][f"summary_{idx}"] = bd_summary_cleaned
-                                discs[i][f"bdinfo_{idx}"] = bdinfo
-
-                        except Exception:
-                            console.print(traceback.format_exc())
-                            await asyncio.sleep(5)
-                            continue
-                        break
+                                console.print("[bold yellow]Unattended mode: Custom edition not added.")
+
+                        # Save to discs array
+                        if idx == 0:
+                            discs[i]["summary"] = bd_summary_cleaned
+                            discs[i]["bdinfo"] = bdinfo
+                            discs[i]["playlists"] = selected_playlists
+                            if valid_playlists and meta["unattended"] and not meta.get("unattended_confirm", False):
+                                simplified_playlists: list[dict[str, Any]] = [{"file": p["file"], "duration": p["duration"]} for p in valid_playlists]
+                                duration_map: dict[int, dict[str, Any]] = {}
+
+                                # Store simplified version with only file and duration, keeping only one per unique duration
+                                for valid_playlist in valid_playlists:
+                                    rounded_duration = round(float(valid_playlist["duration"]))
+                                    if rounded_duration in duration_map:
+                                        continue
+
+                                    duration_map[rounded_duration] = {"file": valid_playlist["file"], "duration": valid_playlist["duration"]}
+
+                                simplified_playlists = list(duration_map.values())
+                                simplified_playlists.sort(key=lambda x: float(x["duration"]), reverse=True)
+                                discs[i]["all_valid_playlists"] = simplified_playlists
+
+                                if meta["debug"]:
+                                    console.print(f"[cyan]Stored {len(simplified_playlists)} unique playlists by duration (from {len(valid_playlists)} total)")
+                        else:
+                            discs[i][f"summary_{idx}"] = bd_summary_cleaned
+                            discs[i][f"bdinfo_{idx}"] = bdinfo
 
-            else:
-                discs = meta_discs
+                    except Exception:
+                        console.print(traceback.format_exc())
+                        await asyncio.sleep(5)
+                        continue
+                    break
 
         return discs, discs[0]["bdinfo"]
 
@@ -544,146 +639,140 @@ class DiscParse:
     Parse VIDEO_TS and get mediainfos
     """
 
-    async def get_dvdinfo(self, discs: list[dict[str, Any]], base_dir: Optional[str] = None, debug: bool = False) -> list[dict[str, Any]]:
-        mediainfo_binary = self.setup_mediainfo_for_dvd(base_dir, debug=debug)
-
-        for each in discs:
-            path = each.get("path")
-            if not isinstance(path, str) or not path:
-                continue
-            os.chdir(path)
-            files = glob("VTS_*.VOB")
-            files.sort()
-            filesdict: OrderedDict[str, list[str]] = OrderedDict()
-            main_set: list[str] = []
-            for file in files:
-                trimmed = file[4:]
-                if trimmed[:2] not in filesdict:
-                    filesdict[trimmed[:2]] = []
-                filesdict[trimmed[:2]].append(trimmed)
-            main_set_duration: float = 0.0
-
-            for vob_set in filesdict.values():
-                try:
-                    ifo_file = f"VTS_{vob_set[0][:2]}_0.IFO"
-
-                    try:
-                        if mediainfo_binary:
-                            process = await asyncio.create_subprocess_exec(
-                                mediainfo_binary, "--Output=JSON", ifo_file, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-                            )
-                            stdout, stderr = await process.communicate()
-
-                            if process.returncode == 0 and stdout:
-                                vob_set_mi = stdout.decode()
-                            else:
-                                console.print(f"[yellow]Specialized MediaInfo failed for {ifo_file}, falling back to standard[/yellow]")
-                                if stderr:
-                                    console.print(f"[red]MediaInfo stderr: {stderr.decode()}[/red]")
-                                vob_set_mi = MediaInfo.parse(ifo_file, output="JSON")
-                        else:
-                            vob_set_mi = MediaInfo.parse(ifo_file, output="JSON")
-
-                    except Exception as e:
-                        console.print(f"[yellow]Error with DVD MediaInfo binary for JSON: {str(e)}")
-                        # Fall back to standard MediaInfo
-                        vob_set_mi = MediaInfo.parse(ifo_file, output="JSON")
-
-                    vob_set_mi = json.loads(vob_set_mi)
-                    tracks = vob_set_mi.get("media", {}).get("track", [])
-
-                    if len(tracks) > 1:
-                        vob_set_duration = tracks[1].get("Duration", "Unknown")
-                    else:
-                        console.print("Warning: Expected track[1] is missing.")
-                        vob_set_duration = "Unknown"
-
-                except Exception as e:
-                    console.print(f"Error processing VOB set: {e}")
-                    vob_set_duration = "Unknown"
-
-                if vob_set_duration == "Unknown" or not vob_set_duration.replace(".", "", 1).isdigit():
-                    console.print(f"Skipping VOB set due to invalid duration: {vob_set_duration}")
-                    continue
-
-                # If the duration of the new vob set > main set by more than 10%, it's the new main set
-                # This should make it so TV shows pick the first episode
-                vob_set_duration_float = float(vob_set_duration)
-                if (vob_set_duration_float * 1.00) > (float(main_set_duration) * 1.10) or len(main_set) < 1:
-                    main_set = vob_set
-                    main_set_duration = vob_set_duration_float
-
-            each["main_set"] = main_set
-            set = main_set[0][:2]
-            each["vob"] = vob = f"{path}/VTS_{set}_1.VOB"
-            each["ifo"] = ifo = f"{path}/VTS_{set}_0.IFO"
+    @staticmethod
+    def _dvd_ifo_fingerprint(path: str) -> tuple[Any, ...]:
+        """Identify a VIDEO_TS folder by the name, size and mtime of its IFO files."""
+        entries: list[tuple[str, int, int]] = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.upper().endswith(".IFO"):
+                    stat = entry.stat()
+                    entries.append((entry.name, stat.st_size, stat.st_mtime_ns))
+        entries.sort()
+        return (os.path.realpath(path), tuple(entries))
+
+    async def _run_dvd_mediainfo(self, mediainfo_binary: Optional[str], path: str, filename: str, semaphore: asyncio.Semaphore, label: str, json_output: bool = False) -> str:
+        """Run mediainfo against a file inside ``path`` so the report only carries the basename.
+
+        The subprocess gets ``cwd=path`` rather than changing the process-wide working
+        directory, which keeps concurrent discs from stepping on each other.
+        """
+        output_format = "JSON" if json_output else "STRING"
 
-            # Use basenames for mediainfo processing to avoid full paths in output
-            vob_basename = os.path.basename(vob)
-            ifo_basename = os.path.basename(ifo)
+        def _fallback() -> str:
+            output = MediaInfo.parse(os.path.join(path, filename), output=output_format, full=False)
+            output = str(output).replace("\r\n", "\n")
+            if not json_output:
+                output = output.replace(f"{path}{os.sep}", "").replace(f"{path}/", "")
+            return output
 
+        async with semaphore:
             try:
-                # Process VOB file
-                try:
-                    if mediainfo_binary:
-                        process = await asyncio.create_subprocess_exec(mediainfo_binary, vob_basename, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
-                        stdout, stderr = await process.communicate()
+                if mediainfo_binary:
+                    args = [mediainfo_binary, "--Output=JSON", filename] if json_output else [mediainfo_binary, filename]
+                    process = await asyncio.create_subprocess_exec(*args, cwd=path, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+                    stdout, stderr = await process.communicate()
+
+                    if process.returncode == 0 and stdout:
+                        return stdout.decode().replace("\r\n", "\n")
+                    console.print(f"[yellow]Specialized MediaInfo failed for {label}, falling back to standard[/yellow]")
+                    if stderr:
+                        console.print(f"[red]MediaInfo stderr: {stderr.decode()}[/red]")
+            except Exception as e:
+                console.print(f"[yellow]Error with DVD MediaInfo binary for {label}: {str(e)}")
 
-                        if process.returncode == 0 and stdout:
-                            vob_mi_output = stdout.decode().replace("\r\n", "\n")
-                        else:
-                            console.print("[yellow]Specialized MediaInfo failed for VOB, falling back[/yellow]")
-                            if stderr:
-                                console.print(f"[red]MediaInfo stderr: {stderr.decode()}[/red]")
-                            vob_mi_output = MediaInfo.parse(vob_basename, output="STRING", full=False).replace("\r\n", "\n")
-                    else:
-                        vob_mi_output = MediaInfo.parse(vob_basename, output="STRING", full=False).replace("\r\n", "\n")
-                except Exception as e:
-                    console.print(f"[yellow]Error with DVD MediaInfo binary for VOB: {str(e)}")
-                    vob_mi_output = MediaInfo.parse(vob_basename, output="STRING", full=False).replace("\r\n", "\n")
+            return await asyncio.to_thread(_fallback)
 
-                # Store VOB mediainfo (same output for both keys)
-                each["vob_mi"] = vob_mi_output
-                each["vob_mi_full"] = vob_mi_output
+    async def _get_vob_set_duration(self, mediainfo_binary: Optional[str], path: str, vob_set: list[str], semaphore: asyncio.Semaphore) -> str:
+        ifo_file = f"VTS_{vob_set[0][:2]}_0.IFO"
+        try:
+            vob_set_mi = json.loads(await self._run_dvd_mediainfo(mediainfo_binary, path, ifo_file, semaphore, ifo_file, json_output=True))
+            tracks = vob_set_mi.get("media", {}).get("track", [])
+
+            if len(tracks) > 1:
+                return tracks[1].get("Duration", "Unknown")
+            console.print("Warning: Expected track[1] is missing.")
+            return "Unknown"
+
+        except Exception as e:
+            console.print(f"Error processing VOB set: {e}")
+            return "Unknown"
+
+    async def _get_single_dvdinfo(self, each: dict[str, Any], path: str, mediainfo_binary: Optional[str], semaphore: asyncio.Semaphore) -> None:
+        fingerprint = self._dvd_ifo_fingerprint(path)
+        cached = _dvd_info_cache.get(fingerprint)
+        if cached is not None:
+            each.update(copy.deepcopy(cached))
+            return
+
+        files = sorted(name for name in os.listdir(path) if fnmatch.fnmatchcase(name, "VTS_*.VOB"))
+        filesdict: OrderedDict[str, list[str]] = OrderedDict()
+        main_set: list[str] = []
+        for file in files:
+            trimmed = file[4:]
+            if trimmed[:2] not in filesdict:
+                filesdict[trimmed[:2]] = []
+            filesdict[trimmed[:2]].append(trimmed)
+        main_set_duration: float = 0.0
+
+        vob_sets = list(filesdict.values())
+        durations = await asyncio.gather(*(self._get_vob_set_duration(mediainfo_binary, path, vob_set, semaphore) for vob_set in vob_sets))
+
+        for vob_set, vob_set_duration in zip(vob_sets, durations):
+            if vob_set_duration == "Unknown" or not vob_set_duration.replace(".", "", 1).isdigit():
+                console.print(f"Skipping VOB set due to invalid duration: {vob_set_duration}")
+                continue
 
-                # Process IFO file
-                try:
-                    if mediainfo_binary:
-                        process = await asyncio.create_subprocess_exec(mediainfo_binary, ifo_basename, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
-                        stdout, stderr = await process.communicate()
+            # If the duration of the new vob set > main set by more than 10%, it's the new main set
+            # This should make it so TV shows pick the first episode
+            vob_set_duration_float = float(vob_set_duration)
+            if (vob_set_duration_float * 1.00) > (float(main_set_duration) * 1.10) or len(main_set) < 1:
+                main_set = vob_set
+                main_set_duration = vob_set_duration_float
+
+        result: dict[str, Any] = {"main_set": main_set}
+        set = main_set[0][:2]
+        result["vob"] = vob = f"{path}/VTS_{set}_1.VOB"
+        result["ifo"] = ifo = f"{path}/VTS_{set}_0.IFO"
+
+        # Use basenames for mediainfo processing to avoid full paths in output
+        vob_basename = os.path.basename(vob)
+        ifo_basename = os.path.basename(ifo)
+
+        vob_mi_output, ifo_mi_output = await asyncio.gather(
+            self._run_dvd_mediainfo(mediainfo_binary, path, vob_basename, semaphore, "VOB"),
+            self._run_dvd_mediainfo(mediainfo_binary, path, ifo_basename, semaphore, "IFO"),
+        )
+
+        # Store VOB/IFO mediainfo (same output for both keys)
+        result["vob_mi"] = vob_mi_output
+        result["vob_mi_full"] = vob_mi_output
+        result["ifo_mi"] = ifo_mi_output
+        result["ifo_mi_full"] = ifo_mi_output
+
+        size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path) if os.path.isfile(os.path.join(path, f))) / float(1 << 30)
+        result["disc_size"] = round(size, 2)
+        dvd_size = "DVD9"
+        if size <= 4.37:
+            dvd_size = "DVD5"
+        result["size"] = dvd_size
+
+        _dvd_info_cache[fingerprint] = copy.deepcopy(result)
+        each.update(result)
 
-                        if process.returncode == 0 and stdout:
-                            ifo_mi_output = stdout.decode().replace("\r\n", "\n")
-                        else:
-                            console.print("[yellow]Specialized MediaInfo failed for IFO, falling back[/yellow]")
-                            if stderr:
-                                console.print(f"[red]MediaInfo stderr: {stderr.decode()}[/red]")
-                            ifo_mi_output = MediaInfo.parse(ifo_basename, output="STRING", full=False).replace("\r\n", "\n")
-                    else:
-                        ifo_mi_output = MediaInfo.parse(ifo_basename, output="STRING", full=False).replace("\r\n", "\n")
-                except Exception as e:
-                    console.print(f"[yellow]Error with DVD MediaInfo binary for IFO: {str(e)}")
-                    ifo_mi_output = MediaInfo.parse(ifo_basename, output="STRING", full=False).replace("\r\n", "\n")
+    async def get_dvdinfo(self, discs: list[dict[str, Any]], base_dir: Optional[str] = None, debug: bool = False) -> list[dict[str, Any]]:
+        mediainfo_binary = self.setup_mediainfo_for_dvd(base_dir, debug=debug)
+        # One pool for every disc, so a box set never runs more than process_limit mediainfo instances
+        semaphore = asyncio.Semaphore(self._process_limit())
 
-                each["ifo_mi"] = ifo_mi_output
-                each["ifo_mi_full"] = ifo_mi_output
+        tasks: list[Any] = []
+        for each in discs:
+            path = each.get("path")
+            if not isinstance(path, str) or not path:
+                continue
+            tasks.append(self._get_single_dvdinfo(each, path, mediainfo_binary, semaphore))
 
-            except Exception as e:
-                console.print(f"[yellow]Error using DVD MediaInfo binary, falling back to standard: {e}")
-                # Fallback to standard MediaInfo using basenames
-                vob_mi_output = MediaInfo.parse(vob_basename, output="STRING", full=False).replace("\r\n", "\n")
-                ifo_mi_output = MediaInfo.parse(ifo_basename, output="STRING", full=False).replace("\r\n", "\n")
-                each["vob_mi"] = vob_mi_output
-                each["ifo_mi"] = ifo_mi_output
-                each["vob_mi_full"] = vob_mi_output
-                each["ifo_mi_full"] = ifo_mi_output
-
-            size = sum(os.path.getsize(f) for f in os.listdir(".") if os.path.isfile(f)) / float(1 << 30)
-            each["disc_size"] = round(size, 2)
-            dvd_size = "DVD9"
-            if size <= 4.37:
-                dvd_size = "DVD5"
-            each["size"] = dvd_size
+        await asyncio.gather(*tasks)
         return discs
 
     async def get_hddvd_info(self, discs: list[dict[str, Any]], meta: dict[str, Any]):
@@ -56,13 +56,12 @@ class DupeChecker:
                 dupes_to_print: list[dict[str, Any]] = []
                 for dupe in dupes:
                     if isinstance(dupe, dict) and "files" in dupe and isinstance(dupe["files"], list):
-                        # Limit files list to first 10 items
-                        limited_dupe = Redaction.redact_private_info(dupe).copy()
-                        limited_files = cast(list[str], limited_dupe.get("files", []))
-                        if len(limited_files) > 10:
-                            dupe_files = cast(list[str], dupe.get("files", []))
-                            limited_dupe["files"] = limited_files[:10] + [f"... and {len(dupe_files) - 10} more files"]
-                        dupes_to_print.append(limited_dupe)
+                        # Limit files list to first 10 items, before redacting so the rest is never copied
+                        limited_dupe = dict(dupe)
+                        dupe_files = cast(list[str], dupe.get("files", []))
+                        if len(dupe_files) > 10:
+                            limited_dupe["files"] = dupe_files[:10] + [f"... and {len(dupe_files) - 10} more files"]
+                        dupes_to_print.append(Redaction.redact_private_info(limited_dupe))
                     else:
                         dupes_to_print.append(Redaction.redact_private_info(dupe))
                 console.log(dupes_to_print)
@@ -627,13 +626,14 @@ class DupeChecker:
             filtered_dupes_to_print: list[dict[str, Any]] = []
 
             for dupe in new_dupes:
-                limited_dupe = Redaction.redact_private_info(dupe).copy()
-                # Limit files list to first 10 items
-                limited_files = limited_dupe.get("files", [])
-                if len(limited_files) > 10:
-                    dupe_files = dupe.get("files", [])
-                    limited_dupe["files"] = limited_files[:10] + [f"... and {len(dupe_files) - 10} more files"]
-
+                # Limit files list to first 10 items, before redacting so the rest is never copied
+                limited_dupe = dict(dupe)
+                dupe_files = dupe.get("files", [])
+                if len(dupe_files) > 10:
+                    limited_dupe["files"] = dupe_files[:10] + [f"... and {len(dupe_files) - 10} more files"]
+                limited_dupe = Redaction.redact_private_info(limited_dupe)
+
+                # The description is cut after redacting, so a secret is never split at the cut
                 if isinstance(limited_dupe.get("description"), str) and len(limited_dupe["description"]) > 200:
                     limited_dupe["description"] = limited_dupe["description"][:200] + "..."
 
@@ -10,6 +10,7 @@ from typing import Any, Optional, Union, cast
 import aiofiles
 from pymediainfo import MediaInfo
 
+from src.checkpoints import MEDIAINFO, UploadCheckpoints
 from src.console import console
 
 
@@ -165,6 +166,7 @@ async def exportInfo(
     base_dir: str,
     is_dvd: bool = False,
     debug: bool = False,
+    checkpoints: Optional[UploadCheckpoints] = None,
 ) -> dict[str, Any]:
     def filter_mediainfo(data: dict[str, Any]) -> dict[str, Any]:
         media = data.get("media")
@@ -364,6 +366,18 @@ async def exportInfo(
                 )
         return filtered
 
+    export_dir = f"{base_dir}/tmp/{folder_id}"
+    export_files = [f"{export_dir}/MEDIAINFO.txt", f"{export_dir}/MEDIAINFO_CLEANPATH.txt", f"{export_dir}/MediaInfo.json"]
+    checkpoint_inputs = {"video": os.path.abspath(video), "is_dvd": bool(is_dvd)}
+    if checkpoints is not None and checkpoints.get(MEDIAINFO, checkpoint_inputs) is not None:
+        if not isdir:
+            os.chdir(os.path.dirname(video))
+        async with aiofiles.open(f"{export_dir}/MediaInfo.json", encoding="utf-8") as f:
+            mi = cast(dict[str, Any], json.loads(await f.read()))
+        if debug:
+            console.print("[bold green]Reusing MediaInfo exported by a previous run.")
+        return mi
+
     mediainfo_cmd = None
     mediainfo_config = None
 
@@ -508,6 +522,9 @@ async def exportInfo(
         if debug:
             console.print("[blue]Reset MediaInfo library configuration[/blue]")
 
+    if checkpoints is not None:
+        checkpoints.put(MEDIAINFO, checkpoint_inputs, files=export_files)
+
     return mi
 
 
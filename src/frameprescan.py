@@ -0,0 +1,84 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Scoring of low-resolution keyframe probes, used to pick screenshot times before capturing.
+
+Each screenshot slot is probed at a few keyframes, decoded as tiny grayscale frames. Black,
+white and flat frames (fades, title cards, credits on black) are rejected by their mean
+brightness and histogram entropy. Of the rest, the most detailed frame that does not repeat
+a shot already chosen for an earlier slot wins.
+"""
+
+import math
+from collections.abc import Sequence
+from typing import Optional
+
+PROBE_WIDTH = 64
+PROBE_HEIGHT = 36
+# Keyframes probed per screenshot slot
+CANDIDATES_PER_SCREEN = 3
+# Mean luma outside this range is a black or white frame
+MIN_MEAN = 20.0
+MAX_MEAN = 235.0
+# Histogram entropy (bits) below which a frame is flat
+MIN_ENTROPY = 3.0
+# Mean absolute luma difference below which two probes show the same shot
+MIN_DIFFERENCE = 6.0
+
+
+def frame_stats(gray: bytes) -> tuple[float, float]:
+    """Mean luma and histogram entropy (bits) of an 8-bit grayscale frame."""
+    counts = [0] * 256
+    for value in gray:
+        counts[value] += 1
+    total = len(gray)
+    mean = sum(value * count for value, count in enumerate(counts)) / total
+    entropy = -sum(count / total * math.log2(count / total) for count in counts if count)
+    return mean, entropy
+
+
+def frame_score(gray: bytes) -> Optional[float]:
+    """How much detail a probe shows, or None for a black, white or flat frame."""
+    if not gray:
+        return None
+    mean, entropy = frame_stats(gray)
+    if not MIN_MEAN <= mean <= MAX_MEAN or entropy < MIN_ENTROPY:
+        return None
+    return entropy
+
+
+def frame_difference(a: bytes, b: bytes) -> float:
+    """Mean absolute luma difference of two probes of the same size."""
+    return sum(abs(x - y) for x, y in zip(a, b)) / max(1, min(len(a), len(b)))
+
+
+def candidate_times(ss_time: float, slot: float, length: float) -> list[float]:
+    """Times to probe for the screenshot planned at ``ss_time``, spread forward through its slot."""
+    step = slot / CANDIDATES_PER_SCREEN
+    limit = length * 0.95 if length > 0 else ss_time + slot
+    return [min(ss_time + i * step, limit) for i in range(CANDIDATES_PER_SCREEN)]
+
+
+def choose_frames(slots: Sequence[Sequence[tuple[float, bytes]]]) -> list[Optional[float]]:
+    """The best probed time of each slot, or None where every probe was rejected.
+
+    Each slot holds ``(time, gray)`` probes. Candidates are taken by score, skipping any
+    that repeats the shot of a frame already chosen.
+    """
+    chosen: list[bytes] = []
+    result: list[Optional[float]] = []
+    for probes in slots:
+        scored = [(score, time, gray) for time, gray in probes if (score := frame_score(gray)) is not None]
+        pick: Optional[tuple[float, bytes]] = None
+        for _, time, gray in sorted(scored, key=lambda item: -item[0]):
+            if all(frame_difference(gray, other) >= MIN_DIFFERENCE for other in chosen):
+                pick = (time, gray)
+                break
+        if pick is None and scored:
+            # Only repeats of earlier shots: still better than a black frame
+            _, time, gray = max(scored, key=lambda item: item[0])
+            pick = (time, gray)
+        if pick is None:
+            result.append(None)
+        else:
+            chosen.append(pick[1])
+            result.append(pick[0])
+    return result
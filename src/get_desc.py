@@ -13,8 +13,9 @@ import httpx
 from jinja2 import Template
 from pymediainfo import MediaInfo
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, HIDE_TO_SPOILER, Conversion, comparison_to_collapse, remove_tags
 from src.console import console
+from src.descfragments import DescriptionFragments
 from src.languages import languages_manager
 from src.takescreens import TakeScreensManager
 from src.trackers.COMMON import COMMON
@@ -301,11 +302,11 @@ class DescriptionBuilder:
         if meta.get("is_disc") == "BDMV":
             return ""
 
+        fragments = DescriptionFragments.for_meta(meta)
         if self.tracker_config.get("full_mediainfo", self.config["DEFAULT"].get("full_mediainfo", False)):
             mi_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt"
             if await self.common.path_exists(mi_path):
-                async with aiofiles.open(mi_path, encoding="utf-8") as mi:
-                    return str(await mi.read())
+                return await fragments.read_text(mi_path)
 
         cache_file_dir = os.path.join(meta["base_dir"], "tmp", meta["uuid"])
         cache_file_path = os.path.join(cache_file_dir, "MEDIAINFO_SHORT.txt")
@@ -315,9 +316,7 @@ class DescriptionBuilder:
 
         if file_exists and file_size > 0:
             try:
-                async with aiofiles.open(cache_file_path, encoding="utf-8") as f:
-                    media_info_content = str(await f.read())
-                return media_info_content
+                return await fragments.read_text(cache_file_path)
             except Exception:
                 pass
 
@@ -351,15 +350,12 @@ class DescriptionBuilder:
             except Exception:
                 cleanpath_exists = await self.common.path_exists(mi_file_path)
                 if cleanpath_exists:
-                    async with aiofiles.open(mi_file_path, encoding="utf-8") as f:
-                        return str(await f.read())
+                    return await fragments.read_text(mi_file_path)
 
         else:
             cleanpath_exists = await self.common.path_exists(mi_file_path)
             if cleanpath_exists:
-                async with aiofiles.open(mi_file_path, encoding="utf-8") as f:
-                    tech_info = str(await f.read())
-                    return tech_info
+                return await fragments.read_text(mi_file_path)
 
         return ""
 
@@ -445,19 +441,18 @@ class DescriptionBuilder:
                 covers = True
 
             if meta.get("is_disc") in ["BDMV", "DVD"] and self.config["DEFAULT"].get("use_bluray_images", False) and covers:
-                async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/covers.json", encoding="utf-8") as f:
-                    cover_data: list[dict[str, str]] = json.loads(await f.read())
+                cover_data: list[dict[str, str]] = json.loads(await DescriptionFragments.for_meta(meta).read_tmp_file("covers.json"))
 
-                    for img_data in cover_data:
-                        web_url = img_data.get("web_url", "")
-                        raw_url = img_data.get("raw_url", "")
+                for img_data in cover_data:
+                    web_url = img_data.get("web_url", "")
+                    raw_url = img_data.get("raw_url", "")
 
-                        if self.tracker == "TL":
-                            cover_list.append(f"""<a href="{web_url}"><img src="{raw_url}" style="max-width: {cover_size}px;"></a>  """)
-                        elif self.tracker == "HDT":
-                            cover_list.append(f"<a href='{raw_url}'><img src='{web_url}' height=137></a> ")
-                        else:
-                            cover_list.append(f"[url={web_url}][img={cover_size}]{raw_url}[/img][/url]")
+                    if self.tracker == "TL":
+                        cover_list.append(f"""<a href="{web_url}"><img src="{raw_url}" style="max-width: {cover_size}px;"></a>  """)
+                    elif self.tracker == "HDT":
+                        cover_list.append(f"<a href='{raw_url}'><img src='{web_url}' height=137></a> ")
+                    else:
+                        cover_list.append(f"[url={web_url}][img={cover_size}]{raw_url}[/img][/url]")
 
             if cover_list:
                 cover_images = "".join(cover_list)
@@ -588,14 +583,11 @@ class DescriptionBuilder:
 
         # Formatting
         bbcode = BBCODE()
-        description = bbcode.convert_hide_to_spoiler(description)
-        description = description.replace("[user]", "").replace("[/user]", "")
-        description = description.replace("[hr]", "").replace("[/hr]", "")
-        description = description.replace("[ul]", "").replace("[/ul]", "")
-        description = description.replace("[ol]", "").replace("[/ol]", "")
-        description = bbcode.remove_extra_lines(description)
+        conversions: list[Conversion] = [HIDE_TO_SPOILER, remove_tags("user", "hr", "ul", "ol")]
         if comparison is False:
-            description = bbcode.convert_comparison_to_collapse(description, 1000)
+            conversions.append(comparison_to_collapse(1000))
+        description = bbcode.convert(description, *conversions)
+        description = bbcode.remove_extra_lines(description)
 
         if meta["debug"]:
             desc_file = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt"
@@ -1145,9 +1137,7 @@ class DescriptionBuilder:
                 # Write filename in BBCode format with MediaInfo in spoiler if not the first file
                 if multi_screens != 0:
                     if i > 0 and char_count < max_char_limit:
-                        mi_dump = MediaInfo.parse(file, output="STRING", full=False, mediainfo_options={"inform_version": "1"})
-                        parsed_mediainfo = self.parser.parse_mediainfo(str(mi_dump))
-                        formatted_bbcode = self.parser.format_bbcode(parsed_mediainfo)
+                        formatted_bbcode = await self._pack_file_mediainfo(meta, file)
                         desc_parts.append(f"[center][spoiler={filename}]{formatted_bbcode}[/spoiler][/center]\n")
                         char_count += len(f"[center][spoiler={filename}]{formatted_bbcode}[/spoiler][/center]\n")
                     else:
@@ -1201,6 +1191,20 @@ class DescriptionBuilder:
 
         return description
 
+    async def _pack_file_mediainfo(self, meta: dict[str, Any], file: str) -> str:
+        """MediaInfo of another file of a pack, formatted as BBCode; the same for every tracker."""
+
+        async def build() -> str:
+            mi_dump = MediaInfo.parse(file, output="STRING", full=False, mediainfo_options={"inform_version": "1"})
+            parsed_mediainfo = self.parser.parse_mediainfo(str(mi_dump))
+            return self.parser.format_bbcode(parsed_mediainfo)
+
+        try:
+            inputs: tuple[Any, ...] = (file, os.stat(file).st_mtime_ns)
+        except OSError:
+            inputs = (file,)
+        return await DescriptionFragments.for_meta(meta).get("pack file mediainfo", inputs, build)
+
     async def get_screens_per_row(self) -> int:
         try:
             # If screensPerRow is set, use that to determine how many screenshots should be on each row. Otherwise, use 2 as default
@@ -0,0 +1,136 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+HTML parsing for the cookie-based trackers, off the event loop.
+
+Search and request pages are parsed with lxml in a small worker pool so that several trackers
+scraping at once don't stall each other (or the rest of the upload) while a page is parsed.
+``parse_html`` returns a BeautifulSoup tree, optionally built only from the part of the page a
+caller reads (``parse_only=only("table", element_id="torrent_table")``). ``scrape_rows`` skips
+BeautifulSoup entirely: it evaluates XPath expressions with lxml and returns plain strings.
+"""
+
+import asyncio
+import functools
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional, Union, cast
+
+import lxml.etree
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer
+
+_MAX_WORKERS = 4
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="html-parse")
+        return _executor
+
+
+async def _run(func: Any, *args: Any) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(_get_executor(), functools.partial(func, *args))
+
+
+def _build_soup(html: Union[str, bytes], parse_only: Optional[SoupStrainer]) -> BeautifulSoup:
+    return BeautifulSoup(html, "lxml", parse_only=parse_only)
+
+
+async def parse_html(html: Union[str, bytes], parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse ``html`` with lxml in the worker pool.
+
+    With ``parse_only`` only matching tags (and everything inside them) are added to the tree.
+    """
+    return cast(BeautifulSoup, await _run(_build_soup, html, parse_only))
+
+
+def only(name: str, element_id: Optional[str] = None, css_class: Optional[str] = None) -> SoupStrainer:
+    """A ``parse_only`` strainer for ``<name id=element_id class="... css_class ...">`` elements.
+
+    The class is matched like ``find(class_=...)``: as one of the element's classes. A plain
+    ``SoupStrainer(class_=...)`` compares against the whole attribute while parsing.
+    """
+    attrs: dict[str, Any] = {}
+    if element_id is not None:
+        attrs["id"] = element_id
+    if css_class is not None:
+        attrs["class"] = lambda value: isinstance(value, str) and css_class in value.split()
+    return SoupStrainer(name, attrs=attrs)
+
+
+def has_class(name: str) -> str:
+    """XPath predicate matching elements whose ``class`` attribute contains ``name``, like ``.name`` in CSS."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+@dataclass(frozen=True)
+class Field:
+    """An XPath relative to a row. Elements give their text, attributes and ``string()`` their value.
+
+    ``many`` returns every match instead of the first one.
+    """
+
+    xpath: str
+    many: bool = False
+
+
+FieldSpec = Union[str, Field]
+
+
+def _value(result: Any) -> str:
+    if isinstance(result, lxml.html.HtmlElement):
+        return str(result.text_content()).strip()
+    if isinstance(result, float) and result.is_integer():
+        # count() and friends
+        return str(int(result))
+    return str(result).strip()
+
+
+def extract_rows(html: Union[str, bytes], rows: str, fields: Mapping[str, FieldSpec]) -> list[dict[str, Any]]:
+    """Return one dict per element matching the XPath ``rows``, with a value per field.
+
+    A plain string field is ``Field(xpath)``. Single fields are None when nothing matches;
+    ``many`` fields are lists.
+    """
+    if not html or not html.strip():
+        return []
+    try:
+        try:
+            document = lxml.html.fromstring(html)
+        except ValueError:
+            # lxml refuses str input that carries an XML encoding declaration
+            if not isinstance(html, str):
+                raise
+            document = lxml.html.fromstring(html.encode("utf-8"))
+    except (lxml.etree.ParserError, ValueError):
+        return []
+
+    specs = {name: spec if isinstance(spec, Field) else Field(spec) for name, spec in fields.items()}
+    compiled = {name: lxml.etree.XPath(spec.xpath) for name, spec in specs.items()}
+    extracted: list[dict[str, Any]] = []
+    for row in cast(list[Any], document.xpath(rows)):
+        item: dict[str, Any] = {}
+        for name, xpath in compiled.items():
+            result = xpath(row)
+            if not isinstance(result, list):
+                item[name] = [_value(result)] if specs[name].many else _value(result)
+                continue
+            matches = cast(list[Any], result)
+            if specs[name].many:
+                item[name] = [_value(match) for match in matches]
+            else:
+                item[name] = _value(matches[0]) if matches else None
+        extracted.append(item)
+    return extracted
+
+
+async def scrape_rows(html: Union[str, bytes], rows: str, fields: Mapping[str, FieldSpec]) -> list[dict[str, Any]]:
+    """``extract_rows`` in the worker pool."""
+    return cast(list[dict[str, Any]], await _run(extract_rows, html, rows, fields))
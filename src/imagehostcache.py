@@ -0,0 +1,145 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, cast
+
+import httpx
+
+from src.console import console
+
+HostEntry = dict[str, Any]
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class ImageHostCache:
+    """Persistent map of screenshot content hash -> uploaded URLs per image host.
+
+    Lets a second tracker, an ``--edit`` re-run or a cross-seed upload reuse links for
+    a PNG that was already pushed to a host instead of uploading it again.
+    Stored at ``data/image_hosts/cache.json`` as ``{sha256: {host: {img_url, raw_url, web_url, uploaded_at}}}``.
+    """
+
+    _instances: dict[str, "ImageHostCache"] = {}
+
+    def __init__(self, base_dir: str) -> None:
+        self.cache_path = Path(base_dir) / "data" / "image_hosts" / "cache.json"
+        self._entries: Optional[dict[str, dict[str, HostEntry]]] = None
+        self._file_hashes: dict[tuple[str, int, int], str] = {}
+        self._dirty = False
+        # A thread lock: the shared instance can outlive the event loop of a single run
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_base_dir(cls, base_dir: str) -> "ImageHostCache":
+        """Return the shared cache for ``base_dir`` so every upload in this process sees the same entries."""
+        key = os.path.abspath(base_dir)
+        if key not in cls._instances:
+            cls._instances[key] = cls(key)
+        return cls._instances[key]
+
+    def hash_file(self, image_path: str) -> str:
+        """SHA-256 of the file contents, memoised on (path, size, mtime) so large PNGs are only read once."""
+        stat = os.stat(image_path)
+        key = (os.path.abspath(image_path), stat.st_size, stat.st_mtime_ns)
+        cached = self._file_hashes.get(key)
+        if cached is not None:
+            return cached
+
+        digest = hashlib.sha256()
+        with open(image_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        file_hash = digest.hexdigest()
+        self._file_hashes[key] = file_hash
+        return file_hash
+
+    def _load_entries(self) -> dict[str, dict[str, HostEntry]]:
+        if self._entries is not None:
+            return self._entries
+        entries: dict[str, dict[str, HostEntry]] = {}
+        try:
+            if self.cache_path.exists():
+                loaded = json.loads(self.cache_path.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict):
+                    entries = cast(dict[str, dict[str, HostEntry]], loaded)
+        except Exception as e:
+            console.print(f"[yellow]Failed to read image host cache, starting fresh: {e}[/yellow]")
+        self._entries = entries
+        return entries
+
+    async def get(self, image_path: str, host: str, revalidate: bool = False) -> Optional[HostEntry]:
+        """Return cached URLs for ``image_path`` on ``host``, or None if it was never uploaded there."""
+        try:
+            file_hash = await asyncio.to_thread(self.hash_file, image_path)
+        except OSError:
+            return None
+
+        def _lookup() -> Optional[HostEntry]:
+            with self._lock:
+                return self._load_entries().get(file_hash, {}).get(host)
+
+        entry = await asyncio.to_thread(_lookup)
+        if not entry or not all(entry.get(key) for key in ("img_url", "raw_url", "web_url")):
+            return None
+
+        if revalidate and not await self.is_alive(str(entry["raw_url"])):
+            with self._lock:
+                self._load_entries().get(file_hash, {}).pop(host, None)
+                self._dirty = True
+            return None
+        return dict(entry)
+
+    async def put(self, image_path: str, host: str, result: dict[str, Any]) -> None:
+        try:
+            file_hash = await asyncio.to_thread(self.hash_file, image_path)
+        except OSError:
+            return
+
+        def _store() -> None:
+            with self._lock:
+                self._load_entries().setdefault(file_hash, {})[host] = {
+                    "img_url": result["img_url"],
+                    "raw_url": result["raw_url"],
+                    "web_url": result["web_url"],
+                    "uploaded_at": time.time(),
+                }
+                self._dirty = True
+
+        await asyncio.to_thread(_store)
+
+    def _write(self) -> None:
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            data = json.dumps(self._entries, indent=2)
+            self._dirty = False
+        tmp_path = self.cache_path.with_suffix(".json.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            self._dirty = True
+            console.print(f"[yellow]Failed to write image host cache: {e}[/yellow]")
+
+    async def save(self) -> None:
+        """Write pending changes, via a temp file so an interrupted run can't truncate the cache."""
+        await asyncio.to_thread(self._write)
+
+    @staticmethod
+    async def is_alive(url: str) -> bool:
+        """Cheap liveness check for a cached link."""
+        try:
+            async with httpx.AsyncClient(follow_redirects=True, timeout=10) as client:
+                response = await client.head(url)
+                if response.status_code in (405, 501):
+                    response = await client.get(url, headers={"Range": "bytes=0-0"})
+                return response.status_code < 400
+        except httpx.HTTPError:
+            return False
@@ -4,13 +4,142 @@ import re
 import sys
 from typing import Any, Optional, Union, cast
 
-import aiofiles
 import cli_ui
 import langcodes
 from langcodes.tag_parser import LanguageTagError
 
 from src.cleanup import cleanup_manager
 from src.console import console
+from src.descfragments import DescriptionFragments
+
+
+def _parse_bd_summary(content: str) -> dict[str, Any]:
+    parsed_data: dict[str, Any] = {"disc_info": {}, "playlist_info": {}, "video": {}, "audio": [], "subtitles": []}
+
+    lines = content.strip().split("\n")
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        if ":" in line:
+            key, value = line.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+
+            if key in ["Disc Title", "Disc Label", "Disc Size", "Protection"]:
+                parsed_data["disc_info"][key.lower().replace(" ", "_")] = value
+
+            elif key in ["Playlist", "Size", "Length", "Total Bitrate"]:
+                parsed_data["playlist_info"][key.lower().replace(" ", "_")] = value
+
+            elif key == "Video":
+                video_parts = [part.strip() for part in value.split("/")]
+                if len(video_parts) >= 6:
+                    parsed_data["video"] = {
+                        "format": video_parts[0],
+                        "bitrate": video_parts[1],
+                        "resolution": video_parts[2],
+                        "framerate": video_parts[3],
+                        "aspect_ratio": video_parts[4],
+                        "profile": video_parts[5],
+                    }
+                else:
+                    parsed_data["video"]["format"] = value
+
+            elif key == "Audio" or (key.startswith("*") and "Audio" in key):
+                is_commentary = key.startswith("*")
+                audio_parts = [part.strip() for part in value.split("/")]
+
+                audio_track: dict[str, Any] = {"is_commentary": is_commentary}
+
+                if len(audio_parts) >= 1:
+                    audio_track["language"] = audio_parts[0]
+                if len(audio_parts) >= 2:
+                    audio_track["format"] = audio_parts[1]
+                if len(audio_parts) >= 3:
+                    audio_track["channels"] = audio_parts[2]
+                if len(audio_parts) >= 4:
+                    audio_track["sample_rate"] = audio_parts[3]
+                if len(audio_parts) >= 5:
+                    bitrate_str = audio_parts[4].strip()
+                    bitrate_match = re.search(r"(\d+)\s*kbps", bitrate_str)
+                    if bitrate_match:
+                        audio_track["bitrate_num"] = int(bitrate_match.group(1))
+                    audio_track["bitrate"] = bitrate_str
+                if len(audio_parts) >= 6:
+                    audio_track["bit_depth"] = audio_parts[5].split("(")[0].strip()
+
+                parsed_data["audio"].append(audio_track)
+
+            elif key == "Subtitle" or (key.startswith("*") and "Subtitle" in key):
+                is_commentary = key.startswith("*")
+                subtitle_parts = [part.strip() for part in value.split("/")]
+
+                subtitle_track: dict[str, Any] = {"is_commentary": is_commentary}
+
+                if len(subtitle_parts) >= 1:
+                    subtitle_track["language"] = subtitle_parts[0]
+                if len(subtitle_parts) >= 2:
+                    subtitle_track["bitrate"] = subtitle_parts[1]
+
+                parsed_data["subtitles"].append(subtitle_track)
+
+    return parsed_data
+
+
+def _parse_mediainfo(mediainfo_content: str) -> dict[str, Any]:
+    parsed_data: dict[str, Any] = {"general": {}, "video": [], "audio": [], "text": []}
+
+    current_section: Optional[str] = None
+    current_track: dict[str, str] = {}
+
+    lines = mediainfo_content.strip().split("\n")
+
+    section_header_re = re.compile(r"^(General|Video|Audio|Text|Menu)(?:\s*#\d+)?$", re.IGNORECASE)
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        section_match = section_header_re.match(line)
+        if section_match:
+            if current_section and current_track:
+                if current_section in ["video", "audio", "text"]:
+                    parsed_data[current_section].append(current_track)
+                elif current_section == "general":
+                    parsed_data["general"] = current_track
+
+            current_section = section_match.group(1).lower()
+            current_track = {}
+            continue
+
+        if ":" in line and current_section:
+            key, value = line.split(":", 1)
+            key = key.strip().lower()
+            value = value.strip()
+
+            if current_section == "video":
+                if key in ["format", "duration", "bit rate", "encoding settings", "title"]:
+                    current_track[key.replace(" ", "_")] = value
+            elif current_section == "audio":
+                if key in ["format", "duration", "bit rate", "language", "commercial name", "channel", "channel (s)", "title"]:
+                    current_track[key.replace(" ", "_")] = value
+            elif current_section == "text":
+                if key in ["format", "duration", "bit rate", "language", "title"]:
+                    current_track[key.replace(" ", "_")] = value
+            elif current_section == "general":
+                current_track[key.replace(" ", "_")] = value
+
+    if current_section and current_track:
+        if current_section in ["video", "audio", "text"]:
+            parsed_data[current_section].append(current_track)
+        elif current_section == "general":
+            parsed_data["general"] = current_track
+
+    return parsed_data
 
 
 class LanguagesManager:
@@ -21,149 +150,24 @@ class LanguagesManager:
                 console.print(f"[yellow]BD_SUMMARY_00.txt not found at {bd_summary_file}[/yellow]")
                 return {}
 
-            async with aiofiles.open(bd_summary_file, encoding="utf-8") as f:
-                content = await f.read()
+            # Parsed once per version of the file and shared by every tracker: don't modify the result
+            return await DescriptionFragments.for_meta(meta).parse_file("parsed BD_SUMMARY_00.txt", bd_summary_file, _parse_bd_summary)
         except Exception as e:
             console.print(f"[red]Error reading BD_SUMMARY file: {e}[/red]")
             return {}
 
-        parsed_data: dict[str, Any] = {"disc_info": {}, "playlist_info": {}, "video": {}, "audio": [], "subtitles": []}
-
-        lines = content.strip().split("\n")
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            if ":" in line:
-                key, value = line.split(":", 1)
-                key = key.strip()
-                value = value.strip()
-
-                if key in ["Disc Title", "Disc Label", "Disc Size", "Protection"]:
-                    parsed_data["disc_info"][key.lower().replace(" ", "_")] = value
-
-                elif key in ["Playlist", "Size", "Length", "Total Bitrate"]:
-                    parsed_data["playlist_info"][key.lower().replace(" ", "_")] = value
-
-                elif key == "Video":
-                    video_parts = [part.strip() for part in value.split("/")]
-                    if len(video_parts) >= 6:
-                        parsed_data["video"] = {
-                            "format": video_parts[0],
-                            "bitrate": video_parts[1],
-                            "resolution": video_parts[2],
-                            "framerate": video_parts[3],
-                            "aspect_ratio": video_parts[4],
-                            "profile": video_parts[5],
-                        }
-                    else:
-                        parsed_data["video"]["format"] = value
-
-                elif key == "Audio" or (key.startswith("*") and "Audio" in key):
-                    is_commentary = key.startswith("*")
-                    audio_parts = [part.strip() for part in value.split("/")]
-
-                    audio_track: dict[str, Any] = {"is_commentary": is_commentary}
-
-                    if len(audio_parts) >= 1:
-                        audio_track["language"] = audio_parts[0]
-                    if len(audio_parts) >= 2:
-                        audio_track["format"] = audio_parts[1]
-                    if len(audio_parts) >= 3:
-                        audio_track["channels"] = audio_parts[2]
-                    if len(audio_parts) >= 4:
-                        audio_track["sample_rate"] = audio_parts[3]
-                    if len(audio_parts) >= 5:
-                        bitrate_str = audio_parts[4].strip()
-                        bitrate_match = re.search(r"(\d+)\s*kbps", bitrate_str)
-                        if bitrate_match:
-                            audio_track["bitrate_num"] = int(bitrate_match.group(1))
-                        audio_track["bitrate"] = bitrate_str
-                    if len(audio_parts) >= 6:
-                        audio_track["bit_depth"] = audio_parts[5].split("(")[0].strip()
-
-                    parsed_data["audio"].append(audio_track)
-
-                elif key == "Subtitle" or (key.startswith("*") and "Subtitle" in key):
-                    is_commentary = key.startswith("*")
-                    subtitle_parts = [part.strip() for part in value.split("/")]
-
-                    subtitle_track: dict[str, Any] = {"is_commentary": is_commentary}
-
-                    if len(subtitle_parts) >= 1:
-                        subtitle_track["language"] = subtitle_parts[0]
-                    if len(subtitle_parts) >= 2:
-                        subtitle_track["bitrate"] = subtitle_parts[1]
-
-                    parsed_data["subtitles"].append(subtitle_track)
-
-        return parsed_data
-
     async def parsed_mediainfo(self, meta: dict[str, Any]) -> dict[str, Any]:
         try:
             mediainfo_file = f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt"
             if os.path.exists(mediainfo_file):
-                async with aiofiles.open(mediainfo_file, encoding="utf-8") as f:
-                    mediainfo_content = await f.read()
+                # Parsed once per version of the file and shared by every tracker: don't modify the result
+                return await DescriptionFragments.for_meta(meta).parse_file("parsed MEDIAINFO.txt", mediainfo_file, _parse_mediainfo)
             else:
                 return {}
         except Exception as e:
             console.print(f"[red]Error reading MEDIAINFO file: {e}[/red]")
             return {}
 
-        parsed_data: dict[str, Any] = {"general": {}, "video": [], "audio": [], "text": []}
-
-        current_section: Optional[str] = None
-        current_track: dict[str, str] = {}
-
-        lines = mediainfo_content.strip().split("\n")
-
-        section_header_re = re.compile(r"^(General|Video|Audio|Text|Menu)(?:\s*#\d+)?$", re.IGNORECASE)
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            section_match = section_header_re.match(line)
-            if section_match:
-                if current_section and current_track:
-                    if current_section in ["video", "audio", "text"]:
-                        parsed_data[current_section].append(current_track)
-                    elif current_section == "general":
-                        parsed_data["general"] = current_track
-
-                current_section = section_match.group(1).lower()
-                current_track = {}
-                continue
-
-            if ":" in line and current_section:
-                key, value = line.split(":", 1)
-                key = key.strip().lower()
-                value = value.strip()
-
-                if current_section == "video":
-                    if key in ["format", "duration", "bit rate", "encoding settings", "title"]:
-                        current_track[key.replace(" ", "_")] = value
-                elif current_section == "audio":
-                    if key in ["format", "duration", "bit rate", "language", "commercial name", "channel", "channel (s)", "title"]:
-                        current_track[key.replace(" ", "_")] = value
-                elif current_section == "text":
-                    if key in ["format", "duration", "bit rate", "language", "title"]:
-                        current_track[key.replace(" ", "_")] = value
-                elif current_section == "general":
-                    current_track[key.replace(" ", "_")] = value
-
-        if current_section and current_track:
-            if current_section in ["video", "audio", "text"]:
-                parsed_data[current_section].append(current_track)
-            elif current_section == "general":
-                parsed_data["general"] = current_track
-
-        return parsed_data
-
     async def process_desc_language(self, meta: dict[str, Any], tracker: str = "") -> None:
         if "language_checked" not in meta:
             meta["language_checked"] = False
@@ -352,7 +356,7 @@ class LanguagesManager:
                     for track in commentary_tracks:
                         if meta["debug"]:
                             console.print(f"Skipping commentary track: {track}")
-                        audio_tracks.remove(track)
+                    audio_tracks = [track for track in audio_tracks if not track.get("is_commentary")]
                 audio_language_set: set[str] = set(existing_audio_languages)
                 audio_language_set.update(track.get("language") for track in audio_tracks if track.get("language"))
                 for track in audio_tracks:
@@ -392,7 +396,7 @@ class LanguagesManager:
                     for track in sub_commentary_tracks:
                         if meta["debug"]:
                             console.print(f"Skipping commentary subtitle track: {track}")
-                        subtitle_tracks.remove(track)
+                    subtitle_tracks = [track for track in subtitle_tracks if not track.get("is_commentary")]
                 subtitle_language_set: set[str] = set(existing_subtitle_languages)
                 if subtitle_tracks and isinstance(subtitle_tracks[0], dict):
                     subtitle_language_set.update(track.get("language") for track in subtitle_tracks if track.get("language"))
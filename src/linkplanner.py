@@ -0,0 +1,138 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Bulk creation of hardlink and symlink trees for seeding from a linked folder.
+
+The whole ``(source, destination)`` plan is built first. Destination directories are created
+in one pass, then the links are made from a thread pool. When the filesystem refuses a hardlink
+(a btrfs subvolume or bind mount boundary, protected hardlinks, too many links), a reflink clone
+(``FICLONE``) is tried instead. It shares the data blocks the same way and uses no extra space.
+"""
+
+import errno
+import os
+import platform
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+
+# Linking is syscall-bound, so a few threads overlap the filesystem round trips
+LINK_WORKERS = 8
+# FICLONE from linux/fs.h
+FICLONE = 0x40049409
+# Hardlink errors a reflink can get around
+_HARDLINK_REFUSED = {errno.EXDEV, errno.EPERM, errno.EMLINK}
+# Reflink errors meaning the filesystem cannot clone at all: the rest of the plan stops trying
+_NO_REFLINK = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV, errno.ENOSYS, errno.EPERM}
+
+LinkPlan = list[tuple[str, str]]
+
+
+class LinkResult(NamedTuple):
+    linked: dict[str, int]
+    existing: int
+    size: int
+    seconds: float
+    error: Optional[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def report(self) -> str:
+        """One-line throughput summary."""
+        count = sum(self.linked.values())
+        rate = count / self.seconds if self.seconds > 0 else float(count)
+        methods = ", ".join(f"{n} {method}" for method, n in sorted(self.linked.items())) or "none"
+        line = f"Linked {count} file(s), {self.size / 1073741824:.2f} GiB in {self.seconds:.2f}s ({rate:.0f} files/s; {methods})"
+        return line + (f", {self.existing} already present" if self.existing else "")
+
+
+def plan_directory(src: str, dst: str, skip_nfo: bool = False) -> LinkPlan:
+    """Every file under ``src`` paired with its place under ``dst``."""
+    plan: LinkPlan = []
+    for root, _dirs, files in os.walk(src):
+        for file in files:
+            if skip_nfo and file.lower().endswith(".nfo"):
+                continue
+            src_path = os.path.join(root, file)
+            plan.append((src_path, os.path.join(dst, os.path.relpath(src_path, src))))
+    return plan
+
+
+def reflink(src: str, dst: str) -> None:
+    """Create ``dst`` as a copy-on-write clone of ``src``; raises OSError where cloning is unsupported."""
+    if platform.system() != "Linux":
+        raise OSError(errno.EOPNOTSUPP, "reflink is only supported on Linux")
+    import fcntl
+
+    with open(src, "rb") as source:
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, os.fstat(source.fileno()).st_mode & 0o777)
+        try:
+            fcntl.ioctl(fd, FICLONE, source.fileno())
+        except OSError:
+            os.close(fd)
+            os.remove(dst)
+            raise
+        os.close(fd)
+
+
+def link_tree(plan: Sequence[tuple[str, str]], symlink: bool = False, workers: int = LINK_WORKERS) -> LinkResult:
+    """Create the links of ``plan``, keeping destinations that already exist.
+
+    Stops at the first failure; the error names the file that failed.
+    """
+    start = time.perf_counter()
+    linked: dict[str, int] = {}
+    existing = 0
+    size = 0
+    error: Optional[str] = None
+    stop = threading.Event()
+    reflink_usable = [True]
+
+    # Every destination directory in one pass, before any worker starts
+    try:
+        for directory in sorted({os.path.dirname(dst) for _, dst in plan if os.path.dirname(dst)}):
+            os.makedirs(directory, exist_ok=True)
+    except OSError as e:
+        return LinkResult(linked, existing, size, time.perf_counter() - start, str(e))
+
+    def link_one(src: str, dst: str) -> tuple[str, int]:
+        if stop.is_set():
+            return "cancelled", 0
+        if os.path.lexists(dst):
+            return "existing", 0
+        if symlink:
+            os.symlink(src, dst)
+            return "symlink", 0
+        try:
+            os.link(src, dst)
+            method = "hardlink"
+        except OSError as e:
+            if e.errno not in _HARDLINK_REFUSED or not reflink_usable[0]:
+                raise
+            try:
+                reflink(src, dst)
+            except OSError as clone_error:
+                if clone_error.errno in _NO_REFLINK:
+                    reflink_usable[0] = False
+                raise e from clone_error
+            method = "reflink"
+        return method, os.stat(dst).st_size
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(plan)))) as pool:
+        futures = [(src, pool.submit(link_one, src, dst)) for src, dst in plan]
+        for src, future in futures:
+            try:
+                method, file_size = future.result()
+            except OSError as e:
+                if error is None:
+                    error = f"{src}: {e}"
+                    stop.set()
+                continue
+            if method == "existing":
+                existing += 1
+            elif method != "cancelled":
+                linked[method] = linked.get(method, 0) + 1
+                size += file_size
+    return LinkResult(linked, existing, size, time.perf_counter() - start, error)
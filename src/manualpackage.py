@@ -4,16 +4,19 @@ import glob
 import json
 import os
 import re
-import shutil
+import tarfile
+import tempfile
+import time
 import urllib.parse
 from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Union, cast
+from typing import Any, Optional, Union, cast
 
 import aiofiles
 import httpx
 from torf import Torrent
 
+from cogs.redaction import Redaction
 from src.console import console
 from src.uploadscreens import UploadScreensManager
 
@@ -30,6 +33,28 @@ class ManualPackageManager:
         self.tracker_config = tracker_config
         self.uploadscreens_manager = UploadScreensManager(cast(dict[str, Any], config))
 
+    @staticmethod
+    def _write_archive(archive_path: str, tmp_dir: str, meta: dict[str, Any]) -> None:
+        """Tar ``tmp_dir`` for sharing, with meta.json replaced by a redacted dump of ``meta``.
+
+        The archive is handed to other people or a public file host, so passkeys and API keys must
+        not travel with it. The meta is redacted and written out one top-level entry at a time.
+        """
+
+        def skip_meta(info: tarfile.TarInfo) -> Optional[tarfile.TarInfo]:
+            return None if info.name == "./meta.json" else info
+
+        with tarfile.open(archive_path, "w") as tar:
+            tar.add(tmp_dir, arcname=".", filter=skip_meta)
+            with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as redacted:
+                for chunk in Redaction.iter_redacted_json(meta):
+                    redacted.write(chunk.encode("utf-8"))
+                info = tarfile.TarInfo("./meta.json")
+                info.size = redacted.tell()
+                info.mtime = int(time.time())
+                redacted.seek(0)
+                tar.addfile(info, redacted)
+
     async def package(self, meta: dict[str, Any]) -> Union[str, bool]:
         tag = "" if meta["tag"] == "" else f" / {meta['tag'][1:]}"
         res = meta["source"] if meta["is_disc"] == "DVD" else meta["resolution"]
@@ -91,7 +116,7 @@ class ManualPackageManager:
             manual_tracker_cfg: dict[str, Any] = cast(dict[str, Any], manual_tracker_raw) if isinstance(manual_tracker_raw, dict) else {}
             manual_filebrowser = manual_tracker_cfg.get("filebrowser")
             filebrowser = manual_filebrowser if isinstance(manual_filebrowser, str) else None
-            shutil.make_archive(archive, "tar", f"{meta['base_dir']}/tmp/{meta['uuid']}")
+            await asyncio.to_thread(self._write_archive, f"{archive}.tar", f"{meta['base_dir']}/tmp/{meta['uuid']}", meta)
             if filebrowser is not None:
                 base_url = filebrowser.rstrip("/")
                 path = f"/tmp/{meta['uuid']}"
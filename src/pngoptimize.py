@@ -0,0 +1,129 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Lossless PNG optimization of screenshots in worker processes, as each capture finishes.
+
+Each image is optimized by a ``python -m src.pngoptimize`` worker, with at most one worker
+per CPU running at once. Workers are plain subprocesses rather than a multiprocessing pool,
+whose spawned workers would import upload.py again. oxipng is used when it is installed;
+otherwise Pillow re-encodes the PNG at a higher zlib level and keeps the result only when it
+is smaller. Both are lossless. When an image host has a size limit and the first
+pass leaves the image above it, a slower pass follows.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, NamedTuple, Optional
+
+from src.console import console
+
+# Largest screenshot each image host accepts, in bytes (the same limits screenshots() checks)
+HOST_SIZE_LIMITS = {
+    "imgbox": 10_000_000,
+    "pixhost": 10_000_000,
+    "imgbb": 31_000_000,
+}
+
+
+class OptimizeResult(NamedTuple):
+    path: str
+    before: int
+    after: int
+    seconds: float
+
+
+def target_size(img_host: Optional[str]) -> Optional[int]:
+    """Size limit of ``img_host`` for screenshots, or None when it has none."""
+    if not img_host:
+        return None
+    return next((limit for host, limit in HOST_SIZE_LIMITS.items() if host in img_host), None)
+
+
+def _pillow_optimize(path: str, level: int) -> None:
+    from PIL import Image
+
+    tmp_path = f"{path}.optimize.tmp"
+    try:
+        with Image.open(path) as image:
+            image.save(tmp_path, format="PNG", compress_level=level)
+        if os.path.getsize(tmp_path) < os.path.getsize(path):
+            os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def optimize_png(path: str, target: Optional[int] = None) -> OptimizeResult:
+    """Losslessly shrink the PNG at ``path`` in place; runs in a worker process."""
+    start = time.perf_counter()
+    before = os.path.getsize(path)
+    oxipng: Any
+    try:
+        import oxipng  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        oxipng = None
+    if oxipng is not None:
+        oxipng.optimize(path, level=2)
+        if target is not None and os.path.getsize(path) > target:
+            oxipng.optimize(path, level=6)
+    else:
+        # zlib level 9 can take several times as long as 7 on a 4K frame, so only when needed
+        _pillow_optimize(path, 7)
+        if target is not None and os.path.getsize(path) > target:
+            _pillow_optimize(path, 9)
+    return OptimizeResult(path, before, os.path.getsize(path), time.perf_counter() - start)
+
+
+_slots: Optional[asyncio.Semaphore] = None
+_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_slots() -> asyncio.Semaphore:
+    # One worker per CPU; the semaphore is recreated per event loop
+    global _slots, _slots_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if _slots is None or _slots_loop is not loop:
+        _slots = asyncio.Semaphore(os.cpu_count() or 1)
+        _slots_loop = loop
+    return _slots
+
+
+async def optimize(path: str, target: Optional[int] = None) -> Optional[OptimizeResult]:
+    """Optimize ``path`` in a worker process; None when optimization failed and the file is unchanged."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    async with _get_slots():
+        try:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "src.pngoptimize", path, str(target or 0), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=base_dir
+            )
+            stdout, stderr = await process.communicate()
+        except OSError as e:
+            console.print(f"[yellow]PNG optimization failed for {path}: {e}[/yellow]")
+            return None
+    if process.returncode != 0:
+        error = stderr.decode("utf-8", errors="replace").strip().splitlines()
+        console.print(f"[yellow]PNG optimization failed for {path}: {error[-1] if error else process.returncode}[/yellow]")
+        return None
+    try:
+        return OptimizeResult(*json.loads(stdout))
+    except (TypeError, ValueError):
+        return None
+
+
+def report(results: list[OptimizeResult]) -> str:
+    """One-line summary of bytes saved and the time spent optimizing."""
+    before = sum(result.before for result in results)
+    saved = before - sum(result.after for result in results)
+    seconds = sum(result.seconds for result in results)
+    percent = saved / before * 100 if before else 0.0
+    return f"Optimized {len(results)} screenshot(s): saved {saved / 1048576:.2f} MiB ({percent:.1f}%) in {seconds:.1f}s of worker time"
+
+
+def main() -> None:
+    path, target = sys.argv[1], int(sys.argv[2])
+    print(json.dumps(list(optimize_png(path, target or None))))
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,7 @@ try:
     from src.apply_overrides import ApplyOverrides
     from src.audio import AudioManager
     from src.bluray_com import get_bluray_releases
+    from src.checkpoints import UploadCheckpoints
     from src.cleanup import cleanup_manager
     from src.clients import Clients
     from src.console import console
@@ -289,6 +290,7 @@ class Prep:
                         meta["base_dir"],
                         is_dvd=True,
                         debug=meta.get("debug", False),
+                        checkpoints=UploadCheckpoints.for_meta(meta, self.config),
                     )
                     meta["mediainfo"] = mi
                 else:
@@ -312,7 +314,9 @@ class Prep:
             except Exception:
                 meta["search_year"] = ""
             if not meta.get("edit", False):
-                mi = await exportInfo(meta["discs"][0]["largest_evo"], False, meta["uuid"], meta["base_dir"], debug=meta["debug"])
+                mi = await exportInfo(
+                    meta["discs"][0]["largest_evo"], False, meta["uuid"], meta["base_dir"], debug=meta["debug"], checkpoints=UploadCheckpoints.for_meta(meta, self.config)
+                )
                 meta["mediainfo"] = mi
             else:
                 mi = meta["mediainfo"]
@@ -384,7 +388,15 @@ class Prep:
                         meta["search_year"] = ""
 
                     if not meta.get("edit", False):
-                        mi = await exportInfo(videopath, meta["isdir"], meta["uuid"], base_dir, is_dvd=meta.get("is_disc", False), debug=meta.get("debug", False))
+                        mi = await exportInfo(
+                            videopath,
+                            meta["isdir"],
+                            meta["uuid"],
+                            base_dir,
+                            is_dvd=meta.get("is_disc", False),
+                            debug=meta.get("debug", False),
+                            checkpoints=UploadCheckpoints.for_meta(meta, self.config),
+                        )
                         meta["mediainfo"] = mi
                     else:
                         mi = meta["mediainfo"]
@@ -4,6 +4,7 @@ from typing import Any, Optional, cast
 
 import httpx
 
+from src.arrmirror import ArrLibraryMirror, configured_instances
 from src.console import console
 
 MovieInfo = dict[str, Any]
@@ -19,52 +20,40 @@ class RadarrManager:
             console.print("[red]No Radarr API keys are configured.[/red]")
             return None
 
-        # Try each Radarr instance until we get valid data
-        instance_index = 0
-        max_instances = 4  # Limit instances to prevent infinite loops
-
-        while instance_index < max_instances:
-            # Determine the suffix for this instance
-            suffix = "" if instance_index == 0 else f"_{instance_index}"
-            api_key_name = f"radarr_api_key{suffix}"
-            url_name = f"radarr_url{suffix}"
-
-            # Check if this instance exists in config
-            api_key_value = self.default_config.get(api_key_name)
-            if not isinstance(api_key_value, str) or not api_key_value.strip():
-                # This slot isn't configured; try the next suffix (supports configs starting at _1)
-                instance_index += 1
-                continue
-
-            # Get instance-specific configuration
-            base_url_value = self.default_config.get(url_name)
-            if not isinstance(base_url_value, str) or not base_url_value.strip():
-                instance_index += 1
-                continue
-
-            api_key = api_key_value.strip()
-            base_url = base_url_value.strip().rstrip("/")
-
-            if debug:
-                console.print(f"[blue]Trying Radarr instance {instance_index if instance_index > 0 else 'default'}[/blue]")
-
-            # Build the appropriate URL
-            if tmdb_id:
-                url = f"{base_url}/api/v3/movie?tmdbId={tmdb_id}&excludeLocalCovers=true"
-            elif filename:
-                url = f"{base_url}/api/v3/movie/lookup?term={filename}"
-            else:
-                instance_index += 1
-                continue
-
-            headers = {"X-Api-Key": api_key, "Content-Type": "application/json"}
-
-            if debug:
-                console.print(f"[green]TMDB ID {tmdb_id}[/green]")
-                console.print(f"[blue]Radarr URL:[/blue] {url}")
+        mirror = ArrLibraryMirror.for_config(self.default_config, "radarr")
+        if mirror is not None:
+            mirror_data = await self._get_from_mirror(mirror, tmdb_id, filename, debug)
+            if mirror_data is not None:
+                return mirror_data
+            if (tmdb_id or filename) and mirror.is_complete():
+                # Every library is loaded and fresh, so asking the instances one by one can't find anything new
+                console.print("[yellow]No Radarr instance returned valid movie data.[/yellow]")
+                return None
 
-            try:
-                async with httpx.AsyncClient() as client:
+        # Try each Radarr instance until we get valid data, sharing one client across instances
+        async with httpx.AsyncClient() as client:
+            for instance_label, base_url, api_key in configured_instances(self.default_config, "radarr"):
+                if debug:
+                    console.print(f"[blue]Trying Radarr instance {instance_label}[/blue]")
+
+                # Build the appropriate URL
+                if mirror is not None and mirror.is_fresh(instance_label):
+                    # Already answered from this instance's library copy
+                    continue
+                if tmdb_id:
+                    url = f"{base_url}/api/v3/movie?tmdbId={tmdb_id}&excludeLocalCovers=true"
+                elif filename:
+                    url = f"{base_url}/api/v3/movie/lookup?term={filename}"
+                else:
+                    continue
+
+                headers = {"X-Api-Key": api_key, "Content-Type": "application/json"}
+
+                if debug:
+                    console.print(f"[green]TMDB ID {tmdb_id}[/green]")
+                    console.print(f"[blue]Radarr URL:[/blue] {url}")
+
+                try:
                     response = await client.get(url, headers=headers, timeout=10.0)
 
                     if response.status_code == 200:
@@ -78,27 +67,43 @@ class RadarrManager:
                         movie_data = await self.extract_movie_data(data, filename)
 
                         if movie_data and (movie_data.get("imdb_id") or movie_data.get("tmdb_id")):
-                            console.print(f"[green]Found valid movie data from Radarr instance {instance_index if instance_index > 0 else 'default'}[/green]")
+                            console.print(f"[green]Found valid movie data from Radarr instance {instance_label}[/green]")
                             return movie_data
                     else:
-                        console.print(
-                            f"[yellow]Failed to fetch from Radarr instance {instance_index if instance_index > 0 else 'default'}: {response.status_code} - {response.text}[/yellow]"
-                        )
-
-            except httpx.TimeoutException:
-                console.print(f"[red]Timeout when fetching from Radarr instance {instance_index if instance_index > 0 else 'default'}[/red]")
-            except httpx.RequestError as e:
-                console.print(f"[red]Error fetching from Radarr instance {instance_index if instance_index > 0 else 'default'}: {e}[/red]")
-            except Exception as e:
-                console.print(f"[red]Unexpected error with Radarr instance {instance_index if instance_index > 0 else 'default'}: {e}[/red]")
+                        console.print(f"[yellow]Failed to fetch from Radarr instance {instance_label}: {response.status_code} - {response.text}[/yellow]")
 
-            # Move to the next instance
-            instance_index += 1
+                except httpx.TimeoutException:
+                    console.print(f"[red]Timeout when fetching from Radarr instance {instance_label}[/red]")
+                except httpx.RequestError as e:
+                    console.print(f"[red]Error fetching from Radarr instance {instance_label}: {e}[/red]")
+                except Exception as e:
+                    console.print(f"[red]Unexpected error with Radarr instance {instance_label}: {e}[/red]")
 
         # If we got here, no instances provided valid data
         console.print("[yellow]No Radarr instance returned valid movie data.[/yellow]")
         return None
 
+    async def _get_from_mirror(self, mirror: ArrLibraryMirror, tmdb_id: Optional[int], filename: Optional[str], debug: bool) -> Optional[MovieInfo]:
+        """Answer from the in-memory library copy: by TMDB ID, or by the release name the movie file was imported from."""
+        await mirror.refresh(debug)
+        if tmdb_id:
+            entry = mirror.find_by_id("tmdbId", tmdb_id)
+        elif filename:
+            entry = mirror.find_by_release(filename)
+        else:
+            return None
+        if entry is None:
+            return None
+
+        instance_label, movie = entry
+        movie_data = await self.extract_movie_data([movie], filename)
+        if not movie_data or not (movie_data.get("imdb_id") or movie_data.get("tmdb_id")):
+            return None
+        if debug:
+            console.print(f"[blue]Radarr library match:[/blue] {movie.get('title')} ({movie.get('path')})")
+        console.print(f"[green]Found valid movie data from Radarr instance {instance_label}[/green]")
+        return movie_data
+
     async def extract_movie_data(self, radarr_data: Any, filename: Optional[str] = None) -> Optional[MovieInfo]:
         if not radarr_data or not isinstance(radarr_data, list):
             return {"imdb_id": None, "tmdb_id": None, "year": None, "genres": [], "release_group": None}
@@ -1,6 +1,7 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
 import glob
+import itertools
 import json
 import os
 import re
@@ -90,6 +91,21 @@ class RehostImagesManager:
             uploadscreens_manager=self.uploadscreens_manager,
         )
 
+    async def prepare_tracker_images(self, meta: dict[str, Any], tracker_instances: Mapping[str, Any]) -> dict[str, str]:
+        requirements: dict[str, tuple[list[str], dict[str, str]]] = {}
+        for tracker, instance in tracker_instances.items():
+            approved = getattr(instance, "approved_image_hosts", None)
+            mapping = getattr(instance, "url_host_mapping", None)
+            if isinstance(approved, list) and isinstance(mapping, dict):
+                requirements[tracker] = ([str(h) for h in cast(list[Any], approved)], cast(dict[str, str], mapping))
+        return await _prepare_tracker_images(
+            meta,
+            requirements,
+            default_config=self.default_config,
+            takescreens_manager=self.takescreens_manager,
+            uploadscreens_manager=self.uploadscreens_manager,
+        )
+
 
 async def _check_hosts(
     meta: dict[str, Any],
@@ -161,6 +177,26 @@ async def _check_hosts(
                 console.print(f"[green]All existing images are from approved hosts for {tracker}.")
             return meta[new_images_key], False, False
 
+    # Check if the tracker-specific key already has valid images (e.g. filled by prepare_tracker_images)
+    has_valid_images = False
+    if meta.get(new_images_key):
+        valid_hosts: list[bool] = []
+        tracker_images = cast(list[dict[str, str]], meta.get(new_images_key, []))
+        for image in tracker_images:
+            raw_url = _as_str(image.get("raw_url")) or ""
+            netloc = urlparse(raw_url).netloc
+            matched_host = await match_host(netloc, url_host_mapping.keys())
+            mapped_host = url_host_mapping.get(matched_host, matched_host)
+            valid_hosts.append(mapped_host in approved_image_hosts)
+
+        # Then check if all are valid
+        if all(valid_hosts) and meta[new_images_key]:
+            has_valid_images = True
+
+    if has_valid_images:
+        console.print(f"[green]Using valid images from {new_images_key}.")
+        return meta[new_images_key], False, False
+
     if tracker == "covers":
         reuploaded_images_path = os.path.join(meta["base_dir"], "tmp", meta["uuid"], "covers.json")
     else:
@@ -178,6 +214,7 @@ async def _check_hosts(
             console.print(f"[red]Failed to load reuploaded images: {e}")
 
     valid_reuploaded_images: list[dict[str, str]] = []
+    valid_reuploaded_hosts: list[str] = []
     for image in reuploaded_images:
         raw_url = _as_str(image.get("raw_url"))
         if not raw_url:
@@ -200,9 +237,15 @@ async def _check_hosts(
             mapped_host = url_host_mapping.get(mapped_host, mapped_host)
             if mapped_host in approved_image_hosts:
                 valid_reuploaded_images.append(image)
+                valid_reuploaded_hosts.append(mapped_host)
             elif meta["debug"]:
                 console.print(f"[red]URL '{raw_url}' from reuploaded_images.json is not recognized as an approved host.")
 
+    # The file can hold copies of the same screenshots on several hosts; use a single host's set
+    if len(set(valid_reuploaded_hosts)) > 1:
+        best_host = max(set(valid_reuploaded_hosts), key=lambda h: (valid_reuploaded_hosts.count(h), -approved_image_hosts.index(h)))
+        valid_reuploaded_images = [image for image, host in zip(valid_reuploaded_images, valid_reuploaded_hosts) if host == best_host]
+
     if valid_reuploaded_images:
         meta[new_images_key] = valid_reuploaded_images
         if tracker == "covers":
@@ -211,26 +254,6 @@ async def _check_hosts(
             console.print("[green]Using valid images from reuploaded_images.json.")
         return meta[new_images_key], False, False
 
-    # Check if the tracker-specific key has valid images
-    has_valid_images = False
-    if meta.get(new_images_key):
-        valid_hosts: list[bool] = []
-        tracker_images = cast(list[dict[str, str]], meta.get(new_images_key, []))
-        for image in tracker_images:
-            raw_url = _as_str(image.get("raw_url")) or ""
-            netloc = urlparse(raw_url).netloc
-            matched_host = await match_host(netloc, url_host_mapping.keys())
-            mapped_host = url_host_mapping.get(matched_host, matched_host)
-            valid_hosts.append(mapped_host in approved_image_hosts)
-
-        # Then check if all are valid
-        if all(valid_hosts) and meta[new_images_key]:
-            has_valid_images = True
-
-    if has_valid_images:
-        console.print(f"[green]Using valid images from {new_images_key}.")
-        return meta[new_images_key], False, False
-
     if meta["debug"]:
         console.print(f"[yellow]No valid images found for {tracker}, will attempt to reupload...")
 
@@ -270,29 +293,145 @@ async def _check_hosts(
     return meta.get(new_images_key, []), False, images_reuploaded
 
 
-async def _handle_image_upload(
+async def _all_on_approved_hosts(images: Any, approved_image_hosts: list[str], url_host_mapping: dict[str, str]) -> bool:
+    if not isinstance(images, list) or not images:
+        return False
+    for image in cast(list[Any], images):
+        raw_url = _as_str(image.get("raw_url")) if isinstance(image, dict) else None
+        if not raw_url:
+            return False
+        matched_host = await match_host(urlparse(raw_url).netloc, url_host_mapping.keys())
+        if url_host_mapping.get(matched_host, matched_host) not in approved_image_hosts:
+            return False
+    return True
+
+
+def _minimal_host_cover(candidates: Mapping[str, list[str]], configured_hosts: list[str]) -> list[str]:
+    """Smallest set of hosts that gives every tracker at least one approved host, preferring config order."""
+    hosts = [host for host in configured_hosts if any(host in tracker_hosts for tracker_hosts in candidates.values())]
+    for size in range(1, len(hosts) + 1):
+        for combo in itertools.combinations(hosts, size):
+            if all(any(host in combo for host in tracker_hosts) for tracker_hosts in candidates.values()):
+                return list(combo)
+    return hosts
+
+
+async def _prepare_tracker_images(
     meta: dict[str, Any],
-    tracker: str,
-    url_host_mapping: dict[str, str],
-    approved_image_hosts: Optional[list[str]] = None,
-    img_host_index: int = 1,
-    file: Optional[str] = None,
+    tracker_requirements: Mapping[str, tuple[list[str], dict[str, str]]],
     default_config: Optional[Mapping[str, Any]] = None,
     takescreens_manager: Optional[TakeScreensManager] = None,
     uploadscreens_manager: Optional[UploadScreensManager] = None,
-) -> tuple[list[dict[str, str]], bool, bool]:
+) -> dict[str, str]:
+    """Re-host screenshots for all trackers that can't use meta['image_list'] in one concurrent pass.
+
+    Works out which configured hosts each tracker accepts, picks the smallest set of hosts covering
+    all of them and uploads to those hosts concurrently (each upload keeps its per-host limit from
+    HOST_LIMITS). Every tracker's ``{tracker}_images_key`` is then filled from the shared results, so the
+    following check_hosts calls only have to validate. Returns the tracker -> host assignment.
+    """
     if default_config is None:
         raise ValueError("default_config is required")
     if takescreens_manager is None:
         raise ValueError("takescreens_manager is required")
     if uploadscreens_manager is None:
         raise ValueError("uploadscreens_manager is required")
-    if approved_image_hosts is None:
-        approved_image_hosts = []
-    original_imghost = meta.get("imghost")
-    retry_mode = False
-    images_reuploaded = False
-    new_images_key = f"{tracker}_images_key"
+    if meta.get("skip_imghost_upload", False):
+        return {}
+
+    if "failed_image_hosts" not in meta:
+        meta["failed_image_hosts"] = []
+    failed_hosts = cast(list[str], meta["failed_image_hosts"])
+
+    configured_hosts: list[str] = []
+    host_indexes: dict[str, int] = {}
+    for index in range(1, 10):
+        host = _as_str(default_config.get(f"img_host_{index}"))
+        if host and host not in host_indexes:
+            configured_hosts.append(host)
+            host_indexes[host] = index
+
+    candidates: dict[str, list[str]] = {}
+    for tracker, (approved_image_hosts, url_host_mapping) in tracker_requirements.items():
+        if await _all_on_approved_hosts(meta.get(f"{tracker}_images_key"), approved_image_hosts, url_host_mapping):
+            continue
+        if await _all_on_approved_hosts(meta.get("image_list"), approved_image_hosts, url_host_mapping):
+            continue
+        hosts = [host for host in configured_hosts if host in approved_image_hosts and host not in failed_hosts]
+        if hosts:
+            candidates[tracker] = hosts
+
+    if not candidates:
+        return {}
+
+    screenshots, multi_screens = await _collect_rehost_screenshots(meta, next(iter(candidates)), default_config, takescreens_manager)
+    if not screenshots:
+        return {}
+
+    async def _upload_to_host(host: str) -> tuple[str, list[dict[str, str]]]:
+        try:
+            images, _ = await uploadscreens_manager.upload_screens(meta, multi_screens, host_indexes[host], 0, multi_screens, screenshots, {}, img_host=host)
+            return host, [{"img_url": img["img_url"], "raw_url": img["raw_url"], "web_url": img["web_url"]} for img in images]
+        except Exception as e:
+            console.print(f"[yellow]Re-hosting screenshots to {host} failed: {e}[/yellow]")
+            return host, []
+
+    # Upload to the smallest covering set of hosts at once; trackers left without a host because
+    # one failed get a new cover from their remaining hosts, until every tracker has one or none are left
+    results: dict[str, list[dict[str, str]]] = {}
+    assignments: dict[str, str] = {}
+    while True:
+        pending: dict[str, list[str]] = {}
+        for tracker, hosts in candidates.items():
+            if tracker in assignments:
+                continue
+            usable = [host for host in hosts if host not in failed_hosts]
+            uploaded_host = next((host for host in usable if results.get(host)), None)
+            if uploaded_host:
+                meta[f"{tracker}_images_key"] = [dict(image) for image in results[uploaded_host]]
+                assignments[tracker] = uploaded_host
+            elif usable:
+                pending[tracker] = usable
+        target_hosts = [host for host in _minimal_host_cover(pending, configured_hosts) if host not in results]
+        if not target_hosts:
+            break
+        if meta.get("debug"):
+            console.print(f"[cyan]Re-hosting for {', '.join(pending)} via {', '.join(target_hosts)}[/cyan]")
+        for host, images in await asyncio.gather(*(_upload_to_host(host) for host in target_hosts)):
+            results[host] = images
+            if not images and host not in failed_hosts:
+                failed_hosts.append(host)
+
+    uploaded = [image for images in results.values() for image in images]
+    if uploaded:
+        output_file = os.path.join(meta["base_dir"], "tmp", meta["uuid"], "reuploaded_images.json")
+        existing_data: list[dict[str, str]] = []
+        try:
+            if os.path.exists(output_file):
+                async with aiofiles.open(output_file, encoding="utf-8") as f:
+                    loaded_value: object = json.loads(await f.read() or "[]")
+                if isinstance(loaded_value, list):
+                    existing_data = cast(list[dict[str, str]], loaded_value)
+        except Exception:
+            existing_data = []
+        known = {image.get("raw_url") for image in existing_data}
+        updated_data = existing_data + [image for image in uploaded if image["raw_url"] not in known]
+        try:
+            async with aiofiles.open(output_file, "w", encoding="utf-8") as f:
+                await f.write(json.dumps(updated_data, indent=4))
+        except Exception as e:
+            console.print(f"[red]Failed to save reuploaded images: {e}")
+
+    return assignments
+
+
+async def _collect_rehost_screenshots(
+    meta: dict[str, Any],
+    tracker: str,
+    default_config: Mapping[str, Any],
+    takescreens_manager: TakeScreensManager,
+) -> tuple[list[str], int]:
+    """Find the local screenshots to re-host, capturing more if needed. Returns (screenshots, wanted count)."""
     filelist: list[str] = []
     filelist_value = meta.get("video", [])
     if isinstance(filelist_value, str):
@@ -310,7 +449,6 @@ async def _handle_image_upload(
     multi_screens = to_int(meta.get("screens"), default_screens)
     base_dir = meta["base_dir"]
     folder_id = meta["uuid"]
-    meta[new_images_key] = []
 
     screenshots_dir = os.path.join(base_dir, "tmp", folder_id)
     if meta["debug"]:
@@ -493,8 +631,7 @@ async def _handle_image_upload(
             console.print(f"[dim]{traceback.format_exc()}[/dim]")
 
     if not all_screenshots:
-        console.print("[red]No screenshots were generated or found. Please check the screenshot generation process.")
-        return [], True, images_reuploaded
+        return [], multi_screens
 
     all_screenshots.sort()
     existing_from_image_list: list[str] = []
@@ -531,6 +668,41 @@ async def _handle_image_upload(
         for i, screenshot in enumerate(all_screenshots):
             console.print(f"  {i + 1}. {os.path.basename(screenshot)}")
 
+    return all_screenshots, multi_screens
+
+
+async def _handle_image_upload(
+    meta: dict[str, Any],
+    tracker: str,
+    url_host_mapping: dict[str, str],
+    approved_image_hosts: Optional[list[str]] = None,
+    img_host_index: int = 1,
+    file: Optional[str] = None,
+    default_config: Optional[Mapping[str, Any]] = None,
+    takescreens_manager: Optional[TakeScreensManager] = None,
+    uploadscreens_manager: Optional[UploadScreensManager] = None,
+) -> tuple[list[dict[str, str]], bool, bool]:
+    if default_config is None:
+        raise ValueError("default_config is required")
+    if takescreens_manager is None:
+        raise ValueError("takescreens_manager is required")
+    if uploadscreens_manager is None:
+        raise ValueError("uploadscreens_manager is required")
+    if approved_image_hosts is None:
+        approved_image_hosts = []
+    _ = file
+    original_imghost = meta.get("imghost")
+    retry_mode = False
+    images_reuploaded = False
+    new_images_key = f"{tracker}_images_key"
+    meta[new_images_key] = []
+    screenshots_dir = os.path.join(meta["base_dir"], "tmp", meta["uuid"])
+
+    all_screenshots, multi_screens = await _collect_rehost_screenshots(meta, tracker, default_config, takescreens_manager)
+    if not all_screenshots:
+        console.print("[red]No screenshots were generated or found. Please check the screenshot generation process.")
+        return [], True, images_reuploaded
+
     if not meta.get("skip_imghost_upload", False):
         uploaded_images: list[dict[str, str]] = []
 
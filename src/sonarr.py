@@ -4,6 +4,7 @@ from typing import Any, Optional, cast
 
 import httpx
 
+from src.arrmirror import ArrLibraryMirror, configured_instances
 from src.console import console
 
 ShowInfo = dict[str, Any]
@@ -25,52 +26,40 @@ class SonarrManager:
             console.print("[red]No Sonarr API keys are configured.[/red]")
             return None
 
-        # Try each Sonarr instance until we get valid data
-        instance_index = 0
-        max_instances = 4  # Limit to prevent infinite loops
-
-        while instance_index < max_instances:
-            # Determine the suffix for this instance
-            suffix = "" if instance_index == 0 else f"_{instance_index}"
-            api_key_name = f"sonarr_api_key{suffix}"
-            url_name = f"sonarr_url{suffix}"
-
-            # Check if this instance exists in config
-            api_key_value = self.default_config.get(api_key_name)
-            if not isinstance(api_key_value, str) or not api_key_value.strip():
-                # This slot isn't configured; try the next suffix (supports configs starting at _1)
-                instance_index += 1
-                continue
-
-            # Get instance-specific configuration
-            base_url_value = self.default_config.get(url_name)
-            if not isinstance(base_url_value, str) or not base_url_value.strip():
-                instance_index += 1
-                continue
-
-            api_key = api_key_value.strip()
-            base_url = base_url_value.strip().rstrip("/")
-
-            if debug:
-                console.print(f"[blue]Trying Sonarr instance {instance_index if instance_index > 0 else 'default'}[/blue]")
-
-            # Build the appropriate URL
-            if tvdb_id:
-                url = f"{base_url}/api/v3/series?tvdbId={tvdb_id}&includeSeasonImages=false"
-            elif filename and title:
-                url = f"{base_url}/api/v3/parse?title={title}&path={filename}"
-            else:
-                instance_index += 1
-                continue
-
-            headers = {"X-Api-Key": api_key, "Content-Type": "application/json"}
-
-            if debug:
-                console.print(f"[green]TVDB ID {tvdb_id}[/green]")
-                console.print(f"[blue]Sonarr URL:[/blue] {url}")
-
-            try:
-                async with httpx.AsyncClient() as client:
+        mirror = ArrLibraryMirror.for_config(self.default_config, "sonarr")
+        if mirror is not None:
+            mirror_data = await self._get_from_mirror(mirror, tvdb_id, filename, title, debug)
+            if mirror_data is not None:
+                return mirror_data
+            if tvdb_id and mirror.is_complete():
+                # Every library is loaded and fresh, so asking the instances one by one can't find anything new
+                console.print("[yellow]No Sonarr instance returned valid show data.[/yellow]")
+                return None
+
+        # Try each Sonarr instance until we get valid data, sharing one client across instances
+        async with httpx.AsyncClient() as client:
+            for instance_label, base_url, api_key in configured_instances(self.default_config, "sonarr"):
+                if debug:
+                    console.print(f"[blue]Trying Sonarr instance {instance_label}[/blue]")
+
+                # Build the appropriate URL
+                if tvdb_id:
+                    if mirror is not None and mirror.is_fresh(instance_label):
+                        # Already answered from this instance's library copy
+                        continue
+                    url = f"{base_url}/api/v3/series?tvdbId={tvdb_id}&includeSeasonImages=false"
+                elif filename and title:
+                    url = f"{base_url}/api/v3/parse?title={title}&path={filename}"
+                else:
+                    continue
+
+                headers = {"X-Api-Key": api_key, "Content-Type": "application/json"}
+
+                if debug:
+                    console.print(f"[green]TVDB ID {tvdb_id}[/green]")
+                    console.print(f"[blue]Sonarr URL:[/blue] {url}")
+
+                try:
                     response = await client.get(url, headers=headers, timeout=10.0)
 
                     if response.status_code == 200:
@@ -84,27 +73,85 @@ class SonarrManager:
                         show_data: ShowInfo = await self.extract_show_data(data)
 
                         if show_data and (show_data.get("tvdb_id") or show_data.get("imdb_id") or show_data.get("tmdb_id")):
-                            console.print(f"[green]Found valid show data from Sonarr instance {instance_index if instance_index > 0 else 'default'}[/green]")
+                            console.print(f"[green]Found valid show data from Sonarr instance {instance_label}[/green]")
                             return show_data
                     else:
-                        console.print(
-                            f"[yellow]Failed to fetch from Sonarr instance {instance_index if instance_index > 0 else 'default'}: {response.status_code} - {response.text}[/yellow]"
-                        )
+                        console.print(f"[yellow]Failed to fetch from Sonarr instance {instance_label}: {response.status_code} - {response.text}[/yellow]")
 
-            except httpx.TimeoutException:
-                console.print(f"[red]Timeout when fetching from Sonarr instance {instance_index if instance_index > 0 else 'default'}[/red]")
-            except httpx.RequestError as e:
-                console.print(f"[red]Error fetching from Sonarr instance {instance_index if instance_index > 0 else 'default'}: {e}[/red]")
-            except Exception as e:
-                console.print(f"[red]Unexpected error with Sonarr instance {instance_index if instance_index > 0 else 'default'}: {e}[/red]")
-
-            # Move to the next instance
-            instance_index += 1
+                except httpx.TimeoutException:
+                    console.print(f"[red]Timeout when fetching from Sonarr instance {instance_label}[/red]")
+                except httpx.RequestError as e:
+                    console.print(f"[red]Error fetching from Sonarr instance {instance_label}: {e}[/red]")
+                except Exception as e:
+                    console.print(f"[red]Unexpected error with Sonarr instance {instance_label}: {e}[/red]")
 
         # If we got here, no instances provided valid data
         console.print("[yellow]No Sonarr instance returned valid show data.[/yellow]")
         return None
 
+    async def _get_from_mirror(self, mirror: ArrLibraryMirror, tvdb_id: Optional[int], filename: Optional[str], title: Optional[str], debug: bool) -> Optional[ShowInfo]:
+        """Answer from the in-memory library copy: by TVDB ID, or by the series folder containing ``filename``.
+
+        The series list carries no release group, so a filename match still asks the matched instance's
+        parser for it, like the per-request ``/parse`` lookup did.
+        """
+        await mirror.refresh(debug)
+        if tvdb_id:
+            entry = mirror.find_by_id("tvdbId", tvdb_id)
+        elif filename:
+            entry = mirror.find_by_path(filename)
+        else:
+            return None
+        if entry is None:
+            return None
+
+        instance_label, series = entry
+        show_data = await self.extract_show_data([series])
+        if not (show_data.get("tvdb_id") or show_data.get("imdb_id") or show_data.get("tmdb_id")):
+            return None
+        if not tvdb_id and filename and title:
+            show_data["release_group"] = await self._parse_release_group(mirror, instance_label, filename, title, debug)
+        if debug:
+            console.print(f"[blue]Sonarr library match:[/blue] {series.get('title')} ({series.get('path')})")
+        console.print(f"[green]Found valid show data from Sonarr instance {instance_label}[/green]")
+        return show_data
+
+    async def _parse_release_group(self, mirror: ArrLibraryMirror, instance_label: str, filename: str, title: str, debug: bool) -> Optional[str]:
+        """Release group Sonarr's parser reads from ``title``, or None if the instance can't be asked."""
+        instance = next((entry for entry in mirror.instances if entry[0] == instance_label), None)
+        if instance is None:
+            return None
+        _, base_url, api_key = instance
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.get(
+                    f"{base_url}/api/v3/parse",
+                    params={"title": title, "path": filename},
+                    headers={"X-Api-Key": api_key, "Content-Type": "application/json"},
+                    timeout=10.0,
+                )
+            if response.status_code != 200:
+                console.print(f"[yellow]Failed to parse release group with Sonarr instance {instance_label}: {response.status_code} - {response.text}[/yellow]")
+                return None
+            data = response.json()
+        except httpx.TimeoutException:
+            console.print(f"[red]Timeout when parsing release group with Sonarr instance {instance_label}[/red]")
+            return None
+        except httpx.RequestError as e:
+            console.print(f"[red]Error parsing release group with Sonarr instance {instance_label}: {e}[/red]")
+            return None
+        except Exception as e:
+            console.print(f"[red]Unexpected error parsing release group with Sonarr instance {instance_label}: {e}[/red]")
+            return None
+
+        if not isinstance(data, dict):
+            return None
+        parsed_info = cast(Mapping[str, Any], data).get("parsedEpisodeInfo")
+        release_group = cast(Mapping[str, Any], parsed_info).get("releaseGroup") if isinstance(parsed_info, dict) else None
+        if debug:
+            console.print(f"[blue]Sonarr parsed release group:[/blue] {release_group}")
+        return str(release_group) if release_group else None
+
     async def extract_show_data(self, sonarr_data: Any) -> ShowInfo:
         if not sonarr_data:
             return {"tvdb_id": None, "imdb_id": None, "tvmaze_id": None, "tmdb_id": None, "genres": [], "title": "", "year": None, "release_group": None}
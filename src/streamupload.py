@@ -0,0 +1,148 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import base64
+import contextlib
+import mimetypes
+import os
+import secrets
+from collections.abc import AsyncIterator, Mapping
+from typing import Any, Optional
+
+import aiofiles
+import httpx
+
+# Bytes read from disk at a time; a multiple of 3, so base64 chunks never need padding in between
+CHUNK_SIZE = 3 * 64 * 1024
+# Bytes of files being uploaded at once across the process; a single larger file still goes, alone
+MAX_IN_FLIGHT_BYTES = 128 * 1024 * 1024
+
+
+def _field_value(value: Any) -> bytes:
+    # Same conversion httpx applies to data= values
+    if value is True:
+        return b"true"
+    if value is False:
+        return b"false"
+    return b"" if value is None else str(value).encode()
+
+
+def _quote(value: str) -> str:
+    # Same escaping httpx applies to multipart names and filenames
+    return value.replace("\\", "\\\\").replace('"', "%22")
+
+
+class FilePart:
+    """A file sent as one part of a multipart form, read from disk while the request is sent.
+
+    With ``base64_encode`` the part is a plain form field holding the file as base64 text, for
+    the hosts that only take the image that way; it is encoded chunk by chunk as it is sent.
+    """
+
+    def __init__(self, path: str, filename: Optional[str] = None, content_type: Optional[str] = None, base64_encode: bool = False) -> None:
+        self.path = path
+        self.filename = os.path.basename(path) if filename is None else filename
+        self.content_type = content_type or mimetypes.guess_type(self.filename)[0] or "application/octet-stream"
+        self.base64_encode = base64_encode
+        self.size = os.path.getsize(path)
+
+    @property
+    def length(self) -> int:
+        return 4 * -(-self.size // 3) if self.base64_encode else self.size
+
+    def header(self, name: str) -> bytes:
+        if self.base64_encode:
+            return f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'.encode()
+        return f'Content-Disposition: form-data; name="{_quote(name)}"; filename="{_quote(self.filename)}"\r\nContent-Type: {self.content_type}\r\n\r\n'.encode()
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        remaining = self.size
+        async with aiofiles.open(self.path, "rb") as f:
+            while remaining > 0:
+                chunk = await f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise OSError(f"{self.path} changed while it was uploaded")
+                remaining -= len(chunk)
+                yield base64.b64encode(chunk) if self.base64_encode else chunk
+
+
+class StreamingForm:
+    """A multipart/form-data body whose files are streamed from disk, with a known Content-Length.
+
+    Fields come before files, in the layout httpx uses for ``data=`` and ``files=``, so only
+    one chunk of each file is held in memory at a time.
+    """
+
+    def __init__(self, data: Optional[Mapping[str, Any]] = None, files: Optional[Mapping[str, FilePart]] = None) -> None:
+        self.boundary = secrets.token_hex(16).encode("ascii")
+        self.fields = [(f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'.encode(), _field_value(value)) for name, value in (data or {}).items()]
+        self.files = [(part.header(name), part) for name, part in (files or {}).items()]
+
+    @property
+    def file_bytes(self) -> int:
+        return sum(part.size for _, part in self.files)
+
+    @property
+    def content_length(self) -> int:
+        delimiter = len(self.boundary) + 4  # --boundary\r\n
+        length = sum(delimiter + len(header) + len(value) + 2 for header, value in self.fields)
+        length += sum(delimiter + len(header) + part.length + 2 for header, part in self.files)
+        return length + len(self.boundary) + 6  # --boundary--\r\n
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Content-Type": f"multipart/form-data; boundary={self.boundary.decode('ascii')}", "Content-Length": str(self.content_length)}
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for header, value in self.fields:
+            yield b"--" + self.boundary + b"\r\n" + header + value + b"\r\n"
+        for header, part in self.files:
+            yield b"--" + self.boundary + b"\r\n" + header
+            async for chunk in part.chunks():
+                yield chunk
+            yield b"\r\n"
+        yield b"--" + self.boundary + b"--\r\n"
+
+
+class _InFlight:
+    """Process-wide budget of file bytes being uploaded. The condition is recreated per event loop."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.used = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.used = 0
+        return self._condition
+
+    @contextlib.asynccontextmanager
+    async def reserve(self, size: int) -> AsyncIterator[None]:
+        size = min(size, self.limit)
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.used + size <= self.limit)
+            self.used += size
+        try:
+            yield
+        finally:
+            async with condition:
+                self.used -= size
+                condition.notify_all()
+
+
+in_flight = _InFlight(MAX_IN_FLIGHT_BYTES)
+
+
+async def post_form(
+    client: httpx.AsyncClient, url: str, data: Optional[Mapping[str, Any]] = None, files: Optional[Mapping[str, FilePart]] = None, **kwargs: Any
+) -> httpx.Response:
+    """POST ``data`` and ``files`` as a streamed multipart form, within the process-wide in-flight budget."""
+    form = StreamingForm(data, files)
+    headers = {**(kwargs.pop("headers", None) or {}), **form.headers}
+    async with in_flight.reserve(form.file_bytes):
+        return await client.post(url, content=form, headers=headers, **kwargs)
@@ -1,5 +1,7 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import contextlib
+import functools
 import gc
 import glob
 import json
@@ -7,6 +9,8 @@ import os
 import platform
 import random
 import re
+import shutil
+import statistics
 import sys
 import time
 import traceback
@@ -18,8 +22,10 @@ import ffmpeg
 import psutil
 from pymediainfo import MediaInfo
 
+from src import frameprescan, pngoptimize
 from src.cleanup import cleanup_manager
 from src.console import console
+from src.tonemapcache import TonemapCache, binary_fingerprint
 
 default_config: dict[str, Any] = {}
 task_limit = 1
@@ -63,33 +69,52 @@ def _apply_config(config: Mapping[str, Any]) -> None:
         desat = 10.0
 
 
+@functools.cache
+def bundled_ffmpeg() -> Optional[str]:
+    """The bundled amd/arm ffmpeg on Linux when present; resolved once per process."""
+    if platform.system() != "Linux":
+        return None
+    machine = platform.machine().lower()
+    if machine in ("x86_64", "amd64"):
+        arch = "amd"
+    elif machine in ("aarch64", "arm64"):
+        arch = "arm"
+    else:
+        return None
+    candidate = os.path.join(os.path.dirname(os.path.dirname(__file__)), "bin", "ffmpeg", arch, "ffmpeg")
+    return candidate if os.path.exists(candidate) else None
+
+
+def ffmpeg_binary() -> Optional[str]:
+    """Path of the ffmpeg binary run_ffmpeg() uses."""
+    return bundled_ffmpeg() or shutil.which("ffmpeg")
+
+
+async def _communicate(process: asyncio.subprocess.Process) -> tuple[bytes, bytes]:
+    try:
+        return await process.communicate()
+    except BaseException:
+        # Timed out (asyncio.wait_for) or cancelled: don't leave ffmpeg running
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+        raise
+
+
 async def run_ffmpeg(command: Any) -> tuple[Optional[int], bytes, bytes]:
     # On Linux prefer bundled amd/arm binary when present; otherwise fall back to system ffmpeg.
-    if platform.system() == "Linux":
-        base_dir = os.path.dirname(os.path.dirname(__file__))
-        ff_bin_dir = os.path.join(base_dir, "bin", "ffmpeg")
-
-        machine = platform.machine().lower()
-        if machine in ("x86_64", "amd64"):
-            arch = "amd"
-        elif machine in ("aarch64", "arm64"):
-            arch = "arm"
-        else:
-            arch = None
+    candidate = bundled_ffmpeg()
+    if candidate:
+        cmd_list = list(command.compile())
+        cmd_list[0] = candidate
 
-        if arch:
-            candidate = os.path.join(ff_bin_dir, arch, "ffmpeg")
-            if os.path.exists(candidate):
-                cmd_list = list(command.compile())
-                cmd_list[0] = candidate
-
-                process = await asyncio.create_subprocess_exec(*cmd_list, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
-                stdout, stderr = await process.communicate()
-                return (process.returncode if process.returncode is not None else -1), stdout, stderr
+        process = await asyncio.create_subprocess_exec(*cmd_list, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        stdout, stderr = await _communicate(process)
+        return (process.returncode if process.returncode is not None else -1), stdout, stderr
 
     # Fallback: use system/default ffmpeg (command.compile())
     process = await asyncio.create_subprocess_exec(*command.compile(), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
-    stdout, stderr = await process.communicate()
+    stdout, stderr = await _communicate(process)
     return process.returncode, stdout, stderr
 
 
@@ -914,6 +939,8 @@ async def screenshots(
 
     if not ss_times:
         ss_times = await valid_ss_time([], num_capture, length, frame_rate, meta, retake=force_screenshots)
+        if default_config.get("screenshot_prescan", True):
+            ss_times = await prescan_ss_times(path, ss_times, length, meta)
 
     if meta.get("frame_overlay", False):
         if meta["debug"]:
@@ -943,7 +970,7 @@ async def screenshots(
         if use_libplacebo and not meta.get("frame_overlay", False):
             if not ffmpeg_is_good:
                 test_time = str(ss_times[0] if ss_times else 0)
-                libplacebo, compatible = await check_libplacebo_compatibility(w_sar, h_sar, width, height, path, test_time, test_image_path, loglevel, meta)
+                libplacebo, compatible = await tonemap_capabilities(w_sar, h_sar, width, height, path, test_time, test_image_path, loglevel, meta)
                 if compatible:
                     hdr_tonemap = True
                     meta["tonemapped"] = True
@@ -976,9 +1003,29 @@ async def screenshots(
     # Create semaphore to limit concurrent tasks
     semaphore = asyncio.Semaphore(num_workers)
 
+    tonemap_key = tonemap_cache_key(meta) if hdr_tonemap else None
+    tonemap_libplacebo = bool(meta.get("libplacebo"))
+    capture_seconds: list[float] = []
+
+    optimize_screens = bool(default_config.get("optimize_screenshots", False))
+    optimize_target = pngoptimize.target_size(img_host)
+    optimize_results: list[pngoptimize.OptimizeResult] = []
+
+    async def optimize_captured(result: Optional[tuple[int, Optional[str]]]) -> Optional[tuple[int, Optional[str]]]:
+        if optimize_screens and result is not None and result[1] is not None:
+            optimized = await pngoptimize.optimize(result[1], optimize_target)
+            if optimized is not None:
+                optimize_results.append(optimized)
+        return result
+
     async def capture_with_semaphore(args: tuple[int, str, float, str, float, float, float, float, str, bool, dict[str, Any]]) -> Optional[tuple[int, Optional[str]]]:
         async with semaphore:
-            return await capture_screenshot(args)
+            capture_start = time.perf_counter()
+            result = await capture_screenshot(args)
+            if result is not None and result[1] is not None:
+                capture_seconds.append(time.perf_counter() - capture_start)
+        # Optimized in a worker process as soon as it is captured, while the next captures run
+        return await optimize_captured(result)
 
     capture_tasks: list[Awaitable[Optional[tuple[int, Optional[str]]]]] = []
     for i in range(num_capture):
@@ -1026,6 +1073,15 @@ async def screenshots(
     if not force_screenshots and meta["debug"]:
         console.print(f"[green]Successfully captured {len(capture_results)} screenshots.")
 
+    if tonemap_key is not None:
+        cache, fingerprint, hdr_format = tonemap_key
+        if tonemap_libplacebo and not meta.get("libplacebo"):
+            # libplacebo failed during capture and the zscale chain took over: remember that instead
+            cache.put(fingerprint, hdr_format, "zscale")
+        elif capture_seconds:
+            cache.record_cost(fingerprint, hdr_format, "libplacebo" if tonemap_libplacebo else "zscale", statistics.median(capture_seconds))
+        cache.save()
+
     valid_results: list[str] = []
     remaining_retakes: list[str] = []
     for image_path in capture_results:
@@ -1077,8 +1133,8 @@ async def screenshots(
                             if os.path.exists(image_path):
                                 os.remove(image_path)
 
-                            screenshot_response = await capture_screenshot(
-                                (original_index, path, adjusted_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
+                            screenshot_response = await optimize_captured(
+                                await capture_screenshot((original_index, path, adjusted_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta))
                             )
 
                             if not isinstance(screenshot_response, tuple) or len(screenshot_response) != 2:
@@ -1124,8 +1180,8 @@ async def screenshots(
                         if os.path.exists(image_path):
                             os.remove(image_path)
 
-                        screenshot_response = await capture_screenshot(
-                            (original_index, path, random_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
+                        screenshot_response = await optimize_captured(
+                            await capture_screenshot((original_index, path, random_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta))
                         )
 
                         if not isinstance(screenshot_response, tuple) or len(screenshot_response) != 2:
@@ -1168,6 +1224,9 @@ async def screenshots(
     if remaining_retakes:
         console.print(f"[red]The following images could not be retaken successfully: {remaining_retakes}[/red]")
 
+    if optimize_results:
+        console.print(f"[cyan]{pngoptimize.report(optimize_results)}[/cyan]")
+
     if meta["debug"]:
         console.print(f"[green]Successfully processed {len(valid_results)} screenshots.")
 
@@ -1518,6 +1577,61 @@ async def valid_ss_time(ss_times: list[str], num_screens: int, length: float, fr
     return result_times
 
 
+async def probe_frame(path: str, ss_time: float) -> Optional[tuple[float, bytes]]:
+    """Decode the keyframe at or before ``ss_time`` as a tiny grayscale frame: its time and pixels."""
+    inp = cast(Any, ffmpeg).input(path, ss=f"{ss_time:.3f}", skip_frame="nokey", noaccurate_seek=None)
+    vf = f"scale={frameprescan.PROBE_WIDTH}:{frameprescan.PROBE_HEIGHT}:flags=area,format=gray,showinfo"
+    out = inp.output("pipe:", map="0:v:0", an=None, sn=None, vframes=1, vf=vf, format="rawvideo", pix_fmt="gray")
+    # showinfo logs the frame's timestamp at the info level
+    cmd = out.global_args("-loglevel", "info", "-hide_banner", "-nostdin")
+    try:
+        returncode, stdout, stderr = await asyncio.wait_for(run_ffmpeg(cmd), timeout=60)
+    except (asyncio.TimeoutError, OSError):
+        return None
+    if returncode != 0 or len(stdout) < frameprescan.PROBE_WIDTH * frameprescan.PROBE_HEIGHT:
+        return None
+    # Timestamps restart at the seek point, so the keyframe sits at ss_time + pts_time
+    match = re.search(rb"pts_time:\s*(-?[\d.]+)", stderr)
+    keyframe_time = ss_time + float(match.group(1)) if match else ss_time
+    return max(0.0, keyframe_time), stdout[: frameprescan.PROBE_WIDTH * frameprescan.PROBE_HEIGHT]
+
+
+async def prescan_ss_times(path: str, ss_times: list[str], length: float, meta: dict[str, Any]) -> list[str]:
+    """Move each planned screenshot to a well-exposed, detailed keyframe within its slot.
+
+    A handful of tiny keyframe decodes per screenshot replace blind picks, so black or flat
+    frames are avoided before any full-quality capture; the retake loop stays as a fallback.
+    """
+    if os.path.isdir(path):
+        filelist = meta.get("filelist") or []
+        if not filelist:
+            return ss_times
+        path = filelist[0]
+    times = [float(t) for t in ss_times]
+    ordered = sorted(times)
+    gaps = [b - a for a, b in zip(ordered, ordered[1:]) if b > a]
+    slot = min(gaps) if gaps else length * 0.05
+    if slot <= 0:
+        return ss_times
+
+    semaphore = asyncio.Semaphore(max(1, task_limit))
+
+    async def probe(candidate: float) -> Optional[tuple[float, bytes]]:
+        async with semaphore:
+            return await probe_frame(path, candidate)
+
+    candidates = [frameprescan.candidate_times(t, slot, length) for t in times]
+    probes = await asyncio.gather(*(probe(c) for slot_candidates in candidates for c in slot_candidates))
+    per_slot = frameprescan.CANDIDATES_PER_SCREEN
+    slots = [[p for p in probes[i * per_slot : (i + 1) * per_slot] if p is not None] for i in range(len(times))]
+    chosen = frameprescan.choose_frames(slots)
+
+    result = [str(picked) if picked is not None else original for picked, original in zip(chosen, ss_times)]
+    if meta.get("debug"):
+        console.print(f"[cyan]Prescanned {len(probes)} keyframes; screenshot times {ss_times} -> {result}[/cyan]")
+    return result
+
+
 async def kill_all_child_processes() -> None:
     """Ensures all child processes are terminated."""
     try:
@@ -1593,6 +1707,37 @@ async def get_frame_info(path: str, ss_time: Union[str, float], meta: dict[str,
         return {"frame_type": "Unknown", "frame_number": int(float(ss_time) * meta.get("frame_rate", 24.0))}
 
 
+def tonemap_cache_key(meta: dict[str, Any]) -> Optional[tuple[TonemapCache, str, str]]:
+    """Capability cache, ffmpeg fingerprint and HDR format for this source, or None when the cache does not apply."""
+    if not default_config.get("tonemap_cache", True) or meta.get("is_disc") or not meta.get("hdr"):
+        return None
+    binary = ffmpeg_binary()
+    fingerprint = binary_fingerprint(binary) if binary else None
+    if fingerprint is None:
+        return None
+    return TonemapCache.for_base_dir(meta.get("base_dir") or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), fingerprint, str(meta["hdr"]).strip()
+
+
+async def tonemap_capabilities(
+    w_sar: float, h_sar: float, width: float, height: float, path: str, ss_time: str, image_path: str, loglevel: str, meta: dict[str, Any]
+) -> tuple[bool, bool]:
+    """check_libplacebo_compatibility(), skipped when this ffmpeg build was already checked for the source's HDR format."""
+    key = tonemap_cache_key(meta)
+    if key is None:
+        return await check_libplacebo_compatibility(w_sar, h_sar, width, height, path, ss_time, image_path, loglevel, meta)
+    cache, fingerprint, hdr_format = key
+    entry = cache.get(fingerprint, hdr_format)
+    if entry is not None:
+        if loglevel == "verbose" or meta.get("debug", False):
+            cost = f", {entry['frame_seconds']}s per screenshot" if entry.get("frame_seconds") is not None else ""
+            console.print(f"[cyan]Tonemap chain for {hdr_format} from capability cache: {entry['chain']}{cost}[/cyan]")
+        return entry["chain"] == "libplacebo", entry["chain"] != "none"
+    libplacebo, compatible = await check_libplacebo_compatibility(w_sar, h_sar, width, height, path, ss_time, image_path, loglevel, meta)
+    cache.put(fingerprint, hdr_format, "libplacebo" if libplacebo else "zscale" if compatible else "none")
+    cache.save()
+    return libplacebo, compatible
+
+
 async def check_libplacebo_compatibility(
     w_sar: float, h_sar: float, width: float, height: float, path: str, ss_time: str, image_path: str, loglevel: str, meta: dict[str, Any]
 ) -> tuple[bool, bool]:
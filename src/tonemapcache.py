@@ -0,0 +1,119 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, cast
+
+from src.console import console
+
+CapabilityEntry = dict[str, Any]
+
+# Filter chains, in the order screenshots() prefers them
+CHAINS = ("libplacebo", "zscale", "none")
+# A "zscale" or "none" result may come from a bad test capture or a shader compile that failed once
+# rather than from the binary, so it is retried after a day; only libplacebo is remembered for good
+FALLBACK_RETRY_SECONDS = 24 * 60 * 60
+# Weight of the newest capture in the per-frame cost average
+COST_WEIGHT = 0.3
+
+
+def binary_fingerprint(binary: str) -> Optional[str]:
+    """Identity of an ffmpeg binary: its resolved path, size and mtime, so an upgrade or rebuild gets a new key."""
+    try:
+        real_path = os.path.realpath(binary)
+        stat = os.stat(real_path)
+    except OSError:
+        return None
+    return hashlib.sha256(f"{real_path}|{stat.st_size}|{stat.st_mtime_ns}".encode()).hexdigest()[:32]
+
+
+class TonemapCache:
+    """Persistent map of ffmpeg binary -> HDR format -> the tonemap filter chain that works with it.
+
+    The libplacebo/zscale compatibility checks depend only on the ffmpeg build and the source's
+    HDR format, so their result is remembered and later uploads skip the test captures.
+    Stored at ``data/tonemap/cache.json`` as ``{fingerprint: {hdr_format: {chain, frame_seconds, checked_at}}}``,
+    where ``frame_seconds`` is a running average of the capture time per screenshot with that chain.
+    """
+
+    _instances: dict[str, "TonemapCache"] = {}
+
+    def __init__(self, base_dir: str) -> None:
+        self.cache_path = Path(base_dir) / "data" / "tonemap" / "cache.json"
+        self._entries: Optional[dict[str, dict[str, CapabilityEntry]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_base_dir(cls, base_dir: str) -> "TonemapCache":
+        """Return the shared cache for ``base_dir``."""
+        key = os.path.abspath(base_dir)
+        if key not in cls._instances:
+            cls._instances[key] = cls(key)
+        return cls._instances[key]
+
+    def _load_entries(self) -> dict[str, dict[str, CapabilityEntry]]:
+        if self._entries is not None:
+            return self._entries
+        entries: dict[str, dict[str, CapabilityEntry]] = {}
+        try:
+            if self.cache_path.exists():
+                loaded = json.loads(self.cache_path.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict):
+                    entries = cast(dict[str, dict[str, CapabilityEntry]], loaded)
+        except Exception as e:
+            console.print(f"[yellow]Failed to read tonemap capability cache, starting fresh: {e}[/yellow]")
+        self._entries = entries
+        return entries
+
+    def get(self, fingerprint: str, hdr_format: str) -> Optional[CapabilityEntry]:
+        """The recorded capability of this binary for ``hdr_format``, or None when it must be probed."""
+        with self._lock:
+            entry = self._load_entries().get(fingerprint, {}).get(hdr_format)
+            if not isinstance(entry, dict) or entry.get("chain") not in CHAINS:
+                return None
+            if entry["chain"] != "libplacebo" and time.time() - float(entry.get("checked_at", 0)) > FALLBACK_RETRY_SECONDS:
+                return None
+            return dict(entry)
+
+    def put(self, fingerprint: str, hdr_format: str, chain: str) -> None:
+        """Record the chain that works; the cost average is kept only while the chain stays the same."""
+        if chain not in CHAINS:
+            raise ValueError(f"Unknown tonemap chain: {chain}")
+        with self._lock:
+            formats = self._load_entries().setdefault(fingerprint, {})
+            previous = formats.get(hdr_format) or {}
+            entry: CapabilityEntry = {"chain": chain, "frame_seconds": None, "checked_at": time.time()}
+            if previous.get("chain") == chain:
+                entry["frame_seconds"] = previous.get("frame_seconds")
+            formats[hdr_format] = entry
+            self._dirty = True
+
+    def record_cost(self, fingerprint: str, hdr_format: str, chain: str, seconds: float) -> None:
+        """Fold one measured capture time into the per-frame cost of ``chain``."""
+        with self._lock:
+            entry = self._load_entries().get(fingerprint, {}).get(hdr_format)
+            if not entry or entry.get("chain") != chain:
+                return
+            previous = entry.get("frame_seconds")
+            entry["frame_seconds"] = round(seconds if previous is None else previous + COST_WEIGHT * (seconds - float(previous)), 3)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write pending changes via a temp file, like the image host cache."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            data = json.dumps(self._entries, indent=2)
+            self._dirty = False
+        tmp_path = self.cache_path.with_suffix(".json.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            self._dirty = True
+            console.print(f"[yellow]Failed to write tonemap capability cache: {e}[/yellow]")
@@ -18,6 +18,7 @@ from torf import Torrent
 
 from cogs.redaction import Redaction
 from src.console import console
+from src.linkplanner import LinkPlan, link_tree, plan_directory
 from src.torrentcreate import TorrentCreator
 
 # These have to be global variables to be shared across all instances since a new instance is made every time
@@ -1898,6 +1899,56 @@ async def create_cross_seed_links(meta: dict[str, Any], torrent: Torrent, tracke
     else:
         await asyncio.to_thread(os.makedirs, tracker_dir, exist_ok=True)
 
+    unique_candidates = await asyncio.to_thread(_collect_candidates, meta, tracker_dir)
+    if not unique_candidates:
+        console.print("[bold red]Unable to find source files for cross-seed linking")
+        return False
+    picker = _CandidatePicker(unique_candidates)
+
+    skip_nfo = meta.get("skip_nfo", False)
+    tracker_root = os.path.abspath(tracker_dir)
+    plan: LinkPlan = []
+    for torrent_file in torrent_files:
+        relative_path = torrent_file["relative_path"]
+
+        # Skip .nfo files if skip_nfo is enabled
+        if skip_nfo and relative_path.lower().endswith(".nfo"):
+            if debug:
+                console.print(f"[yellow]Skipping .nfo file in cross-seed due to skip_nfo: {relative_path}")
+            continue
+
+        dest_file_path = os.path.join(tracker_dir, torrent_name, relative_path) if multi_file else os.path.join(tracker_dir, torrent_name)
+        dest_file_path = os.path.normpath(dest_file_path)
+        try:
+            if os.path.commonpath([tracker_root, os.path.abspath(dest_file_path)]) != tracker_root:
+                console.print(f"[bold red]Refusing to create link outside tracker directory: {dest_file_path}")
+                return False
+        except ValueError:
+            console.print(f"[bold red]Refusing to create link outside tracker directory: {dest_file_path}")
+            return False
+
+        source_file, match_reason = picker.pick(os.path.basename(relative_path), torrent_file.get("length"))
+        if not source_file:
+            console.print(f"[bold red]Failed to map cross-seed file: {relative_path}")
+            return False
+        if match_reason == "fallback" and debug:
+            console.print(f"[yellow]Cross-seed mapping fallback used for: {relative_path}")
+        plan.append((source_file, dest_file_path))
+
+    # Links that already exist are kept
+    result = await asyncio.to_thread(link_tree, plan, not use_hardlink)
+    if not result.ok:
+        console.print(f"[bold red]Linking failed for cross-seed file: {result.error}")
+        return False
+
+    if debug:
+        console.print(f"[green]Prepared cross-seed link tree at {os.path.join(tracker_dir, torrent_name) if multi_file else tracker_dir}")
+        console.print(f"[cyan]{result.report()}")
+    return True
+
+
+def _collect_candidates(meta: dict[str, Any], tracker_dir: str) -> list[_CandidateEntry]:
+    """Files of the release that cross-seed torrent files can be mapped to; runs in a worker thread."""
     release_root_value = meta.get("path")
     release_root = str(release_root_value) if isinstance(release_root_value, str) else None
     candidate_paths: list[str] = []
@@ -1945,90 +1996,60 @@ async def create_cross_seed_links(meta: dict[str, Any], torrent: Torrent, tracke
         except OSError:
             size = None
         unique_candidates.append({"path": abs_candidate, "name": os.path.basename(abs_candidate).lower(), "size": size, "used": False})
+    return unique_candidates
 
-    if not unique_candidates:
-        console.print("[bold red]Unable to find source files for cross-seed linking")
-        return False
-
-    def pick_candidate(filename: Optional[str], length: Optional[int]) -> tuple[Optional[str], Optional[str]]:
-        lower_name = (filename or "").lower()
-
-        if lower_name:
-            for entry in unique_candidates:
-                if entry["used"]:
-                    continue
-                if entry["name"] == lower_name and length is not None and entry["size"] == length:
-                    entry["used"] = True
-                    return entry["path"], "name_size"
-
-        if lower_name:
-            for entry in unique_candidates:
-                if entry["used"]:
-                    continue
-                if entry["name"] == lower_name:
-                    entry["used"] = True
-                    return entry["path"], "name_only"
-
-        if length is not None:
-            for entry in unique_candidates:
-                if entry["used"]:
-                    continue
-                if entry["size"] == length:
-                    entry["used"] = True
-                    return entry["path"], "size_only"
 
-        for entry in unique_candidates:
-            if entry["used"]:
-                continue
-            entry["used"] = True
-            return entry["path"], "fallback"
+class _CandidatePicker:
+    """Maps torrent files to release files by name and size, then name, then size, then whatever is left.
 
-        return None, None
+    Candidates are indexed by name and by size, so a disc with thousands of files is not
+    scanned once per file. Within each rule the first unused candidate wins.
+    """
 
-    skip_nfo = meta.get("skip_nfo", False)
-    for torrent_file in torrent_files:
-        relative_path = torrent_file["relative_path"]
+    def __init__(self, candidates: list[_CandidateEntry]) -> None:
+        self.candidates = candidates
+        self.by_name: dict[str, list[_CandidateEntry]] = {}
+        self.by_size: dict[Optional[int], list[_CandidateEntry]] = {}
+        for entry in candidates:
+            self.by_name.setdefault(entry["name"], []).append(entry)
+            self.by_size.setdefault(entry["size"], []).append(entry)
+        self._next_unused = 0
 
-        # Skip .nfo files if skip_nfo is enabled
-        if skip_nfo and relative_path.lower().endswith(".nfo"):
-            if debug:
-                console.print(f"[yellow]Skipping .nfo file in cross-seed due to skip_nfo: {relative_path}")
-            continue
+    @staticmethod
+    def _take(entries: list[_CandidateEntry], length: Optional[int] = None, match_size: bool = False) -> Optional[str]:
+        for entry in entries:
+            if not entry["used"] and (not match_size or entry["size"] == length):
+                entry["used"] = True
+                return entry["path"]
+        return None
+
+    def pick(self, filename: Optional[str], length: Optional[int]) -> tuple[Optional[str], Optional[str]]:
+        lower_name = (filename or "").lower()
+        named = self.by_name.get(lower_name, []) if lower_name else []
 
-        dest_file_path = os.path.join(tracker_dir, torrent_name, relative_path) if multi_file else os.path.join(tracker_dir, torrent_name)
-        dest_file_path = os.path.normpath(dest_file_path)
-        tracker_root = os.path.abspath(tracker_dir)
-        try:
-            if os.path.commonpath([tracker_root, os.path.abspath(dest_file_path)]) != tracker_root:
-                console.print(f"[bold red]Refusing to create link outside tracker directory: {dest_file_path}")
-                return False
-        except ValueError:
-            console.print(f"[bold red]Refusing to create link outside tracker directory: {dest_file_path}")
-            return False
+        if named and length is not None:
+            path = self._take(named, length, match_size=True)
+            if path:
+                return path, "name_size"
 
-        source_file, match_reason = pick_candidate(os.path.basename(relative_path), torrent_file.get("length"))
-        if not source_file:
-            console.print(f"[bold red]Failed to map cross-seed file: {relative_path}")
-            return False
-        if match_reason == "fallback" and debug:
-            console.print(f"[yellow]Cross-seed mapping fallback used for: {relative_path}")
+        if named:
+            path = self._take(named)
+            if path:
+                return path, "name_only"
 
-        dest_parent = os.path.dirname(dest_file_path)
-        if dest_parent:
-            await asyncio.to_thread(os.makedirs, dest_parent, exist_ok=True)
-        if await asyncio.to_thread(os.path.exists, dest_file_path):
-            if debug:
-                console.print(f"[yellow]Cross-seed link already exists, keeping: {dest_file_path}")
-            continue
+        if length is not None:
+            path = self._take(self.by_size.get(length, []))
+            if path:
+                return path, "size_only"
 
-        linked = await async_link_directory(source_file, dest_file_path, use_hardlink=use_hardlink, debug=debug, skip_nfo=skip_nfo)
-        if not linked:
-            console.print(f"[bold red]Linking failed for cross-seed file: {relative_path}")
-            return False
+        while self._next_unused < len(self.candidates):
+            entry = self.candidates[self._next_unused]
+            self._next_unused += 1
+            if not entry["used"]:
+                entry["used"] = True
+                return entry["path"], "fallback"
 
-    if debug:
-        console.print(f"[green]Prepared cross-seed link tree at {os.path.join(tracker_dir, torrent_name) if multi_file else tracker_dir}")
-    return True
+        return None, None
 
 
 async def async_link_directory(src: str, dst: str, use_hardlink: bool = True, debug: bool = False, skip_nfo: bool = False) -> bool:
@@ -2042,92 +2063,34 @@ async def async_link_directory(src: str, dst: str, use_hardlink: bool = True, de
                 console.print(f"[yellow]Skipping linking, path already exists: {dst}")
             return True
 
-        # Handle file linking
-        if await asyncio.to_thread(os.path.isfile, src):
-            if use_hardlink:
-                try:
-                    await asyncio.to_thread(os.link, src, dst)
-                    if debug:
-                        console.print(f"[green]Hard link created: {dst} -> {src}")
-                    return True
-                except OSError as e:
-                    console.print(f"[yellow]Hard link failed: {e}")
-                    return False
-            else:  # Use symlink
-                try:
-                    if platform.system() == "Windows":
-                        await asyncio.to_thread(os.symlink, src, dst, target_is_directory=False)
-                    else:
-                        await asyncio.to_thread(os.symlink, src, dst)
-
-                    if debug:
-                        console.print(f"[green]Symbolic link created: {dst} -> {src}")
-                    return True
-                except OSError as e:
-                    console.print(f"[yellow]Symlink failed: {e}")
-                    return False
-
-        # Handle directory linking
-        else:
-            if use_hardlink:
-                # For hardlinks, we need to recreate the directory structure
+        is_file = await asyncio.to_thread(os.path.isfile, src)
+        if use_hardlink:
+            # A single file, or the directory structure recreated with a link per file
+            plan = [(src, dst)] if is_file else await asyncio.to_thread(plan_directory, src, dst, skip_nfo)
+            if not is_file:
                 await asyncio.to_thread(os.makedirs, dst, exist_ok=True)
+            result = await asyncio.to_thread(link_tree, plan)
+            if not result.ok:
+                console.print(f"[yellow]Hard link failed for file {result.error}")
+                return False
+            if debug:
+                console.print(f"[green]Hard link tree created: {dst} -> {src}")
+                console.print(f"[cyan]{result.report()}")
+            return True
 
-                # Get all files in the source directory
-                def _collect_files(src: str, dst: str, skip_nfo: bool) -> list[tuple[str, str, str]]:
-                    items: list[tuple[str, str, str]] = []
-                    for root, _dirs, files in os.walk(src):
-                        for file in files:
-                            # Skip .nfo files if skip_nfo is enabled
-                            if skip_nfo and file.lower().endswith(".nfo"):
-                                continue
-                            src_path = os.path.join(root, file)
-                            rel_path = os.path.relpath(src_path, src)
-                            items.append((src_path, os.path.join(dst, rel_path), rel_path))
-                    return items
-
-                all_items = await asyncio.to_thread(_collect_files, src, dst, skip_nfo)
-
-                # Create subdirectories first (to avoid race conditions)
-                subdirs: set[str] = set()
-                for _, dst_path, _ in all_items:
-                    subdir = os.path.dirname(dst_path)
-                    if subdir and subdir not in subdirs:
-                        subdirs.add(subdir)
-                        await asyncio.to_thread(os.makedirs, subdir, exist_ok=True)
-
-                def _try_hardlink(src_path: str, dst_path: str, rel_path: str) -> bool:
-                    try:
-                        os.link(src_path, dst_path)
-                        if debug and rel_path == os.path.relpath(all_items[0][0], src):
-                            console.print(f"[green]Hard link created for file: {dst_path} -> {src_path}")
-                        return True
-                    except OSError as e:
-                        console.print(f"[yellow]Hard link failed for file {rel_path}: {e}")
-                        return False
-
-                # Create hardlinks for all files
-                success = True
-                for src_path, dst_path, rel_path in all_items:
-                    if not await asyncio.to_thread(_try_hardlink, src_path, dst_path, rel_path):
-                        success = False
-                        break
-
-                return success
+        # Symlink the file, or the directory itself
+        try:
+            if platform.system() == "Windows":
+                await asyncio.to_thread(os.symlink, src, dst, target_is_directory=not is_file)
             else:
-                # For symlinks, just link the directory itself
-                try:
-                    if platform.system() == "Windows":
-                        await asyncio.to_thread(os.symlink, src, dst, target_is_directory=True)
-                    else:
-                        await asyncio.to_thread(os.symlink, src, dst)
-
-                    if debug:
-                        console.print(f"[green]Symbolic link created: {dst} -> {src}")
-                    return True
-                except OSError as e:
-                    console.print(f"[yellow]Symlink failed: {e}")
-                    return False
+                await asyncio.to_thread(os.symlink, src, dst)
+
+            if debug:
+                console.print(f"[green]Symbolic link created: {dst} -> {src}")
+            return True
+        except OSError as e:
+            console.print(f"[yellow]Symlink failed: {e}")
+            return False
 
     except Exception as e:
         console.print(f"[bold red]Error during linking: {e}")
@@ -0,0 +1,197 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Optional, cast
+
+import bencodepy
+from torf import Torrent
+
+# Parsed torrents and rendered torrent files kept in memory; each holds a full pieces blob
+_MAX_TEMPLATES = 8
+_MAX_RENDERED = 32
+
+
+def bencode(value: Any) -> bytes:
+    """Bencode ``value``; str is encoded as UTF-8 and dict keys are sorted."""
+    parts: list[bytes] = []
+    _encode(value, parts)
+    return b"".join(parts)
+
+
+def _encode(value: Any, parts: list[bytes]) -> None:
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, int):
+        parts.append(b"i%de" % value)
+    elif isinstance(value, (bytes, bytearray)):
+        parts.append(b"%d:" % len(value))
+        parts.append(bytes(value))
+    elif isinstance(value, str):
+        _encode(value.encode("utf-8"), parts)
+    elif isinstance(value, (list, tuple)):
+        parts.append(b"l")
+        for item in cast(list[Any], value):
+            _encode(item, parts)
+        parts.append(b"e")
+    elif isinstance(value, Mapping):
+        parts.append(b"d")
+        for key, item in sorted((_key(key), item) for key, item in cast(Mapping[Any, Any], value).items()):
+            _encode(key, parts)
+            _encode(item, parts)
+        parts.append(b"e")
+    else:
+        raise TypeError(f"Cannot bencode {type(value).__name__}")
+
+
+def _key(key: Any) -> bytes:
+    return key.encode("utf-8") if isinstance(key, str) else bytes(key)
+
+
+def _signature(path: str) -> Optional[tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _merge(encoded: Mapping[bytes, bytes], overrides: Mapping[str, Any]) -> tuple[list[tuple[bytes, bytes]], Optional[bytes]]:
+    """Sorted (key, bencoded value) pairs of ``encoded`` with ``overrides`` applied, and the first key that changed."""
+    values = dict(encoded)
+    first_changed: Optional[bytes] = None
+    for name, value in overrides.items():
+        key = _key(name)
+        if value is None:
+            if values.pop(key, None) is None:
+                continue
+        else:
+            values[key] = bencode(value)
+        if first_changed is None or key < first_changed:
+            first_changed = key
+    return sorted(values.items()), first_changed
+
+
+class TorrentTemplate:
+    """A torrent file parsed once, for rendering copies of it with a few keys changed.
+
+    Every value is kept bencoded, so ``pieces`` is a single bytes object that each rendering
+    splices in as it is and only the changed keys are encoded again. The SHA-1 of the info
+    dict up to the first changed key is shared by all renderings, so a new ``source`` (which
+    sorts after ``pieces``) only hashes the few bytes that follow it.
+    """
+
+    _instances: "OrderedDict[str, tuple[Optional[tuple[int, int]], TorrentTemplate]]" = OrderedDict()
+
+    def __init__(self, data: bytes) -> None:
+        bencode_module = cast(Any, bencodepy)
+        metainfo = bencode_module.decode(data)
+        if not isinstance(metainfo, dict) or not isinstance(cast(dict[bytes, Any], metainfo).get(b"info"), dict):
+            raise ValueError("Not a torrent file")
+        metainfo = cast(dict[bytes, Any], metainfo)
+        self.metainfo = {key: bencode(value) for key, value in metainfo.items() if key != b"info"}
+        self.info = {key: bencode(value) for key, value in cast(dict[bytes, Any], metainfo[b"info"]).items()}
+        self._info_keys = sorted(self.info)
+        self._prefix_hashes: dict[int, Any] = {}
+
+    @classmethod
+    def for_path(cls, path: str) -> "TorrentTemplate":
+        """The template of the torrent file at ``path``, read and validated again only when the file changed."""
+        key = os.path.abspath(path)
+        signature = _signature(key)
+        cached = cls._instances.get(key)
+        if cached is not None and signature is not None and cached[0] == signature:
+            cls._instances.move_to_end(key)
+            return cached[1]
+        with open(key, "rb") as f:
+            data = f.read()
+        # Raises the same torf errors as Torrent.read did for every tracker
+        Torrent.read_stream(data)
+        template = cls(data)
+        cls._instances[key] = (signature, template)
+        while len(cls._instances) > _MAX_TEMPLATES:
+            cls._instances.popitem(last=False)
+        return template
+
+    def value(self, key: str) -> Any:
+        """Decoded top-level value of ``key`` (strings stay bytes), or None."""
+        encoded = self.metainfo.get(_key(key))
+        return None if encoded is None else cast(Any, bencodepy).decode(encoded)
+
+    def _hasher(self, unchanged: int) -> Any:
+        prefix = self._prefix_hashes.get(unchanged)
+        if prefix is None:
+            prefix = hashlib.sha1(b"d", usedforsecurity=False)  # SHA1 required for torrent info hash
+            for key in self._info_keys[:unchanged]:
+                prefix.update(bencode(key))
+                prefix.update(self.info[key])
+            self._prefix_hashes[unchanged] = prefix
+        return prefix.copy()
+
+    def _info_parts(self, info: Mapping[str, Any]) -> tuple[list[bytes], str]:
+        items, first_changed = _merge(self.info, info)
+        unchanged = len(items) if first_changed is None else sum(1 for key in self._info_keys if key < first_changed)
+        parts: list[bytes] = [b"d"]
+        for key, value in items:
+            parts.append(bencode(key))
+            parts.append(value)
+        parts.append(b"e")
+        hasher = self._hasher(unchanged)
+        for part in parts[1 + 2 * unchanged :]:
+            hasher.update(part)
+        return parts, hasher.hexdigest()
+
+    def info_hash(self, info: Optional[Mapping[str, Any]] = None) -> str:
+        """Info hash of the torrent with ``info`` merged into its info dict."""
+        return self._info_parts(info or {})[1]
+
+    def render(self, metainfo: Optional[Mapping[str, Any]] = None, info: Optional[Mapping[str, Any]] = None, keep: Optional[tuple[str, ...]] = None) -> tuple[bytes, str]:
+        """Bencoded torrent with ``metainfo`` and ``info`` merged in, and its info hash.
+
+        A value of None removes the key. With ``keep``, only those top-level keys are taken
+        from the template (``info`` always is).
+        """
+        encoded = self.metainfo if keep is None else {key: value for key, value in self.metainfo.items() if key.decode("utf-8", "replace") in keep}
+        items, _ = _merge(encoded, metainfo or {})
+        info_parts, info_hash = self._info_parts(info or {})
+        parts: list[bytes] = [b"d"]
+        spliced = False
+        for key, value in items:
+            if not spliced and key > b"info":
+                parts.append(b"4:info")
+                parts.extend(info_parts)
+                spliced = True
+            parts.append(bencode(key))
+            parts.append(value)
+        if not spliced:
+            parts.append(b"4:info")
+            parts.extend(info_parts)
+        parts.append(b"e")
+        return b"".join(parts), info_hash
+
+
+_rendered: "OrderedDict[str, tuple[Optional[tuple[int, int]], bytes]]" = OrderedDict()
+
+
+def write_torrent(path: str, data: bytes) -> None:
+    """Write a rendered torrent to ``path`` and keep it in memory for the upload that follows."""
+    key = os.path.abspath(path)
+    tmp_path = f"{key}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, key)
+    _rendered[key] = (_signature(key), data)
+    _rendered.move_to_end(key)
+    while len(_rendered) > _MAX_RENDERED:
+        _rendered.popitem(last=False)
+
+
+def read_torrent(path: str) -> bytes:
+    """Content of the torrent file at ``path``, from memory when it is still the one written last."""
+    key = os.path.abspath(path)
+    cached = _rendered.get(key)
+    if cached is not None and cached[0] is not None and cached[0] == _signature(key):
+        return cached[1]
+    with open(key, "rb") as f:
+        return f.read()
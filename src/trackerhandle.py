@@ -10,12 +10,15 @@ import cli_ui
 from typing_extensions import TypeAlias
 
 from cogs.redaction import Redaction
+from src.checkpoints import UploadCheckpoints
 from src.cleanup import cleanup_manager
+from src.descfragments import DescriptionFragments
 from src.get_desc import DescriptionBuilder
 from src.manualpackage import ManualPackageManager
 from src.trackers.PTP import PTP
 from src.trackers.THR import THR
 from src.trackersetup import TRACKER_SETUP
+from src.uploadscheduler import UploadScheduler
 
 Meta: TypeAlias = dict[str, Any]
 StatusDict: TypeAlias = dict[str, Any]
@@ -110,6 +113,13 @@ async def process_trackers(
         except Exception as e:
             console.print(f"[red]Error printing {tracker} result: {e}[/red]")
 
+    checkpoints = UploadCheckpoints.for_meta(meta, config)
+
+    def record_result(tracker: str, is_success: bool, status: Mapping[str, Any]) -> None:
+        """Remember the result for the next run of this upload; debug runs only simulate uploading."""
+        if not meta.get("debug"):
+            checkpoints.record_tracker(tracker, is_success, status)
+
     async def process_single_tracker(tracker: str) -> None:
         tracker_class: Any = None
         if tracker not in {"MANUAL", "THR", "PTP"}:
@@ -153,8 +163,10 @@ async def process_trackers(
                 if is_uploaded and "status_message" in status and "data error" not in str(status["status_message"]):
                     await client.add_to_client(meta, tracker_class.tracker)
                     print_tracker_result(tracker, tracker_class, status, True)
+                    record_result(tracker, True, status)
                 else:
                     print_tracker_result(tracker, tracker_class, status, False)
+                    record_result(tracker, False, status)
                     console.print(f"[red]{tracker} upload failed or returned data error.[/red]")
 
         elif tracker in other_api_trackers:
@@ -187,8 +199,10 @@ async def process_trackers(
                 if is_uploaded and "status_message" in status and "data error" not in str(status["status_message"]):
                     await client.add_to_client(meta, tracker_class.tracker)
                     print_tracker_result(tracker, tracker_class, status, True)
+                    record_result(tracker, True, status)
                 else:
                     print_tracker_result(tracker, tracker_class, status, False)
+                    record_result(tracker, False, status)
                     console.print(f"[red]{tracker} upload failed or returned data error.[/red]")
 
         elif tracker in http_trackers:
@@ -220,8 +234,10 @@ async def process_trackers(
                 if is_uploaded and "status_message" in status and "data error" not in str(status["status_message"]):
                     await client.add_to_client(meta, tracker_class.tracker)
                     print_tracker_result(tracker, tracker_class, status, True)
+                    record_result(tracker, True, status)
                 else:
                     print_tracker_result(tracker, tracker_class, status, False)
+                    record_result(tracker, False, status)
                     console.print(f"[red]{tracker} upload failed or returned data error.[/red]")
 
         elif tracker == "MANUAL":
@@ -271,9 +287,11 @@ async def process_trackers(
                     await client.add_to_client(meta, "THR")
                     status = cast(StatusDict, meta.get("tracker_status") or {}).get("THR", {})
                     print_tracker_result(tracker, thr, status, True)
+                    record_result(tracker, True, status)
                 else:
                     status = cast(StatusDict, meta.get("tracker_status") or {}).get("THR", {})
                     print_tracker_result(tracker, thr, status, False)
+                    record_result(tracker, False, status)
                     console.print(f"[red]{tracker} upload failed or returned data error.[/red]")
 
         elif tracker == "PTP":
@@ -299,8 +317,10 @@ async def process_trackers(
                     if is_uploaded and "status_message" in status and "data error" not in str(status["status_message"]):
                         await client.add_to_client(meta, "PTP")
                         print_tracker_result(tracker, ptp, status, True)
+                        record_result(tracker, True, status)
                     else:
                         print_tracker_result(tracker, ptp, status, False)
+                        record_result(tracker, False, status)
                         console.print(f"[red]{tracker} upload failed or returned data error.[/red]")
                 except Exception:
                     console.print(traceback.format_exc())
@@ -314,25 +334,24 @@ async def process_trackers(
     elif discs and len(discs) > 1:
         one_disc = False
 
-    if (not meta.get("tv_pack") and one_disc) or multi_screens == 0:
-        # Run all tracker tasks concurrently with individual error handling
-        tasks: list[tuple[str, asyncio.Task[None]]] = []
-        for tracker in enabled_trackers:
-            task = asyncio.create_task(process_single_tracker(tracker))
-            tasks.append((tracker, task))
-
-        # Wait for all tasks to complete, but don't let one tracker's failure stop others
-        results = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
-
-        # Log any exceptions that occurred
-        for (tracker, _), result in zip(tasks, results):
-            if isinstance(result, Exception):
-                console.print(f"[red]{tracker} encountered an error: {result}[/red]")
-                if meta.get("debug"):
-                    console.print(traceback.format_exception(type(result), result, result.__traceback__))
-    else:
-        # Process each tracker sequentially
-        for tracker in enabled_trackers:
-            await process_single_tracker(tracker)
+    # Packs take and upload their per-file screenshots while the first description is built,
+    # and later trackers reuse them from meta, so their trackers are processed one at a time
+    concurrent = (not meta.get("tv_pack") and one_disc) or multi_screens == 0
+    scheduler = UploadScheduler(config, max_concurrent=None if concurrent else 1)
+    runs = await scheduler.run(enabled_trackers, process_single_tracker)
+
+    # One tracker's failure doesn't stop the others
+    for run in runs.values():
+        if run.error is not None:
+            console.print(f"[red]{run.tracker} encountered an error: {run.error}[/red]")
+            if meta.get("debug"):
+                console.print(traceback.format_exception(type(run.error), run.error, run.error.__traceback__))
+    if meta.get("debug"):
+        console.print(f"[cyan]{scheduler.summary()}[/cyan]")
+
+    fragments = DescriptionFragments.for_meta(meta)
+    if meta.get("debug"):
+        console.print(f"[cyan]{fragments.summary()}[/cyan]")
+    DescriptionFragments.discard(meta)
 
     console.print("[green]All tracker uploads processed.[/green]")
@@ -27,6 +27,15 @@ class A4K(UNIT3D):
         self.torrent_url = f"{self.base_url}/torrents/"
         self.rehost_images_manager = RehostImagesManager(config)
         self.approved_image_hosts = ["ptpimg", "onlyimage", "imgbox", "ptscreens", "imgbb", "imgur", "postimg"]
+        self.url_host_mapping = {
+            "ibb.co": "imgbb",
+            "imgbox.com": "imgbox",
+            "imgur.com": "imgur",
+            "postimg.cc": "postimg",
+            "ptscreens.com": "ptscreens",
+            "onlyimage.org": "onlyimage",
+            "ptpimg.me": "ptpimg",
+        }
         self.banned_groups = ["BiTOR", "DepraveD", "Flights", "SasukeducK", "SPDVD", "TEKNO3D"]
         pass
 
@@ -132,19 +141,10 @@ class A4K(UNIT3D):
         return data
 
     async def check_image_hosts(self, meta: dict[str, Any]) -> None:
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "imgbox.com": "imgbox",
-            "imgur.com": "imgur",
-            "postimg.cc": "postimg",
-            "ptscreens.com": "ptscreens",
-            "onlyimage.org": "onlyimage",
-            "ptpimg.me": "ptpimg",
-        }
         await self.rehost_images_manager.check_hosts(
             meta,
             self.tracker,
-            url_host_mapping=url_host_mapping,
+            url_host_mapping=self.url_host_mapping,
             img_host_index=1,
             approved_image_hosts=self.approved_image_hosts,
         )
@@ -9,8 +9,9 @@ from typing import Any
 import aiofiles
 import httpx
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, HIDE_TO_SPOILER, PRE_TO_CODE, comparison_to_collapse
 from src.console import console
+from src.descfragments import DescriptionFragments
 from src.rehostimages import RehostImagesManager
 from src.trackers.COMMON import COMMON
 
@@ -86,6 +87,14 @@ class ACM:
         self.search_url = f"{self.base_url}/api/torrents/filter"
         self.torrent_url = f"{self.base_url}/torrents/"
         self.approved_image_hosts = ["imgbox", "imgbb", "postimg", "pixhost", "ptpimg", "imagebam"]
+        self.url_host_mapping = {
+            "ibb.co": "imgbb",
+            "imgbox.com": "imgbox",
+            "postimg.cc": "postimg",
+            "pixhost.to": "pixhost",
+            "ptpimg.me": "ptpimg",
+            "imagebam.com": "imagebam",
+        }
         self.rehost_images_manager = RehostImagesManager(config)
         self.banned_groups: list[str] = []
 
@@ -235,18 +244,10 @@ class ACM:
         return f" [{subs[0]} subs only]"
 
     async def check_image_hosts(self, meta: dict[str, Any]) -> None:
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "imgbox.com": "imgbox",
-            "postimg.cc": "postimg",
-            "pixhost.to": "pixhost",
-            "ptpimg.me": "ptpimg",
-            "imagebam.com": "imagebam",
-        }
         await self.rehost_images_manager.check_hosts(
             meta,
             self.tracker,
-            url_host_mapping=url_host_mapping,
+            url_host_mapping=self.url_host_mapping,
             img_host_index=1,
             approved_image_hosts=self.approved_image_hosts,
         )
@@ -322,8 +323,7 @@ class ACM:
             for each in meta["discs"]:
                 bd_dump = bd_dump + each["summary"].strip() + "\n\n"
         else:
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", encoding="utf-8") as f:
-                mi_dump = await f.read()
+            mi_dump = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO.txt")
             bd_dump = None
         torrent_file_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
         async with aiofiles.open(torrent_file_path, "rb") as f:
@@ -570,9 +570,7 @@ class ACM:
                             )
 
             desc = re.sub(r"\[center\]\[spoiler=Scene NFO:\].*?\[/center\]", "", base, flags=re.DOTALL)
-            desc = bbcode.convert_pre_to_code(desc)
-            desc = bbcode.convert_hide_to_spoiler(desc)
-            desc = bbcode.convert_comparison_to_collapse(desc, 1000)
+            desc = bbcode.convert(desc, PRE_TO_CODE, HIDE_TO_SPOILER, comparison_to_collapse(1000))
             desc = desc.replace("[img]", "[img=300]")
 
             await descfile.write(desc)
@@ -12,7 +12,7 @@ import aiofiles
 import cli_ui
 import httpx
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, REMOVE_IMG_RESIZE, REMOVE_LIST, REMOVE_SUB, REMOVE_SUP, TO_ALIGN
 from src.console import console
 from src.get_desc import DescriptionBuilder
 from src.torrentcreate import TorrentCreator
@@ -255,9 +255,7 @@ class ANT:
             meta["tracker_status"][self.tracker]["status_message"] = "data error: upload aborted: unsupported audio format"
             return False
 
-        torrent_file_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
-        async with aiofiles.open(torrent_file_path, "rb") as f:
-            torrent_bytes = await f.read()
+        torrent_bytes = await self.common.read_upload_torrent(meta, self.tracker)
         files = {"file_input": ("torrent.torrent", torrent_bytes, "application/x-bittorrent")}
         data: dict[str, Any] = {
             "type": await self.get_type(meta),
@@ -494,11 +492,7 @@ class ANT:
         description = "\n\n".join(part for part in desc_parts if part.strip())
 
         bbcode = BBCODE()
-        description = bbcode.convert_to_align(description)
-        description = bbcode.remove_img_resize(description)
-        description = bbcode.remove_sup(description)
-        description = bbcode.remove_sub(description)
-        description = bbcode.remove_list(description)
+        description = bbcode.convert(description, TO_ALIGN, REMOVE_IMG_RESIZE, REMOVE_SUP, REMOVE_SUB, REMOVE_LIST)
         description = description.replace("•", "-").replace("’", "'").replace("–", "-")
         description = bbcode.remove_extra_lines(description)
         description = description.strip()
@@ -15,6 +15,7 @@ from rich.prompt import Prompt
 
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
+from src.descfragments import DescriptionFragments
 from src.exceptions import *  # noqa F403
 from src.trackers.COMMON import COMMON
 
@@ -181,16 +182,14 @@ class AR:
                 media_info = await self.parse_mediainfo_async(video, mi_template)
                 description += f"""[code]\n{media_info}\n[/code]\n"""
                 # adding full mediainfo as spoiler
-                async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", encoding="utf-8") as mi_file:
-                    full_mediainfo = await mi_file.read()
+                full_mediainfo = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO_CLEANPATH.txt")
                 description += f"[hide=FULL MEDIAINFO][code]{full_mediainfo}[/code][/hide]\n"
             else:
                 console.print("[bold red]Couldn't find the MediaInfo template")
                 console.print("[green]Using normal MediaInfo for the description.")
 
-                async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", encoding="utf-8") as mi_file:
-                    cleaned_mediainfo = await mi_file.read()
-                    description += f"""[code]\n{cleaned_mediainfo}\n[/code]\n\n"""
+                cleaned_mediainfo = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO_CLEANPATH.txt")
+                description += f"""[code]\n{cleaned_mediainfo}\n[/code]\n\n"""
 
             description += "\n\n" + subheading + "PLOT" + heading_end + "\n" + str(meta["overview"])
             if meta["genres"]:
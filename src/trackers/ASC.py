@@ -10,11 +10,11 @@ from typing import Any, Optional, Union, cast
 import aiofiles
 import cli_ui
 import httpx
-from bs4 import BeautifulSoup
 from pymediainfo import MediaInfo
 
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
+from src.htmlscrape import parse_html
 from src.languages import languages_manager
 from src.tmdb import TmdbManager
 from src.trackers.COMMON import COMMON
@@ -558,7 +558,7 @@ class ASC:
         try:
             file_page_response = await self.session.get(file_page_url, timeout=15)
             file_page_response.raise_for_status()
-            file_page_soup = BeautifulSoup(file_page_response.text, "html.parser")
+            file_page_soup = await parse_html(file_page_response.text)
             file_li_tag = file_page_soup.find("li", class_="list-group-item")
 
             if file_li_tag and file_li_tag.contents:
@@ -599,7 +599,7 @@ class ASC:
         try:
             response = await self.session.get(search_url, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = await parse_html(response.text)
             releases = soup.find_all("li", class_="list-group-item dark-gray")
         except Exception as e:
             console.print(f"[bold red]Falha ao acessar a página de busca do ASC: {e}[/bold red]")
@@ -835,7 +835,7 @@ class ASC:
                 response.raise_for_status()
                 response_results_text = response.text
 
-                soup = BeautifulSoup(response_results_text, "html.parser")
+                soup = await parse_html(response_results_text)
 
                 request_rows = soup.select(".table-responsive table tr")
 
@@ -13,13 +13,13 @@ from urllib.parse import urlparse
 import aiofiles
 import cli_ui
 import httpx
-from bs4 import BeautifulSoup
 
 import bbcode
 from cogs.redaction import Redaction
 from src.console import console
 from src.cookie_auth import CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.htmlscrape import only, parse_html
 from src.languages import languages_manager
 from src.trackers.COMMON import COMMON
 
@@ -264,7 +264,7 @@ class AZTrackerBase:
                 response = await self.session.get(page_url)
                 response.raise_for_status()
 
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = await parse_html(response.text)
 
                 torrent_table = soup.find("table", class_="table-bordered")
                 if not torrent_table:
@@ -329,7 +329,7 @@ class AZTrackerBase:
         try:
             response = await self.session.get(torrent_link, follow_redirects=True)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = await parse_html(response.text, parse_only=only("div", element_id="collapseMediaInfo"))
             mediainfo_container = soup.find("div", id="collapseMediaInfo")
 
             if mediainfo_container:
@@ -557,7 +557,7 @@ class AZTrackerBase:
                 response.raise_for_status()
                 response_results_text = response.text
 
-                soup = BeautifulSoup(response_results_text, "html.parser")
+                soup = await parse_html(response_results_text)
 
                 request_rows = soup.select(".table-responsive table tbody tr")
 
@@ -11,6 +11,7 @@ import cli_ui
 import httpx
 
 from src.console import console
+from src.descfragments import DescriptionFragments
 from src.rehostimages import RehostImagesManager
 from src.trackers.COMMON import COMMON
 
@@ -59,10 +60,7 @@ class BHD:
             "iFT",
         ]
         self.approved_image_hosts = ["ptpimg", "imgbox", "imgbb", "pixhost", "bhd", "bam"]
-        pass
-
-    async def check_image_hosts(self, meta: dict[str, Any]) -> None:
-        url_host_mapping = {
+        self.url_host_mapping = {
             "ibb.co": "imgbb",
             "ptpimg.me": "ptpimg",
             "pixhost.to": "pixhost",
@@ -70,11 +68,13 @@ class BHD:
             "beyondhd.co": "bhd",
             "imagebam.com": "bam",
         }
+        pass
 
+    async def check_image_hosts(self, meta: dict[str, Any]) -> None:
         await self.rehost_images_manager.check_hosts(
             meta,
             self.tracker,
-            url_host_mapping=url_host_mapping,
+            url_host_mapping=self.url_host_mapping,
             img_host_index=1,
             approved_image_hosts=self.approved_image_hosts,
         )
@@ -95,17 +95,13 @@ class BHD:
 
         mi_dump = None
         if meta["is_disc"] == "BDMV":
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", encoding="utf-8") as f:
-                mi_dump = await f.read()
+            mi_dump = await DescriptionFragments.for_meta(meta).read_tmp_file("BD_SUMMARY_00.txt")
         else:
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", encoding="utf-8") as f:
-                mi_dump = await f.read()
+            mi_dump = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO.txt")
 
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", encoding="utf-8") as f:
             desc = await f.read()
-        torrent_file_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
-        async with aiofiles.open(torrent_file_path, "rb") as f:
-            torrent_bytes = await f.read()
+        torrent_bytes = await common.read_upload_torrent(meta, self.tracker)
 
         files = {
             "mediainfo": mi_dump,
@@ -9,6 +9,7 @@ from pymediainfo import MediaInfo
 
 from cogs.redaction import Redaction
 from src.console import console
+from src.descfragments import DescriptionFragments
 from src.trackers.COMMON import COMMON
 
 
@@ -52,11 +53,9 @@ class BHDTV:
 
         if meta["bdinfo"] is not None:
             mi_dump = None
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", encoding="utf-8") as bd_file:
-                bd_dump = await bd_file.read()
+            bd_dump = await DescriptionFragments.for_meta(meta).read_tmp_file("BD_SUMMARY_00.txt")
         else:
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", encoding="utf-8") as mi_file:
-                mi_dump = await mi_file.read()
+            mi_dump = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO_CLEANPATH.txt")
             bd_dump = None
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", encoding="utf-8") as desc_file:
             desc = await desc_file.read()
@@ -86,8 +85,7 @@ class BHDTV:
         }
 
         torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
-        async with aiofiles.open(torrent_path, "rb") as open_torrent:
-            torrent_bytes = await open_torrent.read()
+        torrent_bytes = await common.read_upload_torrent(meta, self.tracker)
         files = {"file": (os.path.basename(torrent_path), torrent_bytes, "application/x-bittorrent")}
 
         if meta["debug"] is False:
@@ -18,14 +18,26 @@ import pycountry
 from bs4 import BeautifulSoup, Tag
 from langcodes.tag_parser import LanguageTagError
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, NAMED_SPOILER_TO_NAMED_HIDE, REMOVE_IMG_RESIZE, REMOVE_LIST, SPOILER_TO_HIDE, TO_ALIGN
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.htmlscrape import Field, FieldSpec, has_class, parse_html, scrape_rows
 from src.languages import languages_manager
 from src.tmdb import TmdbManager
 from src.trackers.COMMON import COMMON
 
+# Request list: one row per request, the title link and quality in the second cell, rewards in the fourth
+_REQUEST_ROWS = f"//*[@id='torrent_table']//tr[{has_class('torrent')}]"
+_REQUEST_LINK = "(.//td)[2]//a[contains(@href, 'requests.php?action=view')]"
+_REQUEST_FIELDS: dict[str, FieldSpec] = {
+    "cells": "count(.//td)",
+    "name": _REQUEST_LINK,
+    "link": f"{_REQUEST_LINK}/@href",
+    "quality": "(.//td)[2]//b",
+    "reward": Field("(.//td)[4]//tr/*[1][self::td]", many=True),
+}
+
 
 class BJS:
     secret_token: str = ""
@@ -387,11 +399,7 @@ class BJS:
         description = "\n\n".join(part for part in desc_parts if part.strip())
 
         bbcode = BBCODE()
-        description = bbcode.convert_named_spoiler_to_named_hide(description)
-        description = bbcode.convert_spoiler_to_hide(description)
-        description = bbcode.remove_img_resize(description)
-        description = bbcode.convert_to_align(description)
-        description = bbcode.remove_list(description)
+        description = bbcode.convert(description, NAMED_SPOILER_TO_NAMED_HIDE, SPOILER_TO_HIDE, REMOVE_IMG_RESIZE, TO_ALIGN, REMOVE_LIST)
         description = bbcode.remove_extra_lines(description)
 
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", "w", encoding="utf-8") as description_file:
@@ -568,7 +576,7 @@ class BJS:
                 async with self.semaphore:
                     ajax_response = await self.session.get(ajax_url)
                     ajax_response.raise_for_status()
-                    ajax_soup = BeautifulSoup(ajax_response.text, "html.parser")
+                    ajax_soup = await parse_html(ajax_response.text)
                 return ajax_soup, None
             except Exception as e:
                 return None, e
@@ -668,7 +676,7 @@ class BJS:
             redirect_url = f"{self.base_url}/{response.headers['Location']}"
             response = await self.session.get(redirect_url)
 
-        return BeautifulSoup(response.text, "html.parser")
+        return await parse_html(response.text)
 
     def get_database_title(self, soup: BeautifulSoup) -> str:
         """
@@ -1129,41 +1137,20 @@ class BJS:
                 response.raise_for_status()
                 response_results_text = response.text
 
-                soup = BeautifulSoup(response_results_text, "html.parser")
-
-                request_rows = soup.select("#torrent_table tr.torrent")
+                request_rows = await scrape_rows(response_results_text, _REQUEST_ROWS, _REQUEST_FIELDS)
 
                 for row in request_rows:
-                    all_tds = row.find_all("td")
-                    if not all_tds or len(all_tds) < 5:
-                        continue
-
-                    info_cell = all_tds[1]
-
-                    link_element = info_cell.select_one('a[href*="requests.php?action=view"]')
-                    quality_element = info_cell.select_one("b")
-
-                    if not isinstance(link_element, Tag) or not isinstance(quality_element, Tag):
+                    if int(row["cells"]) < 5 or row["name"] is None or row["quality"] is None:
                         continue
 
-                    name: str = str(link_element.text).strip()
-                    quality: str = str(quality_element.text).strip()
-                    url = link_element.get("href")
-                    if isinstance(url, str):
-                        link: str = url
-                    else:
-                        link = ""
-
-                    reward_td = all_tds[3]
-                    reward_parts = [td.text.replace("\xa0", " ").strip() for td in reward_td.select("tr > td:first-child")]
-                    reward = " / ".join(reward_parts)
+                    reward = " / ".join(part.replace("\xa0", " ").strip() for part in row["reward"])
 
                     results.append(
                         {
-                            "Name": name,
-                            "Quality": quality,
+                            "Name": row["name"],
+                            "Quality": row["quality"],
                             "Reward": reward,
-                            "Link": link,
+                            "Link": row["link"] or "",
                         }
                     )
 
@@ -11,13 +11,13 @@ import aiofiles
 import cli_ui
 import httpx
 import langcodes
-from bs4 import BeautifulSoup
 from langcodes.tag_parser import LanguageTagError
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, REMOVE_IMG_RESIZE, REMOVE_LIST
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.htmlscrape import only, parse_html
 from src.languages import languages_manager
 from src.tmdb import TmdbManager
 from src.trackers.COMMON import COMMON
@@ -412,8 +412,7 @@ class BT:
         description = "\n\n".join(part for part in desc_parts if part.strip())
 
         bbcode = BBCODE()
-        description = bbcode.remove_img_resize(description)
-        description = bbcode.remove_list(description)
+        description = bbcode.convert(description, REMOVE_IMG_RESIZE, REMOVE_LIST)
         description = bbcode.remove_extra_lines(description)
 
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", "w", encoding="utf-8") as description_file:
@@ -487,7 +486,7 @@ class BT:
 
             response = await self.session.get(search_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = await parse_html(response.text, parse_only=only("table", element_id="torrent_table"))
 
             torrent_table = soup.find("table", id="torrent_table")
             if not torrent_table:
@@ -507,7 +506,7 @@ class BT:
                 group_url = f"{self.base_url}/{group_link}"
                 group_response = await self.session.get(group_url)
                 group_response.raise_for_status()
-                group_soup = BeautifulSoup(group_response.text, "html.parser")
+                group_soup = await parse_html(group_response.text)
 
                 for torrent_row in group_soup.find_all("tr", id=re.compile(r"^torrent\d+$")):
                     desc_link = torrent_row.find("a", onclick=re.compile(r"gtoggle"))
@@ -1230,9 +1230,7 @@ class C411(FrenchTrackerMixin):
         language_tag = await self._build_audio_string(meta)
 
         # ── Read torrent file ──
-        torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
-        async with aiofiles.open(torrent_path, "rb") as f:
-            torrent_bytes = await f.read()
+        torrent_bytes = await common.read_upload_torrent(meta, self.tracker)
 
         # ── NFO file (required by C411) ──
         nfo_path = await self._get_or_generate_nfo(meta)
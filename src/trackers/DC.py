@@ -27,6 +27,15 @@ class DC:
         self.torrent_url = f"{self.base_url}/torrent/"
         self.banned_groups = [""]
         self.approved_image_hosts = ["imgbox", "imgbb", "bhd", "imgur", "postimg", "sharex"]
+        self.url_host_mapping = {
+            "ibb.co": "imgbb",
+            "imgbox.com": "imgbox",
+            "beyondhd.co": "bhd",
+            "imgur.com": "imgur",
+            "postimg.cc": "postimg",
+            "digitalcore.club": "sharex",
+            "img.digitalcore.club": "sharex",
+        }
         self.api_key = self.config["TRACKERS"][self.tracker].get("api_key")
         self.session = httpx.AsyncClient(headers={"X-API-KEY": self.api_key}, timeout=30.0)
 
@@ -102,15 +111,13 @@ class DC:
 
         description = "\n\n".join(part for part in desc_parts if part.strip())
 
-        from src.bbcode import BBCODE
+        from src.bbcode import BBCODE, NAMED_SPOILER_TO_NORMAL_SPOILER, REMOVE_SUB, REMOVE_SUP, comparison_to_centered
 
         bbcode = BBCODE()
         description = description.replace("[user]", "").replace("[/user]", "")
         description = description.replace("[align=left]", "").replace("[/align]", "")
         description = description.replace("[right]", "").replace("[/right]", "")
         description = description.replace("[align=right]", "").replace("[/align]", "")
-        description = bbcode.remove_sup(description)
-        description = bbcode.remove_sub(description)
         description = description.replace("[alert]", "").replace("[/alert]", "")
         description = description.replace("[note]", "").replace("[/note]", "")
         description = description.replace("[hr]", "").replace("[/hr]", "")
@@ -120,8 +127,7 @@ class DC:
         description = description.replace("[ul]", "").replace("[/ul]", "")
         description = description.replace("[ol]", "").replace("[/ol]", "")
         description = description.replace("[*] ", "• ").replace("[*]", "• ")
-        description = bbcode.convert_named_spoiler_to_normal_spoiler(description)
-        description = bbcode.convert_comparison_to_centered(description, 1000)
+        description = bbcode.convert(description, REMOVE_SUP, REMOVE_SUB, NAMED_SPOILER_TO_NORMAL_SPOILER, comparison_to_centered(1000))
         description = description.strip()
         description = bbcode.remove_extra_lines(description)
 
@@ -241,19 +247,10 @@ class DC:
         return dc_name
 
     async def check_image_hosts(self, meta: Meta) -> None:
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "imgbox.com": "imgbox",
-            "beyondhd.co": "bhd",
-            "imgur.com": "imgur",
-            "postimg.cc": "postimg",
-            "digitalcore.club": "sharex",
-            "img.digitalcore.club": "sharex",
-        }
         await self.rehost_images_manager.check_hosts(
             meta,
             self.tracker,
-            url_host_mapping=url_host_mapping,
+            url_host_mapping=self.url_host_mapping,
             img_host_index=1,
             approved_image_hosts=self.approved_image_hosts,
         )
@@ -286,10 +283,7 @@ class DC:
             try:
                 upload_url = f"{self.api_base_url}/upload"
                 await self.common.create_torrent_for_upload(meta, self.tracker, "DigitalCore.club")
-                torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
-
-                async with aiofiles.open(torrent_path, "rb") as torrent_file:
-                    torrent_bytes = await torrent_file.read()
+                torrent_bytes = await self.common.read_upload_torrent(meta, self.tracker)
                 files = {"file": (torrent_title + ".torrent", torrent_bytes, "application/x-bittorrent")}
 
                 response = await self.session.post(upload_url, data=data, files=files, headers=dict(self.session.headers), timeout=90)
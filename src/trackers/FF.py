@@ -8,12 +8,12 @@ from typing import Any, Optional, Union, cast
 
 import aiofiles
 import httpx
-from bs4 import BeautifulSoup
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, REMOVE_SPOILER, REMOVE_SUB, REMOVE_SUP, comparison_to_centered
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.htmlscrape import parse_html
 from src.languages import languages_manager
 
 
@@ -135,7 +135,7 @@ class FF:
                     response.raise_for_status()
                     response_results_text = response.text
 
-                soup = BeautifulSoup(response_results_text, "html.parser")
+                soup = await parse_html(response_results_text)
                 request_rows = soup.select("td.mf_content table tr")
 
                 results: list[dict[str, str]] = []
@@ -252,8 +252,6 @@ class FF:
         description = description.replace("[align=left]", "").replace("[/align]", "")
         description = description.replace("[right]", "").replace("[/right]", "")
         description = description.replace("[align=right]", "").replace("[/align]", "")
-        description = bbcode.remove_sub(description)
-        description = bbcode.remove_sup(description)
         description = description.replace("[alert]", "").replace("[/alert]", "")
         description = description.replace("[note]", "").replace("[/note]", "")
         description = description.replace("[hr]", "").replace("[/hr]", "")
@@ -264,8 +262,7 @@ class FF:
         description = description.replace("[ol]", "").replace("[/ol]", "")
         description = description.replace("[hide]", "").replace("[/hide]", "")
         description = description.replace("•", "-").replace("“", '"').replace("”", '"')
-        description = bbcode.convert_comparison_to_centered(description, 1000)
-        description = bbcode.remove_spoiler(description)
+        description = bbcode.convert(description, REMOVE_SUB, REMOVE_SUP, comparison_to_centered(1000), REMOVE_SPOILER)
 
         # [url][img=000]...[/img][/url]
         description = re.sub(
@@ -15,6 +15,7 @@ from unidecode import unidecode
 from src.console import console
 from src.cookie_auth import CookieValidator
 from src.exceptions import *  # noqa F403
+from src.htmlscrape import parse_html
 from src.trackers.COMMON import COMMON
 
 
@@ -174,8 +175,7 @@ class FL:
         mi_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt" if meta["bdinfo"] is not None else f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt"
         async with aiofiles.open(mi_path, encoding="utf-8") as mi_file:
             mi_dump = await mi_file.read()
-        async with aiofiles.open(torrent_path, "rb") as torrent_file:
-            torrent_bytes = await torrent_file.read()
+        torrent_bytes = await common.read_upload_torrent(meta, self.tracker)
         torrentFileName = unidecode(str(torrentFileName))
         files = {"file": (f"{torrentFileName}.torrent", torrent_bytes, "application/x-bittorent")}
         data = {"name": fl_name, "type": cat_id, "descr": fl_desc.strip(), "nfo": mi_dump}
@@ -243,7 +243,7 @@ class FL:
             async with httpx.AsyncClient(cookies=cookies, timeout=10.0) as client:
                 response = await client.get(search_url, params=params)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
+                    soup = await parse_html(response.text)
                     find = soup.find_all("a", href=True)
                     for each in find:
                         href_attr = each.get("href")
@@ -352,14 +352,12 @@ class FL:
         async with aiofiles.open(base_path, encoding="utf-8") as base_file:
             base = await base_file.read()
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", "w", newline="", encoding="utf-8") as descfile:
-            from src.bbcode import BBCODE
+            from src.bbcode import BBCODE, CODE_TO_QUOTE, REMOVE_SPOILER, comparison_to_centered
 
             bbcode = BBCODE()
 
             desc = base
-            desc = bbcode.remove_spoiler(desc)
-            desc = bbcode.convert_code_to_quote(desc)
-            desc = bbcode.convert_comparison_to_centered(desc, 900)
+            desc = bbcode.convert(desc, REMOVE_SPOILER, CODE_TO_QUOTE, comparison_to_centered(900))
             desc = desc.replace("[img]", "[img]").replace("[/img]", "[/img]")
             desc = re.sub(r"(\[img=\d+)]", "[img]", desc, flags=re.IGNORECASE)
             if meta["is_disc"] != "BDMV":
@@ -9,12 +9,12 @@ from typing import Any, cast
 import aiofiles
 import cli_ui
 import httpx
-from bs4 import BeautifulSoup
 
 from cogs.redaction import Redaction
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, REMOVE_LIST, REMOVE_SUB, REMOVE_SUP, TO_ALIGN
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.htmlscrape import only, parse_html
 from src.languages import languages_manager
 from src.rehostimages import RehostImagesManager
 from src.tmdb import TmdbManager
@@ -324,10 +324,7 @@ class GPW:
         description = "\n\n".join(part for part in desc_parts if part.strip())
 
         bbcode = BBCODE()
-        description = bbcode.remove_sup(description)
-        description = bbcode.remove_sub(description)
-        description = bbcode.convert_to_align(description)
-        description = bbcode.remove_list(description)
+        description = bbcode.convert(description, REMOVE_SUP, REMOVE_SUB, TO_ALIGN, REMOVE_LIST)
         description = bbcode.remove_extra_lines(description)
 
         if meta["debug"]:
@@ -451,7 +448,7 @@ class GPW:
                 async with httpx.AsyncClient(cookies=cookies, timeout=30, headers={"User-Agent": "Upload Assistant/2.3"}) as client:
                     response = await client.get(search_url)
                     response.raise_for_status()
-                    soup = BeautifulSoup(response.text, "html.parser")
+                    soup = await parse_html(response.text, parse_only=only("table", element_id="torrent_table"))
 
                     torrent_table = soup.find("table", id="torrent_table")
                     if not torrent_table:
@@ -502,7 +499,7 @@ class GPW:
             console.print(f"Error on request: {e.response.status_code} - {e.response.reason_phrase}", markup=False)
             return
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = await parse_html(response.text)
 
         empty_slot_rows = soup.find_all("tr", class_="TableTorrent-rowEmptySlotNote")
 
@@ -11,7 +11,7 @@ import aiofiles
 import httpx
 from unidecode import unidecode
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, SPOILER_TO_HIDE, comparison_to_centered
 from src.console import console
 from src.exceptions import *  # noqa F403
 from src.torrentcreate import TorrentCreator
@@ -267,8 +267,7 @@ class HDB:
             await common.create_torrent_for_upload(meta, self.tracker, self.source_flag)
 
         # Proceed with the upload process
-        async with aiofiles.open(torrent_file_path, "rb") as torrent_file:
-            torrent_bytes = await torrent_file.read()
+        torrent_bytes = await common.read_upload_torrent(meta, self.tracker)
         if len(meta["filelist"]) == 1:
             torrentFileName = unidecode(os.path.basename(meta["video"]).replace(" ", "."))
         else:
@@ -544,8 +543,7 @@ class HDB:
         desc = desc.replace("[ul]", "").replace("[/ul]", "")
         desc = desc.replace("[ol]", "").replace("[/ol]", "")
         desc = desc.replace("[*]", "* ")
-        desc = bbcode.convert_spoiler_to_hide(desc)
-        desc = bbcode.convert_comparison_to_centered(desc, 1000)
+        desc = bbcode.convert(desc, SPOILER_TO_HIDE, comparison_to_centered(1000))
         desc = re.sub(r"(\[img=\d+)]", "[img]", desc, flags=re.IGNORECASE)
         desc = re.sub(r"\[/size\]|\[size=\d+\]", "", desc, flags=re.IGNORECASE)
         desc_parts.append(desc)
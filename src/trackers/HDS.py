@@ -7,12 +7,13 @@ from typing import Any, Optional, Union, cast
 
 import aiofiles
 import httpx
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, REMOVE_HIDE, REMOVE_IMG_RESIZE, REMOVE_SPOILER, REMOVE_SUB, REMOVE_SUP, comparison_to_centered
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.htmlscrape import only, parse_html
 
 Meta = dict[str, Any]
 Config = dict[str, Any]
@@ -135,8 +136,6 @@ class HDS:
         description = description.replace("[align=left]", "").replace("[/align]", "")
         description = description.replace("[right]", "").replace("[/right]", "")
         description = description.replace("[align=right]", "").replace("[/align]", "")
-        description = bbcode.remove_sub(description)
-        description = bbcode.remove_sup(description)
         description = description.replace("[alert]", "").replace("[/alert]", "")
         description = description.replace("[note]", "").replace("[/note]", "")
         description = description.replace("[hr]", "").replace("[/hr]", "")
@@ -145,10 +144,7 @@ class HDS:
         description = description.replace("[h3]", "[u][b]").replace("[/h3]", "[/b][/u]")
         description = description.replace("[ul]", "").replace("[/ul]", "")
         description = description.replace("[ol]", "").replace("[/ol]", "")
-        description = bbcode.remove_hide(description)
-        description = bbcode.remove_img_resize(description)
-        description = bbcode.convert_comparison_to_centered(description, 1000)
-        description = bbcode.remove_spoiler(description)
+        description = bbcode.convert(description, REMOVE_SUB, REMOVE_SUP, REMOVE_HIDE, REMOVE_IMG_RESIZE, comparison_to_centered(1000), REMOVE_SPOILER)
         description = bbcode.remove_extra_lines(description)
 
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", "w", encoding="utf-8") as description_file:
@@ -175,7 +171,7 @@ class HDS:
         try:
             response = await self.session.get(search_url, params=params)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = await parse_html(response.text, parse_only=only("table", css_class="lista"))
 
             all_tables = soup.find_all("table", class_="lista")
 
@@ -255,7 +251,7 @@ class HDS:
                 response.raise_for_status()
                 response_results_text = response.text
 
-                soup = BeautifulSoup(response_results_text, "html.parser")
+                soup = await parse_html(response_results_text)
                 request_rows = soup.select('form[action="index.php?page=takedelreq"] table.lista tr')
 
                 results: list[dict[str, Optional[str]]] = []
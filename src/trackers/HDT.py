@@ -8,12 +8,12 @@ from urllib.parse import urlparse
 
 import aiofiles
 import httpx
-from bs4 import BeautifulSoup
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, REMOVE_IMG_RESIZE, REMOVE_LIST, REMOVE_SPOILER, REMOVE_SUB, REMOVE_SUP, SPOILER_TO_HIDE, comparison_to_centered
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.htmlscrape import parse_html
 
 Meta = dict[str, Any]
 Config = dict[str, Any]
@@ -193,8 +193,6 @@ class HDT:
         description = description.replace("[user]", "").replace("[/user]", "")
         description = description.replace("[align=left]", "").replace("[/align]", "")
         description = description.replace("[align=right]", "").replace("[/align]", "")
-        description = bbcode.remove_sub(description)
-        description = bbcode.remove_sup(description)
         description = description.replace("[alert]", "").replace("[/alert]", "")
         description = description.replace("[note]", "").replace("[/note]", "")
         description = description.replace("[hr]", "").replace("[/hr]", "")
@@ -203,11 +201,7 @@ class HDT:
         description = description.replace("[h3]", "[u][b]").replace("[/h3]", "[/b][/u]")
         description = description.replace("[ul]", "").replace("[/ul]", "")
         description = description.replace("[ol]", "").replace("[/ol]", "")
-        description = bbcode.convert_spoiler_to_hide(description)
-        description = bbcode.remove_img_resize(description)
-        description = bbcode.convert_comparison_to_centered(description, 1000)
-        description = bbcode.remove_spoiler(description)
-        description = bbcode.remove_list(description)
+        description = bbcode.convert(description, REMOVE_SUB, REMOVE_SUP, SPOILER_TO_HIDE, REMOVE_IMG_RESIZE, comparison_to_centered(1000), REMOVE_SPOILER, REMOVE_LIST)
         description = bbcode.remove_extra_lines(description)
 
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", "w", encoding="utf-8") as description_file:
@@ -245,7 +239,7 @@ class HDT:
 
         try:
             response = await self.session.get(search_url, params=params)
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = await parse_html(response.text)
             rows = soup.find_all("tr")
 
             for row in rows:
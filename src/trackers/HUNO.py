@@ -3,9 +3,8 @@ import os
 import re
 from typing import Any, cast
 
-import aiofiles
-
 from src.console import console
+from src.descfragments import DescriptionFragments
 from src.get_desc import DescriptionBuilder
 from src.languages import languages_manager
 from src.rehostimages import RehostImagesManager
@@ -71,6 +70,13 @@ class HUNO(UNIT3D):
             "YTS",
         ]
         self.approved_image_hosts = ["ptpimg", "imgbox", "imgbb", "pixhost", "bam"]
+        self.url_host_mapping = {
+            "ibb.co": "imgbb",
+            "ptpimg.me": "ptpimg",
+            "pixhost.to": "pixhost",
+            "imgbox.com": "imgbox",
+            "imagebam.com": "bam",
+        }
         pass
 
     async def get_additional_checks(self, meta: dict[str, Any]) -> bool:
@@ -129,17 +135,10 @@ class HUNO(UNIT3D):
         return {"stream": str(await self.is_plex_friendly(meta))}
 
     async def check_image_hosts(self, meta: dict[str, Any]) -> None:
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "ptpimg.me": "ptpimg",
-            "pixhost.to": "pixhost",
-            "imgbox.com": "imgbox",
-            "imagebam.com": "bam",
-        }
         await self.rehost_images_manager.check_hosts(
             meta,
             self.tracker,
-            url_host_mapping=url_host_mapping,
+            url_host_mapping=self.url_host_mapping,
             img_host_index=1,
             approved_image_hosts=self.approved_image_hosts,
         )
@@ -155,8 +154,7 @@ class HUNO(UNIT3D):
         if meta["bdinfo"] is not None:
             mediainfo = await self.common.get_bdmv_mediainfo(meta, remove=["File size", "Overall bit rate"])
         else:
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", encoding="utf-8") as f:
-                mediainfo = await f.read()
+            mediainfo = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO_CLEANPATH.txt")
 
         return {"mediainfo": mediainfo}
 
@@ -7,12 +7,12 @@ from typing import Any, Union, cast
 
 import aiofiles
 import httpx
-from bs4 import BeautifulSoup
 
 from src.bbcode import BBCODE
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.htmlscrape import only, parse_html
 
 Meta = dict[str, Any]
 Config = dict[str, Any]
@@ -120,7 +120,7 @@ class IS:
         try:
             response = await self.session.get(search_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = await parse_html(response.text, parse_only=only("table", element_id="sortabletable"))
 
             torrent_table = soup.find("table", id="sortabletable")
 
@@ -2,8 +2,7 @@
 import re
 from typing import Any, Optional
 
-import aiofiles
-
+from src.descfragments import DescriptionFragments
 from src.trackers.COMMON import COMMON
 from src.trackers.UNIT3D import UNIT3D
 
@@ -85,8 +84,7 @@ class LCD(UNIT3D):
         if meta.get("bdinfo") is not None:
             mediainfo = await self.common.get_bdmv_mediainfo(meta, remove=["File size", "Overall bit rate"])
         else:
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", encoding="utf-8") as f:
-                mediainfo = await f.read()
+            mediainfo = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO_CLEANPATH.txt")
 
         return {"mediainfo": mediainfo}
 
@@ -14,6 +14,7 @@ import pyotp
 from defusedxml import ElementTree as ET
 
 from src.console import console
+from src.descfragments import DescriptionFragments
 from src.rehostimages import RehostImagesManager
 from src.torrentcreate import TorrentCreator
 from src.trackers.COMMON import COMMON
@@ -40,6 +41,11 @@ class MTV:
         self.forum_link = "https://www.morethantv.me/wiki.php?action=article&id=73"
         self.search_url = "https://www.morethantv.me/api/torznab"
         self.approved_image_hosts = ["ptpimg", "imgbox", "imgbb"]
+        self.url_host_mapping = {
+            "ibb.co": "imgbb",
+            "ptpimg.me": "ptpimg",
+            "imgbox.com": "imgbox",
+        }
         self.banned_groups = [
             "3LTON",
             "[Oj]",
@@ -104,16 +110,10 @@ class MTV:
         return await loop.run_in_executor(None, json.dumps, obj)
 
     async def check_image_hosts(self, meta: Meta) -> None:
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "ptpimg.me": "ptpimg",
-            "imgbox.com": "imgbox",
-        }
-
         await self.rehost_images_manager.check_hosts(
             meta,
             self.tracker,
-            url_host_mapping=url_host_mapping,
+            url_host_mapping=self.url_host_mapping,
             img_host_index=1,
             approved_image_hosts=self.approved_image_hosts,
         )
@@ -258,11 +258,9 @@ class MTV:
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", "w", encoding="utf-8") as desc:
             if meta["bdinfo"] is not None:
                 mi_dump = None
-                async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", encoding="utf-8") as f:
-                    bd_dump = await f.read()
+                bd_dump = await DescriptionFragments.for_meta(meta).read_tmp_file("BD_SUMMARY_00.txt")
             else:
-                async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", encoding="utf-8") as f:
-                    mi_dump = (await f.read()).strip()
+                mi_dump = (await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO.txt")).strip()
                 bd_dump = None
 
             if bd_dump:
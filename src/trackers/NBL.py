@@ -9,6 +9,7 @@ import cli_ui
 import httpx
 
 from src.console import console
+from src.descfragments import DescriptionFragments
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -117,11 +118,9 @@ class NBL:
         await common.create_torrent_for_upload(meta, self.tracker, self.source_flag)
 
         if meta["bdinfo"] is not None:
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", encoding="utf-8") as f:
-                mi_dump = await f.read()
+            mi_dump = await DescriptionFragments.for_meta(meta).read_tmp_file("BD_SUMMARY_00.txt")
         else:
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", encoding="utf-8") as f:
-                mi_dump = await f.read()
+            mi_dump = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO.txt")
         torrent_file_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
         async with aiofiles.open(torrent_file_path, "rb") as f:
             torrent_bytes = await f.read()
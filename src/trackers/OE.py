@@ -5,7 +5,7 @@ from typing import Any, Optional, cast
 
 import aiofiles
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, HIDE_TO_SPOILER, PRE_TO_CODE, comparison_to_collapse
 from src.console import console
 from src.languages import languages_manager
 from src.rehostimages import RehostImagesManager
@@ -29,6 +29,15 @@ class OE(UNIT3D):
         self.search_url = f"{self.base_url}/api/torrents/filter"
         self.torrent_url = f"{self.base_url}/torrents/"
         self.approved_image_hosts = ["ptpimg", "imgbox", "imgbb", "onlyimage", "ptscreens", "passtheimage"]
+        self.url_host_mapping = {
+            "ibb.co": "imgbb",
+            "ptpimg.me": "ptpimg",
+            "imgbox.com": "imgbox",
+            "onlyimage.org": "onlyimage",
+            "imagebam.com": "bam",
+            "ptscreens.com": "ptscreens",
+            "img.passtheima.ge": "passtheimage",
+        }
         self.banned_groups = [
             "0neshot",
             "3LT0N",
@@ -181,20 +190,10 @@ class OE(UNIT3D):
         )
 
     async def check_image_hosts(self, meta: Meta) -> None:
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "ptpimg.me": "ptpimg",
-            "imgbox.com": "imgbox",
-            "onlyimage.org": "onlyimage",
-            "imagebam.com": "bam",
-            "ptscreens.com": "ptscreens",
-            "img.passtheima.ge": "passtheimage",
-        }
-
         await self.rehost_images_manager.check_hosts(
             meta,
             self.tracker,
-            url_host_mapping=url_host_mapping,
+            url_host_mapping=self.url_host_mapping,
             img_host_index=1,
             approved_image_hosts=self.approved_image_hosts,
         )
@@ -226,9 +225,7 @@ class OE(UNIT3D):
                             await descfile.write(f"[spoiler={os.path.basename(each['largest_evo'])}][code][{each['evo_mi']}[/code][/spoiler]\n\n")
 
             desc = str(base)
-            desc = str(bbcode.convert_pre_to_code(desc))
-            desc = str(bbcode.convert_hide_to_spoiler(desc))
-            desc = str(bbcode.convert_comparison_to_collapse(desc, 1000))
+            desc = bbcode.convert(desc, PRE_TO_CODE, HIDE_TO_SPOILER, comparison_to_collapse(1000))
             try:
                 tonemapped_header = self.config["DEFAULT"].get("tonemapped_header")
                 if meta.get("tonemapped", False) and tonemapped_header:
@@ -14,6 +14,7 @@ from unidecode import unidecode
 
 from src.console import console
 from src.cookie_auth import CookieValidator
+from src.descfragments import DescriptionFragments
 from src.exceptions import *  # noqa E403
 from src.trackers.COMMON import COMMON
 
@@ -190,7 +191,7 @@ class PTER:
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/DESCRIPTION.txt", encoding="utf-8") as base_file:
             base = await base_file.read()
 
-        from src.bbcode import BBCODE
+        from src.bbcode import BBCODE, CODE_TO_QUOTE, SPOILER_TO_HIDE, comparison_to_centered
         from src.trackers.COMMON import COMMON
 
         common = COMMON(config=self.config)
@@ -214,14 +215,11 @@ class PTER:
                     parts.append(f"[hide=mediainfo][{each['vob_mi']}[/hide] [hide=mediainfo][{each['ifo_mi']}[/hide]\n")
                     parts.append("\n")
         else:
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", encoding="utf-8") as mi_file:
-                mi = await mi_file.read()
+            mi = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO_CLEANPATH.txt")
             parts.append(f"[hide=mediainfo]{mi}[/hide]")
             parts.append("\n")
         desc = base
-        desc = bbcode.convert_code_to_quote(desc)
-        desc = bbcode.convert_spoiler_to_hide(desc)
-        desc = bbcode.convert_comparison_to_centered(desc, 1000)
+        desc = bbcode.convert(desc, CODE_TO_QUOTE, SPOILER_TO_HIDE, comparison_to_centered(1000))
         desc = desc.replace("[img]", "[img]")
         desc = re.sub(r"(\[img=\d+)]", "[img]", desc, flags=re.IGNORECASE)
         parts.append(desc)
@@ -396,8 +394,7 @@ class PTER:
             pter_desc = await desc_handle.read()
         torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
 
-        async with aiofiles.open(torrent_path, "rb") as torrentFile:
-            torrent_bytes = await torrentFile.read()
+        torrent_bytes = await common.read_upload_torrent(meta, self.tracker)
         filelist = cast(list[Any], meta.get("filelist", []))
         if len(filelist) == 1:
             torrentFileName = unidecode(os.path.basename(str(meta.get("video", ""))).replace(" ", "."))
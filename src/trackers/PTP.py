@@ -20,6 +20,7 @@ from cogs.redaction import Redaction
 from src.bbcode import BBCODE
 from src.console import console
 from src.cookie_auth import CookieValidator
+from src.descfragments import DescriptionFragments
 from src.exceptions import *  # noqa F403
 from src.rehostimages import RehostImagesManager
 from src.takescreens import TakeScreensManager
@@ -88,6 +89,10 @@ class PTP:
             "WORLD",
         ]
         self.approved_image_hosts = ["ptpimg", "pixhost"]
+        self.url_host_mapping = {
+            "ptpimg.me": "ptpimg",
+            "pixhost.to": "pixhost",
+        }
 
         self.sub_lang_map = {
             ("Arabic", "ara", "ar"): 22,
@@ -751,15 +756,10 @@ class PTP:
         return desc
 
     async def check_image_hosts(self, meta: dict[str, Any]) -> None:
-        url_host_mapping = {
-            "ptpimg.me": "ptpimg",
-            "pixhost.to": "pixhost",
-        }
-
         await self.rehost_images_manager.check_hosts(
             meta,
             self.tracker,
-            url_host_mapping=url_host_mapping,
+            url_host_mapping=self.url_host_mapping,
             img_host_index=1,
             approved_image_hosts=self.approved_image_hosts,
         )
@@ -1118,8 +1118,7 @@ class PTP:
         elif len(filelist) == 1:
             if meta["type"] == "WEBDL" and meta.get("service_longname", "") != "" and meta.get("description") is None and self.web_source is True:
                 desc.write(f"[quote][align=center]This release is sourced from {meta['service_longname']}[/align][/quote]")
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", encoding="utf-8") as mi_file:
-                mi_dump = await mi_file.read()
+            mi_dump = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO.txt")
             desc.write(f"[mediainfo]{mi_dump}[/mediainfo]\n")
             base2ptp = self.convert_bbcode(base)
             if base2ptp.strip() != "":
@@ -1172,8 +1171,7 @@ class PTP:
                     if base2ptp.strip() != "":
                         desc.write(base2ptp)
                         desc.write("\n\n")
-                    async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", encoding="utf-8") as mi_file:
-                        mi_dump = await mi_file.read()
+                    mi_dump = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO.txt")
                     desc.write(f"[mediainfo]{mi_dump}[/mediainfo]\n")
                     try:
                         if meta.get("tonemapped", False) and self.config["DEFAULT"].get("tonemapped_header", None):
@@ -1548,7 +1546,6 @@ class PTP:
     async def upload(self, meta: dict[str, Any], url: str, data: dict[str, Any], _disctype: str) -> bool:
         common = COMMON(config=self.config)
         base_piece_mb = int(meta.get("base_torrent_piece_mb", 0) or 0)
-        torrent_file_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
 
         # Check if the piece size exceeds 16 MiB and regenerate the torrent if needed
         if base_piece_mb > 16 and not meta.get("nohash", False):
@@ -1569,8 +1566,7 @@ class PTP:
             await common.create_torrent_for_upload(meta, self.tracker, self.source_flag)
 
         # Proceed with the upload process
-        async with aiofiles.open(torrent_file_path, "rb") as torrentFile:
-            torrent_bytes = await torrentFile.read()
+        torrent_bytes = await common.read_upload_torrent(meta, self.tracker)
         files = {"file_input": ("placeholder.torrent", torrent_bytes, "application/x-bittorent")}
         headers = {
             # 'ApiUser' : self.api_user,
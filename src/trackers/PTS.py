@@ -6,11 +6,11 @@ from typing import Any, Optional, cast
 
 import aiofiles
 import httpx
-from bs4 import BeautifulSoup
 from pymediainfo import MediaInfo
 
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
+from src.htmlscrape import only, parse_html
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -111,7 +111,7 @@ class PTS:
         description_parts.append(f"[right][url=https://github.com/yippee0903/Upload-Assistant][size=1]{meta['ua_signature']}[/size][/url][/right]")
 
         final_description = "\n\n".join(filter(None, description_parts))
-        from src.bbcode import BBCODE
+        from src.bbcode import BBCODE, REMOVE_SPOILER, comparison_to_centered
 
         bbcode = BBCODE()
         desc = final_description
@@ -131,8 +131,7 @@ class PTS:
         desc = desc.replace("[ol]", "").replace("[/ol]", "")
         desc = desc.replace("[hide]", "").replace("[/hide]", "")
         desc = re.sub(r"\[center\]\[spoiler=.*? NFO:\]\[code\](.*?)\[/code\]\[/spoiler\]\[/center\]", r"", desc, flags=re.DOTALL)
-        desc = bbcode.convert_comparison_to_centered(desc, 1000)
-        desc = bbcode.remove_spoiler(desc)
+        desc = bbcode.convert(desc, comparison_to_centered(1000), REMOVE_SPOILER)
         desc = re.sub(r"\n{3,}", "\n\n", desc)
 
         async with aiofiles.open(final_desc_path, "w", encoding="utf-8") as f:
@@ -158,7 +157,7 @@ class PTS:
             response = await self.session.get(search_url, params=params, cookies=self.session.cookies)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = await parse_html(response.text, parse_only=only("table", css_class="torrents"))
 
             torrents_table = soup.find("table", class_="torrents")
 
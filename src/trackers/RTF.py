@@ -10,6 +10,7 @@ import aiofiles
 import httpx
 
 from src.console import console
+from src.descfragments import DescriptionFragments
 from src.get_desc import DescriptionBuilder
 from src.trackers.COMMON import COMMON
 
@@ -54,11 +55,9 @@ class RTF:
         await DescriptionBuilder(self.tracker, self.config).unit3d_edit_desc(meta, signature=self.forum_link)
         if meta["bdinfo"] is not None:
             mi_dump = None
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", encoding="utf-8") as f:
-                bd_dump = await f.read()
+            bd_dump = await DescriptionFragments.for_meta(meta).read_tmp_file("BD_SUMMARY_00.txt")
         else:
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO.txt", encoding="utf-8") as f:
-                mi_dump = await f.read()
+            mi_dump = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO.txt")
             bd_dump = None
 
         screenshots = [image["raw_url"] for image in meta["image_list"] if image["raw_url"] is not None]
@@ -82,11 +81,10 @@ class RTF:
             "isAnonymous": self.config["TRACKERS"][self.tracker]["anon"],
         }
 
-        async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent", "rb") as binary_file:
-            binary_file_data = await binary_file.read()
-            base64_encoded_data = base64.b64encode(binary_file_data)
-            base64_message = base64_encoded_data.decode("utf-8")
-            json_data["file"] = base64_message
+        binary_file_data = await common.read_upload_torrent(meta, self.tracker)
+        base64_encoded_data = base64.b64encode(binary_file_data)
+        base64_message = base64_encoded_data.decode("utf-8")
+        json_data["file"] = base64_message
 
         headers = {
             "accept": "application/json",
@@ -85,8 +85,7 @@ class SN:
         ) as desc_file:
             desc = await desc_file.read()
 
-        async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent", "rb") as f:
-            tfile = await f.read()
+        tfile = await common.read_upload_torrent(meta, self.tracker)
 
         # uploading torrent file.
         files = {"torrent": (f"{meta['name']}.torrent", tfile)}
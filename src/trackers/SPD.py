@@ -11,7 +11,7 @@ import aiofiles
 import httpx
 
 from cogs.redaction import Redaction
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, NAMED_SPOILER_TO_NORMAL_SPOILER, REMOVE_IMG_RESIZE
 from src.console import console
 from src.get_desc import DescriptionBuilder
 from src.languages import languages_manager
@@ -230,8 +230,7 @@ class SPD:
         description = "\n\n".join(part for part in desc_parts if part.strip())
 
         bbcode = BBCODE()
-        description = bbcode.remove_img_resize(description)
-        description = bbcode.convert_named_spoiler_to_normal_spoiler(description)
+        description = bbcode.convert(description, REMOVE_IMG_RESIZE, NAMED_SPOILER_TO_NORMAL_SPOILER)
         description = bbcode.remove_extra_lines(description)
 
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", "w", encoding="utf-8") as description_file:
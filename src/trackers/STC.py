@@ -28,6 +28,10 @@ class STC(UNIT3D):
         self.torrent_url = f"{self.base_url}/torrents/"
         self.banned_groups = [""]
         self.approved_image_hosts = ["imgbox", "imgbb"]
+        self.url_host_mapping = {
+            "ibb.co": "imgbb",
+            "imgbox.com": "imgbox",
+        }
         pass
 
     async def get_additional_files(self, meta: Meta) -> dict[str, tuple[str, bytes, str]]:
@@ -71,14 +75,10 @@ class STC(UNIT3D):
         return should_continue
 
     async def check_image_hosts(self, meta: Meta) -> None:
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "imgbox.com": "imgbox",
-        }
         await self.rehost_images_manager.check_hosts(
             meta,
             self.tracker,
-            url_host_mapping=url_host_mapping,
+            url_host_mapping=self.url_host_mapping,
             img_host_index=1,
             approved_image_hosts=self.approved_image_hosts,
         )
@@ -15,8 +15,9 @@ from bs4 import BeautifulSoup
 from bs4.element import AttributeValueList
 from unidecode import unidecode
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, CODE_TO_PRE, NAMED_SPOILER_TO_NAMED_HIDE, SPOILER_TO_HIDE
 from src.console import console
+from src.htmlscrape import parse_html
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -72,9 +73,7 @@ class THR:
         ) as f:
             desc = await f.read()
 
-        torrent_path = os.path.abspath(f"{meta['base_dir']}/tmp/{meta['uuid']}/[THR].torrent")
-        async with aiofiles.open(torrent_path, "rb") as f:
-            tfile = await f.read()
+        tfile = await common.read_upload_torrent(meta, self.tracker)
 
         # Upload Form
         url = "https://www.torrenthr.org/takeupload.php"
@@ -238,9 +237,7 @@ class THR:
 
         if base:
             # replace unsupported bbcode tags
-            base = bbcode.convert_named_spoiler_to_named_hide(base)
-            base = bbcode.convert_spoiler_to_hide(base)
-            base = bbcode.convert_code_to_pre(base)
+            base = bbcode.convert(base, NAMED_SPOILER_TO_NAMED_HIDE, SPOILER_TO_HIDE, CODE_TO_PRE)
             # fix alignment for NFO content inherited from centering the spoiler
             base = re.sub(
                 r"(?P<open>\[hide=(Scene|FraMeSToR) NFO:\]\[pre\])(?P<content>.*?)(?P<close>\[/pre\]\[/hide\])",
@@ -423,7 +420,7 @@ class THR:
                     console.print(f"[yellow]Response content: {response.text[:500]}")
                 return page_dupes, False, current_page
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = await parse_html(response.text)
 
             result_table = soup.find("table", {"class": "torrentlist"}) or soup.find("table", {"align": "center"})
             if not result_table:
@@ -9,7 +9,7 @@ import aiofiles
 import httpx
 
 from cogs.redaction import Redaction
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, REMOVE_LIST, REMOVE_SPOILER, comparison_to_centered
 from src.console import console
 from src.get_desc import DescriptionBuilder
 from src.trackers.COMMON import COMMON
@@ -162,9 +162,7 @@ class TL:
         description = re.sub(r"\[hr\]", "---", description, flags=re.IGNORECASE)
         description = re.sub(r'\[img=[\d"x]+\]', "[img]", description, flags=re.IGNORECASE)
         description = description.replace("[*] ", "• ").replace("[*]", "• ")
-        description = bbcode.remove_list(description)
-        description = bbcode.convert_comparison_to_centered(description, 1000)
-        description = bbcode.remove_spoiler(description)
+        description = bbcode.convert(description, REMOVE_LIST, comparison_to_centered(1000), REMOVE_SPOILER)
         description = re.sub(r"\n{3,}", "\n\n", description)
 
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", "w", encoding="utf-8") as description_file:
@@ -341,10 +339,7 @@ class TL:
             return is_uploaded
 
     async def upload_api(self, meta: Meta) -> bool:
-        torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent"
-
-        async with aiofiles.open(torrent_path, "rb") as open_torrent:
-            torrent_bytes = await open_torrent.read()
+        torrent_bytes = await self.common.read_upload_torrent(meta, self.tracker)
         files: dict[str, tuple[Any, Any, str]] = {"torrent": (self.get_name(meta) + ".torrent", torrent_bytes, "application/x-bittorrent")}
 
         data: dict[str, Any] = {
@@ -448,8 +443,7 @@ class TL:
             return True  # Debug mode - simulated success
         else:
             try:
-                async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}].torrent", "rb") as f:
-                    torrent_bytes = await f.read()
+                torrent_bytes = await self.common.read_upload_torrent(meta, self.tracker)
                 files = {
                     "torrent": ("torrent.torrent", torrent_bytes, "application/x-bittorrent"),
                     "nfo": ("description.txt", description_content, "text/plain"),
@@ -14,6 +14,7 @@ from unidecode import unidecode
 from src.console import console
 from src.cookie_auth import CookieValidator
 from src.exceptions import *  # noqa #F405
+from src.htmlscrape import parse_html
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -215,7 +216,7 @@ class TTG:
             async with httpx.AsyncClient(cookies=cookies, timeout=10.0) as client:
                 response = await client.get(search_url)
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
+                    soup = await parse_html(response.text)
                     find = soup.find_all("a", href=True)
                     for each in find:
                         href_value = each.get("href")
@@ -303,7 +304,7 @@ class TTG:
         ) as base_file:
             base = await base_file.read()
 
-        from src.bbcode import BBCODE
+        from src.bbcode import BBCODE, CODE_TO_QUOTE, SPOILER_TO_HIDE, comparison_to_centered
         from src.trackers.COMMON import COMMON
 
         common = COMMON(config=self.config)
@@ -342,9 +343,7 @@ class TTG:
             parts.append(f"[quote=MediaInfo]{mi}[/quote]")
             parts.append("\n")
         desc = base
-        desc = bbcode.convert_code_to_quote(desc)
-        desc = bbcode.convert_spoiler_to_hide(desc)
-        desc = bbcode.convert_comparison_to_centered(desc, 1000)
+        desc = bbcode.convert(desc, CODE_TO_QUOTE, SPOILER_TO_HIDE, comparison_to_centered(1000))
         desc = desc.replace("[img]", "[img]")
         desc = re.sub(r"(\[img=\d+)]", "[img]", desc, flags=re.IGNORECASE)
         parts.append(desc)
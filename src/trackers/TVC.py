@@ -14,7 +14,7 @@ import httpx
 import requests
 import tmdbsimple as tmdb
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, HIDE_TO_SPOILER, PRE_TO_CODE, Conversion, comparison_to_collapse
 from src.console import console
 from src.rehostimages import RehostImagesManager
 from src.trackers.COMMON import COMMON
@@ -41,6 +41,14 @@ class TVC:
         self.signature = ""
         self.banned_groups = []
         self.approved_image_hosts = ["imgbb", "ptpimg", "imgbox", "pixhost", "bam", "onlyimage"]
+        self.url_host_mapping = {
+            "ibb.co": "imgbb",
+            "ptpimg.me": "ptpimg",
+            "imgbox.com": "imgbox",
+            "pixhost.to": "pixhost",
+            "imagebam.com": "bam",
+            "onlyimage.org": "onlyimage",
+        }
         tmdb.API_KEY = config["DEFAULT"]["tmdb_api"]
 
         # TV type mapping as a dict for clarity and maintainability
@@ -301,13 +309,12 @@ class TVC:
     def _apply_bbcode_transforms(self, desc: str, comparison: bool) -> str:
         """Apply BBCode transformations."""
         bbcode = BBCODE()
-        desc = bbcode.convert_pre_to_code(desc)
-        desc = bbcode.convert_hide_to_spoiler(desc)
+        conversions: list[Conversion] = [PRE_TO_CODE, HIDE_TO_SPOILER]
 
         if not comparison:
-            desc = bbcode.convert_comparison_to_collapse(desc, self.COMPARISON_COLLAPSE_THRESHOLD)
+            conversions.append(comparison_to_collapse(self.COMPARISON_COLLAPSE_THRESHOLD))
 
-        return desc
+        return bbcode.convert(desc, *conversions)
 
     def _normalize_tvc_formatting(self, desc: str) -> str:
         """Normalize whitespace for TVC (multi-block style)."""
@@ -426,16 +433,9 @@ class TVC:
         return await asyncio.to_thread(_read)
 
     async def check_image_hosts(self, meta: Meta) -> None:
-        url_host_mapping = {
-            "ibb.co": "imgbb",
-            "ptpimg.me": "ptpimg",
-            "imgbox.com": "imgbox",
-            "pixhost.to": "pixhost",
-            "imagebam.com": "bam",
-            "onlyimage.org": "onlyimage",
-        }
-
-        await self.rehost_images_manager.check_hosts(meta, self.tracker, url_host_mapping=url_host_mapping, img_host_index=1, approved_image_hosts=self.approved_image_hosts)
+        await self.rehost_images_manager.check_hosts(
+            meta, self.tracker, url_host_mapping=self.url_host_mapping, img_host_index=1, approved_image_hosts=self.approved_image_hosts
+        )
         return
 
     async def upload(self, meta: Meta, _disctype: str) -> Optional[bool]:
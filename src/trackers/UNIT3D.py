@@ -13,6 +13,7 @@ import httpx
 from typing_extensions import TypeAlias
 
 from src.console import console
+from src.descfragments import DescriptionFragments
 from src.get_desc import DescriptionBuilder
 from src.trackers.COMMON import COMMON
 
@@ -148,6 +149,7 @@ class UNIT3D:
                         dupes.append(result)
                 else:
                     console.print(f"[bold red]Failed to search torrents. HTTP Status: {response.status_code}")
+                    meta["tracker_status"][self.tracker]["status_message"] = f"data error: Search failed with HTTP {response.status_code}"
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 302:
                 meta["tracker_status"][self.tracker]["status_message"] = (
@@ -157,10 +159,13 @@ class UNIT3D:
                 meta["tracker_status"][self.tracker]["status_message"] = f"data error: HTTP {e.response.status_code} - {e.response.text}"
         except httpx.TimeoutException:
             console.print("[bold red]Request timed out after 10 seconds")
+            meta["tracker_status"][self.tracker]["status_message"] = "data error: Search timed out after 10 seconds"
         except httpx.RequestError as e:
             console.print(f"[bold red]Unable to search for existing torrents: {e}")
+            meta["tracker_status"][self.tracker]["status_message"] = f"data error: Unable to search for existing torrents: {e}"
         except Exception as e:
             console.print(f"[bold red]Unexpected error: {e}")
+            meta["tracker_status"][self.tracker]["status_message"] = f"data error: Unexpected error while searching: {e}"
             await asyncio.sleep(5)
 
         return dupes
@@ -175,14 +180,12 @@ class UNIT3D:
         if meta.get("bdinfo") is not None:
             mediainfo = ""
         else:
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/MEDIAINFO_CLEANPATH.txt", encoding="utf-8") as f:
-                mediainfo = await f.read()
+            mediainfo = await DescriptionFragments.for_meta(meta).read_tmp_file("MEDIAINFO_CLEANPATH.txt")
         return {"mediainfo": mediainfo}
 
     async def get_bdinfo(self, meta: dict[str, Any]) -> dict[str, str]:
         if meta.get("bdinfo") is not None:
-            async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/BD_SUMMARY_00.txt", encoding="utf-8") as f:
-                bdinfo = await f.read()
+            bdinfo = await DescriptionFragments.for_meta(meta).read_tmp_file("BD_SUMMARY_00.txt")
         else:
             bdinfo = ""
         return {"bdinfo": bdinfo}
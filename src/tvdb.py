@@ -6,15 +6,21 @@ import contextlib
 import json
 import os
 import re
-import ssl
+import sqlite3
+import threading
 from pathlib import Path
 from typing import Any, Optional, Union, cast
-from urllib.error import URLError
 
-from tvdb_v4_official import TVDB
+import httpx
 
 from src.console import console
 
+TVDB_API_URL = "https://api4.thetvdb.com/v4/"
+
+# Episode pages requested at once once the first page reported the total
+_PAGE_CONCURRENCY = 4
+_MAX_EPISODE_PAGES = 20  # Safety limit, as before
+
 
 def _get_tvdb_k() -> str:
     k = (
@@ -30,11 +36,6 @@ def _get_tvdb_k() -> str:
     return base64.b64decode(b64_bytes).decode()
 
 
-tvdb: Union[TVDB, None] = None
-_tvdb_init_error: Optional[Exception] = None
-_tvdb_error_reported = False
-
-
 def _coerce_int(value: Any) -> Optional[int]:
     try:
         return int(value)
@@ -88,35 +89,288 @@ def _pick_specific_eng_alias(
     return None
 
 
-try:
-    tvdb = TVDB(_get_tvdb_k())
-except (ssl.SSLError, URLError) as e:
-    _tvdb_init_error = e
-except Exception as e:
-    _tvdb_init_error = e
+class TVDBClient:
+    """Async client for the TVDB v4 API.
+
+    Every lookup of the process shares one pooled ``httpx.AsyncClient`` (per event loop) and the
+    bearer token from ``/login``, which TVDB keeps valid for a month; a 401 logs in again.
+    """
+
+    def __init__(self, api_key: str, base_url: str = TVDB_API_URL, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        self._api_key = api_key
+        self._base_url = base_url
+        self._transport = transport
+        self._token: Optional[str] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._login_lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _http(self) -> tuple[httpx.AsyncClient, asyncio.Lock]:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._login_lock is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(base_url=self._base_url, timeout=30.0, transport=self._transport, limits=httpx.Limits(max_keepalive_connections=_PAGE_CONCURRENCY))
+            self._login_lock = asyncio.Lock()
+            self._loop = loop
+        return self._client, self._login_lock
+
+    async def login(self, force: bool = False) -> str:
+        client, lock = self._http()
+        async with lock:
+            if self._token is None or force:
+                response = await client.post("login", json={"apikey": self._api_key})
+                payload = _json_or_empty(response)
+                token = cast(dict[str, Any], payload.get("data") or {}).get("token")
+                if response.status_code != 200 or not isinstance(token, str):
+                    raise ValueError(f"Code:{response.status_code}, {payload.get('message', 'login failed')}")
+                self._token = token
+            return self._token
+
+    async def request(self, path: str, **params: Any) -> tuple[Any, dict[str, Any]]:
+        """``data`` and ``links`` of a GET to ``path``; raises ValueError when TVDB reports a failure."""
+        client, _ = self._http()
+        query = {key: value for key, value in params.items() if value is not None}
+        token = await self.login()
+        response = await client.get(path, params=query, headers={"Authorization": f"Bearer {token}"})
+        if response.status_code == 401:
+            token = await self.login(force=True)
+            response = await client.get(path, params=query, headers={"Authorization": f"Bearer {token}"})
+        payload = _json_or_empty(response)
+        data = payload.get("data")
+        if data is None or payload.get("status", "failure") == "failure":
+            raise ValueError(f"failed to get {response.request.url}\n  {payload.get('message') or 'UNKNOWN FAILURE'}")
+        return data, cast(dict[str, Any], payload.get("links") or {})
+
+    async def search(self, query: str, **params: Any) -> Any:
+        return (await self.request("search", query=query, **params))[0]
+
+    async def search_by_remote_id(self, remote_id: str) -> Any:
+        return (await self.request(f"search/remoteid/{remote_id}"))[0]
+
+    async def get_series_episodes(self, series_id: int, season_type: str = "default", page: int = 0, lang: Optional[str] = None) -> tuple[Any, dict[str, Any]]:
+        path = f"series/{series_id}/episodes/{season_type}" + (f"/{lang}" if lang else "")
+        return await self.request(path, page=page)
+
+    async def get_series_extended(self, series_id: int) -> Any:
+        return (await self.request(f"series/{series_id}/extended"))[0]
+
+    async def get_episode_extended(self, episode_id: int) -> Any:
+        return (await self.request(f"episodes/{episode_id}/extended"))[0]
+
+
+def _json_or_empty(response: httpx.Response) -> dict[str, Any]:
+    try:
+        payload = response.json()
+    except ValueError:
+        return {}
+    return cast(dict[str, Any], payload) if isinstance(payload, dict) else {}
+
+
+tvdb = TVDBClient(_get_tvdb_k())
+_tvdb_init_error: Optional[Exception] = None
+_tvdb_error_reported = False
 
 
-def _get_tvdb_or_warn() -> Optional[TVDB]:
-    global _tvdb_error_reported
+async def _get_tvdb_or_warn() -> Optional[TVDBClient]:
+    """The shared client, logged in; None (reported once) when TVDB can't be reached."""
+    global _tvdb_init_error, _tvdb_error_reported
 
-    if tvdb is not None:
-        return tvdb
+    if _tvdb_init_error is None:
+        try:
+            await tvdb.login()
+            return tvdb
+        except Exception as e:
+            # Don't make every later lookup of this run wait for TVDB as well
+            _tvdb_init_error = e
 
     if not _tvdb_error_reported:
         _tvdb_error_reported = True
-        if _tvdb_init_error:
-            console.print(f"[yellow]TVDB login failed; continuing without TVDB. Reason: {_tvdb_init_error}[/yellow]")
-            console.print(
-                "[yellow]This is usually a local Python CA/cert issue. "
-                "Fix options: install/update Windows roots, or set SSL_CERT_FILE to certifi's bundle "
-                '(e.g. `python -c "import certifi; print(certifi.where())"`).[/yellow]'
-            )
-        else:
-            console.print("[yellow]TVDB unavailable; continuing without TVDB.[/yellow]")
+        console.print(f"[yellow]TVDB login failed; continuing without TVDB. Reason: {_tvdb_init_error}[/yellow]")
+        console.print(
+            "[yellow]This is usually a local Python CA/cert issue. "
+            "Fix options: install/update Windows roots, or set SSL_CERT_FILE to certifi's bundle "
+            '(e.g. `python -c "import certifi; print(certifi.where())"`).[/yellow]'
+        )
 
     return None
 
 
+def _episode_request(
+    season: Optional[Union[int, str]],
+    episode: Optional[Union[int, str]],
+    absolute_number: Optional[Union[int, str]],
+    aired_date: Optional[str],
+) -> Optional[tuple[Optional[int], Optional[int], Optional[int], Optional[str]]]:
+    """Normalised (season, episode, absolute, aired) of a lookup, or None when any episode will do."""
+    if season is None and episode is None and absolute_number is None and not aired_date:
+        return None
+    aired_norm = str(aired_date).strip().replace(".", "-") if aired_date else None
+    return _coerce_int(season), _coerce_int(episode), _coerce_int(absolute_number), aired_norm
+
+
+class TVDBEpisodeCache:
+    """Episodes of multi-page TVDB series, kept in ``data/tvdb/episodes.db``.
+
+    One row per episode, indexed by series, season, number, absolute number and air date, so
+    checking whether a cached series already has the requested episode is a query and storing
+    a refreshed series only rewrites that series. Earlier ``data/tvdb/<id>.json`` files are
+    imported the first time their series is looked up.
+    """
+
+    _instances: dict[str, "TVDBEpisodeCache"] = {}
+
+    def __init__(self, base_dir: str) -> None:
+        self.cache_dir = Path(base_dir) / "data" / "tvdb"
+        self.db_path = self.cache_dir / "episodes.db"
+        self._connection: Optional[sqlite3.Connection] = None
+        # Lookups run in worker threads
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_base_dir(cls, base_dir: str) -> "TVDBEpisodeCache":
+        key = os.path.abspath(base_dir)
+        if key not in cls._instances:
+            cls._instances[key] = cls(key)
+        return cls._instances[key]
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            # On POSIX explicitly apply typical dir perms.
+            if os.name == "posix":
+                self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+                with contextlib.suppress(Exception):
+                    os.chmod(self.cache_dir, 0o700)
+            else:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS series (series_id INTEGER PRIMARY KEY, slug TEXT, aliases TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS episodes (
+                    series_id INTEGER NOT NULL, position INTEGER NOT NULL, season INTEGER, number INTEGER,
+                    absolute INTEGER, aired TEXT, data TEXT NOT NULL, PRIMARY KEY (series_id, position)
+                );
+                CREATE INDEX IF NOT EXISTS episodes_by_number ON episodes (series_id, season, number);
+                CREATE INDEX IF NOT EXISTS episodes_by_absolute ON episodes (series_id, absolute);
+                CREATE INDEX IF NOT EXISTS episodes_by_aired ON episodes (series_id, aired);
+                """
+            )
+            self._connection = connection
+        return self._connection
+
+    def _import_json(self, connection: sqlite3.Connection, series_id: int) -> None:
+        json_path = self.cache_dir / f"{series_id}.json"
+        if not json_path.exists():
+            return
+        with json_path.open("r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if isinstance(cached, dict) and isinstance(cast(dict[str, Any], cached).get("episodes", []), list):
+            self._store(connection, series_id, cast(dict[str, Any], cached))
+
+    def _store(self, connection: sqlite3.Connection, series_id: int, episodes_data: dict[str, Any]) -> None:
+        aliases = episodes_data.get("aliases", [])
+        slug = episodes_data.get("slug")
+        rows = [
+            (
+                series_id,
+                position,
+                _coerce_int(ep.get("seasonNumber")),
+                _coerce_int(ep.get("number")),
+                _coerce_int(ep.get("absoluteNumber")),
+                ep.get("aired"),
+                json.dumps(ep, ensure_ascii=False),
+            )
+            for position, ep in enumerate(_as_dict_list(episodes_data.get("episodes", [])))
+        ]
+        with connection:
+            connection.execute("DELETE FROM episodes WHERE series_id = ?", (series_id,))
+            connection.execute(
+                "INSERT OR REPLACE INTO series (series_id, slug, aliases) VALUES (?, ?, ?)",
+                (series_id, slug if isinstance(slug, str) else None, json.dumps(aliases if isinstance(aliases, list) else [], ensure_ascii=False)),
+            )
+            connection.executemany("INSERT INTO episodes (series_id, position, season, number, absolute, aired, data) VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def store(self, series_id: int, episodes_data: dict[str, Any]) -> None:
+        """Replace the cached episodes, aliases and slug of ``series_id``."""
+        with self._lock:
+            self._store(self._connect(), series_id, episodes_data)
+
+    def _has_episode(self, connection: sqlite3.Connection, series_id: int, request: Optional[tuple[Optional[int], Optional[int], Optional[int], Optional[str]]]) -> bool:
+        def exists(where: str = "", *args: Any) -> bool:
+            return connection.execute(f"SELECT 1 FROM episodes WHERE series_id = ?{where} LIMIT 1", (series_id, *args)).fetchone() is not None
+
+        if request is None:
+            return exists()
+        season, episode, absolute, aired = request
+        # For daily-style episodes, match by aired date.
+        if aired and exists(" AND aired = ?", aired):
+            return True
+        # Treat episode==0/None as "no specific episode" (season packs, etc.)
+        if episode in (None, 0) and absolute is None and not aired:
+            return exists()
+        if absolute is not None and exists(" AND absolute = ?", absolute):
+            return True
+        return season is not None and episode not in (None, 0) and exists(" AND season = ? AND number = ?", season, episode)
+
+    def load(self, series_id: int, request: Optional[tuple[Optional[int], Optional[int], Optional[int], Optional[str]]] = None) -> tuple[bool, Optional[dict[str, Any]]]:
+        """(whether the series is cached, its episodes/aliases/slug if they include the requested episode)."""
+        with self._lock:
+            connection = self._connect()
+            series = connection.execute("SELECT slug, aliases FROM series WHERE series_id = ?", (series_id,)).fetchone()
+            if series is None:
+                self._import_json(connection, series_id)
+                series = connection.execute("SELECT slug, aliases FROM series WHERE series_id = ?", (series_id,)).fetchone()
+                if series is None:
+                    return False, None
+            if not self._has_episode(connection, series_id, request):
+                return True, None
+            rows = connection.execute("SELECT data FROM episodes WHERE series_id = ? ORDER BY position", (series_id,)).fetchall()
+        return True, {"episodes": [json.loads(row[0]) for row in rows], "aliases": json.loads(series[1]), "slug": series[0]}
+
+
+def _episodes_of(response: Any) -> list[dict[str, Any]]:
+    # Handle both dict response and direct episodes list
+    if isinstance(response, dict):
+        return _as_dict_list(cast(dict[str, Any], response).get("episodes", []))
+    return _as_dict_list(response)
+
+
+def _page_count(links: dict[str, Any], first_page_size: int) -> Optional[int]:
+    """Pages of episodes according to the first page's links, or None when it doesn't say."""
+    if first_page_size == 0:
+        return 1
+    total_items = _coerce_int(links.get("total_items"))
+    page_size = _coerce_int(links.get("page_size"))
+    if total_items is None or not page_size:
+        return None
+    return max(1, min(_MAX_EPISODE_PAGES, -(-total_items // page_size)))
+
+
+async def _fetch_episode_pages(client: TVDBClient, series_id: int, pages: range, debug: bool) -> list[list[dict[str, Any]]]:
+    """Episodes of ``pages``, fetched concurrently; stops at the first page that fails or is empty."""
+    semaphore = asyncio.Semaphore(_PAGE_CONCURRENCY)
+
+    async def fetch(page: int) -> list[dict[str, Any]]:
+        async with semaphore:
+            response, _ = await client.get_series_episodes(series_id, season_type="default", page=page, lang="eng")
+            return _episodes_of(response)
+
+    results = await asyncio.gather(*(fetch(page) for page in pages), return_exceptions=True)
+    fetched: list[list[dict[str, Any]]] = []
+    for page, result in zip(pages, results):
+        if isinstance(result, BaseException):
+            if debug:
+                console.print(f"[yellow]Error fetching page {page + 1}: {result}[/yellow]")
+            break
+        if not result:
+            if debug:
+                console.print(f"[yellow]No episodes found on page {page + 1}, stopping pagination[/yellow]")
+            break
+        if debug:
+            console.print(f"[cyan]Retrieved {len(result)} episodes from page {page + 1}[/cyan]")
+        fetched.append(result)
+    return fetched
+
+
 class tvdb_data:
     def __init__(self, config: Any) -> None:
         self.config = config
@@ -130,11 +384,11 @@ class tvdb_data:
     ) -> tuple[Optional[list[dict[str, Any]]], Optional[int]]:
         if debug:
             console.print(f"filename for TVDB search: {filename} year: {year}")
-        client = _get_tvdb_or_warn()
+        client = await _get_tvdb_or_warn()
         if client is None:
             return None, None
 
-        results = _as_dict_list(cast(Any, client).search({filename}, year=year, type="series", lang="eng"))
+        results = _as_dict_list(await client.search(filename, year=year, type="series", lang="eng"))
         await asyncio.sleep(0.1)
         try:
             if results and len(results) > 0:
@@ -195,163 +449,71 @@ class tvdb_data:
             debug = base_dir
             base_dir = None
 
-        def _episode_is_present(episodes: list[dict[str, Any]]) -> bool:
-            if not episodes:
-                return False
-
-            # If no specific episode requested, any cached payload is acceptable.
-            if season is None and episode is None and absolute_number is None and not aired_date:
-                return True
-
-            aired_norm = None
-            if aired_date:
-                aired_norm = str(aired_date).strip().replace(".", "-")
-
-            # Normalize numeric inputs
-            try:
-                season_int = int(season) if season is not None else None
-            except (TypeError, ValueError):
-                season_int = None
-
-            try:
-                episode_int = int(episode) if episode is not None else None
-            except (TypeError, ValueError):
-                episode_int = None
-
-            try:
-                absolute_int = int(absolute_number) if absolute_number is not None else None
-            except (TypeError, ValueError):
-                absolute_int = None
-
-            # For daily-style episodes, match by aired date.
-            if aired_norm:
-                for ep in episodes:
-                    if ep.get("aired") == aired_norm:
-                        return True
-
-            # Treat episode==0/None as "no specific episode" (season packs, etc.)
-            if episode_int in (None, 0) and absolute_int is None and not aired_norm:
-                return True
-
-            for ep in episodes:
-                if absolute_int is not None and ep.get("absoluteNumber") == absolute_int:
-                    return True
-
-                if season_int is not None and episode_int not in (None, 0) and ep.get("seasonNumber") == season_int and ep.get("number") == episode_int:
-                    return True
-
-            return False
-
         series_id_int = _coerce_int(series_id)
         if series_id_int is None:
             if debug:
                 console.print(f"[yellow]Invalid TVDB series ID: {series_id}[/yellow]")
             return None, None
 
-        cache_path = None
-        if isinstance(base_dir, str) and base_dir:
+        cache = TVDBEpisodeCache.for_base_dir(base_dir) if isinstance(base_dir, str) and base_dir else None
+        if cache is not None:
             try:
-                cache_dir = Path(base_dir) / "data" / "tvdb"
-                cache_path = cache_dir / f"{series_id_int}.json"
-
-                if cache_path.exists():
-                    with cache_path.open("r", encoding="utf-8") as f:
-                        cached = json.load(f)
-
-                    if isinstance(cached, dict):
-                        cached_dict = cast(dict[str, Any], cached)
-                        cached_episodes = _as_dict_list(cached_dict.get("episodes", []))
-                        if not cached_episodes and not isinstance(cached_dict.get("episodes", []), list):
-                            cached_episodes = []
-                        if not _episode_is_present(cached_episodes):
-                            if debug:
-                                console.print(f"[yellow]Cached TVDB data for {series_id_int} does not include requested episode; refreshing from TVDB[/yellow]")
-                        else:
-                            if debug:
-                                console.print(f"[cyan]Using cached TVDB episodes for {series_id_int}[/cyan]")
-
-                            episodes_data: dict[str, Any] = {
-                                "episodes": cached_episodes,
-                                "aliases": cached_dict.get("aliases", []) if isinstance(cached_dict.get("aliases", []), list) else [],
-                                "slug": cached_dict.get("slug") if isinstance(cached_dict.get("slug"), str) else None,
-                            }
-
-                            aliases_list = _as_dict_list(episodes_data.get("aliases"))
-                            specific_alias = _pick_specific_eng_alias(
-                                aliases_list,
-                                slug=episodes_data.get("slug"),
-                                debug=debug,
-                            )
-                            if original_language and original_language == "en":
-                                specific_alias = None
-
-                            return episodes_data, specific_alias
+                request = _episode_request(season, episode, absolute_number, aired_date)
+                is_cached, cached_data = await asyncio.to_thread(cache.load, series_id_int, request)
+                if is_cached and cached_data is None:
+                    if debug:
+                        console.print(f"[yellow]Cached TVDB data for {series_id_int} does not include requested episode; refreshing from TVDB[/yellow]")
+                elif cached_data is not None:
+                    if debug:
+                        console.print(f"[cyan]Using cached TVDB episodes for {series_id_int}[/cyan]")
+
+                    aliases_list = _as_dict_list(cached_data.get("aliases"))
+                    specific_alias = _pick_specific_eng_alias(
+                        aliases_list,
+                        slug=cached_data.get("slug"),
+                        debug=debug,
+                    )
+                    if original_language and original_language == "en":
+                        specific_alias = None
+
+                    return cached_data, specific_alias
             except Exception as cache_error:
                 if debug:
                     console.print(f"[yellow]Failed to read TVDB cache for {series_id}: {cache_error}[/yellow]")
 
         try:
-            client = _get_tvdb_or_warn()
+            client = await _get_tvdb_or_warn()
             if client is None:
                 return None, None
 
-            # Get all episodes for the series with pagination
-            all_episodes: list[dict[str, Any]] = []
-            page = 0
-            max_pages = 20  # Safety limit to prevent infinite loops
-            pages_fetched = 0
+            # The first page tells how many episodes there are; the rest are fetched together
+            first_response, links = await client.get_series_episodes(series_id_int, season_type="default", page=0, lang="eng")
             series_slug: Optional[str] = None
-
-            while page < max_pages:
-                if debug and page > 0:
-                    console.print(f"[cyan]Fetching TVDB episodes page {page + 1}[/cyan]")
-
-                try:
-                    episodes_response = cast(Any, client).get_series_episodes(series_id_int, season_type="default", page=page, lang="eng")
-
-                    # Handle both dict response and direct episodes list
-                    if isinstance(episodes_response, dict):
-                        episodes_response_dict = cast(dict[str, Any], episodes_response)
-                        if page == 0:
-                            slug_value = episodes_response_dict.get("slug")
-                            if isinstance(slug_value, str):
-                                series_slug = slug_value
-                        current_episodes = _as_dict_list(episodes_response_dict.get("episodes", []))
-                    else:
-                        # Fallback for direct list response
-                        current_episodes = _as_dict_list(episodes_response)
-
-                    if not current_episodes:
-                        if debug:
-                            console.print(f"[yellow]No episodes found on page {page + 1}, stopping pagination[/yellow]")
-                        break
-
-                    all_episodes.extend(current_episodes)
-                    pages_fetched += 1
-
-                    if debug:
-                        console.print(f"[cyan]Retrieved {len(current_episodes)} episodes from page {page + 1} (total: {len(all_episodes)})[/cyan]")
-
-                    # If we got fewer than 500 results, we've reached the end
-                    if len(current_episodes) < 500:
-                        if debug:
-                            console.print(f"[cyan]Page {page + 1} returned {len(current_episodes)} episodes (< 500), pagination complete[/cyan]")
+            if isinstance(first_response, dict):
+                slug_value = cast(dict[str, Any], first_response).get("slug")
+                if isinstance(slug_value, str):
+                    series_slug = slug_value
+            pages = [_episodes_of(first_response)]
+            if debug:
+                console.print(f"[cyan]Retrieved {len(pages[0])} episodes from page 1[/cyan]")
+
+            page_count = _page_count(links, len(pages[0]))
+            if page_count is not None and page_count > 1:
+                pages.extend(await _fetch_episode_pages(client, series_id_int, range(1, page_count), debug))
+            elif page_count is None:
+                # No total reported: walk on while pages are full
+                page = 1
+                while len(pages[-1]) >= 500 and page < _MAX_EPISODE_PAGES:
+                    fetched = await _fetch_episode_pages(client, series_id_int, range(page, page + 1), debug)
+                    if not fetched:
                         break
-
+                    pages.extend(fetched)
                     page += 1
-                    await asyncio.sleep(0.1)  # Rate limiting
-
-                except Exception as page_error:
-                    if debug:
-                        console.print(f"[yellow]Error fetching page {page + 1}: {page_error}[/yellow]")
-                    # If first page fails, re-raise; otherwise, stop pagination
-                    if page == 0:
-                        raise page_error
-                    else:
-                        break
+            all_episodes = [ep for page_episodes in pages for ep in page_episodes]
+            pages_fetched = sum(1 for page_episodes in pages if page_episodes)
 
             if debug:
-                console.print(f"[green]Total episodes retrieved: {len(all_episodes)} across {page + 1} page(s)[/green]")
+                console.print(f"[green]Total episodes retrieved: {len(all_episodes)} across {len(pages)} page(s)[/green]")
 
             # Create the response structure
             episodes_data: dict[str, Any] = {
@@ -364,7 +526,7 @@ class tvdb_data:
             try:
                 if all_episodes:
                     # Get series details for aliases and main name
-                    series_info = cast(dict[str, Any], cast(Any, client).get_series_extended(series_id_int))
+                    series_info = cast(dict[str, Any], await client.get_series_extended(series_id_int))
                     if "aliases" in series_info:
                         episodes_data["aliases"] = series_info["aliases"]
                     if "name" in series_info:
@@ -378,24 +540,11 @@ class tvdb_data:
                     console.print(f"[yellow]Could not retrieve series aliases: {alias_error}[/yellow]")
 
             # If this was a multi-page series and we have a base_dir, cache results for next time.
-            if cache_path and pages_fetched > 1:
+            if cache is not None and pages_fetched > 1:
                 try:
-                    # Ensure cache dir exists; on POSIX explicitly apply typical dir perms.
-                    if os.name == "posix":
-                        cache_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
-                        with contextlib.suppress(Exception):
-                            os.chmod(cache_path.parent, 0o700)
-                    else:
-                        cache_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    with cache_path.open("w", encoding="utf-8") as f:
-                        json.dump(episodes_data, f, ensure_ascii=False)
-
-                    if os.name == "posix":
-                        with contextlib.suppress(Exception):
-                            os.chmod(cache_path, 0o644)
+                    await asyncio.to_thread(cache.store, series_id_int, episodes_data)
                     if debug:
-                        console.print(f"[green]Cached TVDB episodes to {cache_path}[/green]")
+                        console.print(f"[green]Cached TVDB episodes to {cache.db_path}[/green]")
                 except Exception as cache_write_error:
                     if debug:
                         console.print(f"[yellow]Failed to write TVDB cache for {series_id}: {cache_write_error}[/yellow]")
@@ -425,7 +574,7 @@ class tvdb_data:
         debug: bool = False,
         tv_movie: bool = False,
     ) -> tuple[Optional[int], Optional[str]]:
-        client = _get_tvdb_or_warn()
+        client = await _get_tvdb_or_warn()
         if client is None:
             return None, None
 
@@ -444,7 +593,7 @@ class tvdb_data:
                 if debug:
                     console.print(f"[cyan]Trying TVDB lookup with IMDB ID: {imdb_formatted}[/cyan]")
 
-                results = _as_dict_list(cast(Any, client).search_by_remote_id(imdb_formatted))
+                results = _as_dict_list(await client.search_by_remote_id(imdb_formatted))
                 await asyncio.sleep(0.1)
 
                 if results and len(results) > 0:
@@ -497,7 +646,7 @@ class tvdb_data:
                 if debug:
                     console.print(f"[cyan]Trying TVDB lookup with TMDB ID: {tmdb_str}[/cyan]")
 
-                results = _as_dict_list(cast(Any, client).search_by_remote_id(tmdb_str))
+                results = _as_dict_list(await client.search_by_remote_id(tmdb_str))
                 await asyncio.sleep(0.1)
 
                 if results and len(results) > 0:
@@ -553,7 +702,7 @@ class tvdb_data:
         debug: bool = False,
     ) -> Optional[str]:
         try:
-            client = _get_tvdb_or_warn()
+            client = await _get_tvdb_or_warn()
             if client is None:
                 return None
 
@@ -563,7 +712,7 @@ class tvdb_data:
                     console.print(f"[yellow]Invalid TVDB episode ID: {episode_id}[/yellow]")
                 return None
 
-            episode_data = cast(dict[str, Any], cast(Any, client).get_episode_extended(episode_id_int))
+            episode_data = cast(dict[str, Any], await client.get_episode_extended(episode_id_int))
             if debug:
                 console.print(f"[yellow]Episode data retrieved for episode ID {episode_id}[/yellow]")
 
@@ -0,0 +1,200 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import contextlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Optional, cast
+
+import httpx
+from packaging import version
+
+from src.console import console
+
+REMOTE_VERSION_URL = "https://raw.githubusercontent.com/Audionut/Upload-Assistant/master/data/version.py"
+
+# Hours between two requests to GitHub when update_check_interval isn't configured
+DEFAULT_CHECK_INTERVAL_HOURS = 6.0
+
+_VERSION_RE = re.compile(r'__version__\s*=\s*"([^"]+)"')
+_COMMENT_MARKER_RE = re.compile(r"^# ", re.MULTILINE)
+
+
+def get_local_version(version_file: str) -> Optional[str]:
+    """Extracts the local version from the version.py file."""
+    try:
+        with open(version_file, encoding="utf-8") as f:
+            content = f.read()
+        match = _VERSION_RE.search(content)
+        if match:
+            return match.group(1)
+        else:
+            console.print("[red]Version not found in local file.")
+            return None
+    except FileNotFoundError:
+        console.print("[red]Version file not found.")
+        return None
+
+
+def extract_changelog(content: str, to_version: str) -> Optional[str]:
+    """Extracts the changelog entries between the specified versions."""
+    # Try to find the to_version with 'v' prefix first (current format)
+    patterns_to_try = [
+        rf'__version__\s*=\s*"{re.escape(to_version)}"\s*\n\s*"""\s*(.*?)\s*"""',  # Try with 'v' prefix
+        rf'__version__\s*=\s*"{re.escape(to_version.lstrip("v"))}"\s*\n\s*"""\s*(.*?)\s*"""',  # Try without 'v' prefix
+    ]
+
+    for pattern in patterns_to_try:
+        match = re.search(pattern, content, re.DOTALL)
+        if match:
+            changelog = match.group(1).strip()
+            # Remove the comment markers (# ) that were added by the GitHub Action
+            return _COMMENT_MARKER_RE.sub("", changelog)
+
+    return None
+
+
+def is_newer(remote_version: Optional[str], local_version: str) -> bool:
+    if not remote_version:
+        return False
+    try:
+        return version.parse(remote_version) > version.parse(local_version)
+    except version.InvalidVersion:
+        return False
+
+
+def _parse_remote(content: str) -> dict[str, Optional[str]]:
+    match = _VERSION_RE.search(content)
+    if not match:
+        return {"remote_version": None, "changelog": None}
+    remote_version = match.group(1)
+    return {"remote_version": remote_version, "changelog": extract_changelog(content, remote_version)}
+
+
+class UpdateCheck:
+    """The latest release on GitHub, fetched in the background and remembered between runs.
+
+    Stored at ``data/update_check.json`` as ``{remote_version, changelog, etag, last_modified, checked_at}``.
+    GitHub is asked at most once per check interval, with the stored ETag / Last-Modified so an
+    unchanged ``version.py`` costs a 304. The changelog of the remote version is extracted when it
+    is fetched, so printing it later is just a lookup.
+    """
+
+    _instances: dict[str, "UpdateCheck"] = {}
+
+    def __init__(self, base_dir: str, url: str = REMOTE_VERSION_URL) -> None:
+        self.cache_path = Path(base_dir) / "data" / "update_check.json"
+        self.url = url
+        self._task: Optional[asyncio.Task[dict[str, Any]]] = None
+        # Remote version already printed in this process
+        self.announced: Optional[str] = None
+
+    @classmethod
+    def for_base_dir(cls, base_dir: str) -> "UpdateCheck":
+        key = os.path.abspath(base_dir)
+        if key not in cls._instances:
+            cls._instances[key] = cls(key)
+        return cls._instances[key]
+
+    def cached(self) -> dict[str, Any]:
+        """The stored result of the last check, or an empty dict."""
+        try:
+            loaded = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return cast(dict[str, Any], loaded) if isinstance(loaded, dict) else {}
+
+    def _save(self, entry: dict[str, Any]) -> None:
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(entry, indent=4), encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            console.print(f"[yellow]Could not save the update check result: {e}[/yellow]")
+
+    @staticmethod
+    def is_stale(entry: dict[str, Any], interval_hours: float, now: Optional[float] = None) -> bool:
+        checked_at = entry.get("checked_at")
+        if not isinstance(checked_at, (int, float)):
+            return True
+        current = time.time() if now is None else now
+        # A clock that went backwards counts as stale too
+        return not 0 <= current - checked_at < interval_hours * 3600
+
+    async def refresh(self) -> dict[str, Any]:
+        """Ask GitHub for ``version.py`` (conditionally) and store the result.
+
+        Returns the stored entry, or the previous one when the request fails.
+        """
+        entry = self.cached()
+        headers: dict[str, str] = {}
+        if entry.get("remote_version"):
+            if entry.get("etag"):
+                headers["If-None-Match"] = str(entry["etag"])
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = str(entry["last_modified"])
+
+        try:
+            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+                response = await client.get(self.url, headers=headers)
+        except httpx.HTTPError as e:
+            console.print(f"[red]An error occurred while fetching the remote version file: {e}")
+            return entry
+
+        if response.status_code == 304:
+            entry["checked_at"] = time.time()
+        elif response.status_code == 200:
+            # The changelog is a regex scan over the whole file; keep it off the event loop
+            parsed = await asyncio.to_thread(_parse_remote, response.text)
+            if not parsed["remote_version"]:
+                console.print("[red]Version not found in remote file.")
+                return entry
+            entry = {
+                **parsed,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "checked_at": time.time(),
+            }
+        else:
+            console.print(f"[red]Failed to fetch remote version file. Status code: {response.status_code}")
+            return entry
+
+        await asyncio.to_thread(self._save, entry)
+        return entry
+
+    def start(self, interval_hours: float) -> Optional[dict[str, Any]]:
+        """Return the cached result, starting a background refresh if it is older than ``interval_hours``."""
+        entry = self.cached()
+        task = self._task
+        running = task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop()
+        if self.is_stale(entry, interval_hours) and not running:
+            self._task = asyncio.create_task(self.refresh())
+        return entry or None
+
+    async def finish(self, timeout: float = 2.0) -> Optional[dict[str, Any]]:
+        """Wait up to ``timeout`` seconds for a running refresh; cancel it if GitHub is still busy."""
+        task = self._task
+        if task is None:
+            return None
+        self._task = None
+        if task.cancelled():
+            # cleanup_manager.cleanup() cancels leftover tasks before this runs
+            return None
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+        except asyncio.CancelledError:
+            # The refresh was cancelled while waiting; only a cancellation of the caller is raised again
+            if not task.cancelled():
+                raise
+            return None
+        except asyncio.TimeoutError:
+            # GitHub is slow or unreachable; the next run tries again
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+            return None
+        except Exception:
+            return None
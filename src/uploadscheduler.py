@@ -0,0 +1,169 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import time
+from collections.abc import Awaitable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from src.console import console
+
+# Seconds between "still uploading" lines
+PROGRESS_INTERVAL = 10.0
+
+
+@dataclass
+class TrackerRun:
+    """State of one tracker in an upload: queued, running, done, failed or cancelled."""
+
+    tracker: str
+    state: str = "queued"
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started is None:
+            return None
+        return (self.finished if self.finished is not None else time.monotonic()) - self.started
+
+
+class SiteLimits:
+    """Process-wide per-site slots, shared by every upload running in this process.
+
+    Semaphores are recreated per event loop.
+    """
+
+    def __init__(self) -> None:
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self, site: str, limit: int) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphores = {}
+            self._loop = loop
+        semaphore = self._semaphores.get(site)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, limit))
+            self._semaphores[site] = semaphore
+        return semaphore
+
+
+_site_limits = SiteLimits()
+
+
+def _site(tracker: str) -> str:
+    return tracker.replace(" ", "").upper().strip()
+
+
+def _as_int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class UploadScheduler:
+    """Runs the upload of each tracker concurrently, within a global and a per-site limit.
+
+    Trackers start in priority order (``tracker_upload_priority`` first, then the order they were
+    given in), at most ``tracker_upload_concurrency`` at a time (0 = all at once), and at most
+    ``upload_concurrency`` uploads per site across the process (a site's tracker config, default 1).
+    A failing tracker only fails itself; a fatal error (Ctrl+C, ``sys.exit`` from a prompt)
+    cancels the trackers that are still queued or running and is raised again.
+    """
+
+    def __init__(self, config: Mapping[str, Any], max_concurrent: Optional[int] = None, progress_interval: float = PROGRESS_INTERVAL) -> None:
+        self.config = config
+        default_config = config.get("DEFAULT", {})
+        self.max_concurrent = max_concurrent if max_concurrent is not None else _as_int(default_config.get("tracker_upload_concurrency", 0), 0)
+        priority = default_config.get("tracker_upload_priority") or []
+        if isinstance(priority, str):
+            priority = priority.split(",")
+        self.priority = [str(tracker).strip().upper() for tracker in priority if str(tracker).strip()]
+        self.progress_interval = progress_interval
+        self.runs: dict[str, TrackerRun] = {}
+
+    def order(self, trackers: Iterable[str]) -> list[str]:
+        """``trackers`` with the prioritised ones first; the order is kept otherwise."""
+        ranks = {tracker: rank for rank, tracker in enumerate(self.priority)}
+        indexed = list(enumerate(trackers))
+        return [tracker for _, tracker in sorted(indexed, key=lambda item: (ranks.get(_site(item[1]), len(ranks)), item[0]))]
+
+    def site_limit(self, tracker: str) -> int:
+        tracker_config = self.config.get("TRACKERS", {}).get(_site(tracker), {})
+        return _as_int(tracker_config.get("upload_concurrency", 1) if isinstance(tracker_config, Mapping) else 1, 1)
+
+    def _progress_line(self) -> str:
+        running = [run for run in self.runs.values() if run.state == "running"]
+        finished = sum(1 for run in self.runs.values() if run.state in ("done", "failed"))
+        waiting = sum(1 for run in self.runs.values() if run.state == "queued")
+        details = ", ".join(f"{run.tracker} {run.duration or 0:.0f}s" for run in running)
+        line = f"[yellow]Still uploading: {details} ({finished}/{len(self.runs)} finished"
+        return line + (f", {waiting} queued)" if waiting else ")")
+
+    async def _report_progress(self) -> None:
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            if any(run.state == "running" for run in self.runs.values()):
+                console.print(self._progress_line())
+
+    async def run(self, trackers: Iterable[str], upload: Callable[[str], Awaitable[None]]) -> dict[str, TrackerRun]:
+        """Run ``upload(tracker)`` for every tracker and return the state of each.
+
+        Exceptions of a tracker are kept in its ``TrackerRun.error``.
+        """
+        ordered = self.order(trackers)
+        self.runs = {tracker: TrackerRun(tracker) for tracker in ordered}
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for tracker in ordered:
+            queue.put_nowait(tracker)
+
+        async def run_one(tracker: str) -> None:
+            state = self.runs[tracker]
+            async with _site_limits.get(_site(tracker), self.site_limit(tracker)):
+                state.state = "running"
+                state.started = time.monotonic()
+                try:
+                    await upload(tracker)
+                except Exception as e:
+                    state.state = "failed"
+                    state.error = e
+                else:
+                    state.state = "done"
+                finally:
+                    state.finished = time.monotonic()
+
+        async def worker() -> None:
+            while not queue.empty():
+                await run_one(queue.get_nowait())
+
+        worker_count = len(ordered) if self.max_concurrent <= 0 else min(self.max_concurrent, len(ordered))
+        workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        progress = asyncio.create_task(self._report_progress())
+        try:
+            pending = set(workers)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    # Only fatal errors get out of run_one
+                    error = None if task.cancelled() else task.exception()
+                    if error is not None:
+                        raise error
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            for state in self.runs.values():
+                if state.state in ("queued", "running"):
+                    state.state = "cancelled"
+            raise
+        finally:
+            progress.cancel()
+            await asyncio.gather(progress, return_exceptions=True)
+        return self.runs
+
+    def summary(self) -> str:
+        parts = [f"{run.tracker} {run.state} {run.duration:.1f}s" if run.duration is not None else f"{run.tracker} {run.state}" for run in self.runs.values()]
+        return "Tracker uploads: " + ", ".join(parts)
@@ -1,6 +1,5 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
-import base64
 import contextlib
 import gc
 import glob
@@ -11,16 +10,20 @@ import time
 from collections.abc import Sequence
 from typing import Any, Optional, Union, cast
 
-import aiofiles
 import httpx
 import pyimgbox
 from typing_extensions import TypeAlias
 
 from src.console import console
+from src.imagehostcache import ImageHostCache
+from src.streamupload import FilePart, post_form
 
 Meta: TypeAlias = dict[str, Any]
 ImageDict: TypeAlias = dict[str, Any]
 
+# Hosts that throttle parallel uploads; everything else uploads all screenshots at once
+HOST_LIMITS: dict[str, int] = {"onlyimage": 6, "ptscreens": 6, "lensdump": 1, "passtheimage": 6}
+
 
 class UploadScreensManager:
     def __init__(self, config: dict[str, Any]) -> None:
@@ -38,6 +41,7 @@ class UploadScreensManager:
         retry_mode: bool = False,
         max_retries: int = 3,
         allowed_hosts: Union[list[str], None] = None,
+        img_host: Optional[str] = None,
     ) -> tuple[list[ImageDict], int]:
         return await _upload_screens(
             self.config,
@@ -51,6 +55,7 @@ class UploadScreensManager:
             retry_mode=retry_mode,
             max_retries=max_retries,
             allowed_hosts=allowed_hosts,
+            img_host=img_host,
         )
 
 
@@ -80,12 +85,11 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
 
             try:
                 async with httpx.AsyncClient() as client:
-                    async with aiofiles.open(image, "rb") as file:
-                        files = {"file-upload[0]": (os.path.basename(image), await file.read())}
-                        headers = {"referer": "https://ptpimg.me/index.php"}
+                    files = {"file-upload[0]": FilePart(image)}
+                    headers = {"referer": "https://ptpimg.me/index.php"}
 
                     try:
-                        response = await client.post("https://ptpimg.me/upload.php", headers=headers, data=payload, files=files, timeout=timeout)
+                        response = await post_form(client, "https://ptpimg.me/upload.php", headers=headers, data=payload, files=files, timeout=timeout)
 
                         response.raise_for_status()
                         response_data = cast(list[dict[str, Any]], response.json())
@@ -115,16 +119,11 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
         elif img_host == "imgbb":
             url = "https://api.imgbb.com/1/upload"
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    encoded_image = base64.b64encode(await img_file.read()).decode("utf8")
-
-                data = {
-                    "key": config["DEFAULT"]["imgbb_api"],
-                    "image": encoded_image,
-                }
+                data = {"key": config["DEFAULT"]["imgbb_api"]}
+                files = {"image": FilePart(image, base64_encode=True)}
 
                 async with httpx.AsyncClient() as client:
-                    response = await client.post(url, data=data, timeout=timeout)
+                    response = await post_form(client, url, data=data, files=files, timeout=timeout)
                     response_data = response.json()
                     if response.status_code != 200 or not response_data.get("success"):
                         console.print("[yellow]imgbb failed, trying next image host")
@@ -154,15 +153,10 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
         elif img_host == "dalexni":
             url = "https://dalexni.com/1/upload"
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    encoded_image = base64.b64encode(await img_file.read()).decode("utf8")
-
-                data = {
-                    "key": config["DEFAULT"]["dalexni_api"],
-                    "image": encoded_image,
-                }
+                data = {"key": config["DEFAULT"]["dalexni_api"]}
+                files = {"image": FilePart(image, base64_encode=True)}
                 async with httpx.AsyncClient() as client:
-                    response = await client.post(url, data=data, timeout=timeout)
+                    response = await post_form(client, url, data=data, files=files, timeout=timeout)
                     response_data = response.json()
                     if response.status_code != 200 or not response_data.get("success"):
                         console.print("[yellow]DALEXNI failed, trying next image host")
@@ -194,10 +188,10 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
             try:
                 headers = {"X-API-Key": config["DEFAULT"]["ptscreens_api"]}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, "rb") as file:
-                    files = {"source": ("file-upload[0]", await file.read())}
+                async with httpx.AsyncClient() as client:
+                    files = {"source": FilePart(image, "file-upload[0]")}
 
-                    response = await client.post(url, headers=headers, files=files, timeout=timeout)
+                    response = await post_form(client, url, headers=headers, files=files, timeout=timeout)
                     response_data = response.json()
 
                     if response.status_code != 200:
@@ -224,16 +218,13 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
         elif img_host == "utppm":
             url = "https://utp.pm/api/1/upload"
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    encoded_image = base64.b64encode(await img_file.read()).decode("utf8")
-
-                data = {"source": encoded_image}
+                files = {"source": FilePart(image, base64_encode=True)}
                 headers = {
                     "X-API-Key": config["DEFAULT"]["utppm_api"],
                 }
 
                 async with httpx.AsyncClient() as client:
-                    response = await client.post(url, data=data, headers=headers, timeout=timeout)
+                    response = await post_form(client, url, files=files, headers=headers, timeout=timeout)
                     response_data = response.json()
 
                     if response.status_code != 200:
@@ -260,16 +251,13 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
         elif img_host == "onlyimage":
             url = "https://onlyimage.org/api/1/upload"
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    encoded_image = base64.b64encode(await img_file.read()).decode("utf8")
-
-                data = {"image": encoded_image}
+                files = {"image": FilePart(image, base64_encode=True)}
                 headers = {
                     "X-API-Key": config["DEFAULT"]["onlyimage_api"],
                 }
 
                 async with httpx.AsyncClient() as client:
-                    response = await client.post(url, data=data, headers=headers, timeout=timeout)
+                    response = await post_form(client, url, files=files, headers=headers, timeout=timeout)
                     response_data = response.json()
 
                     if response.status_code != 200 or not response_data.get("success"):
@@ -298,10 +286,10 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
             try:
                 data = {"content_type": "0", "max_th_size": 350}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, "rb") as file:
-                    files = {"img": ("file-upload[0]", await file.read())}
+                async with httpx.AsyncClient() as client:
+                    files = {"img": FilePart(image, "file-upload[0]")}
 
-                    response = await client.post(url, data=data, files=files, timeout=timeout)
+                    response = await post_form(client, url, data=data, files=files, timeout=timeout)
 
                     if response.status_code != 200:
                         console.print(f"[yellow]pixhost failed with status code {response.status_code}, trying next image host")
@@ -335,11 +323,10 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
         elif img_host == "lensdump":
             url = "https://lensdump.com/api/1/upload"
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    data = {"image": base64.b64encode(await img_file.read()).decode("utf8")}
+                files = {"image": FilePart(image, base64_encode=True)}
                 headers = {"X-API-Key": config["DEFAULT"]["lensdump_api"]}
                 async with httpx.AsyncClient() as client:
-                    response = await client.post(url, data=data, headers=headers, timeout=timeout)
+                    response = await post_form(client, url, files=files, headers=headers, timeout=timeout)
                     response_data = response.json()
                     if response_data.get("status_code") == 200:
                         img_url = response_data["data"]["image"]["url"]
@@ -364,15 +351,12 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 return {"status": "failed", "reason": "Missing Zipline URL or API key"}
 
             try:
-                async with aiofiles.open(image, "rb") as img_file:
-                    filename = os.path.basename(image)
-                    file_bytes = await img_file.read()
                 headers = {
                     "Authorization": f"{api_key}",
                 }
 
                 async with httpx.AsyncClient() as client:
-                    response = await client.post(url, files={"file": (filename, file_bytes)}, headers=headers, timeout=timeout)
+                    response = await post_form(client, url, files={"file": FilePart(image)}, headers=headers, timeout=timeout)
                     if response.status_code == 200:
                         response_data = response.json()
                         if "files" in response_data:
@@ -407,9 +391,9 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
 
                 headers = {"X-API-Key": pass_api_key}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, "rb") as img_file:
-                    files = {"source": (os.path.basename(image), await img_file.read())}
-                    response = await client.post(url, headers=headers, files=files, timeout=timeout)
+                async with httpx.AsyncClient() as client:
+                    files = {"source": FilePart(image)}
+                    response = await post_form(client, url, headers=headers, files=files, timeout=timeout)
 
                     if "application/json" in response.headers.get("Content-Type", ""):
                         response_data = response.json()
@@ -458,10 +442,10 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
             try:
                 headers = {"Authorization": f"Bearer {api_key}"}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, "rb") as img_file:
-                    files = {"files[]": (os.path.basename(image), await img_file.read())}
+                async with httpx.AsyncClient() as client:
+                    files = {"files[]": FilePart(image)}
 
-                    response = await client.post(url, headers=headers, files=files, timeout=timeout)
+                    response = await post_form(client, url, headers=headers, files=files, timeout=timeout)
 
                     if response.status_code not in (200, 201):
                         console.print(f"[yellow]Seedpool CDN failed with status code {response.status_code}, trying next image host")
@@ -518,9 +502,9 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 headers = {"Authorization": f"{api_key}"}
                 data = {"title": "Upload-Assistant screenshot"}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, "rb") as img_file:
-                    files = {"file": (os.path.basename(image), await img_file.read())}
-                    response = await client.post(url, headers=headers, data=data, files=files, timeout=timeout)
+                async with httpx.AsyncClient() as client:
+                    files = {"file": FilePart(image)}
+                    response = await post_form(client, url, headers=headers, data=data, files=files, timeout=timeout)
 
                     content_type = response.headers.get("Content-Type", "")
                     if "application/json" in content_type:
@@ -582,7 +566,14 @@ async def _upload_screens(
     retry_mode: bool = False,
     max_retries: int = 3,
     allowed_hosts: Union[list[str], None] = None,
+    img_host: Optional[str] = None,
 ) -> tuple[list[ImageDict], int]:
+    """Upload screenshots to ``img_host`` (defaults to meta['imghost']).
+
+    Passing ``img_host`` explicitly lets several uploads to different hosts run at once
+    without racing on meta['imghost']: such an upload never switches to the next configured
+    host, its caller decides where to go when the host fails.
+    """
     default_config = config.get("DEFAULT", {})
     if "image_list" not in meta:
         meta["image_list"] = []
@@ -593,7 +584,8 @@ async def _upload_screens(
     os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
 
     initial_img_host = default_config[f"img_host_{img_host_num}"]
-    img_host = str(meta.get("imghost", ""))
+    pinned_host = img_host is not None
+    img_host = img_host or str(meta.get("imghost", ""))
 
     image_list = cast(list[ImageDict], meta.get("image_list", []))
 
@@ -684,22 +676,36 @@ async def _upload_screens(
 
     # Concurrency Control
     default_pool_size = len(upload_tasks)
-    host_limits = {"onlyimage": 6, "ptscreens": 6, "lensdump": 1, "passtheimage": 6}
-    pool_size = host_limits.get(img_host, default_pool_size)
+    pool_size = HOST_LIMITS.get(img_host, default_pool_size)
     max_workers = min(len(upload_tasks), pool_size)
     semaphore = asyncio.Semaphore(max_workers)
 
     # Track running tasks for cancellation
     running_tasks: set[asyncio.Task[dict[str, Any]]] = set()
 
+    # Reuse links for screenshots that were already pushed to this host (other tracker, re-run, cross-seed)
+    host_cache = ImageHostCache.for_base_dir(meta["base_dir"]) if default_config.get("image_host_cache", True) else None
+    revalidate_cached = bool(default_config.get("image_host_cache_revalidate", False))
+    cache_hits = 0
+
     async def async_upload(
         task: tuple[int, str, str, dict[str, Any], dict[str, Any]],
         max_retries: int = 3,
     ) -> Union[tuple[int, dict[str, Any]], None]:
         """Upload image with concurrency control and retry logic."""
+        nonlocal cache_hits
         index, *task_args = task
+        image_path = str(task_args[0])
         retry_count = 0
 
+        if host_cache is not None:
+            cached = await host_cache.get(image_path, img_host, revalidate=revalidate_cached)
+            if cached:
+                cache_hits += 1
+                if meta.get("debug"):
+                    console.print(f"[cyan]Reusing cached {img_host} link for image {index}: {cached['raw_url']}[/cyan]")
+                return (index, {"status": "success", "img_url": cached["img_url"], "raw_url": cached["raw_url"], "web_url": cached["web_url"], "local_file_path": image_path})
+
         async with semaphore:
             while retry_count <= max_retries:
                 future: Optional[asyncio.Task[dict[str, Any]]] = None
@@ -712,6 +718,8 @@ async def _upload_screens(
                         running_tasks.discard(future)
 
                         if result.get("status") == "success":
+                            if host_cache is not None:
+                                await host_cache.put(image_path, img_host, result)
                             return (index, result)
                         else:
                             reason = result.get("reason", "Unknown error")
@@ -773,6 +781,11 @@ async def _upload_screens(
         except Exception as e:
             console.print(f"[red]Error during uploads: {str(e)}[/red]")
 
+        if host_cache is not None:
+            await host_cache.save()
+            if cache_hits:
+                console.print(f"[green]Reused {cache_hits} previously uploaded {img_host} links.")
+
         successfully_uploaded = [(index, result) for index, result in results if result["status"] == "success"]
         if meta["debug"]:
             console.print(f"[blue]Successfully uploaded {len(successfully_uploaded)} out of {len(upload_tasks)} attempted uploads.[/blue]")
@@ -782,7 +795,7 @@ async def _upload_screens(
             console.print(f"[blue]Double checking current image host: {img_host}, Initial image host: {initial_img_host}[/blue]")
             console.print(f"[blue]retry_mode: {retry_mode}, using_custom_img_list: {using_custom_img_list}[/blue]")
             console.print(f"[blue]successfully_uploaded={len(successfully_uploaded)}, meta['image_list']={len(image_list)}, cutoff={meta.get('cutoff', 1)}[/blue]")
-        if (len(successfully_uploaded) + len(image_list)) < images_needed and not retry_mode and img_host == initial_img_host and not using_custom_img_list:
+        if (len(successfully_uploaded) + len(image_list)) < images_needed and not retry_mode and img_host == initial_img_host and not using_custom_img_list and not pinned_host:
             # Mark this host as failed so we don't retry it for other trackers
             if "failed_image_hosts" not in meta:
                 meta["failed_image_hosts"] = []
@@ -0,0 +1,76 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the buffered, rotated and filtered web UI access log in web_ui/access_log.py."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+import web_ui.access_log as access_log
+from web_ui.access_log import AccessLogger, parse_time
+
+
+def _log(logger: AccessLogger, endpoint: str, status: int, remote_addr: str = "10.0.0.1") -> None:
+    logger.log(endpoint=endpoint, method="GET", remote_addr=remote_addr, username=None, success=200 <= status < 300, status=status)
+
+
+def test_entries_survive_restart_and_are_read_from_the_file_end(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(access_log, "RECENT_ENTRIES", 5)
+    logger = AccessLogger(tmp_path)
+    for i in range(40):
+        _log(logger, f"/api/item/{i}", 401)
+    logger.close()
+    assert len(logger.log_file.read_text(encoding="utf-8").splitlines()) == 40
+
+    reopened = AccessLogger(tmp_path)
+    # Five entries come from memory, the rest from reading the file backwards
+    assert [entry["endpoint"] for entry in reopened.tail(12)] == [f"/api/item/{i}" for i in range(28, 40)]
+    assert reopened.tail(100) == [json.loads(line) for line in logger.log_file.read_text(encoding="utf-8").splitlines()]
+    reopened.close()
+
+
+def test_filters(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(access_log, "RECENT_ENTRIES", 3)
+    monkeypatch.setattr(access_log, "INDEX_EVERY", 4)
+    logger = AccessLogger(tmp_path)
+    for i in range(30):
+        _log(logger, "/api/browse" if i % 2 else "/api/execute", 403 if i % 3 else 401, remote_addr=f"10.0.0.{i % 5}")
+    logger.close()
+    everything = logger.tail(100)
+
+    assert [entry["status"] for entry in logger.entries(100, status="401")] == [401] * 10
+    assert len(logger.entries(100, status="4xx")) == 30
+    assert logger.entries(100, status="success") == []
+    assert {entry["endpoint"] for entry in logger.entries(100, endpoint="/api/br")} == {"/api/browse"}
+    # Auth failures keep the remote address
+    assert logger.entries(2, ip="10.0.0.3") == [entry for entry in everything if entry["remote_addr"] == "10.0.0.3"][-2:]
+
+    since, until = everything[7]["timestamp"], everything[19]["timestamp"]
+    assert logger.entries(100, since=since, until=until) == everything[7:20]
+    assert logger.entries(3, until=until) == everything[17:20]
+    assert logger.entries(100, endpoint="/api/execute", since=since, until=until) == [entry for entry in everything[7:20] if entry["endpoint"] == "/api/execute"]
+
+    with pytest.raises(ValueError):
+        logger.entries(10, status="teapot")
+    assert parse_time("0") == "1970-01-01T00:00:00.000000+00:00"
+    assert parse_time("2025-01-02T03:04:05Z") == "2025-01-02T03:04:05.000000+00:00"
+
+
+def test_rotation_compresses_and_keeps_recent_entries_visible(tmp_path: Path) -> None:
+    logger = AccessLogger(tmp_path, max_bytes=2000, backups=2)
+    for round_ in range(4):
+        for i in range(12):
+            _log(logger, f"/api/round/{round_}/{i}", 401)
+        logger.flush()
+    logger.close()
+
+    # Each batch is over max_bytes, so every flush after the first rotates the file
+    assert [json.loads(line)["endpoint"] for line in logger.log_file.read_text(encoding="utf-8").splitlines()] == [f"/api/round/3/{i}" for i in range(12)]
+    assert logger.backup_file(1).exists() and logger.backup_file(2).exists()
+    assert not logger.backup_file(3).exists()
+    with gzip.open(logger.backup_file(1), "rt", encoding="utf-8") as f:
+        assert json.loads(f.readline())["endpoint"] == "/api/round/2/0"
+    assert [entry["endpoint"] for entry in logger.tail(48)] == [f"/api/round/{round_}/{i}" for round_ in range(4) for i in range(12)]
@@ -0,0 +1,227 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the Sonarr/Radarr library mirror in src/arrmirror.py."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any, Optional
+
+import httpx
+import pytest
+
+from src.arrmirror import ArrLibraryMirror, configured_instances
+from src.radarr import RadarrManager
+from src.sonarr import SonarrManager
+
+_SERIES: dict[str, list[dict[str, Any]]] = {
+    "default": [
+        {"title": "Show A", "tvdbId": 100, "imdbId": "tt0000100", "tmdbId": 1000, "path": os.path.join(os.sep, "tv", "Show A"), "genres": ["Drama"], "year": 2001},
+    ],
+    "1": [
+        {"title": "Show A (second copy)", "tvdbId": 100, "tmdbId": 1000, "path": os.path.join(os.sep, "tv2", "Show A"), "genres": [], "year": 2001},
+        {"title": "Show B", "tvdbId": 200, "tmdbId": 2000, "path": os.path.join(os.sep, "tv2", "Show B"), "genres": ["Anime"], "year": 2010},
+    ],
+}
+
+_MOVIES: dict[str, list[dict[str, Any]]] = {
+    "default": [
+        {
+            "title": "Movie",
+            "tmdbId": 5,
+            "imdbId": "tt0000005",
+            "year": 1999,
+            "genres": ["Action"],
+            "path": os.path.join(os.sep, "movies", "Movie (1999)"),
+            "movieFile": {"path": os.path.join(os.sep, "movies", "Movie (1999)", "Movie.mkv"), "originalFilePath": "Movie.1999.1080p.BluRay-GRP.mkv", "releaseGroup": "GRP"},
+        },
+    ],
+}
+
+
+def _config(service: str, **extra: Any) -> dict[str, Any]:
+    default: dict[str, Any] = {
+        f"{service}_url": "http://first:1",
+        f"{service}_api_key": "key0",
+        f"{service}_url_1": "http://second:2",
+        f"{service}_api_key_1": "key1",
+    }
+    default.update(extra)
+    return {"DEFAULT": default}
+
+
+@pytest.fixture(autouse=True)
+def _isolate_mirrors(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ArrLibraryMirror, "_instances", {})
+
+
+def _fake_libraries(monkeypatch: pytest.MonkeyPatch, libraries: dict[str, Optional[list[dict[str, Any]]]], calls: list[str]) -> None:
+    async def fake_fetch(self: ArrLibraryMirror, client: httpx.AsyncClient, label: str, base_url: str, api_key: str, debug: bool) -> Optional[list[dict[str, Any]]]:
+        _ = (self, client, base_url, api_key, debug)
+        calls.append(label)
+        return libraries.get(label)
+
+    monkeypatch.setattr(ArrLibraryMirror, "_fetch_library", fake_fetch)
+
+
+def _no_network(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fail_get(self: httpx.AsyncClient, url: str, **kwargs: Any) -> httpx.Response:
+        _ = (self, kwargs)
+        raise AssertionError(f"unexpected request to {url}")
+
+    monkeypatch.setattr(httpx.AsyncClient, "get", fail_get)
+
+
+def test_configured_instances_skip_unset_slots() -> None:
+    default = {"sonarr_url_1": "http://b/", "sonarr_api_key_1": " k ", "sonarr_url_2": "http://c", "sonarr_api_key_2": ""}
+    assert configured_instances(default, "sonarr") == [("1", "http://b", "k")]
+
+
+def test_sonarr_lookups_come_from_mirror(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    _fake_libraries(monkeypatch, dict(_SERIES), calls)
+    requested: list[str] = []
+
+    async def fake_get(self: httpx.AsyncClient, url: str, **kwargs: Any) -> httpx.Response:
+        _ = self
+        requested.append(f"{url} {kwargs.get('params')}")
+        parsed = {"series": _SERIES["1"][1], "parsedEpisodeInfo": {"releaseGroup": "GRP"}}
+        return httpx.Response(200, json=parsed, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "get", fake_get)
+    manager = SonarrManager(_config("sonarr"))
+
+    async def run() -> tuple[Any, Any, Any, Any]:
+        by_id = await manager.get_sonarr_data(tvdb_id=100)
+        by_path = await manager.get_sonarr_data(filename=os.path.join(os.sep, "tv2", "Show B", "Season 01", "ep.mkv"), title="ep.mkv")
+        mirror = ArrLibraryMirror.for_config(manager.default_config, "sonarr")
+        missing = await manager.get_sonarr_data(tvdb_id=999)
+        return by_id, by_path, mirror, missing
+
+    by_id, by_path, mirror, missing = asyncio.run(run())
+
+    # Both instances were loaded once, concurrently, for all three lookups
+    assert sorted(calls) == ["1", "default"]
+    # Instance priority is kept: the default instance answers for a show both libraries have
+    assert by_id["title"] == "Show A"
+    assert by_id["imdb_id"] == 100
+    assert by_path["tvdb_id"] == 200
+    # The series list has no release group, so the matched instance's parser is still asked for it
+    assert by_path["release_group"] == "GRP"
+    assert requested == ["http://second:2/api/v3/parse {'title': 'ep.mkv', 'path': '" + os.path.join(os.sep, "tv2", "Show B", "Season 01", "ep.mkv") + "'}"]
+    assert mirror is not None and mirror.find_by_id("imdbId", "tt100") is not None
+    # Every library is fresh, so a miss is final without asking each instance
+    assert missing is None
+
+
+def test_radarr_lookups_come_from_mirror(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    _fake_libraries(monkeypatch, {"default": _MOVIES["default"], "1": []}, calls)
+    _no_network(monkeypatch)
+    manager = RadarrManager(_config("radarr"))
+
+    by_release = asyncio.run(manager.get_radarr_data(filename="Movie.1999.1080p.BluRay-GRP.mkv"))
+    by_id = asyncio.run(manager.get_radarr_data(tmdb_id=5))
+
+    assert by_release == {"imdb_id": 5, "tmdb_id": 5, "year": 1999, "genres": ["Action"], "release_group": "GRP"}
+    assert by_id == by_release
+    assert sorted(calls) == ["1", "default"]
+
+
+def test_failed_instance_falls_back_to_api(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    _fake_libraries(monkeypatch, {"default": _SERIES["default"], "1": None}, calls)
+    requested: list[str] = []
+
+    async def fake_get(self: httpx.AsyncClient, url: str, **kwargs: Any) -> httpx.Response:
+        _ = (self, kwargs)
+        requested.append(url)
+        return httpx.Response(200, json=[_SERIES["1"][1]], request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "get", fake_get)
+    manager = SonarrManager(_config("sonarr"))
+
+    async def run() -> tuple[Any, Any]:
+        return await manager.get_sonarr_data(tvdb_id=200), await manager.get_sonarr_data(tvdb_id=200)
+
+    first, second = asyncio.run(run())
+
+    assert first is not None and first["tvdb_id"] == 200
+    assert second == first
+    # Only the instance whose library failed is asked directly, and its library isn't refetched right away
+    assert requested == ["http://second:2/api/v3/series?tvdbId=200&includeSeasonImages=false"] * 2
+    assert calls == ["default", "1"]
+
+
+def test_mirror_can_be_disabled() -> None:
+    assert ArrLibraryMirror.for_config(_config("sonarr", arr_library_mirror=False)["DEFAULT"], "sonarr") is None
+
+
+def test_expired_copy_only_fetches_changed_items(monkeypatch: pytest.MonkeyPatch) -> None:
+    library = [
+        {"id": 1, "title": "Kept", "tvdbId": 100, "path": os.path.join(os.sep, "tv", "Kept")},
+        {"id": 2, "title": "Moved", "tvdbId": 200, "path": os.path.join(os.sep, "tv", "Old")},
+        {"id": 3, "title": "Deleted", "tvdbId": 300, "path": os.path.join(os.sep, "tv", "Deleted")},
+    ]
+    responses: dict[str, tuple[int, Any]] = {
+        "http://first:1/api/v3/series?includeSeasonImages=false": (200, library),
+        "http://first:1/api/v3/series/2": (200, {"id": 2, "title": "Moved", "tvdbId": 200, "path": os.path.join(os.sep, "tv", "New")}),
+        "http://first:1/api/v3/series/3": (404, {"message": "NotFound"}),
+    }
+    history = [{"seriesId": 2, "date": "2030-01-01T00:00:00Z"}, {"seriesId": 3, "date": "2030-01-02T00:00:00Z"}, {"seriesId": 2, "date": "2030-01-01T10:00:00Z"}]
+    requested: list[str] = []
+
+    async def fake_get(self: httpx.AsyncClient, url: str, **kwargs: Any) -> httpx.Response:
+        _ = (self, kwargs)
+        requested.append(url)
+        status, body = (200, history) if "/history/since?" in url else responses[url]
+        return httpx.Response(status, json=body, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "get", fake_get)
+    mirror = ArrLibraryMirror("sonarr", [("default", "http://first:1", "key0")], ttl=0.0)
+
+    asyncio.run(mirror.refresh())
+    kept = mirror.find_by_id("tvdbId", 100)
+    assert requested == ["http://first:1/api/v3/series?includeSeasonImages=false"]
+
+    requested.clear()
+    asyncio.run(mirror.refresh())
+
+    # Only the history and the two changed series are fetched; the rest of the copy is untouched
+    assert requested[0].startswith("http://first:1/api/v3/history/since?date=")
+    assert sorted(requested[1:]) == ["http://first:1/api/v3/series/2", "http://first:1/api/v3/series/3"]
+    assert mirror.find_by_id("tvdbId", 100) == kept
+    moved = mirror.find_by_path(os.path.join(os.sep, "tv", "New", "ep.mkv"))
+    assert moved is not None and moved[1]["title"] == "Moved"
+    assert mirror.find_by_path(os.path.join(os.sep, "tv", "Old", "ep.mkv")) is None
+    assert mirror.find_by_id("tvdbId", 300) is None
+
+    # The next sync asks from the newest event seen
+    requested.clear()
+    history.clear()
+    asyncio.run(mirror.refresh())
+    assert requested == ["http://first:1/api/v3/history/since?date=2030-01-02T00%3A00%3A00Z"]
+
+
+def test_unreadable_history_falls_back_to_full_load(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    libraries: dict[str, Optional[list[dict[str, Any]]]] = {"default": [{"id": 1, "tvdbId": 100, "path": os.path.join(os.sep, "tv", "A")}]}
+    _fake_libraries(monkeypatch, libraries, calls)
+    requested: list[str] = []
+
+    async def fake_get(self: httpx.AsyncClient, url: str, **kwargs: Any) -> httpx.Response:
+        _ = (self, kwargs)
+        requested.append(url)
+        return httpx.Response(500, text="boom", request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(httpx.AsyncClient, "get", fake_get)
+    mirror = ArrLibraryMirror("sonarr", [("default", "http://first:1", "key0")], ttl=0.0)
+
+    asyncio.run(mirror.refresh())
+    libraries["default"] = [{"id": 2, "tvdbId": 200, "path": os.path.join(os.sep, "tv", "B")}]
+    asyncio.run(mirror.refresh())
+
+    assert calls == ["default", "default"]
+    assert len(requested) == 1 and "/history/since?" in requested[0]
+    assert mirror.find_by_id("tvdbId", 100) is None
+    assert mirror.find_by_id("tvdbId", 200) is not None
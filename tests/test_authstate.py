@@ -0,0 +1,67 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the cached webui_auth.json state in web_ui/authstate.py."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from web_ui.authstate import AuthState
+
+
+def _touch_later(path: Path) -> None:
+    # Make an external edit visible even on filesystems with coarse mtimes
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_reads_are_cached_until_the_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "webui_auth.json"
+    path.write_text(json.dumps({"ip_whitelist": ["1.2.3.4"]}), encoding="utf-8")
+    state = AuthState(path)
+    calls: list[int] = []
+
+    def compute() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert state.get("ip_whitelist") == ["1.2.3.4"]
+    assert state.memo("count", compute) == state.memo("count", compute) == 1
+    # Copies are handed out, so callers cannot change the cache
+    state.get("ip_whitelist").append("5.6.7.8")
+    assert state.get("ip_whitelist") == ["1.2.3.4"]
+
+    path.write_text(json.dumps({"ip_whitelist": ["9.9.9.9"], "other": 1}), encoding="utf-8")
+    _touch_later(path)
+    assert state.get("ip_whitelist") == ["9.9.9.9"]
+    assert state.memo("count", compute) == 2
+
+    path.unlink()
+    assert state.load() is None
+    assert state.get("ip_whitelist", []) == []
+
+
+def test_update_writes_through_and_keeps_other_keys(tmp_path: Path) -> None:
+    path = tmp_path / "webui_auth.json"
+    path.write_text(json.dumps({"password_hash": "x"}), encoding="utf-8")
+    state = AuthState.for_path(path)
+    assert AuthState.for_path(tmp_path / "." / "webui_auth.json") is state
+
+    for count in range(3):
+        # Several writes within one mtime tick are still all seen
+        state.update("ip_failures", {"1.2.3.4": [count]})
+        assert state.get("ip_failures") == {"1.2.3.4": [count]}
+    assert json.loads(path.read_text(encoding="utf-8")) == {"password_hash": "x", "ip_failures": {"1.2.3.4": [2]}}
+
+
+def test_unreadable_file_is_not_overwritten(tmp_path: Path) -> None:
+    path = tmp_path / "webui_auth.json"
+    path.write_text("{not json", encoding="utf-8")
+    state = AuthState(path)
+    assert state.get("ip_blacklist", []) == []
+    with pytest.raises(ValueError):
+        state.update("ip_blacklist", ["1.2.3.4"])
+    assert path.read_text(encoding="utf-8") == "{not json"
@@ -0,0 +1,139 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the BBCode tree in src/bbcodetree.py and the description cleaners built on it."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from src.bbcode import BBCODE
+from src.bbcodetree import BBNode, Node, parse, render, transform
+
+_UNIT3D_DESC = """[center][b]Release Notes[/b][/center]
+See [url=https://aither.cc/torrents/123]the other torrent[/url] on aither.cc
+[center]   [/center]
+[center]
+[url=https://imgbox.com/abc][img=350]https://thumbs2.imgbox.com/ab/cd/abc_t.png[/img][/url][url=https://imgbox.com/def][img=350]https://thumbs2.imgbox.com/ab/cd/def_t.png[/img][/url]
+[/center]
+[URL=https://ptpimg.me/up.png][IMG]https://ptpimg.me/up.png[/IMG][/URL]
+[img]https://ptpimg.me/standalone.png[/img]
+[img]https://ptpimg.me/standalone.png[/img]
+[img] https://ptpimg.me/spaced.png [/img]
+[spoiler=Screens][img]https://ptpimg.me/inside_spoiler.png[/img][/spoiler]
+[img=100]https://i.ibb.co/2NVWb0c/uploadrr.webp[/img]
+[center][url=https://github.com/z-ink/uploadrr][img=100]https://i.ibb.co/2NVWb0c/uploadrr.webp[/img][/url][/center]
+[center][b]Uploaded Using [url=https://github.com/HDInnovations/UNIT3D]UNIT3D[/url] Auto Uploader[/b][/center]
+[right][url=https://github.com/Audionut/Upload-Assistant]Created by Upload Assistant[/url][/right]
+"""
+
+
+def _image(url: str, web_url: Optional[str] = None) -> dict[str, str]:
+    return {"img_url": url, "raw_url": url, "web_url": web_url or url}
+
+
+def test_parse_round_trips_malformed_input() -> None:
+    samples = [
+        "",
+        "plain text",
+        "[b]bold[/b] [i]unclosed",
+        "[/url] stray close [center][b]mis[/center]nested[/b]",
+        "[url=https://x/a][img=350]https://x/a.png[/img][/URL] [IMG]y[/img]",
+        "[spoiler=A [b]] [] [=] [1tag] [hide  name=x]z[/hide]",
+        "[b]" * 2000 + "deep" + "[/b]" * 2000,
+    ]
+    for sample in samples:
+        assert render(parse(sample)) == sample
+
+
+def test_parse_builds_nested_nodes() -> None:
+    nodes = parse("a [URL=https://x/y][img=350]https://x/y.png[/IMG][/url] [center]c[/b]")
+
+    assert nodes[0] == "a "
+    link = nodes[1]
+    assert isinstance(link, BBNode)
+    assert (link.name, link.arg, link.close_raw) == ("url", "https://x/y", "[/url]")
+    image = link.children[0]
+    assert isinstance(image, BBNode)
+    assert (image.name, image.arg, image.text()) == ("img", "350", "https://x/y.png")
+    # The unclosed [center] and the stray [/b] stay text
+    assert nodes[2:] == [" [center]c[/b]"]
+
+
+def test_transform_visits_children_first() -> None:
+    seen: list[str] = []
+
+    def record(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+        seen.append("/".join([*(a.name for a in ancestors), node.name]))
+        return None
+
+    def unwrap_bold(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+        _ = ancestors
+        return node.children if node.name == "b" else None
+
+    def drop_empty(node: BBNode, ancestors: tuple[BBNode, ...]) -> Optional[list[Node]]:
+        _ = ancestors
+        return [] if not node.text().strip() else None
+
+    nodes = transform(parse("[quote][b]x[/b] [i] [/i][/quote] [b][/b]"), record, unwrap_bold, drop_empty)
+
+    assert seen == ["quote/b", "quote/i", "quote", "b"]
+    assert render(nodes) == "[quote]x [/quote] "
+
+
+def test_clean_unit3d_description() -> None:
+    desc, images = BBCODE().clean_unit3d_description(_UNIT3D_DESC, "https://aither.cc/torrents/download/1")
+
+    assert desc == "[center][b]Release Notes[/b][/center]\nSee the other torrent on aither\n\n\n\n\n\n\n[spoiler=Screens][/spoiler]"
+    assert images == [_image("https://ptpimg.me/up.png"), _image("https://ptpimg.me/standalone.png"), _image("https://ptpimg.me/spaced.png")]
+
+
+def test_clean_unit3d_description_only_images() -> None:
+    desc, images = BBCODE().clean_unit3d_description(
+        "[center][url=https://imgbox.com/x][img]https://images2.imgbox.com/x_o.png[/img][/url][/center]\n[spoiler][/spoiler]\n", "https://blutopia.cc"
+    )
+
+    assert desc == ""
+    assert images == [_image("https://images2.imgbox.com/x_o.png", "https://imgbox.com/x")]
+
+
+def test_clean_unit3d_description_nested_centers() -> None:
+    site = "https://aither.cc"
+
+    # Nested [center] blocks are tidied up to the first [/center], as the string cleanup did
+    assert BBCODE().clean_unit3d_description("[center][center][img=350]x[/img][/center] b \n[/center]", site)[0] == "[center] b \n[/center]"
+    assert BBCODE().clean_unit3d_description("a\n[center] [b][center] c [/center][/b] d [/center]\n[center]  [/center]e", site)[0] == "a\n[center][b][center]c[/center][/b] d [/center]\ne"
+    # Whitespace left around a removed image is trimmed with the rest of the block
+    assert BBCODE().clean_unit3d_description("[center] b [img=350]https://x/y.png[/img]\n[/center]", site)[0] == "[center]b[/center]"
+
+
+def test_clean_ptp_description_keeps_first_image_before_comparison() -> None:
+    desc = "Intro text\nhttps://ptpimg.me/intro.png\n[comparison=Source, Encode]\nhttps://ptpimg.me/s1.png https://ptpimg.me/e1.png\n[/comparison]\ntrailing text https://ptpimg.me/after.png\n"
+
+    assert BBCODE().clean_ptp_description(desc, "") == ("Intro text", [_image("https://ptpimg.me/intro.png")])
+
+
+def test_clean_bhd_description() -> None:
+    desc = "[size=3]FraMeSToR[/size] notes <here>\n[img]https://example.com/a.png[/img]\nhttps://example.com/loose.png\n[URL=https://example.com/linked.jpg][/URL]\nMore text"
+
+    cleaned, images = BBCODE().clean_bhd_description(desc, {"flux": True})
+
+    assert cleaned == "[code]FraMeSToR notes /here>\n\nMore text[/code]"
+    assert images == [_image("https://example.com/loose.png"), _image("https://example.com/linked.jpg")]
+
+
+def test_convert_comparison_to_collapse() -> None:
+    desc = "[comparison=Source, Encode]https://x/s1.png, https://x/e1.png https://x/s2.png https://x/e2.png[/comparison]"
+
+    assert BBCODE().convert_comparison_to_collapse(desc, 1000) == (
+        "[spoiler=Source vs Encode][center]Source | Encode[/center]\n"
+        "[url=https://x/s1.png][img=350]https://x/s1.png[/img][/url][url=https://x/e1.png][img=350]https://x/e1.png[/img][/url]\n"
+        "[url=https://x/s2.png][img=350]https://x/s2.png[/img][/url][url=https://x/e2.png][img=350]https://x/e2.png[/img][/url][/spoiler]"
+    )
+
+
+def test_deeply_nested_input_does_not_hit_the_recursion_limit() -> None:
+    nested = "[quote]" * 1500 + "text [img]https://ptpimg.me/deep.png[/img]" + "[/quote]" * 1500
+
+    assert render(transform(parse(nested))) == nested
+    desc, images = BBCODE().clean_unit3d_description(nested, "https://aither.cc")
+    assert desc == "[quote]" * 1500 + "text " + "[/quote]" * 1500
+    assert images == [_image("https://ptpimg.me/deep.png")]
@@ -0,0 +1,166 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Golden tests for the description cleaners and converters in src/bbcode.py.
+
+The fixtures in tests/data/bbcode are descriptions as the sites serve them, plus malformed
+markup (unclosed, stray and misnested tags). golden.json holds what the string-based cleaners
+returned for them before they moved to the tag tree (scripts/capture_bbcode_golden.py --rev
+699c134^), except for the cases the tree changed on purpose: tags that never close are left
+alone instead of being matched up to an unrelated closing tag further on, and the HDB and PTP
+cleaners no longer leave stray closing tags or cut "img."/"t." out of unrelated links.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.bbcode import (
+    BBCODE,
+    CODE_TO_PRE,
+    CODE_TO_QUOTE,
+    HIDE_TO_SPOILER,
+    NAMED_SPOILER_TO_NAMED_HIDE,
+    NAMED_SPOILER_TO_NORMAL_SPOILER,
+    PRE_TO_CODE,
+    REMOVE_HIDE,
+    REMOVE_IMG_RESIZE,
+    REMOVE_LIST,
+    REMOVE_SPOILER,
+    REMOVE_SUB,
+    REMOVE_SUP,
+    SPOILER_TO_CODE,
+    SPOILER_TO_HIDE,
+    TO_ALIGN,
+    Conversion,
+    comparison_to_centered,
+    comparison_to_collapse,
+)
+
+DATA_DIR = Path(__file__).resolve().parent / "data" / "bbcode"
+GOLDEN_PATH = DATA_DIR / "golden.json"
+
+_PTP_FIXTURES = ("ptp_encode.txt", "ptp_bdmv.txt", "ptp_malformed.txt")
+_UNIT3D_FIXTURES = {"unit3d_aither.txt": "https://aither.cc/torrents/download/12345", "unit3d_malformed.txt": "https://blutopia.cc/torrents/download/1"}
+_HDB_FIXTURES = ("hdb_encode.txt", "hdb_malformed.txt")
+_BHD_FIXTURES = ("bhd_framestor.txt", "bhd_malformed.txt")
+_CONVERTER_FIXTURES = ("ua_description.txt", "converters_malformed.txt", "ptp_encode.txt", "unit3d_malformed.txt")
+
+# Single converters, with their extra arguments
+CONVERTERS: dict[str, tuple[Any, ...]] = {
+    "convert_pre_to_code": (),
+    "convert_code_to_pre": (),
+    "convert_hide_to_spoiler": (),
+    "convert_spoiler_to_hide": (),
+    "remove_hide": (),
+    "convert_named_spoiler_to_named_hide": (),
+    "remove_spoiler": (),
+    "convert_named_spoiler_to_normal_spoiler": (),
+    "convert_spoiler_to_code": (),
+    "convert_code_to_quote": (),
+    "remove_img_resize": (),
+    "remove_extra_lines": (),
+    "convert_to_align": (),
+    "remove_sup": (),
+    "remove_sub": (),
+    "remove_list": (),
+    "convert_comparison_to_collapse": (1000,),
+    "convert_comparison_to_centered": (1000,),
+}
+
+# Runs of converter calls the trackers make back to back
+CHAINS: dict[str, tuple[tuple[Any, ...], ...]] = {
+    "ANT": (("convert_to_align",), ("remove_img_resize",), ("remove_sup",), ("remove_sub",), ("remove_list",)),
+    "OE": (("convert_pre_to_code",), ("convert_hide_to_spoiler",), ("convert_comparison_to_collapse", 1000)),
+    "TL": (("remove_list",), ("convert_comparison_to_centered", 1000), ("remove_spoiler",)),
+    "PTER": (("convert_code_to_quote",), ("convert_spoiler_to_hide",), ("convert_comparison_to_centered", 1000)),
+    "HDS": (("remove_hide",), ("remove_img_resize",), ("convert_comparison_to_centered", 1000), ("remove_spoiler",)),
+    "SPD": (("remove_img_resize",), ("convert_named_spoiler_to_normal_spoiler",)),
+    "HDB": (("convert_spoiler_to_hide",), ("convert_comparison_to_centered", 1000)),
+    "BJS": (("convert_named_spoiler_to_named_hide",), ("convert_spoiler_to_hide",), ("remove_img_resize",), ("convert_to_align",), ("remove_list",)),
+    "THR": (("convert_named_spoiler_to_named_hide",), ("convert_spoiler_to_hide",), ("convert_code_to_pre",)),
+    "BT": (("remove_img_resize",), ("remove_list",)),
+    "FL": (("remove_spoiler",), ("convert_code_to_quote",), ("convert_comparison_to_centered", 900)),
+    "HDT": (("convert_spoiler_to_hide",), ("remove_img_resize",), ("convert_comparison_to_centered", 1000), ("remove_spoiler",), ("remove_list",)),
+}
+
+# The converters as conversions for BBCODE.convert; the comparison ones take the converter's arguments
+_CONVERSIONS: dict[str, Any] = {
+    "convert_pre_to_code": PRE_TO_CODE,
+    "convert_code_to_pre": CODE_TO_PRE,
+    "convert_hide_to_spoiler": HIDE_TO_SPOILER,
+    "convert_spoiler_to_hide": SPOILER_TO_HIDE,
+    "remove_hide": REMOVE_HIDE,
+    "convert_named_spoiler_to_named_hide": NAMED_SPOILER_TO_NAMED_HIDE,
+    "remove_spoiler": REMOVE_SPOILER,
+    "convert_named_spoiler_to_normal_spoiler": NAMED_SPOILER_TO_NORMAL_SPOILER,
+    "convert_spoiler_to_code": SPOILER_TO_CODE,
+    "convert_code_to_quote": CODE_TO_QUOTE,
+    "remove_img_resize": REMOVE_IMG_RESIZE,
+    "convert_to_align": TO_ALIGN,
+    "remove_sup": REMOVE_SUP,
+    "remove_sub": REMOVE_SUB,
+    "remove_list": REMOVE_LIST,
+    "convert_comparison_to_collapse": comparison_to_collapse,
+    "convert_comparison_to_centered": comparison_to_centered,
+}
+
+
+def as_conversion(method: str, *args: Any) -> Conversion:
+    conversion = _CONVERSIONS[method]
+    return conversion(*args) if args else conversion
+
+
+def read_fixture(name: str) -> str:
+    return (DATA_DIR / name).read_text(encoding="utf-8")
+
+
+def golden_outputs(bbcode: Any) -> dict[str, Any]:
+    """Run every fixture through ``bbcode`` (a BBCODE instance, old or new) and key the results by case."""
+    outputs: dict[str, Any] = {}
+    for name in _PTP_FIXTURES:
+        for is_disc in ("", "BDMV", "DVD"):
+            outputs[f"ptp:{name}:{is_disc}"] = bbcode.clean_ptp_description(read_fixture(name), is_disc)
+    for name, site in _UNIT3D_FIXTURES.items():
+        outputs[f"unit3d:{name}"] = bbcode.clean_unit3d_description(read_fixture(name), site)
+    for name in _HDB_FIXTURES:
+        outputs[f"hdb:{name}"] = bbcode.clean_hdb_description(read_fixture(name))
+    for name in _BHD_FIXTURES:
+        for flux in (True, False):
+            outputs[f"bhd:{name}:{flux}"] = bbcode.clean_bhd_description(read_fixture(name), {"flux": flux})
+    for name in _CONVERTER_FIXTURES:
+        for method, args in CONVERTERS.items():
+            outputs[f"convert:{name}:{method}"] = getattr(bbcode, method)(read_fixture(name), *args)
+        for tracker, chain in CHAINS.items():
+            desc = read_fixture(name)
+            for method, *args in chain:
+                desc = getattr(bbcode, method)(desc, *args)
+            outputs[f"chain:{name}:{tracker}"] = desc
+    # JSON has no tuples: compare in the form golden.json stores
+    return json.loads(json.dumps(outputs))
+
+
+_GOLDEN: dict[str, Any] = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def outputs() -> dict[str, Any]:
+    return golden_outputs(BBCODE())
+
+
+def test_golden_covers_every_case(outputs: dict[str, Any]) -> None:
+    assert sorted(outputs) == sorted(_GOLDEN)
+
+
+@pytest.mark.parametrize("case", sorted(_GOLDEN))
+def test_output_matches_golden(outputs: dict[str, Any], case: str) -> None:
+    assert outputs[case] == _GOLDEN[case]
+
+
+@pytest.mark.parametrize("tracker", sorted(CHAINS))
+def test_chain_in_one_convert_matches_golden(tracker: str) -> None:
+    conversions = [as_conversion(method, *args) for method, *args in CHAINS[tracker]]
+    for name in _CONVERTER_FIXTURES:
+        assert BBCODE().convert(read_fixture(name), *conversions) == _GOLDEN[f"chain:{name}:{tracker}"]
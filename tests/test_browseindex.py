@@ -0,0 +1,113 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the web UI browse index and directory listing cache in web_ui/browseindex.py."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import web_ui.browseindex as browseindex
+from web_ui.browseindex import BrowseIndex, Entry, list_directory
+
+VIDEO = {".mkv", ".mp4", ".ts"}
+
+
+def _tree(root: Path) -> None:
+    for rel in (
+        "Movies/The.Movie.2020.1080p.BluRay/The.Movie.2020.1080p.BluRay.mkv",
+        "Movies/The.Movie.2020.1080p.BluRay/The.Movie.2020.nfo",
+        "Movies/Movie.The.2019/movie.the.2019.mp4",
+        "TV/Show.S01/Show.S01E01.1080p.mkv",
+        "TV/Show.S01/Show.S01E02.1080p.mkv",
+        "TV/.hidden/The.Movie.2020.mkv",
+    ):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+
+
+def _age(root: Path) -> None:
+    # Older than the racy-mtime window, so unchanged directories are not listed again
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, ns=(1_000_000_000, 1_000_000_000))
+
+
+def _indexed(root: Path) -> BrowseIndex:
+    index = BrowseIndex([str(root)])
+    index.refresh()
+    index.ready.set()
+    return index
+
+
+def _names(matches: list[tuple[str, Entry]]) -> list[str]:
+    return [entry.name for _, entry in matches]
+
+
+@pytest.mark.parametrize("query", ["the movie", "movie the", "1080p", "s01e02", "show 1080p", "nothing"])
+def test_index_answers_like_a_walk(tmp_path: Path, query: str) -> None:
+    _tree(tmp_path)
+    indexed = _indexed(tmp_path).search(query, VIDEO, 100, allow=lambda _: True)
+    walked = BrowseIndex([str(tmp_path)]).search(query, VIDEO, 100, allow=lambda _: True)
+
+    assert indexed == walked
+    assert all(not name.startswith(".") and name != "The.Movie.2020.nfo" for name in _names(indexed))
+
+
+def test_search_order_limit_and_links(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    outside = tmp_path.parent / f"{tmp_path.name}-outside"
+    outside.mkdir()
+    (tmp_path / "Show.S01.link.mkv").symlink_to(outside)
+    index = _indexed(tmp_path)
+
+    assert _names(index.search("show", VIDEO, 100, allow=lambda _: True)) == ["Show.S01", "Show.S01.link.mkv", "Show.S01E01.1080p.mkv", "Show.S01E02.1080p.mkv"]
+    assert _names(index.search("show", VIDEO, 2, allow=lambda path: not path.endswith(".link.mkv"))) == ["Show.S01", "Show.S01E01.1080p.mkv"]
+
+
+def test_rescan_lists_only_changed_directories(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _tree(tmp_path)
+    _age(tmp_path)
+    index = _indexed(tmp_path)
+    entries = len(index)
+
+    scanned: list[str] = []
+    scan = browseindex._scan
+
+    def counting_scan(path: str) -> Any:
+        scanned.append(os.path.relpath(path, tmp_path))
+        return scan(path)
+
+    monkeypatch.setattr(browseindex, "_scan", counting_scan)
+    index.refresh()
+    assert scanned == []
+    assert len(index) == entries
+
+    (tmp_path / "TV" / "Show.S01" / "Show.S01E03.1080p.mkv").write_bytes(b"")
+    for path in (tmp_path / "Movies" / "Movie.The.2019").iterdir():
+        path.unlink()
+    (tmp_path / "Movies" / "Movie.The.2019").rmdir()
+    index.refresh()
+
+    assert sorted(scanned) == ["Movies", os.path.join("TV", "Show.S01")]
+    assert _names(index.search("s01e03", VIDEO, 100, allow=lambda _: True)) == ["Show.S01E03.1080p.mkv"]
+    assert index.search("2019", VIDEO, 100, allow=lambda _: True) == []
+    assert len(index) == entries - 1
+
+
+def test_listing_is_cached_until_the_directory_changes(tmp_path: Path) -> None:
+    (tmp_path / "b.mkv").write_bytes(b"")
+    (tmp_path / "a").mkdir()
+    (tmp_path / ".hidden").write_bytes(b"")
+    _age(tmp_path)
+
+    first = list_directory(str(tmp_path))
+    assert first == [Entry("a", True, False), Entry("b.mkv", False, False)]
+    assert list_directory(str(tmp_path)) is first
+
+    (tmp_path / "a" / "c.mkv").write_bytes(b"")
+    assert list_directory(str(tmp_path)) is first
+    (tmp_path / "c.mkv").symlink_to(tmp_path / "b.mkv")
+    assert list_directory(str(tmp_path))[-1] == Entry("c.mkv", False, True)
@@ -0,0 +1,97 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the upload stage checkpoints in src/checkpoints.py."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src import exportmi
+from src.checkpoints import MEDIAINFO, SCREENSHOTS, UploadCheckpoints
+
+
+@pytest.fixture(autouse=True)
+def _isolate_checkpoints(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(UploadCheckpoints, "_instances", {})
+
+
+@pytest.fixture
+def meta(tmp_path: Path) -> dict[str, Any]:
+    source = tmp_path / "Movie.2020.1080p.mkv"
+    source.write_bytes(b"video")
+    (tmp_path / "tmp" / "Movie").mkdir(parents=True)
+    return {"base_dir": str(tmp_path), "uuid": "Movie", "path": str(source)}
+
+
+def _reload(meta: dict[str, Any], config: Any = None) -> UploadCheckpoints:
+    UploadCheckpoints.discard(meta)
+    return UploadCheckpoints.for_meta(meta, config)
+
+
+def test_stage_is_reused_while_inputs_and_files_match(meta: dict[str, Any]) -> None:
+    screenshot = os.path.join(meta["base_dir"], "tmp", "Movie", "Movie-0.png")
+    Path(screenshot).write_bytes(b"png")
+    UploadCheckpoints.for_meta(meta).put(SCREENSHOTS, {"screens": 1}, {"count": 1}, files=[screenshot])
+
+    checkpoints = _reload(meta)
+    assert checkpoints.get(SCREENSHOTS, {"screens": 1}) == {"count": 1}
+    assert checkpoints.get(SCREENSHOTS, {"screens": 2}) is None
+    assert checkpoints.get(MEDIAINFO, {"screens": 1}) is None
+
+    Path(screenshot).write_bytes(b"changed png")
+    assert checkpoints.get(SCREENSHOTS, {"screens": 1}) is None
+    assert _reload(meta, {"DEFAULT": {"resume_uploads": False}}).get(SCREENSHOTS, {"screens": 1}) is None
+
+
+def test_trackers_are_remembered_until_the_source_changes(meta: dict[str, Any]) -> None:
+    screenshot = os.path.join(meta["base_dir"], "tmp", "Movie", "Movie-0.png")
+    Path(screenshot).write_bytes(b"png")
+    checkpoints = UploadCheckpoints.for_meta(meta)
+    checkpoints.put(SCREENSHOTS, {"screens": 1}, files=[screenshot, __file__])
+    checkpoints.record_tracker("BLU", True, {"torrent_id": 12})
+    checkpoints.record_tracker("AITHER", False, {"status_message": "data error"})
+
+    assert _reload(meta).uploaded_trackers() == {"BLU"}
+    with open(os.path.join(meta["base_dir"], "tmp", "Movie", "checkpoints.json"), encoding="utf-8") as f:
+        assert json.load(f)["trackers"]["BLU"]["torrent_id"] == 12
+
+    with open(meta["path"], "ab") as f:
+        f.write(b" re-encoded")
+    changed = _reload(meta)
+
+    assert changed.source_changed
+    assert changed.uploaded_trackers() == set()
+    assert changed.get(SCREENSHOTS, {"screens": 1}) is None
+    # Only files in the upload's own tmp folder are offered for removal
+    assert changed.stale_files(SCREENSHOTS) == [screenshot]
+
+
+def test_mediainfo_export_is_reused(meta: dict[str, Any], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(meta["base_dir"])
+    parsed: list[str] = []
+
+    def parse(video: str, output: str = "", full: bool = True) -> str:
+        _ = full
+        parsed.append(output)
+        if output == "JSON":
+            return json.dumps({"creatingLibrary": {"name": "MediaInfoLib"}, "media": {"@ref": video, "track": []}})
+        return f"General\nComplete name : {video}\n"
+
+    monkeypatch.setattr(exportmi.MediaInfo, "parse", parse)
+
+    def export() -> dict[str, Any]:
+        return asyncio.run(exportmi.exportInfo(meta["path"], False, "Movie", meta["base_dir"], checkpoints=_reload(meta)))
+
+    first = export()
+    second = export()
+
+    assert first == second
+    assert parsed == ["STRING", "JSON"]
+    Path(meta["base_dir"], "tmp", "Movie", "MEDIAINFO.txt").write_text("edited", encoding="utf-8")
+    export()
+    assert parsed == ["STRING", "JSON"] * 2
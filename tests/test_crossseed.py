@@ -0,0 +1,133 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the cross-seed search and injection engine in src/crossseed.py."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from src import crossseed
+from src.crossseed import CrossSeedEngine, CrossSeedMisses, content_fingerprint
+from src.torrenttemplate import bencode
+
+
+def _config(**default: Any) -> dict[str, Any]:
+    return {"DEFAULT": default, "TRACKERS": {}}
+
+
+def _torrent(path: Path, name: str) -> str:
+    path.write_bytes(bencode({"announce": "https://tracker/announce", "info": {"name": name, "length": 1, "piece length": 16384, "pieces": b"\0" * 20}}))
+    return str(path)
+
+
+def test_matches_are_added_while_searches_run_and_deduped(tmp_path: Path) -> None:
+    events: list[str] = []
+    slow_search_done = asyncio.Event()
+    # AAA and BBB serve the same torrent, CCC has nothing
+    torrents = {"AAA": _torrent(tmp_path / "a.torrent", "movie"), "BBB": _torrent(tmp_path / "b.torrent", "movie"), "DDD": _torrent(tmp_path / "d.torrent", "other")}
+
+    async def search(tracker: str) -> bool:
+        if tracker == "CCC":
+            # The slowest search: matches found earlier must not wait for it
+            await asyncio.sleep(0.2)
+            slow_search_done.set()
+            return False
+        await asyncio.sleep(0.01)
+        return True
+
+    async def download(tracker: str) -> Optional[str]:
+        return torrents.get(tracker)
+
+    async def add(tracker: str) -> None:
+        events.append(f"{tracker} added{' after' if slow_search_done.is_set() else ' before'} slow search")
+
+    engine = CrossSeedEngine(_config())
+    outcomes = asyncio.run(engine.run(["AAA", "CCC"], ["DDD", "EEE"], search, download, add))
+
+    assert outcomes == {"DDD": "added", "EEE": "no torrent", "AAA": "added", "CCC": "no match"}
+    assert events == ["DDD added before slow search", "AAA added before slow search"]
+
+    outcomes = asyncio.run(CrossSeedEngine(_config()).run(["AAA", "BBB"], [], search, download, add))
+    assert sorted(outcomes.values()) == ["added", "duplicate"]
+
+
+def test_misses_are_skipped_until_they_expire(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    media = tmp_path / "Movie.2020.1080p.mkv"
+    media.write_bytes(b"x" * 10)
+    fingerprint = content_fingerprint({"path": str(media), "filelist": [str(media)]})
+    assert fingerprint is not None and fingerprint != content_fingerprint({"path": str(tmp_path)})
+    searched: list[str] = []
+
+    async def search(tracker: str) -> bool:
+        searched.append(tracker)
+        return False
+
+    async def download(tracker: str) -> Optional[str]:
+        return None
+
+    async def add(tracker: str) -> None:
+        return None
+
+    def run(**default: Any) -> dict[str, str]:
+        misses = CrossSeedMisses(str(tmp_path))
+        engine = CrossSeedEngine(_config(**default), misses, fingerprint)
+        return asyncio.run(engine.run(engine.needs_search(["AAA", "BBB"]), [], search, download, add))
+
+    assert run() == {"AAA": "no match", "BBB": "no match"}
+    assert run() == {"AAA": "recent miss", "BBB": "recent miss"}
+    assert run(cross_seed_miss_ttl=0) == {"AAA": "no match", "BBB": "no match"}
+    now = crossseed.time.time()
+    monkeypatch.setattr(crossseed.time, "time", lambda: now + 3601)
+    assert run() == {"AAA": "no match", "BBB": "no match"}
+    assert searched == ["AAA", "BBB"] * 3
+
+
+def test_search_concurrency_is_bounded() -> None:
+    running: list[int] = [0, 0]
+
+    async def search(tracker: str) -> bool:
+        running[0] += 1
+        running[1] = max(running[1], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        # A failing search only fails its own tracker
+        if tracker == "T3":
+            raise RuntimeError("site down")
+        return False
+
+    async def download(tracker: str) -> Optional[str]:
+        return None
+
+    async def add(tracker: str) -> None:
+        return None
+
+    engine = CrossSeedEngine(_config(cross_seed_search_concurrency=2))
+    outcomes = asyncio.run(engine.run([f"T{i}" for i in range(6)], [], search, download, add))
+    assert running[1] == 2
+    assert outcomes["T3"] == "failed" and list(outcomes.values()).count("no match") == 5
+
+
+def test_searches_that_did_not_complete_are_not_recorded_as_misses(tmp_path: Path) -> None:
+    searched: list[str] = []
+
+    async def search(tracker: str) -> Optional[bool]:
+        searched.append(tracker)
+        # BBB's site timed out: search_existing() swallowed the error and returned no dupes
+        return None if tracker == "BBB" else False
+
+    async def download(tracker: str) -> Optional[str]:
+        return None
+
+    async def add(tracker: str) -> None:
+        return None
+
+    def run() -> dict[str, str]:
+        engine = CrossSeedEngine(_config(), CrossSeedMisses(str(tmp_path)), "content")
+        return asyncio.run(engine.run(engine.needs_search(["AAA", "BBB"]), [], search, download, add))
+
+    assert run() == {"AAA": "no match", "BBB": "failed"}
+    assert run() == {"AAA": "recent miss", "BBB": "failed"}
+    assert searched == ["AAA", "BBB", "BBB"]
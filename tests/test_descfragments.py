@@ -0,0 +1,131 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the per-upload description fragment cache in src/descfragments.py."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import aiofiles
+import pytest
+
+from src.descfragments import DescriptionFragments
+from src.get_desc import DescriptionBuilder
+from src.languages import languages_manager
+
+_TRACKERS = [f"T{index}" for index in range(15)]
+
+_MEDIAINFO = """General
+Complete name                            : Movie.mkv
+
+Audio
+Format                                   : DTS
+Language                                 : English
+"""
+
+
+@pytest.fixture(autouse=True)
+def _isolate_fragments(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(DescriptionFragments, "_instances", OrderedDict())
+
+
+@pytest.fixture
+def meta(tmp_path: Path) -> dict[str, Any]:
+    tmp_dir = tmp_path / "tmp" / "Movie"
+    tmp_dir.mkdir(parents=True)
+    (tmp_dir / "MEDIAINFO.txt").write_text(_MEDIAINFO, encoding="utf-8")
+    (tmp_dir / "MEDIAINFO_CLEANPATH.txt").write_text(_MEDIAINFO, encoding="utf-8")
+    return {"base_dir": str(tmp_path), "uuid": "Movie", "is_disc": "", "filelist": [str(tmp_path / "Movie.mkv")]}
+
+
+def _count_opens(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    opened: list[str] = []
+    real_open = aiofiles.open
+
+    def counting_open(path: Any, *args: Any, **kwargs: Any) -> Any:
+        opened.append(os.path.basename(str(path)))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(aiofiles, "open", counting_open)
+    return opened
+
+
+def test_trackers_share_one_mediainfo_read(meta: dict[str, Any], monkeypatch: pytest.MonkeyPatch) -> None:
+    config: dict[str, Any] = {"DEFAULT": {"full_mediainfo": True}, "TRACKERS": {tracker: {} for tracker in _TRACKERS}}
+    opened = _count_opens(monkeypatch)
+
+    async def run() -> list[str]:
+        builders = [DescriptionBuilder(tracker, config) for tracker in _TRACKERS]
+        return await asyncio.gather(*[builder.get_mediainfo_section(meta) for builder in builders])
+
+    sections = asyncio.run(run())
+
+    assert sections == [_MEDIAINFO] * len(_TRACKERS)
+    assert opened == ["MEDIAINFO_CLEANPATH.txt"]
+    assert DescriptionFragments.for_meta(meta).stats() == {"MEDIAINFO_CLEANPATH.txt": (14, 1)}
+
+
+def test_parsed_mediainfo_reads_file_once(meta: dict[str, Any], monkeypatch: pytest.MonkeyPatch) -> None:
+    opened = _count_opens(monkeypatch)
+
+    async def run() -> list[dict[str, Any]]:
+        return [await languages_manager.parsed_mediainfo(meta) for _ in range(3)]
+
+    parsed = asyncio.run(run())
+
+    assert parsed[0]["audio"] == [{"format": "DTS", "language": "English"}]
+    # Parsed once and shared, until the file changes
+    assert parsed[0] is parsed[2]
+    assert opened == ["MEDIAINFO.txt"]
+    assert DescriptionFragments.for_meta(meta).stats() == {"MEDIAINFO.txt": (0, 1), "parsed MEDIAINFO.txt": (2, 1)}
+
+    path = os.path.join(meta["base_dir"], "tmp", "Movie", "MEDIAINFO.txt")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("\nText\nLanguage                                 : French\n")
+    reparsed = asyncio.run(languages_manager.parsed_mediainfo(meta))
+    assert reparsed["text"] == [{"language": "French"}] and parsed[0]["text"] == []
+
+
+def test_rewritten_file_is_read_again(meta: dict[str, Any]) -> None:
+    fragments = DescriptionFragments.for_meta(meta)
+    path = os.path.join(meta["base_dir"], "tmp", "Movie", "MEDIAINFO.txt")
+
+    first = asyncio.run(fragments.read_tmp_file("MEDIAINFO.txt"))
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("Menu\n")
+    second = asyncio.run(fragments.read_tmp_file("MEDIAINFO.txt"))
+
+    assert first == _MEDIAINFO
+    assert second == _MEDIAINFO + "Menu\n"
+    assert fragments.stats() == {"MEDIAINFO.txt": (0, 2)}
+
+
+def test_missing_file_raises_like_open(meta: dict[str, Any]) -> None:
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(DescriptionFragments.for_meta(meta).read_tmp_file("BD_SUMMARY_00.txt"))
+
+
+def test_fragments_are_built_once_per_inputs(meta: dict[str, Any]) -> None:
+    fragments = DescriptionFragments.for_meta(meta)
+    builds: list[str] = []
+
+    def builder(value: str) -> Any:
+        async def build() -> str:
+            builds.append(value)
+            await asyncio.sleep(0)
+            return value.upper()
+
+        return build
+
+    async def run() -> list[str]:
+        return await asyncio.gather(*[fragments.get("pack file mediainfo", name, builder(name)) for name in ("a", "b", "a", "a")])
+
+    assert asyncio.run(run()) == ["A", "B", "A", "A"]
+    assert builds == ["a", "b"]
+    assert fragments.stats() == {"pack file mediainfo": (2, 2)}
+    assert DescriptionFragments.for_meta(dict(meta)) is fragments
+    DescriptionFragments.discard(meta)
+    assert DescriptionFragments.for_meta(meta) is not fragments
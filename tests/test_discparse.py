@@ -0,0 +1,129 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for DVD MediaInfo extraction and BDInfo scan scheduling in src/discparse.py."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src import discparse
+from src.discparse import DiscParse
+
+
+def _make_video_ts(root: Path, name: str, durations: dict[str, str]) -> Path:
+    video_ts = root / name / "VIDEO_TS"
+    video_ts.mkdir(parents=True)
+    (video_ts / "VIDEO_TS.IFO").write_bytes(b"ifo")
+    for vts in durations:
+        (video_ts / f"VTS_{vts}_0.IFO").write_bytes(b"ifo" + vts.encode())
+        (video_ts / f"VTS_{vts}_1.VOB").write_bytes(b"vob")
+    return video_ts
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    discparse._dvd_info_cache.clear()
+
+
+def _fake_runner(durations: dict[str, str], calls: list[tuple[str, str]]) -> Any:
+    async def _run(self: DiscParse, binary: Any, path: str, filename: str, semaphore: asyncio.Semaphore, label: str, json_output: bool = False) -> str:
+        async with semaphore:
+            calls.append((path, filename))
+            if json_output:
+                return json.dumps({"media": {"track": [{}, {"Duration": durations[filename[4:6]]}]}})
+            return f"Complete name : {filename}\n"
+
+    return _run
+
+
+class TestGetDvdInfo:
+    def test_selects_longest_set_without_changing_cwd(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        durations = {"01": "120.5", "02": "5400.0", "03": "300"}
+        video_ts = _make_video_ts(tmp_path, "DISC1", durations)
+        calls: list[tuple[str, str]] = []
+        monkeypatch.setattr(DiscParse, "_run_dvd_mediainfo", _fake_runner(durations, calls))
+
+        cwd = os.getcwd()
+        discs = [{"path": str(video_ts), "name": "DISC1", "type": "DVD"}]
+        asyncio.run(DiscParse({"DEFAULT": {}}).get_dvdinfo(discs))
+
+        assert os.getcwd() == cwd
+        assert discs[0]["main_set"] == ["02_1.VOB"]
+        assert discs[0]["vob"] == f"{video_ts}/VTS_02_1.VOB"
+        assert discs[0]["vob_mi"] == "Complete name : VTS_02_1.VOB\n"
+        assert discs[0]["ifo_mi_full"] == "Complete name : VTS_02_0.IFO\n"
+        assert discs[0]["size"] == "DVD5"
+        assert len(calls) == 5
+
+    def test_multiple_discs_and_cache_reuse(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        durations = {"01": "1000", "02": "1050"}
+        paths = [_make_video_ts(tmp_path, f"DISC{i}", durations) for i in range(3)]
+        calls: list[tuple[str, str]] = []
+        monkeypatch.setattr(DiscParse, "_run_dvd_mediainfo", _fake_runner(durations, calls))
+
+        parser = DiscParse({"DEFAULT": {"process_limit": "2"}})
+        discs = [{"path": str(p), "name": p.parent.name, "type": "DVD"} for p in paths]
+        asyncio.run(parser.get_dvdinfo(discs))
+        # Within 10% of the first set, so the first set stays the main set
+        assert all(d["main_set"] == ["01_1.VOB"] for d in discs)
+        assert len(calls) == 12
+
+        again = [{"path": str(p), "name": p.parent.name, "type": "DVD"} for p in paths]
+        asyncio.run(parser.get_dvdinfo(again))
+        assert len(calls) == 12
+        assert [d["vob_mi"] for d in again] == [d["vob_mi"] for d in discs]
+
+    def test_cache_invalidated_when_ifo_changes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        durations = {"01": "1000"}
+        video_ts = _make_video_ts(tmp_path, "DISC", durations)
+        calls: list[tuple[str, str]] = []
+        monkeypatch.setattr(DiscParse, "_run_dvd_mediainfo", _fake_runner(durations, calls))
+
+        parser = DiscParse({"DEFAULT": {}})
+        asyncio.run(parser.get_dvdinfo([{"path": str(video_ts)}]))
+        (video_ts / "VTS_01_0.IFO").write_bytes(b"changed ifo contents")
+        asyncio.run(parser.get_dvdinfo([{"path": str(video_ts)}]))
+        assert len(calls) == 6
+
+
+class TestBdinfoScanScheduler:
+    def test_scans_write_to_own_reports(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        import sys
+
+        save_dir = tmp_path / "tmp"
+        save_dir.mkdir()
+        script = tmp_path / "fake_bdinfo.py"
+        script.write_text("import sys, pathlib\npathlib.Path(sys.argv[3], 'BDINFO.' + sys.argv[2] + '.txt').write_text(sys.argv[1])\n")
+
+        def _command(base_dir: str, path: str, playlist_file: str, output_dir: str) -> list[str]:
+            return [sys.executable, str(script), path, playlist_file, output_dir]
+
+        monkeypatch.setattr(DiscParse, "_get_bdinfo_command", staticmethod(_command))
+        scans: list[dict[str, Any]] = []
+        for i in range(3):
+            disc = tmp_path / f"DISC{i}" / "BDMV"
+            disc.mkdir(parents=True)
+            scans.append(
+                {
+                    "disc_index": i,
+                    "disc_name": f"Disc{i + 1}",
+                    "idx": 0,
+                    "path": str(disc),
+                    "playlist": {"file": "00800.mpls", "duration": 5400.0},
+                    "playlist_number": "00800",
+                    "report_path": str(save_dir / f"Disc{i + 1}_00800_FULL.txt"),
+                    "report": None,
+                }
+            )
+
+        asyncio.run(DiscParse({"DEFAULT": {}})._scan_bdinfo_playlists(scans, str(tmp_path), str(save_dir)))
+
+        for scan in scans:
+            assert scan["report"] == scan["report_path"]
+            assert Path(scan["report_path"]).read_text() == scan["path"]
+        assert sorted(p.name for p in save_dir.iterdir()) == ["Disc1_00800_FULL.txt", "Disc2_00800_FULL.txt", "Disc3_00800_FULL.txt"]
@@ -0,0 +1,91 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for screenshot frame prescanning in src/frameprescan.py and src/takescreens.py."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+from typing import Any, Optional
+
+import pytest
+
+import src.takescreens as takescreens
+from src import frameprescan
+from src.frameprescan import PROBE_HEIGHT, PROBE_WIDTH, choose_frames, frame_score
+
+SIZE = PROBE_WIDTH * PROBE_HEIGHT
+
+
+def _flat(value: int) -> bytes:
+    return bytes([value]) * SIZE
+
+
+def _detailed(seed: int, low: int = 30, high: int = 220) -> bytes:
+    rng = random.Random(seed)  # nosec B311 - test data
+    return bytes(rng.randint(low, high) for _ in range(SIZE))
+
+
+def test_black_white_and_flat_frames_are_rejected() -> None:
+    assert frame_score(_flat(2)) is None
+    assert frame_score(_flat(250)) is None
+    # Mid-grey with a little noise: a fade or title card
+    assert frame_score(_detailed(1, 120, 123)) is None
+    assert frame_score(b"") is None
+    assert (frame_score(_detailed(1, 30, 220)) or 0) > (frame_score(_detailed(1, 100, 140)) or 0) > 0
+
+
+def test_choose_frames_prefers_detail_and_skips_repeated_shots() -> None:
+    shot = _detailed(7)
+    slots = [
+        [(10.0, _flat(0)), (12.0, shot), (14.0, _detailed(8, 100, 140))],
+        # The most detailed candidate repeats the shot chosen for the first slot
+        [(20.0, shot), (22.0, _detailed(9, 90, 160))],
+        [(30.0, _flat(0)), (32.0, _flat(255))],
+        [],
+    ]
+    assert choose_frames(slots) == [12.0, 22.0, None, None]
+
+
+def test_prescan_moves_screenshots_off_black_frames(monkeypatch: pytest.MonkeyPatch) -> None:
+    probed: list[float] = []
+
+    async def fake_probe(path: str, ss_time: float) -> Optional[tuple[float, bytes]]:
+        probed.append(ss_time)
+        if ss_time >= 300:
+            return None  # ffmpeg failed
+        # Black up to 10 s into each 100 s slot, then a keyframe 1 s before the probe time
+        return ss_time - 1, _flat(0) if ss_time % 100 < 10 else _detailed(int(ss_time))
+
+    monkeypatch.setattr(takescreens, "probe_frame", fake_probe)
+    monkeypatch.setattr(frameprescan, "CANDIDATES_PER_SCREEN", 4)
+    times = asyncio.run(takescreens.prescan_ss_times("/media/movie.mkv", ["100.0", "200.0", "300.0"], 1000.0, {}))
+
+    assert sorted(probed) == [100.0, 125.0, 150.0, 175.0, 200.0, 225.0, 250.0, 275.0, 300.0, 325.0, 350.0, 375.0]
+    # Every probe of the third slot failed, so its planned time stays
+    assert times[0] in {"124.0", "149.0", "174.0"} and times[1] in {"224.0", "249.0", "274.0"} and times[2] == "300.0"
+
+
+def test_timed_out_ffmpeg_is_killed(monkeypatch: pytest.MonkeyPatch) -> None:
+    processes: list[asyncio.subprocess.Process] = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def recording_exec(*args: Any, **kwargs: Any) -> asyncio.subprocess.Process:
+        process = await real_exec(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    class SlowCommand:
+        def compile(self) -> list[str]:
+            return [sys.executable, "-c", "import time; time.sleep(30)"]
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", recording_exec)
+    monkeypatch.setattr(takescreens, "bundled_ffmpeg", lambda: None)
+
+    async def run() -> None:
+        # As probe_frame() and the capture retries wait for ffmpeg
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(takescreens.run_ffmpeg(SlowCommand()), timeout=0.5)
+
+    asyncio.run(run())
+    assert len(processes) == 1 and processes[0].returncode is not None
@@ -0,0 +1,97 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the off-loop HTML scraping helpers in src/htmlscrape.py."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from bs4 import BeautifulSoup, Tag
+
+from src.htmlscrape import Field, extract_rows, has_class, only, parse_html, scrape_rows
+from src.trackers.BJS import _REQUEST_FIELDS, _REQUEST_ROWS
+
+
+def _request_page(rows: int) -> str:
+    body = []
+    for index in range(rows):
+        quality = "" if index % 7 == 3 else f"<b> 1080p {index} </b>"
+        body.append(
+            f"""<tr class="torrent rowa">
+  <td class="cats"><div class="cat_{index % 3}"></div></td>
+  <td><a href="requests.php?action=view&amp;id={index}"> Request &amp; title {index} </a><br>{quality}
+    <div class="tags">tag{index}</div></td>
+  <td>{index} votes</td>
+  <td><table><tr><td>{index}&nbsp;GB</td><td>x</td></tr><tr><td>{index * 2}&nbsp;BP</td></tr></table></td>
+  <td>2 days ago</td>
+</tr>"""
+        )
+    return f"""<!DOCTYPE html><html><head><title>Requests</title></head><body>
+<div id="header"><ul><li><a href="/">Home</a></li></ul></div>
+<table id="torrent_table"><tr class="colhead"><td>Cat</td><td>Name</td><td>Votes</td><td>Bounty</td><td>Age</td></tr>
+{"".join(body)}
+<tr class="torrent"><td colspan="2">No cells</td></tr>
+</table><div id="footer">footer</div></body></html>"""
+
+
+def _bs4_requests(html: str) -> list[dict[str, str]]:
+    # The extraction BJS.get_requests did with BeautifulSoup before it moved to scrape_rows
+    results: list[dict[str, str]] = []
+    for row in BeautifulSoup(html, "html.parser").select("#torrent_table tr.torrent"):
+        all_tds = row.find_all("td")
+        if not all_tds or len(all_tds) < 5:
+            continue
+        link_element = all_tds[1].select_one('a[href*="requests.php?action=view"]')
+        quality_element = all_tds[1].select_one("b")
+        if not isinstance(link_element, Tag) or not isinstance(quality_element, Tag):
+            continue
+        reward = " / ".join(td.text.replace("\xa0", " ").strip() for td in all_tds[3].select("tr > td:first-child"))
+        results.append({"Name": link_element.text.strip(), "Quality": quality_element.text.strip(), "Reward": reward, "Link": str(link_element.get("href"))})
+    return results
+
+
+def _scraped_requests(rows: list[dict[str, Any]]) -> list[dict[str, str]]:
+    return [
+        {"Name": row["name"], "Quality": row["quality"], "Reward": " / ".join(part.replace("\xa0", " ").strip() for part in row["reward"]), "Link": row["link"] or ""}
+        for row in rows
+        if int(row["cells"]) >= 5 and row["name"] is not None and row["quality"] is not None
+    ]
+
+
+def test_bjs_request_fields_match_previous_extraction() -> None:
+    html = _request_page(40)
+
+    scraped = _scraped_requests(asyncio.run(scrape_rows(html, _REQUEST_ROWS, _REQUEST_FIELDS)))
+
+    assert scraped == _bs4_requests(html)
+    assert len(scraped) == 34
+    assert scraped[0] == {"Name": "Request & title 0", "Quality": "1080p 0", "Reward": "0 GB / 0 BP", "Link": "requests.php?action=view&id=0"}
+
+
+def test_extract_rows_field_kinds() -> None:
+    html = "<ul><li class='item a' data-id='1'><i>one</i> <i>two</i></li><li class='item'>none</li><li class='other'>x</li></ul>"
+
+    rows = extract_rows(html, f"//li[{has_class('item')}]", {"id": "@data-id", "first": ".//i", "all": Field(".//i", many=True), "count": "count(.//i)"})
+
+    assert rows == [{"id": "1", "first": "one", "all": ["one", "two"], "count": "2"}, {"id": None, "first": None, "all": [], "count": "0"}]
+    assert extract_rows("", "//li", {"id": "@id"}) == []
+    assert extract_rows(b"  ", "//li", {"id": "@id"}) == []
+    assert extract_rows('<?xml version="1.0" encoding="utf-8"?><ul><li id="x"></li></ul>', "//li", {"id": "@id"}) == [{"id": "x"}]
+
+
+def test_parse_only_keeps_the_target_subtree() -> None:
+    html = _request_page(5) + '<table class="torrents big"><tr><td>kept</td></tr></table>'
+
+    async def run() -> tuple[BeautifulSoup, BeautifulSoup, BeautifulSoup]:
+        return await asyncio.gather(
+            parse_html(html),
+            parse_html(html, parse_only=only("table", element_id="torrent_table")),
+            parse_html(html, parse_only=only("table", css_class="torrents")),
+        )
+
+    full, by_id, by_class = asyncio.run(run())
+
+    assert str(by_id.find("table", id="torrent_table")) == str(full.find("table", id="torrent_table"))
+    assert by_id.find("div", id="footer") is None
+    classed = by_class.find("table", class_="torrents")
+    assert classed is not None and classed.get_text() == "kept"
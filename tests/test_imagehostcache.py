@@ -0,0 +1,58 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the persistent image host cache in src/imagehostcache.py."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from src.imagehostcache import ImageHostCache
+
+_RESULT = {"img_url": "https://ptpimg.me/a.png", "raw_url": "https://ptpimg.me/a.png", "web_url": "https://ptpimg.me/a.png"}
+
+
+def test_put_save_and_reload(tmp_path: Path) -> None:
+    image = tmp_path / "shot-0.png"
+    image.write_bytes(b"png data")
+
+    cache = ImageHostCache(str(tmp_path))
+    asyncio.run(cache.put(str(image), "ptpimg", _RESULT))
+    asyncio.run(cache.save())
+
+    stored = json.loads((tmp_path / "data" / "image_hosts" / "cache.json").read_text())
+    assert list(stored.values())[0]["ptpimg"]["raw_url"] == _RESULT["raw_url"]
+
+    reloaded = ImageHostCache(str(tmp_path))
+    # Same content under another name still hits, another host misses
+    copy = tmp_path / "other-1.png"
+    copy.write_bytes(b"png data")
+    entry = asyncio.run(reloaded.get(str(copy), "ptpimg"))
+    assert entry is not None and entry["web_url"] == _RESULT["web_url"]
+    assert asyncio.run(reloaded.get(str(copy), "imgbox")) is None
+
+
+def test_changed_content_misses(tmp_path: Path) -> None:
+    image = tmp_path / "shot-0.png"
+    image.write_bytes(b"png data")
+    cache = ImageHostCache(str(tmp_path))
+    asyncio.run(cache.put(str(image), "ptpimg", _RESULT))
+
+    image.write_bytes(b"different png data")
+    assert asyncio.run(cache.get(str(image), "ptpimg")) is None
+
+
+def test_revalidate_drops_dead_links(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    image = tmp_path / "shot-0.png"
+    image.write_bytes(b"png data")
+    cache = ImageHostCache(str(tmp_path))
+    asyncio.run(cache.put(str(image), "ptpimg", _RESULT))
+
+    async def _dead(url: str) -> bool:
+        return False
+
+    monkeypatch.setattr(ImageHostCache, "is_alive", staticmethod(_dead))
+    assert asyncio.run(cache.get(str(image), "ptpimg", revalidate=True)) is None
+    assert asyncio.run(cache.get(str(image), "ptpimg")) is None
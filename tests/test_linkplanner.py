@@ -0,0 +1,86 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for bulk link tree creation in src/linkplanner.py and the qBittorrent linking paths."""
+
+from __future__ import annotations
+
+import asyncio
+import errno
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src import linkplanner
+from src.linkplanner import link_tree, plan_directory
+from src.torrent_clients.qbittorrent import async_link_directory, create_cross_seed_links
+
+
+def _disc(root: Path) -> Path:
+    release = root / "Movie.2020.BluRay"
+    for name in ("BDMV/STREAM/00001.m2ts", "BDMV/STREAM/00002.m2ts", "BDMV/CLIPINF/00001.clpi", "BDMV/index.bdmv", "Movie.nfo"):
+        path = release / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(name.encode() * 10)
+    return release
+
+
+def test_hardlink_tree_skips_nfo_and_keeps_existing_links(tmp_path: Path) -> None:
+    release = _disc(tmp_path)
+    dst = tmp_path / "links" / release.name
+
+    assert asyncio.run(async_link_directory(str(release), str(dst), use_hardlink=True, skip_nfo=True))
+    stream = dst / "BDMV" / "STREAM" / "00002.m2ts"
+    assert stream.stat().st_ino == (release / "BDMV" / "STREAM" / "00002.m2ts").stat().st_ino
+    assert not (dst / "Movie.nfo").exists()
+
+    # A second run over the same plan links only what is missing
+    stream.unlink()
+    result = link_tree(plan_directory(str(release), str(dst), skip_nfo=True))
+    assert result.ok and result.linked == {"hardlink": 1} and result.existing == 3
+    assert "Linked 1 file(s)" in result.report()
+
+
+def test_refused_hardlinks_fall_back_to_reflinks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    release = _disc(tmp_path)
+    clones: list[str] = []
+
+    def cross_device(src: str, dst: str) -> None:
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    def fake_reflink(src: str, dst: str) -> None:
+        clones.append(dst)
+        Path(dst).write_bytes(Path(src).read_bytes())
+
+    monkeypatch.setattr(linkplanner.os, "link", cross_device)
+    monkeypatch.setattr(linkplanner, "reflink", fake_reflink)
+    result = link_tree(plan_directory(str(release), str(tmp_path / "a")))
+    assert result.ok and result.linked == {"reflink": 5} and len(clones) == 5
+
+    def unsupported(src: str, dst: str) -> None:
+        raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+    monkeypatch.setattr(linkplanner, "reflink", unsupported)
+    result = link_tree(plan_directory(str(release), str(tmp_path / "b")), workers=1)
+    assert not result.ok and "cross-device" in (result.error or "") and not result.linked
+
+
+def test_cross_seed_links_map_torrent_files_to_the_release(tmp_path: Path) -> None:
+    release = _disc(tmp_path)
+    files = [
+        {"path": [b"BDMV", b"STREAM", b"00001.m2ts"], "length": len(b"BDMV/STREAM/00001.m2ts") * 10},
+        # Renamed on the other tracker: mapped by size
+        {"path": [b"BDMV", b"STREAM", b"renamed.m2ts"], "length": len(b"BDMV/STREAM/00002.m2ts") * 10},
+        {"path": [b"BDMV", b"index.bdmv"], "length": len(b"BDMV/index.bdmv") * 10},
+    ]
+    torrent = SimpleNamespace(metainfo={"info": {"name": "Movie 2020", "files": files}})
+    meta = {"path": str(release), "debug": False}
+    tracker_dir = tmp_path / "links" / "TRK"
+
+    for use_hardlink in (True, False):
+        target = tracker_dir / ("hard" if use_hardlink else "soft")
+        assert asyncio.run(create_cross_seed_links(meta, torrent, str(target), use_hardlink=use_hardlink))
+        renamed = target / "Movie 2020" / "BDMV" / "STREAM" / "renamed.m2ts"
+        assert os.path.samefile(renamed, release / "BDMV" / "STREAM" / "00002.m2ts")
+        assert renamed.is_symlink() is not use_hardlink
+        assert sorted(p.name for p in (target / "Movie 2020").rglob("*") if p.is_file()) == ["00001.m2ts", "index.bdmv", "renamed.m2ts"]
@@ -0,0 +1,43 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the manual upload package in src/manualpackage.py."""
+
+from __future__ import annotations
+
+import json
+import tarfile
+from pathlib import Path
+from typing import Any
+
+from src.manualpackage import ManualPackageManager
+
+_PASSKEY = "abcdef0123456789abcdef0123456789"
+
+
+def test_archive_carries_redacted_meta(tmp_path: Path) -> None:
+    tmp_dir = tmp_path / "uuid"
+    tmp_dir.mkdir()
+    meta: dict[str, Any] = {
+        "uuid": "uuid",
+        "name": "Movie 2020 1080p",
+        "api_key": "secret",
+        "tracker_status": {"BLU": {"status_message": f"https://blu.cc/announce/{_PASSKEY}"}},
+        "image_list": [{"img_url": "https://img/1.png"}],
+    }
+    (tmp_dir / "meta.json").write_text(json.dumps(meta, indent=4), encoding="utf-8")
+    (tmp_dir / "DESCRIPTION.txt").write_text("desc", encoding="utf-8")
+    archive = tmp_dir / "Movie.tar"
+
+    ManualPackageManager._write_archive(str(archive), str(tmp_dir), meta)
+
+    with tarfile.open(archive) as tar:
+        names = sorted(tar.getnames())
+        meta_file = tar.extractfile("./meta.json")
+        assert meta_file is not None
+        packaged = meta_file.read().decode("utf-8")
+
+    # One meta.json, the redacted one; the archive doesn't contain itself
+    assert names == [".", "./DESCRIPTION.txt", "./meta.json"]
+    assert _PASSKEY not in packaged and "secret" not in packaged
+    assert json.loads(packaged)["image_list"] == meta["image_list"]
+    # The file in tmp is left as it was, since later steps read it back
+    assert _PASSKEY in (tmp_dir / "meta.json").read_text(encoding="utf-8")
@@ -0,0 +1,50 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the screenshot PNG optimization stage in src/pngoptimize.py."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from PIL import Image
+
+from src import pngoptimize
+
+
+def _screenshot(path: Path) -> bytes:
+    image = Image.new("RGB", (320, 180))
+    image.putdata([((x * 3) % 256, (y * 5) % 256, (x * y) % 256) for y in range(180) for x in range(320)])
+    # Fast, weak compression, like a low ffmpeg compression level
+    image.save(path, format="PNG", compress_level=1)
+    return image.tobytes()
+
+
+def test_target_size_per_host() -> None:
+    assert pngoptimize.target_size("imgbox") == 10_000_000
+    assert pngoptimize.target_size("imgbb") == 31_000_000
+    assert pngoptimize.target_size("ptpimg") is None
+    assert pngoptimize.target_size(None) is None
+
+
+def test_optimize_in_workers_is_lossless_and_reported(tmp_path: Path) -> None:
+    paths = [tmp_path / f"screen-{i}.png" for i in range(2)]
+    pixels = [_screenshot(path) for path in paths]
+
+    async def run() -> list[pngoptimize.OptimizeResult | None]:
+        return await asyncio.gather(*(pngoptimize.optimize(str(path), 10_000_000) for path in paths))
+
+    results = [result for result in asyncio.run(run()) if result is not None]
+    assert len(results) == 2
+    for path, before_pixels, result in zip(paths, pixels, results):
+        assert result.after == path.stat().st_size < result.before
+        with Image.open(path) as image:
+            assert image.tobytes() == before_pixels
+    assert pngoptimize.report(results).startswith("Optimized 2 screenshot(s): saved ")
+
+
+def test_failed_optimization_leaves_the_file(tmp_path: Path) -> None:
+    path = tmp_path / "broken.png"
+    path.write_bytes(b"not a png")
+    assert asyncio.run(pngoptimize.optimize(str(path))) is None
+    assert path.read_bytes() == b"not a png"
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,74 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the redaction helpers in cogs/redaction.py."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from cogs.redaction import SENSITIVE_KEYS, Redaction, _classifier_for
+
+_PASSKEY = "abcdef0123456789abcdef0123456789"
+
+
+def test_redact_value_patterns() -> None:
+    assert Redaction.redact_value(f"https://tracker.cc/{_PASSKEY}/announce") == "https://tracker.cc/[REDACTED]/announce"
+    assert Redaction.redact_value("http://host:8080/proxy/s3cr3t/api/v2/torrents/info") == "http://host:8080/proxy/[REDACTED]/api/v2/torrents/info"
+    assert Redaction.redact_value("https://x/dl.php?id=5&Passkey=abc&x=1") == "https://x/dl.php?id=5&Passkey=[REDACTED]&x=1"
+    assert Redaction.redact_value(f"hash {_PASSKEY}0000 end") == "hash [REDACTED] end"
+    # The announce passkey is redacted before the proxy secret is looked for
+    assert Redaction.redact_value("/proxy/user/apipasskey01/announce") == "/proxy/user/[REDACTED]/announce"
+    assert Redaction.redact_value("short text, no secrets") == "short text, no secrets"
+    assert Redaction.redact_value(5) == 5
+
+
+def test_redact_private_info_keys_and_embedded_json() -> None:
+    data: dict[str, Any] = {
+        "name": "Movie",
+        "api_key": "x",
+        "Username": "y",
+        "nested": [{"AntiCsrfToken": "z", "size": 1}],
+        "message": 'Upload failed {"error": "bad", "passkey": "p"} done',
+        "raw": '{"token": "t", "id": 1}',
+        "count": 3,
+    }
+
+    assert Redaction.redact_private_info(data) == {
+        "name": "Movie",
+        "api_key": "[REDACTED]",
+        "Username": "[REDACTED]",
+        "nested": [{"AntiCsrfToken": "[REDACTED]", "size": 1}],
+        "message": 'Upload failed {"error": "bad", "passkey": "[REDACTED]"} done',
+        "raw": '{"token": "[REDACTED]", "id": 1}',
+        "count": 3,
+    }
+    assert Redaction.redact_private_info({"name": "x", "title": "y"}, {"TITLE"}) == {"name": "x", "title": "[REDACTED]"}
+
+
+def test_key_classification_is_cached_per_key_set() -> None:
+    classifier = _classifier_for(None)
+
+    assert classifier is _classifier_for(set(SENSITIVE_KEYS))
+    assert classifier.is_sensitive("qbit_PASSWORD") and not classifier.is_sensitive("resolution")
+    assert classifier.cache["qbit_PASSWORD"] is True and classifier.cache["resolution"] is False
+    assert _classifier_for({"title"}) is not classifier
+
+
+def test_extract_json_blocks_skips_quoted_brackets() -> None:
+    text = r'a {"x": "}\"{", "y": [1, {"z": 2}]} b [3] c "{not}" {'
+
+    assert [text[start:end] for start, end in Redaction.extract_json_blocks(text)] == [r'{"x": "}\"{", "y": [1, {"z": 2}]}', "[3]"]
+
+
+def test_iter_redacted_json_matches_json_dumps() -> None:
+    samples: list[Any] = [
+        {"uuid": "Movie", "passkey": "p", "tracker_status": {"BLU": {"status_message": f"https://blu/{_PASSKEY}/announce"}}, "list": [1, [2, {}], []], "empty": {}},
+        [{"token": "t"}, "text", None],
+        {},
+        [],
+        "plain",
+    ]
+    for sample in samples:
+        expected = json.dumps(Redaction.redact_private_info(sample), indent=4)
+        assert "".join(Redaction.iter_redacted_json(sample)) == expected
+        assert "".join(Redaction.iter_redacted_json(sample, indent=2)) == json.dumps(Redaction.redact_private_info(sample), indent=2)
@@ -0,0 +1,115 @@
+# Tests for region / distributor / service detection — src/region.py, src/trackers/COMMON.py
+"""
+Test suite for the precompiled region, distributor and service lookups.
+Covers: token matching rules (space delimited, first/last token excluded), declaration-order
+        precedence, service re-mapping, and the UNIT3D id maps in both directions.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+import pytest
+
+from src import region
+from src.trackers.COMMON import COMMON
+
+
+def _run(coro: Any) -> Any:
+    return asyncio.run(coro)
+
+
+def _naive_service_keys(video_name: str) -> set[str]:
+    """The original per-key substring scan, as the reference for the token index."""
+    services = region._SERVICES  # pyright: ignore[reportPrivateUsage]
+    return {key for key in services if f" {key} " in video_name}
+
+
+# ─── get_region ───────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "label, expected",
+    [
+        ("Movie.2001.GBR.1080p.Blu-ray", "GBR"),
+        ("GBR.Movie.2001", ""),  # first token never matches
+        ("Movie.2001.GBR", ""),  # neither does the last
+        ("Movie.FRA.GBR.1080p", "GBR"),  # later entry in the region table wins
+        ("Movie.GBR.FRA.1080p", "GBR"),
+        ("Movie.2001.1080p", ""),
+    ],
+)
+def test_get_region_from_label(label: str, expected: str) -> None:
+    assert _run(region.get_region({"label": label})) == expected
+
+
+def test_get_region_explicit_value_is_upper_cased() -> None:
+    assert _run(region.get_region({"label": "Movie GBR x"}, "usa")) == "USA"
+
+
+# ─── get_distributor ──────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("101 films", "101 FILMS"), ("Not A Distributor", ""), ("None", ""), ("", ""), (None, "")],
+)
+def test_get_distributor(value: Optional[str], expected: str) -> None:
+    assert _run(region.get_distributor(value)) == expected
+
+
+# ─── get_service ──────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "video_name",
+    [
+        "Show S01E01 Amazon Prime WEB-DL ",
+        "x AMZN NF HULU y",
+        "x Apple TV+ Apple TV ATVP ",
+        " 9Now 9NOW ",
+        "Comedians in Cars Getting Coffee",
+        "a  CR  b",
+    ],
+)
+def test_service_token_index_matches_substring_scan(video_name: str) -> None:
+    assert region._find_service_keys(video_name) == _naive_service_keys(video_name)  # pyright: ignore[reportPrivateUsage]
+
+
+def test_get_service_services_only_returns_copy() -> None:
+    services = _run(region.get_service(get_services_only=True))
+    assert isinstance(services, dict)
+    services["ZZZZ"] = "ZZZZ"
+    assert "ZZZZ" not in _run(region.get_service(get_services_only=True))
+
+
+def test_get_service_longname() -> None:
+    service, longname = _run(region.get_service("Show.S01E01.1080p.AMZN.WEB-DL.DDP5.1.H.264-GRP", tag="-GRP", guess_title="Show"))
+    assert service == "AMZN"
+    assert longname == "Amazon"
+
+
+def test_get_service_without_video() -> None:
+    assert _run(region.get_service()) == ("", "")
+
+
+# ─── UNIT3D id maps ───────────────────────────────────────────
+
+
+def test_unit3d_region_ids_round_trip() -> None:
+    common = COMMON({"DEFAULT": {}})
+    region_id = _run(common.unit3d_region_ids("GBR"))
+    assert region_id == str(COMMON.UNIT3D_REGION_IDS["GBR"])
+    assert _run(common.unit3d_region_ids(reverse=True, region_id=int(region_id))) == "GBR"
+    assert _run(common.unit3d_region_ids("NOPE")) == ""
+    assert _run(common.unit3d_region_ids(reverse=True, region_id="abc")) == ""  # pyright: ignore[reportArgumentType]
+
+
+def test_unit3d_reverse_maps_prefer_first_listed_name() -> None:
+    for names, reverse in (
+        (COMMON.UNIT3D_REGION_IDS, COMMON._UNIT3D_REGION_CODES),  # pyright: ignore[reportPrivateUsage]
+        (COMMON.UNIT3D_DISTRIBUTOR_IDS, COMMON._UNIT3D_DISTRIBUTOR_NAMES),  # pyright: ignore[reportPrivateUsage]
+    ):
+        first: dict[int, str] = {}
+        for name, id_value in names.items():
+            first.setdefault(id_value, name)
+        assert reverse == first
@@ -0,0 +1,138 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the multi-tracker re-hosting fan-out in src/rehostimages.py."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, Optional, cast
+
+import pytest
+
+from src import rehostimages
+from src.rehostimages import _minimal_host_cover, _prepare_tracker_images
+
+_MAPPING = {"ptpimg.me": "ptpimg", "imgbox.com": "imgbox", "ibb.co": "imgbb", "pixhost.to": "pixhost"}
+_DOMAINS = {v: k for k, v in _MAPPING.items()}
+
+
+class _FakeUploader:
+    def __init__(self, fail: Optional[set[str]] = None) -> None:
+        self.fail = fail or set()
+        self.calls: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def upload_screens(self, meta: dict[str, Any], *args: Any, img_host: Optional[str] = None, **kwargs: Any) -> tuple[list[dict[str, str]], int]:
+        assert img_host is not None
+        self.calls.append(img_host)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if img_host in self.fail:
+            raise Exception("No images uploaded")
+        url = f"https://{_DOMAINS[img_host]}/a.png"
+        return [{"img_url": url, "raw_url": url, "web_url": url}], 1
+
+
+def _meta(tmp_path: Path) -> dict[str, Any]:
+    (tmp_path / "tmp" / "uuid").mkdir(parents=True)
+    return {
+        "base_dir": str(tmp_path),
+        "uuid": "uuid",
+        "debug": False,
+        "image_list": [{"img_url": "https://ibb.co/x.png", "raw_url": "https://ibb.co/x.png", "web_url": "https://ibb.co/x"}],
+    }
+
+
+@pytest.fixture(autouse=True)
+def _fake_screens(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _collect(*args: Any) -> tuple[list[str], int]:
+        return ["shot-0.png"], 1
+
+    monkeypatch.setattr(rehostimages, "_collect_rehost_screenshots", _collect)
+
+
+def test_minimal_host_cover_prefers_config_order() -> None:
+    candidates = {"PTP": ["ptpimg", "pixhost"], "MTV": ["ptpimg", "imgbox"], "GPW": ["pixhost", "imgbox"]}
+    assert _minimal_host_cover(candidates, ["imgbox", "ptpimg", "pixhost"]) == ["imgbox", "ptpimg"]
+    assert _minimal_host_cover({"PTP": ["ptpimg"], "MTV": ["ptpimg", "imgbox"]}, ["imgbox", "ptpimg"]) == ["ptpimg"]
+
+
+def test_fan_out_uploads_each_host_once_concurrently(tmp_path: Path) -> None:
+    meta = _meta(tmp_path)
+    uploader = _FakeUploader()
+    requirements = {
+        "PTP": (["ptpimg", "pixhost"], _MAPPING),
+        "MTV": (["ptpimg", "imgbox", "imgbb"], _MAPPING),
+        "GPW": (["imgbox"], _MAPPING),
+        "HDB": (["pixhost", "imgbox"], _MAPPING),
+    }
+    config = {"img_host_1": "imgbb", "img_host_2": "imgbox", "img_host_3": "ptpimg", "img_host_4": "pixhost"}
+
+    assignments = asyncio.run(_prepare_tracker_images(meta, requirements, config, cast(Any, object()), cast(Any, uploader)))
+
+    # MTV can use image_list (imgbb); PTP and GPW share no host, so two uploads run side by side and HDB reuses imgbox
+    assert assignments == {"PTP": "ptpimg", "GPW": "imgbox", "HDB": "imgbox"}
+    assert sorted(uploader.calls) == ["imgbox", "ptpimg"]
+    assert uploader.max_active == 2
+    assert meta["PTP_images_key"][0]["raw_url"].startswith("https://ptpimg.me/")
+    assert "MTV_images_key" not in meta
+    assert (tmp_path / "tmp" / "uuid" / "reuploaded_images.json").exists()
+
+
+def test_trackers_get_nothing_when_all_their_hosts_fail(tmp_path: Path) -> None:
+    meta = _meta(tmp_path)
+    uploader = _FakeUploader(fail={"ptpimg", "pixhost"})
+    requirements = {"PTP": (["ptpimg", "pixhost"], _MAPPING)}
+    config = {"img_host_1": "ptpimg", "img_host_2": "imgbox", "img_host_3": "pixhost"}
+
+    assignments = asyncio.run(_prepare_tracker_images(meta, requirements, config, cast(Any, object()), cast(Any, uploader)))
+
+    assert assignments == {}
+    assert uploader.calls == ["ptpimg", "pixhost"]
+    assert meta["failed_image_hosts"] == ["ptpimg", "pixhost"]
+    assert "PTP_images_key" not in meta
+
+
+def test_failed_host_falls_back_per_tracker_while_other_uploads_run(tmp_path: Path) -> None:
+    meta = _meta(tmp_path)
+    meta["imghost"] = "imgbb"
+    uploader = _FakeUploader(fail={"ptpimg"})
+    requirements = {"PTP": (["ptpimg", "pixhost"], _MAPPING), "GPW": (["imgbox"], _MAPPING), "MTV": (["ptpimg", "imgbox"], _MAPPING)}
+    config = {"img_host_1": "ptpimg", "img_host_2": "imgbox", "img_host_3": "pixhost"}
+
+    assignments = asyncio.run(_prepare_tracker_images(meta, requirements, config, cast(Any, object()), cast(Any, uploader)))
+
+    # ptpimg and imgbox ran side by side; only PTP lost its host and moved on to pixhost
+    assert uploader.calls == ["ptpimg", "imgbox", "pixhost"] and uploader.max_active == 2
+    assert assignments == {"GPW": "imgbox", "MTV": "imgbox", "PTP": "pixhost"}
+    assert meta["PTP_images_key"][0]["raw_url"].startswith("https://pixhost.to/")
+    assert meta["MTV_images_key"][0]["raw_url"].startswith("https://imgbox.com/")
+    assert meta["failed_image_hosts"] == ["ptpimg"]
+    # The uploads never switched the shared host setting
+    assert meta["imghost"] == "imgbb"
+
+
+def test_pinned_host_upload_does_not_switch_hosts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from src import uploadscreens
+
+    meta = _meta(tmp_path)
+    meta.update({"imghost": "imgbb", "image_list": []})
+    (tmp_path / "tmp" / "uuid" / "shot-0.png").write_bytes(b"png")
+    hosts: list[str] = []
+
+    async def failing_upload(args: Any) -> dict[str, Any]:
+        hosts.append(args[1])
+        return {"status": "failed", "reason": "Invalid API key"}
+
+    monkeypatch.setattr(uploadscreens, "upload_image_task", failing_upload)
+    monkeypatch.chdir(tmp_path)
+    config = {"DEFAULT": {"img_host_1": "ptpimg", "img_host_2": "imgbox", "image_host_cache": False}}
+
+    with pytest.raises(Exception, match="No images uploaded"):
+        asyncio.run(uploadscreens._upload_screens(config, cast(Any, meta), 1, 1, 0, 1, [], {}, img_host="ptpimg"))
+    # No fallback to img_host_2 and no write to the shared meta['imghost']
+    assert hosts == ["ptpimg"]
+    assert meta["imghost"] == "imgbb"
@@ -0,0 +1,97 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the streamed multipart uploads in src/streamupload.py."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import os
+import tracemalloc
+from pathlib import Path
+
+import httpx
+
+from src.streamupload import FilePart, StreamingForm, _InFlight, post_form
+
+
+async def _body(form: StreamingForm) -> bytes:
+    return b"".join([chunk async for chunk in form])
+
+
+def test_form_matches_httpx_multipart(tmp_path: Path) -> None:
+    image = tmp_path / "shot 01.png"
+    image.write_bytes(os.urandom(500_001))
+    data = {"content_type": "0", "max_th_size": 350, "nsfw": False}
+
+    form = StreamingForm(data, {"img": FilePart(str(image), "file-upload[0]"), "source": FilePart(str(image))})
+    body = asyncio.run(_body(form))
+
+    request = httpx.Request("POST", "https://example.org", data=data, files={"img": ("file-upload[0]", image.read_bytes()), "source": (image.name, image.read_bytes())})
+    boundary = request.headers["Content-Type"].split("boundary=")[1].encode()
+    assert body == request.read().replace(boundary, form.boundary)
+    assert len(body) == form.content_length == int(form.headers["Content-Length"])
+
+
+def test_base64_part_is_encoded_in_chunks(tmp_path: Path) -> None:
+    image = tmp_path / "shot.png"
+    content = os.urandom(3 * 1024 * 1024 + 2)
+    image.write_bytes(content)
+
+    form = StreamingForm({"key": "secret"}, {"image": FilePart(str(image), base64_encode=True)})
+    body = asyncio.run(_body(form))
+
+    expected = httpx.Request("POST", "https://example.org", files={"key": (None, "secret"), "image": (None, base64.b64encode(content).decode())})
+    boundary = expected.headers["Content-Type"].split("boundary=")[1].encode()
+    assert body == expected.read().replace(boundary, form.boundary)
+    assert len(body) == form.content_length
+
+
+def test_post_form_streams_with_flat_memory(tmp_path: Path) -> None:
+    image = tmp_path / "shot.png"
+    image.write_bytes(os.urandom(20 * 1024 * 1024))
+    received: list[int] = []
+
+    class Transport(httpx.AsyncBaseTransport):
+        # MockTransport reads the whole request first; this one consumes it like a socket would
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            size = 0
+            async for chunk in request.stream:  # type: ignore[union-attr]
+                size += len(chunk)
+            received.append(size)
+            assert int(request.headers["Content-Length"]) == size
+            return httpx.Response(200, json={"success": True})
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=Transport()) as client:
+            await asyncio.gather(
+                *(post_form(client, "https://example.org/upload", data={"key": "x"}, files={"image": FilePart(str(image), base64_encode=True)}) for _ in range(3))
+            )
+
+    tracemalloc.start()
+    try:
+        asyncio.run(run())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(received) == 3
+    # Three 20 MiB images (27 MiB as base64) never sit in memory
+    assert peak < 8 * 1024 * 1024
+
+
+def test_in_flight_budget_bounds_concurrent_bytes() -> None:
+    budget = _InFlight(100)
+    used: list[int] = []
+
+    async def upload(size: int) -> None:
+        async with budget.reserve(size):
+            used.append(budget.used)
+            await asyncio.sleep(0.01)
+
+    async def run() -> None:
+        await asyncio.gather(*(upload(size) for size in (60, 60, 30, 500)))
+
+    asyncio.run(run())
+
+    assert max(used) <= 100
+    assert budget.used == 0
@@ -0,0 +1,87 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the persistent tonemap capability cache in src/tonemapcache.py."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import src.takescreens as takescreens
+from src import tonemapcache
+from src.tonemapcache import TonemapCache, binary_fingerprint
+
+
+def test_put_record_cost_and_reload(tmp_path: Path) -> None:
+    cache = TonemapCache(str(tmp_path))
+    cache.put("build", "DV HDR", "libplacebo")
+    cache.record_cost("build", "DV HDR", "libplacebo", 2.0)
+    cache.record_cost("build", "DV HDR", "libplacebo", 4.0)
+    # Costs of another chain are not mixed in
+    cache.record_cost("build", "DV HDR", "zscale", 100.0)
+    cache.save()
+
+    stored = json.loads((tmp_path / "data" / "tonemap" / "cache.json").read_text())
+    assert stored["build"]["DV HDR"]["chain"] == "libplacebo"
+
+    reloaded = TonemapCache(str(tmp_path))
+    entry = reloaded.get("build", "DV HDR")
+    assert entry is not None and entry["frame_seconds"] == 2.6
+    assert reloaded.get("build", "HLG") is None and reloaded.get("other build", "DV HDR") is None
+
+    # A different chain starts its own cost average
+    reloaded.put("build", "DV HDR", "zscale")
+    entry = reloaded.get("build", "DV HDR")
+    assert entry is not None and entry["chain"] == "zscale" and entry["frame_seconds"] is None
+
+
+def test_fingerprint_follows_the_binary_and_fallbacks_are_retried(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    binary = tmp_path / "ffmpeg"
+    binary.write_bytes(b"build 1")
+    first = binary_fingerprint(str(binary))
+    binary.write_bytes(b"build 22")
+    assert first is not None and binary_fingerprint(str(binary)) != first
+    assert binary_fingerprint(str(tmp_path / "missing")) is None
+
+    cache = TonemapCache(str(tmp_path))
+    cache.put("build", "HDR", "none")
+    cache.put("build", "DV", "zscale")
+    cache.put("build", "HLG", "libplacebo")
+    assert all(cache.get("build", hdr_format) is not None for hdr_format in ("HDR", "DV", "HLG"))
+    now = tonemapcache.time.time()
+    monkeypatch.setattr(tonemapcache.time, "time", lambda: now + tonemapcache.FALLBACK_RETRY_SECONDS + 1)
+    # Fallback chains are probed again, a working libplacebo is kept
+    assert cache.get("build", "HDR") is None and cache.get("build", "DV") is None
+    assert cache.get("build", "HLG") is not None
+
+
+def test_second_run_skips_the_compatibility_check(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    binary = tmp_path / "ffmpeg"
+    binary.write_bytes(b"ffmpeg")
+    os.chmod(binary, 0o755)
+    checks: list[str] = []
+
+    async def fake_check(*args: Any) -> tuple[bool, bool]:
+        checks.append(args[4])
+        return False, True
+
+    monkeypatch.setattr(takescreens, "check_libplacebo_compatibility", fake_check)
+    monkeypatch.setattr(takescreens, "ffmpeg_binary", lambda: str(binary))
+    monkeypatch.setattr(takescreens, "default_config", {})
+    meta = {"base_dir": str(tmp_path), "hdr": "HDR", "is_disc": None, "debug": False}
+
+    for _ in range(2):
+        TonemapCache._instances.clear()
+        result = asyncio.run(takescreens.tonemap_capabilities(1, 1, 3840, 2160, "/media/movie.mkv", "10", "test.png", "quiet", meta))
+        assert result == (False, True)
+    assert checks == ["/media/movie.mkv"]
+
+    # Another HDR format, or the cache turned off, is checked again
+    asyncio.run(takescreens.tonemap_capabilities(1, 1, 3840, 2160, "/media/hlg.mkv", "10", "test.png", "quiet", {**meta, "hdr": "HLG"}))
+    monkeypatch.setattr(takescreens, "default_config", {"tonemap_cache": False})
+    asyncio.run(takescreens.tonemap_capabilities(1, 1, 3840, 2160, "/media/movie.mkv", "10", "test.png", "quiet", meta))
+    assert checks == ["/media/movie.mkv", "/media/hlg.mkv", "/media/movie.mkv"]
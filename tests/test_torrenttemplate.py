@@ -0,0 +1,82 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the torrent templating in src/torrenttemplate.py."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import bencodepy
+from torf import Torrent
+
+from src.torrenttemplate import TorrentTemplate, bencode, read_torrent, write_torrent
+
+
+def _base_torrent(tmp_path: Path) -> Path:
+    content = tmp_path / "content"
+    content.mkdir()
+    (content / "a.mkv").write_bytes(os.urandom(300_000))
+    (content / "b.srt").write_bytes(b"subtitle" * 100)
+    torrent = Torrent(path=content, private=True, piece_size=16384, created_by="mkbrr v1", comment="https://example.org/download?key=secret")
+    torrent.metainfo["custom"] = "dropped"
+    torrent.generate()
+    path = tmp_path / "BASE.torrent"
+    torrent.write(path)
+    return path
+
+
+def test_render_matches_torf_copy(tmp_path: Path) -> None:
+    path = _base_torrent(tmp_path)
+
+    # What create_torrent_for_upload wrote with torf before it used the template
+    expected = Torrent.read(path)
+    for key in list(expected.metainfo):
+        if key not in ("announce", "comment", "creation date", "created by", "encoding", "info"):
+            expected.metainfo.pop(key, None)
+    expected.metainfo["announce"] = "https://tracker.example/announce"
+    expected.metainfo["info"]["source"] = "BLU"
+    expected.metainfo["comment"] = ""
+
+    template = TorrentTemplate.for_path(str(path))
+    data, info_hash = template.render(
+        {"announce": "https://tracker.example/announce", "comment": ""},
+        {"source": "BLU"},
+        keep=("announce", "comment", "creation date", "created by", "encoding"),
+    )
+
+    assert data == Torrent.copy(expected).dump()
+    assert info_hash == Torrent.read_stream(data).infohash
+    assert template.value("created by") == b"mkbrr v1"
+
+
+def test_info_hash_with_changed_and_removed_keys(tmp_path: Path) -> None:
+    template = TorrentTemplate.for_path(str(_base_torrent(tmp_path)))
+    info = bencodepy.decode(template.render()[0])[b"info"]
+
+    for overrides in ({}, {"source": "PTP"}, {"entropy": 12345, "source": "AITHER"}, {"private": None}, {"source": "X"}):
+        expected = dict(info)
+        for key, value in overrides.items():
+            if value is None:
+                expected.pop(key.encode(), None)
+            else:
+                expected[key.encode()] = value
+        assert template.info_hash(overrides) == hashlib.sha1(bencode(expected), usedforsecurity=False).hexdigest()
+
+
+def test_templates_and_rendered_files_follow_the_disk(tmp_path: Path) -> None:
+    path = _base_torrent(tmp_path)
+    template = TorrentTemplate.for_path(str(path))
+    assert TorrentTemplate.for_path(str(path)) is template
+
+    out_path = str(tmp_path / "[BLU].torrent")
+    data, _ = template.render({"announce": "https://tracker.example/announce"})
+    write_torrent(out_path, data)
+    assert read_torrent(out_path) is data
+    assert Path(out_path).read_bytes() == data
+
+    # Replaced on disk, e.g. by the torrent downloaded from the tracker
+    Path(out_path).write_bytes(path.read_bytes())
+    os.utime(out_path, ns=(1, 1))
+    assert read_torrent(out_path) == path.read_bytes()
+    assert TorrentTemplate.for_path(out_path) is not template
@@ -0,0 +1,89 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the async TVDB client and episode cache in src/tvdb.py."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+import src.tvdb as tvdb_module
+from src.tvdb import TVDBClient, TVDBEpisodeCache, tvdb_data
+
+
+def _episode(index: int) -> dict[str, Any]:
+    return {"id": 1000 + index, "seasonNumber": 1 + index // 100, "number": 1 + index % 100, "absoluteNumber": index + 1, "aired": f"2020-01-{1 + index % 28:02d}", "name": f"Episode {index}"}
+
+
+def _client(total: int, calls: list[str], expire_first_token: bool = False) -> TVDBClient:
+    tokens = iter(["expired", "token-2"] if expire_first_token else ["token-1"])
+    episodes = [_episode(index) for index in range(total)]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/v4/")
+        calls.append(path if path == "login" else f"{path}?page={request.url.params.get('page', '')}")
+        if path == "login":
+            return httpx.Response(200, json={"status": "success", "data": {"token": next(tokens)}})
+        if request.headers["Authorization"] == "Bearer expired":
+            return httpx.Response(401, json={"status": "failure", "message": "Unauthorized"})
+        if path.startswith("series/42/episodes/default"):
+            page = int(request.url.params["page"])
+            await asyncio.sleep(0.01)
+            data = {"slug": "show", "episodes": episodes[page * 500 : (page + 1) * 500]}
+            return httpx.Response(200, json={"status": "success", "data": data, "links": {"total_items": total, "page_size": 500}})
+        if path == "series/42/extended":
+            return httpx.Response(200, json={"status": "success", "data": {"name": "Show", "aliases": [{"language": "eng", "name": "Show (2020)"}]}})
+        return httpx.Response(404, json={"status": "failure", "message": "NotFoundException"})
+
+    return TVDBClient("key", transport=httpx.MockTransport(handler))
+
+
+def test_episode_pages_are_fetched_after_the_first(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(tvdb_module, "tvdb", _client(1300, calls, expire_first_token=True))
+    monkeypatch.setattr(tvdb_module, "_tvdb_init_error", None)
+
+    data, alias = asyncio.run(tvdb_data({}).get_tvdb_episodes(42, str(tmp_path), season=13, episode=1))
+
+    assert data is not None
+    assert [ep["id"] for ep in data["episodes"]] == [1000 + index for index in range(1300)]
+    assert data["series_name"] == "Show"
+    assert alias == "Show (2020)"
+    # Logged in once more after the 401, then every page exactly once
+    assert calls.count("login") == 2
+    assert sorted(call for call in calls if call.startswith("series/42/episodes")) == [f"series/42/episodes/default/eng?page={page}" for page in (0, 0, 1, 2)]
+
+    # Multi-page series are cached; the requested episode is found without asking TVDB
+    calls.clear()
+    cached, _ = asyncio.run(tvdb_data({}).get_tvdb_episodes(42, str(tmp_path), season=13, episode=1))
+    assert cached is not None and cached["episodes"] == data["episodes"]
+    assert calls == []
+
+
+def test_cache_queries_the_requested_episode(tmp_path: Path) -> None:
+    cache = TVDBEpisodeCache(str(tmp_path))
+    cache.store(7, {"episodes": [_episode(index) for index in range(150)], "aliases": [], "slug": "seven"})
+
+    assert cache.load(8) == (False, None)
+    assert cache.load(7)[1] is not None
+    assert cache.load(7, (2, 50, None, None))[1] is not None
+    assert cache.load(7, (2, 51, None, None)) == (True, None)
+    assert cache.load(7, (None, None, 150, None))[1] is not None
+    assert cache.load(7, (None, 99, 151, "2020-01-03"))[1] is not None
+    assert cache.load(7, (5, 0, None, None))[1] is not None
+
+
+def test_cache_imports_earlier_json_files(tmp_path: Path) -> None:
+    json_dir = tmp_path / "data" / "tvdb"
+    json_dir.mkdir(parents=True)
+    episodes = [_episode(index) for index in range(3)]
+    (json_dir / "9.json").write_text(json.dumps({"episodes": episodes, "aliases": [{"language": "eng", "name": "Nine"}], "slug": "nine"}), encoding="utf-8")
+
+    is_cached, data = TVDBEpisodeCache(str(tmp_path)).load(9, (1, 3, None, None))
+
+    assert is_cached
+    assert data == {"episodes": episodes, "aliases": [{"language": "eng", "name": "Nine"}], "slug": "nine"}
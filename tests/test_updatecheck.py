@@ -0,0 +1,122 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the background update check in src/updatecheck.py."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+import pytest
+
+from src.updatecheck import UpdateCheck, is_newer
+
+_VERSION_PY = '''__version__ = "v7.1.0"
+"""
+# - New feature
+# - Fixed bug
+"""
+
+__version__ = "v7.0.0"
+"""
+# - Old entry
+"""
+'''
+
+
+def _serve(monkeypatch: pytest.MonkeyPatch, requests: list[dict[str, str]], delay: float = 0.0) -> None:
+    real_client = httpx.AsyncClient
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.headers))
+        if delay:
+            await asyncio.sleep(delay)
+        if request.headers.get("If-None-Match") == '"abc"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=_VERSION_PY, headers={"ETag": '"abc"', "Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT"})
+
+    def client(*args: Any, **kwargs: Any) -> httpx.AsyncClient:
+        kwargs.pop("transport", None)
+        return real_client(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", client)
+
+
+def test_refresh_stores_version_and_revalidates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[dict[str, str]] = []
+    _serve(monkeypatch, requests)
+    checker = UpdateCheck(str(tmp_path))
+
+    first = asyncio.run(checker.refresh())
+    second = asyncio.run(checker.refresh())
+
+    assert first["remote_version"] == "v7.1.0"
+    assert first["changelog"] == "- New feature\n- Fixed bug"
+    assert "if-none-match" not in requests[0]
+    assert requests[1]["if-none-match"] == '"abc"'
+    assert requests[1]["if-modified-since"] == "Sat, 17 Oct 2026 10:00:00 GMT"
+    assert second["remote_version"] == "v7.1.0" and second["checked_at"] >= first["checked_at"]
+    assert checker.cached() == second
+
+
+def test_start_only_refreshes_stale_results(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[dict[str, str]] = []
+    _serve(monkeypatch, requests)
+    checker = UpdateCheck(str(tmp_path))
+
+    async def run() -> tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]:
+        cached = checker.start(6)
+        return cached, await checker.finish()
+
+    assert asyncio.run(run()) == (None, checker.cached())
+    cached, refreshed = asyncio.run(run())
+    assert cached == checker.cached() and refreshed is None
+    assert len(requests) == 1
+    assert UpdateCheck.is_stale({"checked_at": time.time() - 7 * 3600}, 6)
+    assert UpdateCheck.is_stale({"checked_at": time.time() + 3600}, 6)
+    assert UpdateCheck.is_stale({}, 6)
+
+
+def test_slow_check_does_not_hold_up_the_run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[dict[str, str]] = []
+    _serve(monkeypatch, requests, delay=5)
+    checker = UpdateCheck(str(tmp_path))
+
+    async def run() -> Optional[dict[str, Any]]:
+        checker.start(6)
+        return await checker.finish(timeout=0.05)
+
+    started = time.monotonic()
+    assert asyncio.run(run()) is None
+    assert time.monotonic() - started < 2
+    assert checker.cached() == {}
+
+
+def test_finish_after_cleanup_cancelled_the_refresh(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    requests: list[dict[str, str]] = []
+    _serve(monkeypatch, requests, delay=5)
+    checker = UpdateCheck(str(tmp_path))
+
+    async def run(cancel_while_waiting: bool) -> Optional[dict[str, Any]]:
+        checker.start(6)
+        task = checker._task
+        assert task is not None
+        if cancel_while_waiting:
+            asyncio.get_running_loop().call_later(0.05, task.cancel)
+        else:
+            # As cleanup_manager.cleanup() does before the finally block of do_the_thing
+            task.cancel()
+            await asyncio.sleep(0)
+        return await checker.finish(timeout=2)
+
+    assert asyncio.run(run(False)) is None
+    assert asyncio.run(run(True)) is None
+
+
+def test_is_newer() -> None:
+    assert is_newer("v7.1.0", "v7.0.0")
+    assert not is_newer("v7.0.0", "v7.0.0")
+    assert not is_newer(None, "v7.0.0")
+    assert not is_newer("not a version", "v7.0.0")
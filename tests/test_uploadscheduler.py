@@ -0,0 +1,108 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the per-tracker upload scheduling in src/uploadscheduler.py."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from src.uploadscheduler import UploadScheduler
+
+
+def _config(default: dict[str, Any] | None = None, trackers: dict[str, Any] | None = None) -> dict[str, Any]:
+    return {"DEFAULT": default or {}, "TRACKERS": trackers or {}}
+
+
+def test_trackers_upload_concurrently() -> None:
+    delays = {"BLU": 0.2, "AITHER": 0.05, "LST": 0.1}
+
+    async def upload(tracker: str) -> None:
+        await asyncio.sleep(delays[tracker])
+
+    scheduler = UploadScheduler(_config())
+    started = time.monotonic()
+    runs = asyncio.run(scheduler.run(delays, upload))
+    elapsed = time.monotonic() - started
+
+    # Bounded by the slowest tracker, not the sum of all of them
+    assert elapsed < 0.3
+    assert {tracker: run.state for tracker, run in runs.items()} == dict.fromkeys(delays, "done")
+    assert all(run.duration is not None for run in runs.values())
+
+
+def test_global_limit_and_priority_order() -> None:
+    started: list[str] = []
+    running = 0
+    peak = 0
+
+    async def upload(tracker: str) -> None:
+        nonlocal running, peak
+        started.append(tracker)
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    scheduler = UploadScheduler(_config({"tracker_upload_concurrency": "2", "tracker_upload_priority": "lst, ptp"}))
+    asyncio.run(scheduler.run(["BLU", "AITHER", "PTP", "LST", "OE"], upload))
+
+    assert peak == 2
+    assert started == ["LST", "PTP", "BLU", "AITHER", "OE"]
+    assert UploadScheduler(_config(), max_concurrent=1).max_concurrent == 1
+
+
+def test_per_site_limit_spans_schedulers() -> None:
+    running: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def upload(tracker: str) -> None:
+        running[tracker] = running.get(tracker, 0) + 1
+        peak[tracker] = max(peak.get(tracker, 0), running[tracker])
+        await asyncio.sleep(0.02)
+        running[tracker] -= 1
+
+    config = _config(trackers={"BLU": {"upload_concurrency": 2}})
+
+    async def run() -> None:
+        # Three uploads at once, each sending to both sites
+        await asyncio.gather(*(UploadScheduler(config).run(["BLU", "AITHER"], upload) for _ in range(3)))
+
+    asyncio.run(run())
+
+    assert peak == {"BLU": 2, "AITHER": 1}
+
+
+def test_failure_is_kept_to_its_tracker() -> None:
+    async def upload(tracker: str) -> None:
+        await asyncio.sleep(0.01)
+        if tracker == "AITHER":
+            raise RuntimeError("upload rejected")
+
+    scheduler = UploadScheduler(_config())
+    runs = asyncio.run(scheduler.run(["BLU", "AITHER", "LST"], upload))
+
+    assert runs["AITHER"].state == "failed"
+    assert isinstance(runs["AITHER"].error, RuntimeError)
+    assert runs["BLU"].state == runs["LST"].state == "done"
+    assert "AITHER failed" in scheduler.summary()
+
+
+def test_cancellation_cancels_remaining_trackers() -> None:
+    async def upload(tracker: str) -> None:
+        await asyncio.sleep(0 if tracker == "AITHER" else 1)
+
+    scheduler = UploadScheduler(_config({"tracker_upload_concurrency": 2}))
+
+    async def run() -> None:
+        task = asyncio.create_task(scheduler.run(["AITHER", "BLU", "LST"], upload))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(run())
+
+    assert {tracker: run.state for tracker, run in scheduler.runs.items()} == {"AITHER": "done", "BLU": "cancelled", "LST": "cancelled"}
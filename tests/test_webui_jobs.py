@@ -0,0 +1,154 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Tests for the web UI job queue and worker pool in web_ui/jobs.py."""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from web_ui.jobs import FINISHED_STATES, JobManager
+
+# Stands in for web_ui.jobworker: reads its argv line, then acts on the path it was given
+_WORKER = """
+import json, sys, time
+argv = json.loads(sys.stdin.readline())
+path = argv[1]
+print("start", path, flush=True)
+if path.startswith("sleep"):
+    time.sleep(float(path[5:]))
+elif path == "prompt":
+    print("answer?", flush=True)
+    print("got", sys.stdin.readline().strip(), flush=True)
+elif path == "fail":
+    sys.exit(3)
+print("end", path, flush=True)
+"""
+
+
+def _manager(tmp_path: Path, max_jobs: int = 2, warm_workers: int = 1) -> JobManager:
+    return JobManager(tmp_path, tmp_path, max_jobs=max_jobs, warm_workers=warm_workers, command=[sys.executable, "-c", _WORKER])
+
+
+def _wait(manager: JobManager, job_ids: list[str], timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if all(manager.jobs[job_id].status in FINISHED_STATES for job_id in job_ids):
+            return
+        time.sleep(0.02)
+    raise AssertionError("jobs did not finish")
+
+
+def _log(manager: JobManager, job_id: str) -> str:
+    data, offset, finished = b"", 0, False
+    while not finished:
+        chunk, finished = manager.read_log(job_id, offset, timeout=5)
+        data += chunk
+        offset += len(chunk)
+    return data.decode()
+
+
+def test_jobs_run_concurrently_in_priority_order(tmp_path: Path) -> None:
+    manager = _manager(tmp_path, max_jobs=2)
+    manager.start()
+    try:
+        first = manager.submit("sleep0.3", [])
+        second = manager.submit("sleep0.3", ["--debug"])
+        low = manager.submit("low", [], priority=0)
+        high = manager.submit("high", [], priority=5)
+        _wait(manager, [first.id, second.id, low.id, high.id])
+
+        # Both sleeps ran at once, the rest waited for a free slot, and high priority went first
+        assert manager.jobs[second.id].started < manager.jobs[first.id].finished
+        assert manager.jobs[high.id].started <= manager.jobs[low.id].started
+        assert manager.jobs[high.id].started >= min(manager.jobs[first.id].finished, manager.jobs[second.id].finished)
+        assert all(manager.jobs[job.id].status == "done" for job in (first, second, low, high))
+        assert _log(manager, low.id) == "start low\nend low\n"
+    finally:
+        manager.close()
+
+
+def test_input_failure_and_cancel(tmp_path: Path) -> None:
+    manager = _manager(tmp_path, max_jobs=3, warm_workers=0)
+    manager.start()
+    try:
+        prompt = manager.submit("prompt", [])
+        fail = manager.submit("fail", [])
+        slow = manager.submit("sleep30", [])
+
+        chunk, _ = manager.read_log(prompt.id, 0, timeout=5)
+        while b"answer?" not in chunk:
+            more, _ = manager.read_log(prompt.id, len(chunk), timeout=5)
+            chunk += more
+        assert manager.send_input(prompt.id, "yes")
+        assert manager.cancel(slow.id)
+        _wait(manager, [prompt.id, fail.id, slow.id])
+
+        assert "got yes" in _log(manager, prompt.id)
+        assert (manager.jobs[fail.id].status, manager.jobs[fail.id].exit_code) == ("failed", 3)
+        assert manager.jobs[slow.id].status == "cancelled"
+        assert not manager.cancel(slow.id)
+    finally:
+        manager.close()
+
+
+def test_queue_survives_restart(tmp_path: Path) -> None:
+    manager = _manager(tmp_path, max_jobs=1, warm_workers=0)
+    manager.start()
+    running = manager.submit("sleep30", [])
+    queued = manager.submit("later", [], priority=1)
+    manager.close()
+
+    saved = {job["id"]: job["status"] for job in json.loads((tmp_path / "jobs.json").read_text(encoding="utf-8"))}
+    assert saved == {running.id: "interrupted", queued.id: "queued"}
+
+    restarted = _manager(tmp_path, max_jobs=1, warm_workers=0)
+    restarted.start()
+    try:
+        _wait(restarted, [queued.id])
+        assert restarted.jobs[queued.id].status == "done"
+        assert restarted.jobs[running.id].status == "interrupted"
+        assert "end later" in _log(restarted, queued.id)
+    finally:
+        restarted.close()
+
+
+def test_job_api_checks_priority_and_owner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from flask import g
+
+    from web_ui import server
+
+    manager = _manager(tmp_path, warm_workers=0)
+    monkeypatch.setattr(server, "_get_job_manager", lambda: manager)
+    monkeypatch.setattr(server, "_verify_csrf_header", lambda: True)
+    monkeypatch.setattr(server, "_resolve_user_path", lambda path, **_kwargs: path)
+    monkeypatch.setattr(server, "_assert_safe_resolved_path", lambda _path: None)
+    server.limiter.enabled = False
+
+    def call(view: Any, user: str, body: dict[str, Any], *args: str) -> tuple[int, dict[str, Any]]:
+        with server.app.test_request_context(method="POST", json=body):
+            g.authenticated = True
+            g.username = user
+            response = view(*args)
+            response, status = response if isinstance(response, tuple) else (response, response.status_code)
+            return status, response.get_json()
+
+    try:
+        for priority in ([1], {"a": 1}, "high"):
+            assert call(server.jobs_api, "alice", {"path": "movie", "priority": priority})[0] == 400
+        status, body = call(server.jobs_api, "alice", {"path": "movie", "priority": 2})
+        assert status == 200 and body["job"]["owner"] == "alice"
+        job_id = body["job"]["id"]
+
+        # Another user's session can't drive or stop the job
+        assert call(server.job_input, "mallory", {"input": "y"}, job_id)[0] == 403
+        assert call(server.job_cancel, "mallory", {}, job_id)[0] == 403
+        assert call(server.job_cancel, "alice", {}, "missing")[0] == 404
+        assert call(server.job_cancel, "alice", {}, job_id)[0] == 200
+    finally:
+        server.limiter.enabled = True
+        manager.close()
@@ -3,6 +3,7 @@
 import asyncio
 import contextlib
 import gc
+import glob
 import json
 import os
 import platform
@@ -20,8 +21,6 @@ from typing import Any, Optional, cast
 import aiofiles
 import cli_ui
 import discord
-import requests
-from packaging import version
 from torf import Torrent
 from typing_extensions import TypeAlias
 
@@ -30,9 +29,11 @@ from cogs.redaction import Redaction
 from discordbot import DiscordNotifier
 from src.add_comparison import ComparisonManager
 from src.args import Args
+from src.checkpoints import BASE_TORRENT, IMAGES, SCREENSHOTS, UploadCheckpoints
 from src.cleanup import cleanup_manager
 from src.clients import Clients
 from src.console import console
+from src.crossseed import CrossSeedEngine, CrossSeedMisses, content_fingerprint
 from src.disc_menus import process_disc_menus
 from src.dupe_checking import DupeChecker
 from src.get_desc import gen_desc
@@ -42,6 +43,7 @@ from src.languages import languages_manager
 from src.nfo_link import NfoLinkManager
 from src.qbitwait import Wait
 from src.queuemanage import QueueManager
+from src.rehostimages import RehostImagesManager
 from src.takescreens import TakeScreensManager
 from src.torrentcreate import TorrentCreator
 from src.trackerhandle import process_trackers
@@ -50,6 +52,7 @@ from src.trackers.COMMON import COMMON
 from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP, api_trackers, http_trackers, nfo_skip_trackers, notag_labels, other_api_trackers, tracker_class_map
 from src.trackerstatus import TrackerStatusManager
+from src.updatecheck import DEFAULT_CHECK_INTERVAL_HOURS, UpdateCheck, get_local_version, is_newer
 from src.uphelper import UploadHelper
 from src.uploadscreens import UploadScreensManager
 
@@ -490,6 +493,15 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                 if tracker in meta["trackers"]:
                     meta["trackers"].remove(tracker)
 
+        uploaded_before = UploadCheckpoints.for_meta(meta, config).uploaded_trackers()
+        skipped_trackers = [tracker for tracker in meta["trackers"] if tracker in uploaded_before]
+        if skipped_trackers:
+            console.print(
+                f"[yellow]Already uploaded to {', '.join(skipped_trackers)} in a previous run, skipping. Use --delete-tmp to upload this release to them again.[/yellow]"
+            )
+            meta["trackers"] = [tracker for tracker in meta["trackers"] if tracker not in uploaded_before]
+            trackers = meta["trackers"]
+
         meta["name_notag"], meta["name"], meta["clean_name"], meta["potential_missing"] = await name_manager.get_name(meta)
 
         if meta["debug"]:
@@ -874,8 +886,18 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                 await ComparisonManager(meta, config).add_comparison()
 
             else:
+                checkpoints = UploadCheckpoints.for_meta(meta, config)
+                saved_images = checkpoints.get(IMAGES, {"imghost": meta.get("imghost")})
+                if saved_images is not None and not meta.get("image_list"):
+                    meta["image_list"] = saved_images.get("image_list", [])
+                    meta["image_sizes"] = saved_images.get("image_sizes", {})
+                    meta["tonemapped"] = saved_images.get("tonemapped", False)
+                    if meta.get("debug"):
+                        console.print(f"[cyan]Loaded {len(meta['image_list'])} image links uploaded by a previous run")
+
                 image_data_file = f"{meta['base_dir']}/tmp/{meta['uuid']}/image_data.json"
-                if os.path.exists(image_data_file) and not meta.get("image_list"):
+                # Images of an earlier version of the source are stale
+                if os.path.exists(image_data_file) and not meta.get("image_list") and not checkpoints.source_changed:
                     try:
                         async with aiofiles.open(image_data_file, encoding="utf-8") as img_file:
                             content = await img_file.read()
@@ -917,6 +939,12 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                     elif meta.get("path_to_menu_screenshots", ""):
                         await process_disc_menus(meta, config)
 
+                # Screenshots of an earlier version of the source would be picked up as existing ones
+                if checkpoints.source_changed:
+                    for stale_file in checkpoints.stale_files(SCREENSHOTS):
+                        with contextlib.suppress(OSError):
+                            os.remove(stale_file)
+
                 # Take Screenshots
                 try:
                     if meta["is_disc"] == "BDMV":
@@ -1009,6 +1037,11 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                     gc.collect()
                     cleanup_manager.reset_terminal()
 
+                # Only a full set counts; screenshots skipped because images came from elsewhere don't
+                screenshot_files = glob.glob(os.path.join(glob.escape(f"{meta['base_dir']}/tmp/{meta['uuid']}"), "*.png"))
+                if len(screenshot_files) >= int(meta.get("screens") or 0) > 0:
+                    checkpoints.put(SCREENSHOTS, {"screens": meta.get("screens"), "manual_frames": manual_frames}, {"count": len(screenshot_files)}, files=screenshot_files)
+
                 if "image_list" not in meta:
                     meta["image_list"] = []
                 manual_frames_str = meta.get("manual_frames", "")
@@ -1168,9 +1201,13 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                         if image_list_count < min_successful_uploads:
                             raise Exception(f"Minimum of {min_successful_uploads} successful image uploads required, but only {image_list_count} were uploaded.")
 
-                        # Now that image_list exists, populate tracker-specific keys (and only reupload if required)
+                        # Now that image_list exists, populate tracker-specific keys (and only reupload if required).
+                        # Trackers needing other hosts are re-hosted together first, one concurrent upload per target host.
+                        rehost_instances = {tracker_name: tracker_class_map[tracker_name](config=config) for tracker_name in relevant_trackers}
+                        if len(rehost_instances) > 1:
+                            await RehostImagesManager(config).prepare_tracker_images(meta, rehost_instances)
                         for tracker_name in relevant_trackers:
-                            tracker_instance = tracker_class_map[tracker_name](config=config)
+                            tracker_instance = rehost_instances[tracker_name]
                             if meta.get("debug"):
                                 key = f"{tracker_name}_images_key"
                                 console.print(
@@ -1209,6 +1246,8 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
 
                         if meta.get("debug"):
                             console.print(f"[cyan]Saved {len(image_list)} images to image_data.json")
+                        if len(image_list) >= cutoff:
+                            checkpoints.put(IMAGES, {"imghost": meta.get("imghost")}, image_data)
                     except Exception as e:
                         console.print(f"[yellow]Failed to save image data: {str(e)}")
         finally:
@@ -1239,7 +1278,13 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                     break
             meta["skip_nfo"] = skip_nfo
 
-        if not os.path.exists(torrent_path):
+        checkpoints = UploadCheckpoints.for_meta(meta, config)
+        base_torrent_inputs = {"path": meta.get("path")}
+        if os.path.exists(torrent_path) and checkpoints.source_changed and checkpoints.get(BASE_TORRENT, base_torrent_inputs) is None and meta["nohash"] is False:
+            console.print("[yellow]The source changed since BASE.torrent was created, hashing it again.")
+            await TorrentCreator.create_torrent(meta, Path(meta["path"]), "BASE")
+
+        elif not os.path.exists(torrent_path):
             reuse_torrent = None
             if meta.get("rehash", False) is False and not meta["base_torrent_created"] and not meta["we_checked_them_all"]:
                 reuse_torrent = await client.find_existing_torrent(meta)
@@ -1259,6 +1304,8 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
             await TorrentCreator.create_torrent(meta, Path(meta["path"]), "BASE")
 
         if os.path.exists(torrent_path):
+            if checkpoints.get(BASE_TORRENT, base_torrent_inputs) is None:
+                checkpoints.put(BASE_TORRENT, base_torrent_inputs, files=[torrent_path])
             raw_trackers = meta.get("trackers")
             if isinstance(raw_trackers, str):
                 trackers_list = [raw_trackers]
@@ -1338,64 +1385,25 @@ async def save_processed_file(log_file: str, file_path: str) -> None:
         await f.write(json.dumps(processed_files_clean, indent=4))
 
 
-def get_local_version(version_file: str) -> Optional[str]:
-    """Extracts the local version from the version.py file."""
-    try:
-        with open(version_file, encoding="utf-8") as f:
-            content = f.read()
-        match = re.search(r'__version__\s*=\s*"([^"]+)"', content)
-        if match:
-            return match.group(1)
+def _print_update_notice(entry: Mapping[str, Any], local_version: str, verbose: bool) -> None:
+    remote_version = entry.get("remote_version")
+    console.print(f"[red][NOTICE] [green]Update available: v[/green][yellow]{remote_version}")
+    console.print(f"[red][NOTICE] [green]Current version: v[/green][yellow]{local_version}")
+    if verbose:
+        changelog = entry.get("changelog")
+        if changelog:
+            console.print(f"{changelog}")
         else:
-            console.print("[red]Version not found in local file.")
-            return None
-    except FileNotFoundError:
-        console.print("[red]Version file not found.")
-        return None
-
-
-def get_remote_version(url: str) -> tuple[Optional[str], Optional[str]]:
-    """Fetches the latest version information from the remote repository."""
-    try:
-        response = requests.get(url, timeout=30)
-        if response.status_code == 200:
-            content = response.text
-            match = re.search(r'__version__\s*=\s*"([^"]+)"', content)
-            if match:
-                return match.group(1), content
-            else:
-                console.print("[red]Version not found in remote file.")
-                return None, None
-        else:
-            console.print(f"[red]Failed to fetch remote version file. Status code: {response.status_code}")
-            return None, None
-    except requests.RequestException as e:
-        console.print(f"[red]An error occurred while fetching the remote version file: {e}")
-        return None, None
-
-
-def extract_changelog(content: str, to_version: str) -> Optional[str]:
-    """Extracts the changelog entries between the specified versions."""
-    # Try to find the to_version with 'v' prefix first (current format)
-    patterns_to_try = [
-        rf'__version__\s*=\s*"{re.escape(to_version)}"\s*\n\s*"""\s*(.*?)\s*"""',  # Try with 'v' prefix
-        rf'__version__\s*=\s*"{re.escape(to_version.lstrip("v"))}"\s*\n\s*"""\s*(.*?)\s*"""',  # Try without 'v' prefix
-    ]
-
-    for pattern in patterns_to_try:
-        match = re.search(pattern, content, re.DOTALL)
-        if match:
-            changelog = match.group(1).strip()
-            # Remove the comment markers (# ) that were added by the GitHub Action
-            changelog = re.sub(r"^# ", "", changelog, flags=re.MULTILINE)
-            return changelog
-
-    return None
+            console.print("[yellow]Changelog not found between versions.[/yellow]")
 
 
 async def update_notification(base_dir: str) -> Optional[str]:
+    """Return the local version, printing the last known update notice.
+
+    GitHub is asked in the background (at most every ``update_check_interval`` hours);
+    ``finish_update_notification`` prints a notice that the refresh turned up.
+    """
     version_file = os.path.join(base_dir, "data", "version.py")
-    remote_version_url = "https://raw.githubusercontent.com/Audionut/Upload-Assistant/master/data/version.py"
 
     notice = config["DEFAULT"].get("update_notification", True)
     verbose = config["DEFAULT"].get("verbose_notification", False)
@@ -1407,25 +1415,28 @@ async def update_notification(base_dir: str) -> Optional[str]:
     if not notice:
         return local_version
 
-    remote_version, remote_content = get_remote_version(remote_version_url)
-    if not remote_version:
-        return local_version
-
-    if version.parse(remote_version) > version.parse(local_version):
-        console.print(f"[red][NOTICE] [green]Update available: v[/green][yellow]{remote_version}")
-        console.print(f"[red][NOTICE] [green]Current version: v[/green][yellow]{local_version}")
-        asyncio.create_task(asyncio.sleep(1))
-        if verbose and remote_content:
-            changelog = extract_changelog(remote_content, remote_version)
-            if changelog:
-                asyncio.create_task(asyncio.sleep(1))
-                console.print(f"{changelog}")
-            else:
-                console.print("[yellow]Changelog not found between versions.[/yellow]")
+    interval = config["DEFAULT"].get("update_check_interval", DEFAULT_CHECK_INTERVAL_HOURS)
+    checker = UpdateCheck.for_base_dir(base_dir)
+    cached = checker.start(float(interval))
+    if cached and is_newer(cached.get("remote_version"), local_version):
+        _print_update_notice(cached, local_version, bool(verbose))
+        checker.announced = cached.get("remote_version")
 
     return local_version
 
 
+async def finish_update_notification(base_dir: str, local_version: Optional[str]) -> None:
+    """Print the notice of a background update check that found a release not announced at startup."""
+    checker = UpdateCheck.for_base_dir(base_dir)
+    entry = await checker.finish()
+    if not entry or not local_version:
+        return
+    remote_version = entry.get("remote_version")
+    if is_newer(remote_version, local_version) and remote_version != checker.announced:
+        checker.announced = remote_version
+        _print_update_notice(entry, local_version, bool(config["DEFAULT"].get("verbose_notification", False)))
+
+
 async def do_the_thing(base_dir: str) -> None:
     # Reload config from disk so that changes made via the WebUI config
     # editor (or manual file edits between runs) are picked up.  The
@@ -1521,7 +1532,7 @@ async def do_the_thing(base_dir: str) -> None:
 
             from waitress import create_server  # type: ignore[attr-defined]
 
-            from web_ui.server import app, set_runtime_browse_roots
+            from web_ui.server import app, set_runtime_browse_roots, start_job_manager, stop_job_manager
 
             # Set browse roots for web UI
             browse_roots = os.environ.get("UA_BROWSE_ROOTS", "").strip()
@@ -1536,6 +1547,7 @@ async def do_the_thing(base_dir: str) -> None:
                 raise SystemExit("No browse roots specified. Please set UA_BROWSE_ROOTS environment variable or provide explicit paths.")
 
             set_runtime_browse_roots(browse_roots)
+            start_job_manager()
 
             try:
                 _webui_server = create_server(app, host=host, port=port)
@@ -1569,6 +1581,7 @@ async def do_the_thing(base_dir: str) -> None:
                     console.print(f"[red]Web UI server error: {e}[/red]")
                     sys.exit(1)
             finally:
+                stop_job_manager()
                 console.print("[yellow]Web UI server stopped[/yellow]")
 
             return  # Exit early when running web UI only
@@ -1689,6 +1702,8 @@ async def do_the_thing(base_dir: str) -> None:
                             console.print()
                     except Exception as e:
                         console.print(f"[bold red]Failed to delete temp directory: {str(e)}")
+                # Read the upload checkpoints from disk again for every run of this path
+                UploadCheckpoints.discard({"base_dir": base_dir, "uuid": os.path.basename(path)})
 
                 meta_file = os.path.join(base_dir, "tmp", os.path.basename(path), "meta.json")
 
@@ -1989,6 +2004,7 @@ async def do_the_thing(base_dir: str) -> None:
         cleanup_manager.reset_terminal()
 
     finally:
+        await finish_update_notification(base_dir, meta.get("current_version"))
         if bot is not None:
             await bot.close()
         if connect_task is not None:
@@ -2048,77 +2064,72 @@ async def process_cross_seeds(meta: Meta) -> None:
 
         valid_unchecked_trackers.append(tracker)
 
-    # Search for cross-seeds on unchecked trackers
-    if valid_unchecked_trackers and config["DEFAULT"].get("cross_seed_check_everything", False):
-        console.print(f"[cyan]Checking for cross-seeds on unchecked trackers: {valid_unchecked_trackers}[/cyan]")
+    # Trackers that already have cross-seed data from the dupe check go straight to injection
+    found_trackers = [tracker for tracker in all_trackers if meta.get(f"{tracker}_cross_seed", None) is not None]
+    check_everything = bool(valid_unchecked_trackers and config["DEFAULT"].get("cross_seed_check_everything", False))
+
+    if not found_trackers and not check_everything:
+        if meta.get("debug"):
+            console.print("[yellow]No trackers found with cross-seed data[/yellow]")
+        return
+
+    debug = meta.get("debug", False)
+    misses = CrossSeedMisses.for_base_dir(meta["base_dir"]) if check_everything else None
+    engine = CrossSeedEngine(config, misses, content_fingerprint(meta), debug=bool(debug))
+    search_trackers = engine.needs_search(valid_unchecked_trackers) if check_everything else []
+    if check_everything and len(search_trackers) < len(valid_unchecked_trackers):
+        skipped = [tracker for tracker in valid_unchecked_trackers if tracker not in search_trackers]
+        console.print(f"[cyan]Skipping trackers that had no cross-seed for this content recently: {skipped}[/cyan]")
+
+    if search_trackers:
+        console.print(f"[cyan]Checking for cross-seeds on unchecked trackers: {search_trackers}[/cyan]")
 
         try:
-            await validate_tracker_logins(meta, valid_unchecked_trackers)
+            await validate_tracker_logins(meta, search_trackers)
             await asyncio.sleep(0.2)
         except Exception as e:
             console.print(f"[yellow]Warning: Tracker validation encountered an error: {e}[/yellow]")
+        search_trackers = [tracker for tracker in search_trackers if not meta.get("tracker_status", {}).get(tracker, {}).get("skipped")]
 
-        # Store original unattended value
-        original_unattended = meta.get("unattended", False)
-        meta["unattended"] = True
-
-        helper = UploadHelper(config)
-        dupe_checker = DupeChecker(config)
+    if found_trackers:
+        console.print(f"[cyan]Valid trackers for cross-seed check: {found_trackers}[/cyan]")
 
-        async def check_tracker_for_dupes(tracker: str) -> None:
-            try:
-                tracker_class = tracker_class_map[tracker](config=config)
-                disctype = meta.get("disctype", "")
-
-                # Search for existing torrents
-                if tracker != "PTP":
-                    dupes = await tracker_class.search_existing(meta, disctype)
-                else:
-                    ptp = PTP(config=config)
-                    group_id = meta.get("ptp_groupID")
-                    if not group_id:
-                        group_id = await ptp.get_group_by_imdb(meta["imdb"])
-                        meta["ptp_groupID"] = group_id
-                    if group_id is None:
-                        return
-                    dupes = await ptp.search_existing(group_id, meta, disctype)
-
-                if dupes:
-                    dupes = await dupe_checker.filter_dupes(dupes, meta, tracker)
-                    _is_dupe, updated_meta = await helper.dupe_check(cast(list[Any], dupes), meta, tracker)
-                    # Persist any updates from dupe_check (defensive in case it returns a copy)
-                    if updated_meta is not meta:
-                        meta.update(updated_meta)
-
-            except Exception as e:
-                if meta.get("debug"):
-                    console.print(f"[yellow]Error checking {tracker} for cross-seeds: {e}[/yellow]")
-
-        # Run all dupe checks concurrently
-        await asyncio.gather(*[check_tracker_for_dupes(tracker) for tracker in valid_unchecked_trackers], return_exceptions=True)
-
-        # Restore original unattended value
-        meta["unattended"] = original_unattended
-
-    # Filter to only trackers with cross-seed data
-    valid_trackers = [tracker for tracker in all_trackers if meta.get(f"{tracker}_cross_seed", None) is not None]
+    helper = UploadHelper(config)
+    dupe_checker = DupeChecker(config)
 
-    if not valid_trackers:
-        if meta.get("debug"):
-            console.print("[yellow]No trackers found with cross-seed data[/yellow]")
-        return
+    async def search_tracker(tracker: str) -> Optional[bool]:
+        tracker_class = tracker_class_map[tracker](config=config)
+        disctype = meta.get("disctype", "")
+        # search_existing() reports site errors as a "data error" status message and returns no dupes
+        previous_message = meta.get("tracker_status", {}).get(tracker, {}).get("status_message")
 
-    console.print(f"[cyan]Valid trackers for cross-seed check: {valid_trackers}[/cyan]")
+        # Search for existing torrents
+        if tracker != "PTP":
+            dupes = await tracker_class.search_existing(meta, disctype)
+        else:
+            ptp = PTP(config=config)
+            group_id = meta.get("ptp_groupID")
+            if not group_id:
+                group_id = await ptp.get_group_by_imdb(meta["imdb"])
+                meta["ptp_groupID"] = group_id
+            if group_id is None:
+                return False
+            dupes = await ptp.search_existing(group_id, meta, disctype)
+
+        status_message = meta.get("tracker_status", {}).get(tracker, {}).get("status_message")
+        if status_message != previous_message and "data error" in str(status_message):
+            return None
+        if dupes:
+            dupes = await dupe_checker.filter_dupes(dupes, meta, tracker)
+            _is_dupe, updated_meta = await helper.dupe_check(cast(list[Any], dupes), meta, tracker)
+            # Persist any updates from dupe_check (defensive in case it returns a copy)
+            if updated_meta is not meta:
+                meta.update(updated_meta)
+        return bool(meta.get(f"{tracker}_cross_seed"))
 
     common = COMMON(config)
-    try:
-        concurrency_limit = int(config.get("DEFAULT", {}).get("cross_seed_concurrency", 8))
-    except (TypeError, ValueError):
-        concurrency_limit = 8
-    semaphore = asyncio.Semaphore(max(1, concurrency_limit))
-    debug = meta.get("debug", False)
 
-    async def handle_cross_seed(tracker: str) -> None:
+    async def download_cross_seed(tracker: str) -> Optional[str]:
         cross_seed_key = f"{tracker}_cross_seed"
         cross_seed_value = meta.get(cross_seed_key, False)
 
@@ -2126,7 +2137,7 @@ async def process_cross_seeds(meta: Meta) -> None:
             console.print(f"[cyan]Debug: {tracker} - cross_seed: {Redaction.redact_private_info(cross_seed_value)}")
 
         if not cross_seed_value:
-            return
+            return None
 
         if debug:
             console.print(f"[green]Found cross-seed for {tracker}!")
@@ -2137,7 +2148,7 @@ async def process_cross_seeds(meta: Meta) -> None:
         else:
             if meta.get("debug"):
                 console.print(f"[yellow]Invalid cross-seed URL for {tracker}, skipping[/yellow]")
-            return
+            return None
 
         headers = None
         if tracker == "RTF":
@@ -2167,16 +2178,26 @@ async def process_cross_seeds(meta: Meta) -> None:
                 if debug:
                     console.print(f"[yellow]Error getting AR auth credentials: {e}[/yellow]")
 
-        async with semaphore:
-            await common.download_tracker_torrent(meta, tracker, headers=headers, params=None, downurl=download_url, hash_is_id=False, cross=True)
-            await client.add_to_client(meta, tracker, cross=True)
+        torrent_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}_cross].torrent"
+        # A torrent left by an earlier run must not be mistaken for this download
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(torrent_path)
+        await common.download_tracker_torrent(meta, tracker, headers=headers, params=None, downurl=download_url, hash_is_id=False, cross=True)
+        return torrent_path
 
-    tasks = [(tracker, asyncio.create_task(handle_cross_seed(tracker))) for tracker in valid_trackers]
+    async def add_cross_seed(tracker: str) -> None:
+        await client.add_to_client(meta, tracker, cross=True)
 
-    results = await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
-    for (tracker, _), result in zip(tasks, results):
-        if isinstance(result, Exception):
-            console.print(f"[red]Cross-seed handling failed for {tracker}: {result}[/red]")
+    # Searches run unattended; the prompts of dupe_check are not wanted for cross-seeds
+    original_unattended = meta.get("unattended", False)
+    meta["unattended"] = True
+    try:
+        outcomes = await engine.run(search_trackers, found_trackers, search_tracker, download_cross_seed, add_cross_seed)
+    finally:
+        meta["unattended"] = original_unattended
+
+    if debug:
+        console.print(f"[cyan]Cross-seed results: {', '.join(f'{tracker} {outcome}' for tracker, outcome in sorted(outcomes.items()))}[/cyan]")
 
 
 async def get_mkbrr_path(meta: Meta, base_dir: Optional[str] = None) -> Optional[str]:
@@ -2214,10 +2235,11 @@ async def main() -> None:
             console.print(f"[bold red]Unexpected error: {e}[/bold red]")
 
 
-if __name__ == "__main__":
+def run_cli() -> None:
+    """Run ``main()`` as the command line entry point: signal handlers, event loop and final cleanup."""
     check_python_version()
 
-    # Register signal handlers only when run as main script (not when imported)
+    # Register signal handlers only for a command line run (not when imported)
     signal.signal(signal.SIGINT, _handle_shutdown_signal)
     if hasattr(signal, "SIGTERM"):
         signal.signal(signal.SIGTERM, _handle_shutdown_signal)
@@ -2256,3 +2278,7 @@ if __name__ == "__main__":
             console.print("[green]Shutdown complete[/green]")
 
         sys.exit(0)
+
+
+if __name__ == "__main__":
+    run_cli()
@@ -1,54 +1,174 @@
 from __future__ import annotations
 
+import atexit
+import bisect
+import gzip
 import json
+import os
+import shutil
+import sys
+import threading
+from collections import deque
+from collections.abc import Iterator
 from contextlib import suppress
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Callable, Optional
+
+from web_ui.authstate import AuthState
 
 DEFAULT_LEVEL = "access_denied"  # default: log only failed/denied attempts
 VALID_LEVELS = {"access_denied", "access", "disabled"}
 
+# The log file is compressed into access_log.log.1.gz once it reaches this size or age
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_MAX_AGE_DAYS = 7
+# Compressed logs kept (access_log.log.1.gz is the newest)
+DEFAULT_BACKUPS = 5
+# Newest entries kept in memory, so the log view rarely has to read the file
+RECENT_ENTRIES = 1000
+# Entries are written in batches by a background thread, at least this often (seconds)
+FLUSH_INTERVAL = 1.0
+FLUSH_BATCH = 100
+# One (timestamp, offset) checkpoint per this many lines of the log file, for time-range reads
+INDEX_EVERY = 256
+_READ_BLOCK = 64 * 1024
+
+
+def _timestamp(moment: datetime) -> str:
+    # Always with microseconds, so timestamps compare correctly as strings
+    return moment.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def parse_time(value: str) -> str:
+    """Timestamp filter from an ISO 8601 time or epoch seconds, as stored in log records.
+
+    Raises ValueError for anything else.
+    """
+    try:
+        moment = datetime.fromtimestamp(float(value), timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        moment = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+    return _timestamp(moment)
+
+
+def _status_matcher(status: str) -> Callable[[dict[str, Any]], bool]:
+    """Status filter: ``success``, ``failed``, a class such as ``4xx`` or an exact code."""
+    status = status.strip().lower()
+    if status in ("success", "failed"):
+        wanted = status == "success"
+        return lambda record: bool(record.get("success")) == wanted
+    if len(status) == 3 and status[0].isdigit() and status[1:] == "xx":
+        status_class = int(status[0])
+        return lambda record: int(record.get("status") or 0) // 100 == status_class
+    if status.isdigit():
+        code = int(status)
+        return lambda record: record.get("status") == code
+    raise ValueError(f"Invalid status filter: {status}")
+
+
+def _lines_backwards(f: IO[bytes], end: int) -> Iterator[tuple[int, bytes]]:
+    """Lines of ``f`` before byte ``end``, newest first, with the offsets they start at."""
+    pos = end
+    head = b""
+    while pos > 0:
+        size = min(_READ_BLOCK, pos)
+        pos -= size
+        f.seek(pos)
+        lines = (f.read(size) + head).split(b"\n")
+        # The first piece may continue in the previous block
+        head = lines.pop(0)
+        offset = pos + len(head) + 1
+        starts: list[int] = []
+        for line in lines:
+            starts.append(offset)
+            offset += len(line) + 1
+        for start, line in zip(reversed(starts), reversed(lines)):
+            if line.strip():
+                yield start, line
+    if head.strip():
+        yield 0, head
+
+
+def _parse(line: bytes) -> Optional[dict[str, Any]]:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+class _Line:
+    """A log record kept in memory, with the offset of its line in the log file once written."""
+
+    __slots__ = ("offset", "record", "timestamp")
+
+    def __init__(self, offset: Optional[int], record: dict[str, Any]) -> None:
+        self.offset = offset
+        self.record = record
+        self.timestamp = str(record.get("timestamp") or "")
+
 
 class AccessLogger:
-    def __init__(self, cfg_dir: Path) -> None:
+    def __init__(self, cfg_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES, max_age_days: int = DEFAULT_MAX_AGE_DAYS, backups: int = DEFAULT_BACKUPS) -> None:
         self.cfg_dir = Path(cfg_dir)
         self.cfg_dir.mkdir(parents=True, exist_ok=True)
         # store access level inside webui_auth.json per request
         self.user_file = self.cfg_dir / "webui_auth.json"
         self.log_file = self.cfg_dir / "access_log.log"
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        self.backups = backups
+        # Guards the in-memory entries; _io_lock guards the file, its size and index, and is taken first
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._recent: deque[_Line] = deque(maxlen=RECENT_ENTRIES)
+        self._pending: list[_Line] = []
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        self._size = 0
+        # Epoch of the first entry in the log file, for age-based rotation
+        self._started: Optional[float] = None
+        # (timestamp, offset) checkpoints of the log file, built on the first time-range read
+        self._index: Optional[list[tuple[str, int]]] = None
+        self._lines = 0
+        self._load()
+        atexit.register(self.close)
 
-    def get_level(self) -> str:
+    def _load(self) -> None:
+        """Read the newest entries of the log file into memory, from its end."""
         try:
-            if self.user_file.exists():
-                try:
-                    doc = json.loads(self.user_file.read_text(encoding="utf-8"))
-                except Exception:
-                    doc = None
-                if isinstance(doc, dict):
-                    txt = doc.get("access_log_level")
-                    if isinstance(txt, str) and txt in VALID_LEVELS:
-                        return txt
-        except Exception:
-            pass
+            with open(self.log_file, "rb") as f:
+                first = _parse(f.readline())
+                self._size = f.seek(0, os.SEEK_END)
+                lines: list[_Line] = []
+                for offset, raw in _lines_backwards(f, self._size):
+                    record = _parse(raw)
+                    if record is not None:
+                        lines.append(_Line(offset, record))
+                        if len(lines) >= RECENT_ENTRIES:
+                            break
+        except OSError:
+            return
+        self._recent.extend(reversed(lines))
+        with suppress(Exception):
+            self._started = datetime.fromisoformat(str((first or {})["timestamp"])).timestamp()
+
+    def get_level(self) -> str:
+        txt = AuthState.for_path(self.user_file).get("access_log_level")
+        if isinstance(txt, str) and txt in VALID_LEVELS:
+            return txt
         return DEFAULT_LEVEL
 
     def set_level(self, level: str) -> bool:
         if level not in VALID_LEVELS:
             return False
         try:
-            # load existing user file (if any), update the access_log_level key
-            data: dict[str, object] = {}
-            if self.user_file.exists():
-                try:
-                    data = json.loads(self.user_file.read_text(encoding="utf-8")) or {}
-                except Exception:
-                    return False
-            if not isinstance(data, dict):
-                data = {}
-            data["access_log_level"] = level
-            # write back safely
-            self.user_file.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            # update the access_log_level key, keeping the rest of the user file
+            AuthState.for_path(self.user_file).update("access_log_level", level)
             return True
         except Exception:
             return False
@@ -89,7 +209,7 @@ class AccessLogger:
     ) -> None:
         try:
             record: dict[str, Any] = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": "",
                 "endpoint": endpoint,
                 "method": method,
                 "remote_addr": remote_addr,
@@ -160,25 +280,175 @@ class AccessLogger:
                 if record.get("user") is not None:
                     record["user"] = "<REDACTED>"
 
-            # Append as JSON line
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            with self._lock:
+                if self._closed:
+                    return
+                # Stamped under the lock, so entries are in timestamp order
+                record["timestamp"] = _timestamp(datetime.now(timezone.utc))
+                line = _Line(None, record)
+                self._recent.append(line)
+                self._pending.append(line)
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._run_writer, name="access-log-writer", daemon=True)
+                    self._writer.start()
+                elif len(self._pending) >= FLUSH_BATCH:
+                    self._wake.notify()
         except Exception:
             # Best-effort logging: swallow errors
             pass
 
+    def _run_writer(self) -> None:
+        while True:
+            with self._lock:
+                self._wake.wait_for(lambda: self._closed or len(self._pending) >= FLUSH_BATCH, FLUSH_INTERVAL)
+                closed = self._closed
+            self.flush()
+            if closed:
+                return
+
+    def flush(self) -> None:
+        """Write the pending entries to the log file, rotating it first when it is due."""
+        with self._io_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+            try:
+                if self._size and self._rotation_due():
+                    self._rotate()
+                data: list[bytes] = []
+                offset = self._size
+                for line in batch:
+                    raw = (json.dumps(line.record, ensure_ascii=False) + "\n").encode("utf-8")
+                    data.append(raw)
+                    line.offset = offset
+                    if self._index is not None and self._lines % INDEX_EVERY == 0:
+                        self._index.append((line.timestamp, offset))
+                    self._lines += 1
+                    offset += len(raw)
+                with open(self.log_file, "ab") as f:
+                    f.write(b"".join(data))
+                if not self._size:
+                    self._started = datetime.fromisoformat(batch[0].timestamp).timestamp()
+                self._size = offset
+            except Exception:
+                # Best-effort logging: the batch stays in memory only
+                for line in batch:
+                    line.offset = None
+                self._index = None
+
+    def _rotation_due(self) -> bool:
+        if self.max_bytes and self._size >= self.max_bytes:
+            return True
+        return bool(self.max_age and self._started is not None and datetime.now(timezone.utc).timestamp() - self._started >= self.max_age)
+
+    def backup_file(self, number: int) -> Path:
+        return self.log_file.with_name(f"{self.log_file.name}.{number}.gz")
+
+    def _rotate(self) -> None:
+        # Called with _io_lock held
+        if self.backups > 0:
+            for number in range(self.backups - 1, 0, -1):
+                if self.backup_file(number).exists():
+                    os.replace(self.backup_file(number), self.backup_file(number + 1))
+            with open(self.log_file, "rb") as src, gzip.open(self.backup_file(1), "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        self.log_file.unlink()
+        self._size = 0
+        self._started = None
+        self._index = []
+        self._lines = 0
+        with self._lock:
+            # Still shown from memory, but no longer in the log file
+            for line in self._recent:
+                line.offset = None
+
+    def close(self) -> None:
+        """Write out the pending entries and stop the writer thread."""
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+        self.flush()
+
+    def _build_index(self) -> None:
+        # Called with _io_lock held
+        index: list[tuple[str, int]] = []
+        offset = 0
+        lines = 0
+        with suppress(OSError), open(self.log_file, "rb") as f:
+            for raw in f:
+                if lines % INDEX_EVERY == 0:
+                    record = _parse(raw)
+                    if record is not None:
+                        index.append((str(record.get("timestamp") or ""), offset))
+                offset += len(raw)
+                lines += 1
+        self._index = index
+        self._lines = lines
+
+    def entries(
+        self,
+        n: int = 200,
+        *,
+        status: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        ip: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """The newest ``n`` entries matching all the given filters, oldest first.
+
+        ``status`` is ``success``, ``failed``, a class such as ``4xx`` or a code, ``endpoint``
+        a path prefix and ``ip`` an exact remote address. ``since`` and ``until`` are timestamps
+        from ``parse_time``. Entries are read newest first, from memory and then backwards
+        through the log file, until ``n`` match; compressed older logs are not searched.
+        """
+        checks: list[Callable[[dict[str, Any]], bool]] = []
+        if status:
+            checks.append(_status_matcher(status))
+        if endpoint:
+            checks.append(lambda record: str(record.get("endpoint") or "").startswith(endpoint))
+        if ip:
+            checks.append(lambda record: record.get("remote_addr") == ip)
+        out: list[dict[str, Any]] = []
+
+        def take(timestamp: str, record: dict[str, Any]) -> bool:
+            """Collect ``record`` if it matches; True once no older entry can be needed."""
+            if until and timestamp > until:
+                return False
+            if since and timestamp < since:
+                return True
+            if all(check(record) for check in checks):
+                out.append(record)
+            return len(out) >= n
+
+        with self._io_lock:
+            with self._lock:
+                recent = list(self._recent)
+            if any(take(line.timestamp, line.record) for line in reversed(recent)):
+                return out[::-1]
+            # Older entries are in the file, before the first one still in memory
+            end = next((line.offset for line in recent if line.offset is not None), self._size)
+            if until:
+                if self._index is None:
+                    self._build_index()
+                index = self._index or []
+                # Lines from the first checkpoint after ``until`` on are all too new
+                after = bisect.bisect_right(index, (until, sys.maxsize))
+                if after < len(index):
+                    end = min(end, index[after][1])
+            try:
+                with open(self.log_file, "rb") as f:
+                    for _, raw in _lines_backwards(f, end):
+                        record = _parse(raw)
+                        if record is not None and take(str(record.get("timestamp") or ""), record):
+                            break
+            except OSError:
+                pass
+        return out[::-1]
+
     def tail(self, n: int = 200) -> list[dict[str, Any]]:
         try:
-            if not self.log_file.exists():
-                return []
-            # Read last n lines (simple approach)
-            with open(self.log_file, encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            lines = lines[-n:]
-            out = []
-            for ln in lines:
-                with suppress(Exception):
-                    out.append(json.loads(ln))
-            return out
+            return self.entries(n)
         except Exception:
             return []
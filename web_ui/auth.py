@@ -10,6 +10,7 @@ Provides:
 from __future__ import annotations
 
 import base64
+import copy
 import json
 import logging
 import math
@@ -22,6 +23,8 @@ from typing import Optional
 from argon2 import PasswordHasher
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
+from web_ui.authstate import AuthState
+
 log = logging.getLogger(__name__)
 
 
@@ -264,10 +267,41 @@ def verify_password(hash: str, password: str) -> bool:
         return False
 
 
+_cached_user_file: Optional[Path] = None
+
+
 def _get_user_file() -> Path:
-    cfg = get_config_dir()
-    cfg.mkdir(parents=True, exist_ok=True)
-    return cfg / "webui_auth.json"
+    # Resolved once: get_config_dir probes the container runtime on every call
+    global _cached_user_file  # noqa: PLW0603
+    if _cached_user_file is None:
+        cfg = get_config_dir()
+        cfg.mkdir(parents=True, exist_ok=True)
+        _cached_user_file = cfg / "webui_auth.json"
+    return _cached_user_file
+
+
+def _state() -> AuthState:
+    """Cached webui_auth.json; reloaded when the file changes on disk."""
+    return AuthState.for_path(_get_user_file())
+
+
+def _load_raw_user_file() -> dict:
+    """The stored user record for an update, or {} when there is none yet."""
+    try:
+        raw = _state().load()
+    except ValueError:
+        raise OSError("failed to read existing user file; aborting to avoid overwriting encrypted data") from None
+    if raw is None:
+        return {}
+    if not isinstance(raw, dict):
+        raise OSError("failed to read existing user file; aborting to avoid overwriting encrypted data")
+    return raw
+
+
+def _save_user_file(raw: dict) -> None:
+    _state().save(raw)
+    with suppress(Exception):
+        os.chmod(_get_user_file(), 0o600)
 
 
 def _get_master_key() -> bytes:
@@ -399,18 +433,19 @@ def create_user(username: str, password: str) -> None:
     username_enc = encrypt_text(key, username)
 
     data = {"username_enc": username_enc, "password_hash": hash_password(password), "extras_enc": extras_enc}
-    path.write_text(json.dumps(data), encoding="utf-8")
-    with suppress(Exception):
-        os.chmod(path, 0o600)
+    _save_user_file(data)
 
 
 def load_user() -> Optional[dict]:
-    path = _get_user_file()
-    if not path.exists():
-        return None
+    return copy.deepcopy(_state().memo("user", _decrypt_user))
+
+
+def _decrypt_user() -> Optional[dict]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
+        data = _state().load()
+    except ValueError:
+        return None
+    if data is None:
         return None
 
     # Attempt to decrypt extras blob (contains per-field encrypted values)
@@ -451,6 +486,10 @@ def load_user() -> Optional[dict]:
 
 
 def get_totp_secret() -> Optional[str]:
+    return _state().memo("totp_secret", _decrypt_totp_secret)
+
+
+def _decrypt_totp_secret() -> Optional[str]:
     u = load_user()
     if not u:
         return None
@@ -465,14 +504,7 @@ def get_totp_secret() -> Optional[str]:
 
 def set_totp_secret(secret: Optional[str]) -> None:
     # Read raw file, update extras, re-encrypt
-    path = _get_user_file()
-    if path.exists():
-        try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            raise OSError("failed to read existing user file; aborting to avoid overwriting encrypted data") from None
-    else:
-        raw = {}
+    raw = _load_raw_user_file()
     extras = {}
     extras_enc = raw.get("extras_enc")
     if extras_enc:
@@ -489,12 +521,14 @@ def set_totp_secret(secret: Optional[str]) -> None:
 
     key = _get_master_key()
     raw["extras_enc"] = encrypt_text(key, json.dumps(extras, separators=(",", ":"), ensure_ascii=False))
-    path.write_text(json.dumps(raw), encoding="utf-8")
-    with suppress(Exception):
-        os.chmod(path, 0o600)
+    _save_user_file(raw)
 
 
 def get_recovery_hashes() -> list[str]:
+    return list(_state().memo("recovery_hashes", _decrypt_recovery_hashes))
+
+
+def _decrypt_recovery_hashes() -> list[str]:
     u = load_user()
     if not u:
         return []
@@ -512,14 +546,7 @@ def get_recovery_hashes() -> list[str]:
 
 
 def set_recovery_hashes(hashes: list[str]) -> None:
-    path = _get_user_file()
-    if path.exists():
-        try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            raise OSError("failed to read existing user file; aborting to avoid overwriting encrypted data") from None
-    else:
-        raw = {}
+    raw = _load_raw_user_file()
     extras = {}
     extras_enc = raw.get("extras_enc")
     if extras_enc:
@@ -534,12 +561,14 @@ def set_recovery_hashes(hashes: list[str]) -> None:
 
     key = _get_master_key()
     raw["extras_enc"] = encrypt_text(key, json.dumps(extras, separators=(",", ":"), ensure_ascii=False))
-    path.write_text(json.dumps(raw), encoding="utf-8")
-    with suppress(Exception):
-        os.chmod(path, 0o600)
+    _save_user_file(raw)
 
 
 def get_api_tokens() -> dict:
+    return copy.deepcopy(_state().memo("api_tokens", _decrypt_api_tokens))
+
+
+def _decrypt_api_tokens() -> dict:
     u = load_user()
     if not u:
         return {}
@@ -556,14 +585,7 @@ def get_api_tokens() -> dict:
 
 
 def set_api_tokens(store: dict) -> None:
-    path = _get_user_file()
-    if path.exists():
-        try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            raise OSError("failed to read existing user file; aborting to avoid overwriting encrypted data") from None
-    else:
-        raw = {}
+    raw = _load_raw_user_file()
     extras = {}
     extras_enc = raw.get("extras_enc")
     if extras_enc:
@@ -578,9 +600,7 @@ def set_api_tokens(store: dict) -> None:
 
     key = _get_master_key()
     raw["extras_enc"] = encrypt_text(key, json.dumps(extras, separators=(",", ":"), ensure_ascii=False))
-    path.write_text(json.dumps(raw), encoding="utf-8")
-    with suppress(Exception):
-        os.chmod(path, 0o600)
+    _save_user_file(raw)
 
 
 def verify_user(username: str, password: str) -> bool:
@@ -0,0 +1,120 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""In-memory copy of webui_auth.json for the web UI auth, IP control and access log code.
+
+The file is parsed once and reused until its mtime, size or inode changes, so edits made
+outside the web UI are still picked up. Writes go to the file and to the cached copy
+together. Values derived from the file, such as the decrypted user record, are memoized
+against the same version of the file.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Parsed contents of a file that is not valid JSON
+_INVALID = object()
+
+
+class AuthState:
+    """Cached contents of one JSON state file, shared by every user of that path."""
+
+    _instances: dict[Path, AuthState] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._signature: Optional[tuple[int, int, int]] = None
+        self._data: Any = None
+        self._memo: dict[str, Any] = {}
+
+    @classmethod
+    def for_path(cls, path: Path) -> AuthState:
+        key = Path(os.path.abspath(path))
+        with cls._instances_lock:
+            state = cls._instances.get(key)
+            if state is None:
+                state = cls._instances[key] = cls(key)
+            return state
+
+    def _stat(self) -> Optional[tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _refresh(self) -> None:
+        # Called with the lock held
+        signature = self._stat()
+        if self._loaded and signature == self._signature:
+            return
+        self._memo.clear()
+        self._signature = signature
+        self._loaded = True
+        if signature is None:
+            self._data = None
+            return
+        try:
+            self._data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._data = _INVALID
+
+    def load(self) -> Optional[Any]:
+        """A copy of the parsed file, or None when it does not exist.
+
+        Raises ValueError when the file exists but could not be read as JSON.
+        """
+        with self._lock:
+            self._refresh()
+            if self._data is _INVALID:
+                raise ValueError(f"{self.path} is not valid JSON")
+            return copy.deepcopy(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """A copy of top-level ``key`` of the file, or ``default`` when missing or unreadable."""
+        with self._lock:
+            self._refresh()
+            if not isinstance(self._data, dict) or key not in self._data:
+                return default
+            return copy.deepcopy(self._data[key])
+
+    def save(self, data: Any, indent: Optional[int] = None) -> None:
+        """Write ``data`` to the file in place (keeping its permissions) and to the cache."""
+        with self._lock:
+            self.path.write_text(json.dumps(data, ensure_ascii=False, indent=indent), encoding="utf-8")
+            self._memo.clear()
+            self._data = copy.deepcopy(data)
+            self._signature = self._stat()
+            self._loaded = True
+
+    def update(self, key: str, value: Any) -> None:
+        """Set top-level ``key`` of the file, keeping the other keys.
+
+        Raises ValueError when the existing file could not be read, rather than overwrite it.
+        """
+        with self._lock:
+            data = self.load()
+            if data is None:
+                data = {}
+            elif not isinstance(data, dict):
+                raise ValueError(f"{self.path} does not hold a JSON object")
+            data[key] = value
+            self.save(data, indent=2)
+
+    def memo(self, name: str, compute: Callable[[], T]) -> T:
+        """``compute()``, cached until the file changes. The result is shared; do not modify it."""
+        with self._lock:
+            self._refresh()
+            if name not in self._memo:
+                self._memo[name] = compute()
+            return self._memo[name]
@@ -0,0 +1,260 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Name index and directory listing cache for the web UI file browser.
+
+``BrowseIndex`` walks the browse roots in a background thread and keeps an inverted index
+from name token to the entries holding it, so a search looks up a few token sets instead
+of walking the whole library. It is kept current by periodic incremental rescans that only
+list directories again when their mtime changed. ``list_directory`` caches the listing of
+single directories for ``/api/browse`` on the same mtime rule.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import heapq
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from typing import NamedTuple, Optional
+
+# Separators names are split on for searching (dots, dashes, underscores, spaces)
+TOKEN_SEP_RE = re.compile(r"[\s.\-_]+")
+# Seconds between incremental rescans of the browse roots
+DEFAULT_RESCAN_INTERVAL = 300.0
+# Directory listings kept for /api/browse
+_MAX_LISTINGS = 256
+# A directory changed this recently may change again within the same mtime tick, so its
+# listing is not trusted until it is older (coarse mtimes on FAT and some network shares)
+_RACY_MTIME_NS = 2_000_000_000
+
+
+class Entry(NamedTuple):
+    name: str
+    is_dir: bool
+    # Symlink or junction: may resolve outside the browse roots, so callers check it
+    is_link: bool
+
+
+def tokenize(name: str) -> list[str]:
+    return [token for token in TOKEN_SEP_RE.split(name.lower()) if token]
+
+
+def name_matches(name_tokens: list[str], query_tokens: list[str]) -> bool:
+    """Whether ``query_tokens`` all appear in ``name_tokens`` as whole tokens, in order."""
+    remaining = iter(name_tokens)
+    return all(any(token == query_token for token in remaining) for query_token in query_tokens)
+
+
+def _is_link(entry: os.DirEntry[str]) -> bool:
+    is_junction = getattr(entry, "is_junction", None)
+    return entry.is_symlink() or bool(is_junction is not None and is_junction())
+
+
+def _scan(path: str) -> tuple[int, list[Entry]]:
+    """mtime of directory ``path`` and its entries, hidden ones skipped, sorted by name."""
+    mtime = os.stat(path).st_mtime_ns
+    if time.time_ns() - mtime < _RACY_MTIME_NS:
+        mtime = -1
+    entries: list[Entry] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name.startswith("."):
+                continue
+            try:
+                # DirEntry answers from the directory listing itself; only links need a stat
+                entries.append(Entry(entry.name, entry.is_dir(), _is_link(entry)))
+            except OSError:
+                continue
+    entries.sort()
+    return mtime, entries
+
+
+_listings: OrderedDict[str, tuple[int, list[Entry]]] = OrderedDict()
+_listings_lock = threading.Lock()
+
+
+def list_directory(path: str) -> list[Entry]:
+    """Entries of directory ``path`` (hidden ones skipped), listed again only when its mtime changed."""
+    mtime = os.stat(path).st_mtime_ns
+    with _listings_lock:
+        cached = _listings.get(path)
+        if cached is not None and cached[0] == mtime:
+            _listings.move_to_end(path)
+            return cached[1]
+    mtime, entries = _scan(path)
+    with _listings_lock:
+        _listings[path] = (mtime, entries)
+        _listings.move_to_end(path)
+        while len(_listings) > _MAX_LISTINGS:
+            _listings.popitem(last=False)
+    return entries
+
+
+def _has_extension(entry: Entry, extensions: set[str]) -> bool:
+    return entry.is_dir or os.path.splitext(entry.name.lower())[1] in extensions
+
+
+def _walk(roots: list[str]) -> Iterator[tuple[str, Entry]]:
+    for root in roots:
+        if not os.path.isdir(root):
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for dirname in dirnames:
+                full_path = os.path.join(dirpath, dirname)
+                yield full_path, Entry(dirname, True, os.path.islink(full_path))
+            for filename in filenames:
+                if not filename.startswith("."):
+                    full_path = os.path.join(dirpath, filename)
+                    yield full_path, Entry(filename, False, os.path.islink(full_path))
+
+
+class BrowseIndex:
+    """Inverted name index of the browse roots, maintained by a background thread."""
+
+    _instances: dict[tuple[str, ...], BrowseIndex] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, roots: list[str], interval: float = DEFAULT_RESCAN_INTERVAL) -> None:
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.interval = interval
+        self.ready = threading.Event()
+        self._dirs: dict[str, tuple[int, list[Entry]]] = {}
+        self._entries: dict[str, Entry] = {}
+        # Per path: "0" for folders or "1" for files, the lowercased name, NUL, the path;
+        # comparing these strings gives the result order without building tuples
+        self._keys: dict[str, str] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._folders: set[str] = set()
+        self._files_by_ext: dict[str, set[str]] = {}
+        self._links: set[str] = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    @classmethod
+    def for_roots(cls, roots: list[str], interval: float = DEFAULT_RESCAN_INTERVAL) -> BrowseIndex:
+        """The running index of ``roots``; an index of other roots is stopped and dropped."""
+        key = tuple(os.path.abspath(root) for root in roots)
+        with cls._instances_lock:
+            index = cls._instances.get(key)
+            if index is None:
+                for other in cls._instances.values():
+                    other.stop()
+                cls._instances.clear()
+                index = cls._instances[key] = cls(list(key), interval)
+                threading.Thread(target=index._run, name="browse-index", daemon=True).start()
+            return index
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            with contextlib.suppress(Exception):
+                self.refresh()
+            self.ready.set()
+            self._stopped.wait(self.interval)
+
+    def refresh(self) -> None:
+        """Bring the index up to date, listing only the directories whose mtime changed."""
+        seen: set[str] = set()
+        stack = [root for root in reversed(self.roots) if os.path.isdir(root)]
+        while stack and not self._stopped.is_set():
+            path = stack.pop()
+            if path in seen:
+                continue
+            try:
+                mtime = os.stat(path).st_mtime_ns
+                cached = self._dirs.get(path)
+                if cached is not None and cached[0] == mtime:
+                    entries = cached[1]
+                else:
+                    mtime, entries = _scan(path)
+                    self._replace(path, mtime, entries)
+            except OSError:
+                continue
+            seen.add(path)
+            # Links are indexed but not followed, like os.walk
+            stack.extend(os.path.join(path, entry.name) for entry in reversed(entries) if entry.is_dir and not entry.is_link)
+        if not self._stopped.is_set():
+            for path in [path for path in self._dirs if path not in seen]:
+                self._replace(path, None, [])
+
+    def _replace(self, path: str, mtime: Optional[int], entries: list[Entry]) -> None:
+        with self._lock:
+            old = self._dirs.pop(path, (0, []))[1]
+            if mtime is not None:
+                self._dirs[path] = (mtime, entries)
+            kept = set(old).intersection(entries)
+            for entry in old:
+                if entry not in kept:
+                    self._remove(os.path.join(path, entry.name), entry)
+            for entry in entries:
+                if entry not in kept:
+                    self._add(os.path.join(path, entry.name), entry)
+
+    def _kind(self, entry: Entry) -> set[str]:
+        if entry.is_dir:
+            return self._folders
+        return self._files_by_ext.setdefault(os.path.splitext(entry.name.lower())[1], set())
+
+    def _add(self, full_path: str, entry: Entry) -> None:
+        self._entries[full_path] = entry
+        self._keys[full_path] = f"{0 if entry.is_dir else 1}{entry.name.lower()}\0{full_path}"
+        self._kind(entry).add(full_path)
+        if entry.is_link:
+            self._links.add(full_path)
+        for token in set(tokenize(entry.name)):
+            self._postings.setdefault(token, set()).add(full_path)
+
+    def _remove(self, full_path: str, entry: Entry) -> None:
+        self._entries.pop(full_path, None)
+        self._keys.pop(full_path, None)
+        self._kind(entry).discard(full_path)
+        self._links.discard(full_path)
+        for token in set(tokenize(entry.name)):
+            paths = self._postings.get(token)
+            if paths is not None:
+                paths.discard(full_path)
+                if not paths:
+                    del self._postings[token]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, query: str, extensions: set[str], limit: int, allow: Callable[[str], bool]) -> list[tuple[str, Entry]]:
+        """Entries whose names hold the query's tokens in order, folders first, then by name.
+
+        Files must have one of ``extensions``. Links are only returned when ``allow`` accepts
+        their path. Until the first scan has finished, the roots are walked instead.
+        """
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+        if self.ready.is_set():
+            with self._lock:
+                postings = [self._postings.get(token) for token in set(query_tokens)]
+                if not all(postings):
+                    return []
+                candidates = set.intersection(*sorted((paths for paths in postings if paths is not None), key=len))
+                # Folders, and files with one of the extensions
+                candidates = (candidates & self._folders).union(*(candidates & self._files_by_ext.get(ext, set()) for ext in extensions))
+                if len(query_tokens) > 1:
+                    # Every candidate holds all the tokens; their order still has to match
+                    candidates = {path for path in candidates if name_matches(tokenize(self._entries[path].name), query_tokens)}
+                # Room for links that ``allow`` turns down
+                ranked = heapq.nsmallest(limit + len(candidates & self._links), map(self._keys.__getitem__, candidates))
+                matches = [(path, self._entries[path]) for path in (key.partition("\0")[2] for key in ranked)]
+            return [(path, entry) for path, entry in matches if not entry.is_link or allow(path)][:limit]
+
+        # Not indexed yet: stop at the first ``limit`` matches, as a plain walk always has
+        matches = []
+        for path, entry in _walk(self.roots):
+            if _has_extension(entry, extensions) and name_matches(tokenize(entry.name), query_tokens) and (not entry.is_link or allow(path)):
+                matches.append((path, entry))
+                if len(matches) >= limit:
+                    break
+        return sorted(matches, key=lambda match: (not match[1].is_dir, match[1].name.lower(), match[0]))
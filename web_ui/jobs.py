@@ -0,0 +1,348 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Upload jobs run by the web UI in prewarmed worker processes.
+
+``WorkerPool`` keeps a few ``web_ui.jobworker`` processes waiting with the upload modules
+already imported; each one runs a single ``upload.py`` invocation and exits. ``JobManager``
+queues jobs by priority, runs up to ``max_jobs`` of them at once and appends each job's
+output to a log file that clients follow by byte offset. The queue is saved to
+``jobs.json`` so queued jobs survive a restart of the web UI.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import heapq
+import itertools
+import json
+import os
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Optional
+
+DEFAULT_MAX_JOBS = 2
+DEFAULT_WARM_WORKERS = 1
+# Finished jobs kept in the job list, with their logs
+MAX_FINISHED_JOBS = 100
+# Bytes of log returned per read
+LOG_CHUNK_SIZE = 64 * 1024
+
+FINISHED_STATES = frozenset({"done", "failed", "cancelled", "interrupted"})
+
+
+def env_int(name: str, default: int, minimum: int = 0) -> int:
+    """Integer environment variable ``name``, or ``default`` when unset or invalid."""
+    raw = os.environ.get(name, "").strip()
+    try:
+        return max(minimum, int(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+class WorkerPool:
+    """Idle worker processes that have imported upload.py and wait for the arguments of one run."""
+
+    def __init__(self, base_dir: Path, size: int, command: Optional[list[str]] = None) -> None:
+        self.base_dir = base_dir
+        self.size = size
+        self.command = command or [sys.executable, "-u", "-m", "web_ui.jobworker"]
+        self._idle: list[subprocess.Popen[str]] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _spawn(self) -> subprocess.Popen[str]:
+        env = os.environ.copy()
+        env["PYTHONUNBUFFERED"] = "1"
+        env["PYTHONIOENCODING"] = "utf-8"
+        return subprocess.Popen(  # lgtm[py/command-line-injection]
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=0,
+            cwd=str(self.base_dir),
+            env=env,
+        )
+
+    def fill(self) -> None:
+        """Start workers until ``size`` of them are idle."""
+        with self._lock:
+            self._idle = [process for process in self._idle if process.poll() is None]
+            while not self._closed and len(self._idle) < self.size:
+                self._idle.append(self._spawn())
+
+    def take(self, argv: list[str]) -> subprocess.Popen[str]:
+        """A worker running upload.py with ``argv``; started cold when none is idle."""
+        with self._lock:
+            process: Optional[subprocess.Popen[str]] = None
+            while self._idle and process is None:
+                candidate = self._idle.pop(0)
+                if candidate.poll() is None:
+                    process = candidate
+            if process is None:
+                process = self._spawn()
+        if process.stdin is None:
+            raise RuntimeError("Worker has no stdin")
+        process.stdin.write(json.dumps(argv) + "\n")
+        process.stdin.flush()
+        if self.size:
+            threading.Thread(target=self.fill, name="job-pool-fill", daemon=True).start()
+        return process
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for process in idle:
+            _stop(process)
+
+
+def _stop(process: subprocess.Popen[str]) -> None:
+    with contextlib.suppress(Exception):
+        process.terminate()
+        try:
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+class Job:
+    """One queued, running or finished upload.py run."""
+
+    def __init__(self, job_id: str, path: str, args: list[str], priority: int = 0, owner: Optional[str] = None) -> None:
+        self.id = job_id
+        self.path = path
+        self.args = args
+        self.priority = priority
+        self.owner = owner
+        self.status = "queued"
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.exit_code: Optional[int] = None
+        self.error: Optional[str] = None
+        self.log_size = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "path": self.path,
+            "args": self.args,
+            "priority": self.priority,
+            "owner": self.owner,
+            "status": self.status,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "exit_code": self.exit_code,
+            "error": self.error,
+            "log_size": self.log_size,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Job:
+        job = cls(str(data["id"]), str(data["path"]), [str(arg) for arg in data.get("args") or []], int(data.get("priority") or 0), data.get("owner"))
+        job.status = str(data.get("status") or "queued")
+        job.created = float(data.get("created") or time.time())
+        job.started = data.get("started")
+        job.finished = data.get("finished")
+        job.exit_code = data.get("exit_code")
+        job.error = data.get("error")
+        return job
+
+
+class JobManager:
+    """Priority queue of upload jobs, run concurrently in worker processes from a ``WorkerPool``."""
+
+    def __init__(
+        self, state_dir: Path, base_dir: Path, max_jobs: int = DEFAULT_MAX_JOBS, warm_workers: int = DEFAULT_WARM_WORKERS, command: Optional[list[str]] = None
+    ) -> None:
+        self.state_file = state_dir / "jobs.json"
+        self.log_dir = state_dir / "jobs"
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.upload_script = str(base_dir / "upload.py")
+        self.max_jobs = max(1, max_jobs)
+        self.pool = WorkerPool(base_dir, warm_workers, command)
+        self.jobs: dict[str, Job] = {}
+        self._queue: list[tuple[int, int, str]] = []
+        self._order = itertools.count()
+        self._processes: dict[str, subprocess.Popen[str]] = {}
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._closed = False
+        self._load()
+
+    def log_path(self, job_id: str) -> Path:
+        return self.log_dir / f"{job_id}.log"
+
+    def _load(self) -> None:
+        try:
+            records = json.loads(self.state_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        for record in records if isinstance(records, list) else []:
+            try:
+                job = Job.from_dict(record)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if job.status == "running":
+                # The web UI stopped while it ran; its worker went with it
+                job.status = "interrupted"
+                job.finished = job.finished or time.time()
+            with contextlib.suppress(OSError):
+                job.log_size = self.log_path(job.id).stat().st_size
+            self.jobs[job.id] = job
+            if job.status == "queued":
+                heapq.heappush(self._queue, (-job.priority, next(self._order), job.id))
+
+    def _save(self) -> None:
+        finished = sorted((job for job in self.jobs.values() if job.status in FINISHED_STATES), key=lambda job: job.finished or 0)
+        for job in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job.id]
+            with contextlib.suppress(OSError):
+                self.log_path(job.id).unlink()
+        tmp_path = self.state_file.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps([job.to_dict() for job in self.jobs.values()], ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self.state_file)
+        except OSError:
+            pass
+
+    def start(self) -> None:
+        """Warm the worker pool and run any jobs still queued from the last session."""
+        self.pool.fill()
+        with self._lock:
+            self._dispatch()
+
+    def submit(self, path: str, args: list[str], priority: int = 0, owner: Optional[str] = None) -> Job:
+        """Queue a run of upload.py for ``path`` with the already validated ``args``."""
+        job = Job(secrets.token_hex(8), path, list(args), priority, owner)
+        with self._lock:
+            self.jobs[job.id] = job
+            heapq.heappush(self._queue, (-priority, next(self._order), job.id))
+            self._dispatch()
+            self._changed.notify_all()
+        return job
+
+    def _dispatch(self) -> None:
+        # Called with the lock held
+        while not self._closed and self._queue and len(self._processes) < self.max_jobs:
+            _, _, job_id = heapq.heappop(self._queue)
+            job = self.jobs.get(job_id)
+            if job is None or job.status != "queued":
+                continue
+            job.started = time.time()
+            try:
+                process = self.pool.take([self.upload_script, job.path, *job.args])
+            except Exception as e:
+                job.status = "failed"
+                job.error = f"Could not start worker: {e}"
+                job.finished = time.time()
+                continue
+            job.status = "running"
+            self._processes[job.id] = process
+            threading.Thread(target=self._run, args=(job, process), name=f"job-{job.id}", daemon=True).start()
+        self._save()
+
+    def _run(self, job: Job, process: subprocess.Popen[str]) -> None:
+        with open(self.log_path(job.id), "ab") as log:
+            readers = [threading.Thread(target=self._copy_output, args=(job, stream, log), daemon=True) for stream in (process.stdout, process.stderr) if stream is not None]
+            for reader in readers:
+                reader.start()
+            for reader in readers:
+                reader.join()
+        exit_code = process.wait()
+        for stream in (process.stdin, process.stdout, process.stderr):
+            with contextlib.suppress(Exception):
+                if stream is not None:
+                    stream.close()
+        with self._lock:
+            self._processes.pop(job.id, None)
+            job.exit_code = exit_code
+            job.finished = time.time()
+            if job.status == "running":
+                job.status = "interrupted" if self._closed else "done" if exit_code == 0 else "failed"
+            self._dispatch()
+            self._changed.notify_all()
+
+    def _copy_output(self, job: Job, stream: IO[str], log: IO[bytes]) -> None:
+        fd = stream.fileno()
+        while True:
+            try:
+                chunk = os.read(fd, LOG_CHUNK_SIZE)
+            except OSError:
+                break
+            if not chunk:
+                break
+            with self._lock:
+                log.write(chunk)
+                log.flush()
+                job.log_size += len(chunk)
+                self._changed.notify_all()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def to_list(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [job.to_dict() for job in sorted(self.jobs.values(), key=lambda job: job.created)]
+
+    def read_log(self, job_id: str, offset: int, timeout: float = 0.0) -> tuple[bytes, bool]:
+        """Log bytes of ``job_id`` from ``offset``, waiting up to ``timeout`` for more, and whether the job has finished."""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                raise KeyError(job_id)
+            self._changed.wait_for(lambda: job.log_size > offset or job.status in FINISHED_STATES, timeout)
+            size = job.log_size
+            finished = job.status in FINISHED_STATES
+        if offset >= size:
+            return b"", finished
+        with open(self.log_path(job_id), "rb") as f:
+            f.seek(offset)
+            data = f.read(min(LOG_CHUNK_SIZE, size - offset))
+        return data, finished and offset + len(data) >= size
+
+    def send_input(self, job_id: str, text: str) -> bool:
+        """Write a line of input to a running job's prompts."""
+        with self._lock:
+            process = self._processes.get(job_id)
+        if process is None or process.stdin is None or process.poll() is not None:
+            return False
+        try:
+            process.stdin.write(text + "\n")
+            process.stdin.flush()
+        except OSError:
+            return False
+        return True
+
+    def cancel(self, job_id: str) -> bool:
+        """Drop a queued job or stop a running one."""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status in FINISHED_STATES:
+                return False
+            queued = job.status == "queued"
+            job.status = "cancelled"
+            if queued:
+                job.finished = time.time()
+                self._save()
+                self._changed.notify_all()
+            process = self._processes.get(job_id)
+        if process is not None:
+            _stop(process)
+        return True
+
+    def close(self) -> None:
+        """Stop the pool and any running jobs; queued jobs stay saved for the next start."""
+        with self._lock:
+            self._closed = True
+            running = list(self._processes.values())
+        self.pool.close()
+        for process in running:
+            _stop(process)
@@ -0,0 +1,26 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Prewarmed web UI worker: imports upload.py up front, then runs the one job sent on stdin.
+
+The first line of stdin is the JSON argv for upload.py; everything after it is input for
+the run's prompts, exactly as for a plain ``python upload.py`` subprocess.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import upload  # noqa: E402
+
+
+def main() -> None:
+    line = sys.stdin.readline()
+    if not line.strip():
+        return  # The pool closed before this worker was given a job
+    sys.argv = [str(arg) for arg in json.loads(line)]
+    upload.run_cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,18 @@
 # ruff: noqa: I001
 import ast
 import base64
+import codecs
 import contextlib
 import hashlib
 import hmac
+import html
 import json
 import time
 import os
 import queue
 import re
 import secrets
+import shlex
 import subprocess
 import sys
 import threading
@@ -30,6 +33,9 @@ from werkzeug.middleware.proxy_fix import ProxyFix
 
 
 import web_ui.auth as auth_mod
+from web_ui.authstate import AuthState
+from web_ui.browseindex import DEFAULT_RESCAN_INTERVAL, BrowseIndex, list_directory, tokenize
+from web_ui.jobs import DEFAULT_MAX_JOBS, DEFAULT_WARM_WORKERS, JobManager, env_int
 from flask_session import Session
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -47,11 +53,20 @@ cfg_dir.mkdir(parents=True, exist_ok=True)
 
 # Access logging helper
 try:
-    from web_ui.access_log import AccessLogger
+    from web_ui import access_log as access_log_mod
 except Exception:
-    AccessLogger = None
-
-access_logger = AccessLogger(cfg_dir) if AccessLogger is not None else None
+    access_log_mod = None
+
+access_logger = (
+    access_log_mod.AccessLogger(
+        cfg_dir,
+        max_bytes=env_int("UA_ACCESS_LOG_MAX_BYTES", access_log_mod.DEFAULT_MAX_BYTES),
+        max_age_days=env_int("UA_ACCESS_LOG_MAX_AGE_DAYS", access_log_mod.DEFAULT_MAX_AGE_DAYS),
+        backups=env_int("UA_ACCESS_LOG_BACKUPS", access_log_mod.DEFAULT_BACKUPS),
+    )
+    if access_log_mod is not None
+    else None
+)
 
 
 # Helper: simple file-backed config store under the auth config dir. Values
@@ -233,13 +248,19 @@ def _load_session_dict() -> dict:
         enc = session.get("enc")
         if not enc:
             return {}
+        # Decrypted once per request: auth checks and logging read it several times
+        cached = g.get("session_dict")
+        if cached is not None and cached[0] == enc:
+            return dict(cached[1])
         key = _derive_aes_key()
         if not key:
             return {}
         dec = auth_mod.decrypt_text(key, enc)
         if not dec:
             return {}
-        return json.loads(dec)
+        d = json.loads(dec)
+        g.session_dict = (enc, d)
+        return dict(d)
     except Exception:
         return {}
 
@@ -252,6 +273,7 @@ def _commit_session_dict(d: dict) -> None:
         raw = json.dumps(d, separators=(",", ":"), ensure_ascii=False)
         enc = auth_mod.encrypt_text(key, raw)
         session["enc"] = enc
+        g.session_dict = (enc, dict(d))
     except Exception:
         pass
 
@@ -274,64 +296,32 @@ def _session_pop(key: str, default: Any = None) -> Any:
 
 
 # IP control helpers --------------------------------------------------
+# webui_auth.json is parsed once and reloaded only when it changes on disk
+auth_state = AuthState.for_path(cfg_dir / "webui_auth.json")
+
+
 def _get_ip_whitelist() -> list[str]:
     """Get the list of whitelisted IPs."""
-    try:
-        path = cfg_dir / "webui_auth.json"
-        if path.exists():
-            data = json.loads(path.read_text(encoding="utf-8"))
-            val = data.get("ip_whitelist")
-            if isinstance(val, list):
-                return val
-    except Exception:
-        pass
-    return []
+    val = auth_state.get("ip_whitelist")
+    return val if isinstance(val, list) else []
 
 
 def _set_ip_whitelist(ips: list[str]) -> None:
     """Set the list of whitelisted IPs."""
-    try:
-        path = cfg_dir / "webui_auth.json"
-        data = {}
-        if path.exists():
-            try:
-                data = json.loads(path.read_text(encoding="utf-8")) or {}
-            except Exception:
-                return
-        data["ip_whitelist"] = ips
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-    except Exception:
-        pass
+    with contextlib.suppress(Exception):
+        auth_state.update("ip_whitelist", ips)
 
 
 def _get_ip_blacklist() -> list[str]:
     """Get the list of blacklisted IPs."""
-    try:
-        path = cfg_dir / "webui_auth.json"
-        if path.exists():
-            data = json.loads(path.read_text(encoding="utf-8"))
-            val = data.get("ip_blacklist")
-            if isinstance(val, list):
-                return val
-    except Exception:
-        pass
-    return []
+    val = auth_state.get("ip_blacklist")
+    return val if isinstance(val, list) else []
 
 
 def _set_ip_blacklist(ips: list[str]) -> None:
     """Set the list of blacklisted IPs."""
-    try:
-        path = cfg_dir / "webui_auth.json"
-        data = {}
-        if path.exists():
-            try:
-                data = json.loads(path.read_text(encoding="utf-8")) or {}
-            except Exception:
-                return
-        data["ip_blacklist"] = ips
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-    except Exception:
-        pass
+    with contextlib.suppress(Exception):
+        auth_state.update("ip_blacklist", ips)
 
 
 def _get_ip_failures() -> dict[str, list[int]]:
@@ -341,44 +331,28 @@ def _get_ip_failures() -> dict[str, list[int]]:
     compatibility any integer legacy counts are converted into recent
     timestamps so they behave as recent failures.
     """
-    try:
-        path = cfg_dir / "webui_auth.json"
-        if path.exists():
-            data = json.loads(path.read_text(encoding="utf-8"))
-            val = data.get("ip_failures")
-            if isinstance(val, dict):
-                now = int(time.time())
-                out: dict[str, list[int]] = {}
-                for k, v in val.items():
-                    if isinstance(v, list):
-                        # Coerce list members to ints and filter invalid
-                        try:
-                            out[k] = [int(x) for x in v]
-                        except Exception:
-                            out[k] = []
-                    elif isinstance(v, int):
-                        # Legacy count: treat as recent failures
-                        out[k] = [now] * v
-                return out
-    except Exception:
-        pass
-    return {}
+    val = auth_state.get("ip_failures")
+    if not isinstance(val, dict):
+        return {}
+    now = int(time.time())
+    out: dict[str, list[int]] = {}
+    for k, v in val.items():
+        if isinstance(v, list):
+            # Coerce list members to ints and filter invalid
+            try:
+                out[k] = [int(x) for x in v]
+            except Exception:
+                out[k] = []
+        elif isinstance(v, int):
+            # Legacy count: treat as recent failures
+            out[k] = [now] * v
+    return out
 
 
 def _set_ip_failures(failures: dict[str, list[int]]) -> None:
     """Set the dict of IP failure timestamps (ip -> list[timestamps])."""
-    try:
-        path = cfg_dir / "webui_auth.json"
-        data = {}
-        if path.exists():
-            try:
-                data = json.loads(path.read_text(encoding="utf-8")) or {}
-            except Exception:
-                return
-        data["ip_failures"] = failures
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-    except Exception:
-        pass
+    with contextlib.suppress(Exception):
+        auth_state.update("ip_failures", failures)
 
 
 def _is_ip_allowed(ip: str) -> bool:
@@ -496,12 +470,13 @@ SUPPORTED_VIDEO_EXTS = {".mkv", ".mp4", ".ts"}
 # Supported description file extensions for WebUI description file browser
 SUPPORTED_DESC_EXTS = {".txt", ".nfo", ".md"}
 
-# Regex for splitting filenames on common separators (dots, dashes, underscores, spaces)
-_BROWSE_SEARCH_SEP_RE = re.compile(r"[\s.\-_]+")
-
 # Lock to prevent concurrent in-process uploads (avoids cross-session interference)
 inproc_lock = threading.Lock()
 
+# Queue of upload jobs run in prewarmed worker processes; created on first use
+_job_manager: Optional[JobManager] = None
+_job_manager_lock = threading.Lock()
+
 # Runtime browse roots (set by upload.py when starting web UI)
 _runtime_browse_roots: Optional[str] = None
 
@@ -1132,6 +1107,43 @@ def set_runtime_browse_roots(browse_roots: str) -> None:
     """Set browse roots at runtime (used by upload.py when starting web UI)"""
     global _runtime_browse_roots
     _runtime_browse_roots = browse_roots
+    # Start indexing now so the first search does not wait for it
+    _get_browse_index()
+
+
+def _get_browse_index() -> Optional[BrowseIndex]:
+    """Search index of the current browse roots; None when disabled with UA_BROWSE_INDEX_INTERVAL=0."""
+    roots = _get_browse_roots()
+    interval = env_int("UA_BROWSE_INDEX_INTERVAL", int(DEFAULT_RESCAN_INTERVAL))
+    if not roots or interval <= 0:
+        return None
+    return BrowseIndex.for_roots(roots, float(interval))
+
+
+def _get_job_manager() -> JobManager:
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager(
+                cfg_dir,
+                Path(__file__).parent.parent,
+                max_jobs=env_int("UA_WEBUI_MAX_JOBS", DEFAULT_MAX_JOBS, minimum=1),
+                warm_workers=env_int("UA_WEBUI_WARM_WORKERS", DEFAULT_WARM_WORKERS),
+            )
+            _job_manager.start()
+        return _job_manager
+
+
+def start_job_manager() -> None:
+    """Warm the upload worker pool and resume jobs left queued (called by upload.py when starting the web UI)."""
+    _get_job_manager()
+
+
+def stop_job_manager() -> None:
+    """Stop idle workers and running jobs; queued jobs are kept for the next start."""
+    with _job_manager_lock:
+        if _job_manager is not None:
+            _job_manager.close()
 
 
 def _load_config_from_file(path: Path) -> dict[str, Any] | None:
@@ -2206,7 +2218,9 @@ def access_log_entries_api():
     """Get recent access log entries.
 
     GET: returns recent log entries (requires web session).
-    Query params: n (number of entries, default 50, max 200)
+    Query params: n (number of entries, default 50, max 200), and optional filters
+    status (success, failed, 4xx or a code), endpoint (path prefix), ip, since and until
+    (ISO 8601 or epoch seconds)
     """
     # Require authenticated web session
     if not _is_authenticated():
@@ -2228,8 +2242,19 @@ def access_log_entries_api():
         n = 50
 
     try:
-        entries = access_logger.tail(n)
+        since = request.args.get("since", "").strip()
+        until = request.args.get("until", "").strip()
+        entries = access_logger.entries(
+            n,
+            status=request.args.get("status", "").strip() or None,
+            endpoint=request.args.get("endpoint", "").strip() or None,
+            ip=request.args.get("ip", "").strip() or None,
+            since=access_log_mod.parse_time(since) if access_log_mod is not None and since else None,
+            until=access_log_mod.parse_time(until) if access_log_mod is not None and until else None,
+        )
         return jsonify({"success": True, "entries": entries})
+    except ValueError:
+        return jsonify({"success": False, "error": "Invalid status, since or until filter"}), 400
     except Exception:
         return jsonify({"success": False, "error": "Failed to read log entries"}), 500
 
@@ -2779,35 +2804,33 @@ def browse_path():
                 console.print(f"Path failed containment check before listing: {safe_path!r}", markup=False)
                 return jsonify({"error": "Invalid path specified", "success": False}), 400
 
-            for item in sorted(os.listdir(safe_path)):
-                # Skip hidden files
-                if item.startswith("."):
-                    continue
+            # Listing is cached until the directory's mtime changes; hidden entries are skipped
+            for entry in list_directory(safe_path):
+                item = entry.name
                 full_path = os.path.join(safe_path, item)
-                # Explicitly assert each resolved child path is safe. If the
+                # A plain child of the checked directory stays inside it. Links
+                # may point anywhere, so assert each resolved link is safe; if the
                 # assertion fails for a specific entry, skip it rather than
                 # failing the whole browse operation.
-                try:
-                    _assert_safe_resolved_path(full_path)
-                except ValueError:
-                    continue
-                try:
-                    is_dir = os.path.isdir(full_path)
-
-                    # Skip files based on filter type
-                    if not is_dir:
-                        _, ext = os.path.splitext(item.lower())
-                        if file_filter == "desc":
-                            if ext not in SUPPORTED_DESC_EXTS:
-                                continue
-                        else:
-                            # Default to video filter
-                            if ext not in SUPPORTED_VIDEO_EXTS:
-                                continue
-
-                    items.append({"name": item, "path": full_path, "type": "folder" if is_dir else "file", "children": [] if is_dir else None})
-                except (PermissionError, OSError):
-                    continue
+                if entry.is_link:
+                    try:
+                        _assert_safe_resolved_path(full_path)
+                    except ValueError:
+                        continue
+                is_dir = entry.is_dir
+
+                # Skip files based on filter type
+                if not is_dir:
+                    _, ext = os.path.splitext(item.lower())
+                    if file_filter == "desc":
+                        if ext not in SUPPORTED_DESC_EXTS:
+                            continue
+                    else:
+                        # Default to video filter
+                        if ext not in SUPPORTED_VIDEO_EXTS:
+                            continue
+
+                items.append({"name": item, "path": full_path, "type": "folder" if is_dir else "file", "children": [] if is_dir else None})
 
             console.print(f"Found {len(items)} items in {path}", markup=False)
 
@@ -2866,86 +2889,27 @@ def browse_search():
     if not roots:
         return jsonify({"success": False, "error": "Browsing is not configured"}), 400
 
-    # Split on common separators
-    query_tokens = [t for t in _BROWSE_SEARCH_SEP_RE.split(query.lower()) if t]
-    if not query_tokens:
+    # Names and the query are split into tokens on common separators
+    if not tokenize(query):
         return jsonify({"success": True, "items": [], "query": query})
 
-    def name_matches(name: str) -> bool:
-        """Check if query tokens appear as whole-word ordered subsequence in the name."""
-        name_tokens = [t for t in _BROWSE_SEARCH_SEP_RE.split(name.lower()) if t]
-        pos = 0
-        for qt in query_tokens:
-            found = False
-            while pos < len(name_tokens):
-                if name_tokens[pos] == qt:
-                    pos += 1
-                    found = True
-                    break
-                pos += 1
-            if not found:
-                return False
+    def is_safe(full_path: str) -> bool:
+        try:
+            _assert_safe_resolved_path(full_path)
+        except ValueError:
+            return False
         return True
 
     allowed_exts = SUPPORTED_DESC_EXTS if file_filter == "desc" else SUPPORTED_VIDEO_EXTS
-    items: list[BrowseItem] = []
 
     try:
-        for root in roots:
-            root_abs = os.path.abspath(root)
-            if not os.path.isdir(root_abs):
-                continue
-            try:
-                for dirpath, dirnames, filenames in os.walk(root_abs):
-                    # Skip hidden dirs
-                    dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-
-                    # Check dirs
-                    for dirname in dirnames:
-                        if name_matches(dirname):
-                            full_path = os.path.join(dirpath, dirname)
-                            try:
-                                _assert_safe_resolved_path(full_path)
-                            except ValueError:
-                                continue
-                            items.append({"name": dirname, "path": full_path, "type": "folder", "children": []})
-                            if len(items) >= max_results:
-                                break
-
-                    if len(items) >= max_results:
-                        break
-
-                    # Check files
-                    for filename in filenames:
-                        if filename.startswith("."):
-                            continue
-                        if not name_matches(filename):
-                            continue
-                        _, ext = os.path.splitext(filename.lower())
-                        if ext not in allowed_exts:
-                            continue
-                        full_path = os.path.join(dirpath, filename)
-                        try:
-                            _assert_safe_resolved_path(full_path)
-                        except ValueError:
-                            continue
-                        items.append({"name": filename, "path": full_path, "type": "file", "children": None})
-                        if len(items) >= max_results:
-                            break
-
-                    if len(items) >= max_results:
-                        break
-            except PermissionError:
-                continue
-            except Exception as e:
-                console.print(f"Error searching in {root}: {e}", markup=False)
-                continue
-
-            if len(items) >= max_results:
-                break
-
-        # Sort by folders first and then alphabetically
-        items.sort(key=lambda x: (0 if x.get("type") == "folder" else 1, (x.get("name") or "").lower()))
+        # Answered from the name index; links are resolved and checked per match. Folders
+        # come first, then names alphabetically.
+        index = _get_browse_index() or BrowseIndex(roots)
+        matches = index.search(query, allowed_exts, max_results, allow=is_safe)
+        items: list[BrowseItem] = [
+            {"name": entry.name, "path": full_path, "type": "folder" if entry.is_dir else "file", "children": [] if entry.is_dir else None} for full_path, entry in matches
+        ]
 
         return jsonify({"success": True, "items": items, "query": query, "count": len(items), "truncated": len(items) >= max_results})
 
@@ -3468,12 +3432,6 @@ def execute_command():
                     return
 
                 else:
-                    # Set environment to unbuffered and force line buffering
-                    env = os.environ.copy()
-                    env["PYTHONUNBUFFERED"] = "1"
-                    env["PYTHONIOENCODING"] = "utf-8"
-                    # Disable Python output buffering
-
                     # Sanity-check the working directory used for the subprocess.
                     # `base_dir` is computed from the application `__file__`, but
                     # perform lightweight validation to satisfy static analysis
@@ -3520,17 +3478,10 @@ def execute_command():
                         yield f"data: {json.dumps({'type': 'error', 'data': 'Unsafe execution request'})}\n\n"
                         return
 
-                    process = subprocess.Popen(  # lgtm[py/command-line-injection]
-                        command,
-                        stdin=subprocess.PIPE,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        bufsize=0,  # Completely unbuffered
-                        cwd=str(base_dir),
-                        env=env,
-                        universal_newlines=True,
-                    )
+                    # Hand the run to a prewarmed worker (same pipes, cwd and
+                    # environment as a fresh `python -u upload.py`), so it does
+                    # not pay interpreter and import startup first.
+                    process = _get_job_manager().pool.take(command[2:])
 
                     # Store process for input handling (no queue needed)
                     active_processes[session_id] = {"process": process}
@@ -3918,6 +3869,149 @@ def kill_process():
         return jsonify({"error": "Kill error", "success": False}), 500
 
 
+def _job_access_error() -> Optional[tuple[Response, int]]:
+    """Same rule as /api/input and /api/kill: a valid bearer token or an authenticated web session."""
+    bearer = _get_bearer_from_header()
+    if bearer:
+        if not _token_is_valid(bearer):
+            return jsonify({"error": "Forbidden (invalid token)", "success": False}), 403
+    elif not _is_authenticated():
+        return jsonify({"error": "Authentication required (web session)", "success": False}), 401
+    return None
+
+
+def _job_requester() -> Optional[str]:
+    """User behind this request: the web session's user, the API token's owner or the basic auth user."""
+    username = getattr(g, "username", None) or _session_get("username")
+    if not username and request.authorization:
+        username = request.authorization.username
+    return str(username) if username else None
+
+
+def _job_owner_error(job_id: str) -> Optional[tuple[Response, int]]:
+    """Only the user who queued a job may send it input or cancel it."""
+    job = _get_job_manager().get(job_id)
+    if job is None:
+        return jsonify({"error": "No such job", "success": False}), 404
+    if job.owner != _job_requester():
+        return jsonify({"error": "Forbidden (job belongs to another user)", "success": False}), 403
+    return None
+
+
+def _output_html(text: str) -> str:
+    if ansi_to_html:
+        with contextlib.suppress(Exception):
+            return ansi_to_html(text)
+    return f"<pre>{html.escape(text)}</pre>"
+
+
+@app.route("/api/jobs", methods=["GET", "POST"])
+@limiter.limit("100 per hour", key_func=_rate_limit_key_func, methods=["POST"])
+def jobs_api():
+    """List upload jobs, or queue a new one"""
+    error = _job_access_error()
+    if error:
+        return error
+    manager = _get_job_manager()
+    if request.method == "GET":
+        return jsonify({"success": True, "jobs": manager.to_list(), "max_jobs": manager.max_jobs})
+
+    if not _verify_csrf_header():
+        return jsonify({"error": "CSRF token missing or invalid", "success": False}), 403
+
+    data = request.get_json(silent=True) or {}
+    path = data.get("path")
+    args = data.get("args") or ""
+    if not path:
+        return jsonify({"error": "Missing path", "success": False}), 400
+    try:
+        validated_path = _resolve_user_path(path, require_exists=True, require_dir=False)
+        _assert_safe_resolved_path(validated_path)
+        validated_args = _validate_upload_assistant_args(shlex.split(args) if isinstance(args, str) else args)
+        priority = int(data.get("priority") or 0)
+    except (TypeError, ValueError) as e:
+        console.print(f"Invalid job request: {e}", markup=False)
+        return jsonify({"error": "Invalid job request", "success": False}), 400
+
+    job = manager.submit(validated_path, validated_args, priority, owner=_job_requester())
+    console.print(f"Queued job {job.id} - Path: {validated_path}, Args: {validated_args}, Priority: {priority}", markup=False)
+    return jsonify({"success": True, "job": job.to_dict()})
+
+
+@app.route("/api/jobs/<job_id>")
+def job_status(job_id: str):
+    """Status of one upload job"""
+    error = _job_access_error()
+    if error:
+        return error
+    job = _get_job_manager().get(job_id)
+    if job is None:
+        return jsonify({"error": "No such job", "success": False}), 404
+    return jsonify({"success": True, "job": job.to_dict()})
+
+
+@app.route("/api/jobs/<job_id>/log")
+def job_log(job_id: str):
+    """Stream a job's output as SSE, from byte `offset` until the job finishes"""
+    error = _job_access_error()
+    if error:
+        return error
+    manager = _get_job_manager()
+    if manager.get(job_id) is None:
+        return jsonify({"error": "No such job", "success": False}), 404
+    offset = max(0, request.args.get("offset", 0, type=int) or 0)
+
+    def generate():
+        position = offset
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            try:
+                data, finished = manager.read_log(job_id, position, timeout=15)
+            except (KeyError, OSError):
+                yield f"data: {json.dumps({'type': 'error', 'data': 'Job log is no longer available'})}\n\n"
+                return
+            position += len(data)
+            text = decoder.decode(data, final=finished)
+            if text:
+                yield f"data: {json.dumps({'type': 'html', 'data': _output_html(text), 'offset': position})}\n\n"
+            elif not finished:
+                yield f"data: {json.dumps({'type': 'keepalive'})}\n\n"
+            if finished:
+                job = manager.get(job_id)
+                status = job.status if job else None
+                code = job.exit_code if job else None
+                yield f"data: {json.dumps({'type': 'exit', 'code': code, 'status': status})}\n\n"
+                return
+
+    return Response(generate(), mimetype="text/event-stream")
+
+
+@app.route("/api/jobs/<job_id>/input", methods=["POST"])
+@limiter.limit("200 per hour", key_func=_rate_limit_key_func)
+def job_input(job_id: str):
+    """Send a line of input to a running job"""
+    error = _job_access_error() or _job_owner_error(job_id)
+    if error:
+        return error
+    data = request.get_json(silent=True) or {}
+    if not _get_job_manager().send_input(job_id, str(data.get("input", ""))):
+        return jsonify({"error": "Job not running", "success": False}), 404
+    return jsonify({"success": True})
+
+
+@app.route("/api/jobs/<job_id>/cancel", methods=["POST"])
+@limiter.limit("50 per hour", key_func=_rate_limit_key_func)
+def job_cancel(job_id: str):
+    """Drop a queued job or stop a running one"""
+    error = _job_access_error() or _job_owner_error(job_id)
+    if error:
+        return error
+    if not _get_job_manager().cancel(job_id):
+        return jsonify({"error": "Job not queued or running", "success": False}), 404
+    console.print(f"Cancelled job {job_id}", markup=False)
+    return jsonify({"success": True})
+
+
 @app.errorhandler(404)
 def not_found(_e: Exception):
     return jsonify({"error": "Not found", "success": False}), 404
@@ -1147,9 +1147,9 @@ function ItemList({
 
   // Define known subgroupings for better visual breakdown (screenshots-related)
   const subgroupDefinitions = {
-    'General ffmpeg': ['ffmpeg_compression', 'process_limit', 'ffmpeg_limit'],
+    'General ffmpeg': ['ffmpeg_compression', 'process_limit', 'ffmpeg_limit', 'screenshot_prescan', 'optimize_screenshots'],
     'Overlay': ['frame_overlay', 'overlay_text_size'],
-    'HDR Tonemapping': ['tone_map', 'algorithm', 'desat', 'use_libplacebo', 'ffmpeg_is_good', 'ffmpeg_warmup'],
+    'HDR Tonemapping': ['tone_map', 'algorithm', 'desat', 'use_libplacebo', 'ffmpeg_is_good', 'ffmpeg_warmup', 'tonemap_cache'],
     'Bluray & DVD': ['use_largest_playlist', 'get_bluray_info', 'bluray_score', 'bluray_single_score', 'ping_unit3d'],
     'Extra': ['btn_api', 'user_overrides'],
     'Logos': ['add_logo', 'logo_size', 'logo_language'],